@@ -0,0 +1,230 @@
+"""FastAPI dependencies - Infrastructure singleton 與 Repository / 認證依賴。"""
+
+from collections.abc import Awaitable, Callable
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.adapters.api.middleware.rate_limit import RateLimiter
+from app.adapters.repositories.supabase_product_repository import SupabaseProductRepository
+from app.adapters.repositories.supabase_snapshot_repository import SupabaseSnapshotRepository
+from app.domain.entities.user import User
+from app.infrastructure.config import Settings
+from app.infrastructure.metrics import Metrics
+from app.infrastructure.resilience import Resilience
+from app.infrastructure.supabase_client import SupabaseClientProvider
+from app.use_cases.auth.ports import AsyncAuthRepository, TokenVerifier
+from app.use_cases.auth.verify_token_use_case import VerifyTokenUseCase
+from app.use_cases.cache.ports import CachePort
+from app.use_cases.exceptions import InvalidTokenError
+from app.use_cases.health.health_monitor import HealthMonitor
+from app.use_cases.product.ports import ProductRepository, SnapshotRepository
+from app.use_cases.report.report_generator import ReportGenerator
+
+# ============= Infrastructure 層（Singleton，由 app lifespan 建立） =============
+
+
+def get_app_settings(request: Request) -> Settings:
+    """取得啟動時驗證過的設定（Singleton）。"""
+    settings = getattr(request.app.state, "settings", None)
+    if settings is None:
+        raise RuntimeError("Settings not initialized")
+    return settings
+
+
+def get_supabase_provider(request: Request) -> SupabaseClientProvider:
+    """取得 Supabase client provider（Singleton）。"""
+    provider = getattr(request.app.state, "supabase_provider", None)
+    if provider is None:
+        raise RuntimeError("Supabase client provider not initialized")
+    return provider
+
+
+def get_token_verifier(request: Request) -> TokenVerifier:
+    """取得 Token verifier（Singleton，金鑰與已驗證 token 快取跨請求共用）。"""
+    verifier = getattr(request.app.state, "token_verifier", None)
+    if verifier is None:
+        raise RuntimeError("Token verifier not initialized")
+    return verifier
+
+
+def get_health_monitor(request: Request) -> HealthMonitor:
+    """取得 Health monitor（Singleton）。"""
+    monitor = getattr(request.app.state, "health_monitor", None)
+    if monitor is None:
+        raise RuntimeError("Health monitor not initialized")
+    return monitor
+
+
+def get_cache(request: Request) -> CachePort:
+    """取得快取（Singleton，程序內 LRU 與後端連線跨請求共用）。"""
+    cache = getattr(request.app.state, "cache", None)
+    if cache is None:
+        raise RuntimeError("Cache not initialized")
+    return cache
+
+
+def get_auth_repository(request: Request) -> AsyncAuthRepository:
+    """取得 AuthRepository（Singleton，登入 session 快取跨請求共用，上游呼叫自動計時）。"""
+    auth_repository = getattr(request.app.state, "auth_repository", None)
+    if auth_repository is None:
+        raise RuntimeError("Auth repository not initialized")
+    return auth_repository
+
+
+def get_metrics(request: Request) -> Metrics:
+    """取得 Metrics（Singleton）。"""
+    metrics = getattr(request.app.state, "metrics", None)
+    if metrics is None:
+        raise RuntimeError("Metrics not initialized")
+    return metrics
+
+
+def get_resilience(request: Request) -> Resilience:
+    """取得上游韌性設定（Singleton，斷路器狀態跨請求共用）。"""
+    resilience = getattr(request.app.state, "resilience", None)
+    if resilience is None:
+        raise RuntimeError("Resilience not initialized")
+    return resilience
+
+
+def get_report_generator(request: Request) -> ReportGenerator:
+    """取得報告產生器（Singleton，快取與進行中的 LLM 呼叫跨請求共用）.
+
+    Raises:
+        HTTPException: 503，當未設定 LLM（OPENAI_API_KEY）時
+    """
+    generator = getattr(request.app.state, "report_generator", None)
+    if generator is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Report generation is not configured",
+        )
+    return generator
+
+
+def get_rate_limiter(request: Request) -> RateLimiter | None:
+    """取得限流器（Singleton；未建立時回傳 None，與 middleware 相同一律放行）。"""
+    return getattr(request.app.state, "rate_limiter", None)
+
+
+SettingsDep = Annotated[Settings, Depends(get_app_settings)]
+AuthRepositoryDep = Annotated[AsyncAuthRepository, Depends(get_auth_repository)]
+HealthMonitorDep = Annotated[HealthMonitor, Depends(get_health_monitor)]
+CacheDep = Annotated[CachePort, Depends(get_cache)]
+MetricsDep = Annotated[Metrics, Depends(get_metrics)]
+ReportGeneratorDep = Annotated[ReportGenerator, Depends(get_report_generator)]
+RateLimiterDep = Annotated[RateLimiter | None, Depends(get_rate_limiter)]
+
+# ============= 認證 =============
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+    token_verifier: Annotated[TokenVerifier, Depends(get_token_verifier)],
+) -> User:
+    """從 Authorization bearer token 取得目前使用者（本機驗證，不呼叫 Supabase）。
+
+    Raises:
+        HTTPException: 401，當缺少 token 或 token 無效時
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        use_case = VerifyTokenUseCase(token_verifier=token_verifier)
+        return await use_case.execute(credentials.credentials)
+    except InvalidTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
+
+
+async def get_access_token(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> str:
+    """取得已驗證的 bearer token（資料查詢以呼叫者身分送出，由 RLS 限制可讀取的資料）。"""
+    # get_current_user 已確認 token 存在且有效
+    return credentials.credentials
+
+
+CurrentUserDep = Annotated[User, Depends(get_current_user)]
+
+
+def require_role(*roles: str) -> Callable[..., Awaitable[User]]:
+    """建立要求特定角色的認證依賴.
+
+    角色取自 token 的 ``app_metadata.role``（只能由 service role 設定，使用者無法自行修改）。
+
+    Args:
+        roles: 允許的角色
+
+    Returns:
+        回傳目前使用者的 FastAPI dependency；角色不符時回應 403
+    """
+
+    async def dependency(
+        credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+        token_verifier: Annotated[TokenVerifier, Depends(get_token_verifier)],
+        current_user: CurrentUserDep,
+    ) -> User:
+        # get_current_user 已驗證過 token，再次 verify 會命中已驗證 token 快取
+        payload = await token_verifier.verify(credentials.credentials)
+        if (payload.get("app_metadata") or {}).get("role") not in roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions",
+            )
+        return current_user
+
+    return dependency
+
+
+# ============= Adapter 層（Factory - 每次建立新實例） =============
+
+
+# SnapshotRepository 的冪等讀取（上游慢時可 hedge）
+SNAPSHOT_READS = ("find_latest_by_product", "find_latest_by_products", "find_range")
+
+
+def get_snapshot_repository(
+    provider: Annotated[SupabaseClientProvider, Depends(get_supabase_provider)],
+    metrics: Annotated[Metrics, Depends(get_metrics)],
+    resilience: Annotated[Resilience, Depends(get_resilience)],
+    access_token: Annotated[str, Depends(get_access_token)],
+) -> SnapshotRepository:
+    """建立 SnapshotRepository（Factory，以呼叫者的 token 查詢套用 RLS；共用連線池與斷路器）。"""
+    client = provider.get_user_data_client(access_token)
+    return resilience.wrap(
+        metrics.instrument(SupabaseSnapshotRepository(supabase_client=client)),
+        port="SnapshotRepository",
+        hedged_methods=SNAPSHOT_READS,
+    )
+
+
+def get_product_repository(
+    provider: Annotated[SupabaseClientProvider, Depends(get_supabase_provider)],
+    metrics: Annotated[Metrics, Depends(get_metrics)],
+    resilience: Annotated[Resilience, Depends(get_resilience)],
+    access_token: Annotated[str, Depends(get_access_token)],
+) -> ProductRepository:
+    """建立 ProductRepository（Factory，以呼叫者的 token 查詢套用 RLS；共用連線池與斷路器）。"""
+    client = provider.get_user_data_client(access_token)
+    return resilience.wrap(
+        metrics.instrument(SupabaseProductRepository(supabase_client=client)),
+        port="ProductRepository",
+        hedged_methods=("find_by_id",),
+    )
+
+
+SnapshotRepositoryDep = Annotated[SnapshotRepository, Depends(get_snapshot_repository)]
+ProductRepositoryDep = Annotated[ProductRepository, Depends(get_product_repository)]
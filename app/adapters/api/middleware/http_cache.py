@@ -0,0 +1,163 @@
+"""HTTP cache middleware - GET 路由的 ETag / If-None-Match（304）、Cache-Control 與回應快取。
+
+以純 ASGI middleware 實作，依路由規則處理 GET 請求的 200 回應：
+
+- 單一 body 的回應：加上 strong ETag（回應已有 ETag 時沿用，例如 FileResponse），
+  If-None-Match 符合時改回 304（不傳 body）
+- 串流回應（多段 body）：直接轉送，只加 Cache-Control
+- ``store_body`` 的路由：保存已序列化的回應，命中時不再進入 app；
+  只用於與使用者無關、程序存活期間不變的回應，帶 Authorization header 的請求不讀寫快取
+- 快取命中不經過 router：以規則的 path 寫入 ``scope["route"]``，指標仍記在該路由下
+
+HttpCache 於 app lifespan 建立並放在 ``app.state.http_cache``；尚未建立時一律直接轉送。
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.http_cache import ResponseCache, etag_matches, strong_etag
+
+# 304 回應保留的 header（RFC 9110 15.4.5）
+_NOT_MODIFIED_HEADERS = frozenset({b"etag", b"cache-control", b"vary", b"expires"})
+
+
+@dataclass(frozen=True, slots=True)
+class CacheRule:
+    """單一路由的快取設定（path 結尾為 * 時為前綴比對）。"""
+
+    path: str
+    cache_control: str
+    store_body: bool = False
+
+    def matches(self, path: str) -> bool:
+        """判斷請求是否套用此設定。"""
+        if self.path.endswith("*"):
+            return path.startswith(self.path[:-1])
+        return path == self.path
+
+
+class HttpCache:
+    """依路由規則決定快取策略（第一條符合的規則生效）。"""
+
+    def __init__(self, rules: Sequence[CacheRule], store: ResponseCache | None = None):
+        """初始化 HttpCache.
+
+        Args:
+            rules: 路由規則（依序比對）
+            store: 已序列化回應的快取（None 時使用預設大小的 ResponseCache）
+        """
+        self.rules = tuple(rules)
+        self.store = store or ResponseCache()
+
+    def rule_for(self, path: str) -> CacheRule | None:
+        """取得套用於 path 的規則。"""
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule
+        return None
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _not_modified(headers: list[tuple[bytes, bytes]]) -> list[Message]:
+    return [
+        {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(k, v) for k, v in headers if k in _NOT_MODIFIED_HEADERS],
+        },
+        {"type": "http.response.body", "body": b""},
+    ]
+
+
+class HttpCacheMiddleware:
+    """GET 路由的條件式請求與回應快取 middleware（純 ASGI）。"""
+
+    def __init__(self, app: ASGIApp):
+        """初始化 HttpCacheMiddleware.
+
+        Args:
+            app: 下一層 ASGI app
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """處理 ASGI 請求。"""
+        cache: HttpCache | None = (
+            getattr(scope["app"].state, "http_cache", None)
+            if scope["type"] == "http" and scope["method"] == "GET"
+            else None
+        )
+        rule = cache.rule_for(scope["path"]) if cache is not None else None
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = _header(scope, b"if-none-match")
+        store = cache.store if rule.store_body and not _header(scope, b"authorization") else None
+        query = scope.get("query_string", b"")
+        if store is not None:
+            entry = store.get(scope["path"], query)
+            if entry is not None:
+                # 不進入 router：以規則（path 與 route 相同）作為 MetricsMiddleware 的 route label
+                scope["route"] = rule
+                if if_none_match and etag_matches(if_none_match, entry.etag):
+                    messages = _not_modified(entry.headers)
+                else:
+                    messages = [
+                        {"type": "http.response.start", "status": 200, "headers": entry.headers},
+                        {"type": "http.response.body", "body": entry.body},
+                    ]
+                for message in messages:
+                    await send(message)
+                return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # 等到第一段 body 才知道是否為單一 body 的回應
+                start = message
+                return
+
+            passthrough = True
+            headers = list(start.get("headers", []))
+            if start["status"] != 200:
+                await send(start)
+                await send(message)
+                return
+            names = {k.lower() for k, _ in headers}
+            if b"cache-control" not in names:
+                headers.append((b"cache-control", rule.cache_control.encode("latin-1")))
+            if message.get("more_body", False):
+                await send({**start, "headers": headers})
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            etag = next((v.decode("latin-1") for k, v in headers if k.lower() == b"etag"), None)
+            if etag is None:
+                etag = strong_etag(body)
+                headers.append((b"etag", etag.encode("latin-1")))
+            if store is not None:
+                store.put(scope["path"], query, headers, body, etag)
+            if if_none_match and etag_matches(if_none_match, etag):
+                for not_modified in _not_modified(headers):
+                    await send(not_modified)
+                return
+            await send({**start, "headers": headers})
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
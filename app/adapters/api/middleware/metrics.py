@@ -0,0 +1,52 @@
+"""Metrics middleware - 記錄每個請求的延遲、狀態碼與進行中請求數。
+
+以路由樣板（例如 ``/api/v1/products/{product_id}``）作為 label，避免 path 參數造成
+label 爆量；沒有對應路由的請求（404）記為 ``unmatched``。Metrics 於 app lifespan
+建立並放在 ``app.state.metrics``；尚未建立時不記錄。
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Prometheus 請求指標 middleware（純 ASGI）。"""
+
+    def __init__(self, app: ASGIApp):
+        """初始化 MetricsMiddleware.
+
+        Args:
+            app: 下一層 ASGI app
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """處理 ASGI 請求。"""
+        metrics = getattr(scope["app"].state, "metrics", None) if scope["type"] == "http" else None
+        if metrics is None:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = metrics.in_flight(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+            # 路由比對後 router 會把 route 寫回同一個 scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            metrics.observe_request(method, route, str(status_code), elapsed)
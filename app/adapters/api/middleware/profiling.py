@@ -0,0 +1,73 @@
+"""Profiling middleware - 對選中的請求執行取樣式 profiler。
+
+RequestProfiler 於 app lifespan 建立並放在 ``app.state.profiler``（未啟用時為 None，
+此時每個請求只多一次 getattr）。存檔模式下回應會帶 ``X-Profile-File`` header；
+inline 模式下原本的回應被丟棄，改回傳 profile 內容。
+"""
+
+import asyncio
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.profiling import RequestProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """請求層級 profiling middleware（純 ASGI）。"""
+
+    def __init__(self, app: ASGIApp):
+        """初始化 ProfilingMiddleware.
+
+        Args:
+            app: 下一層 ASGI app
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """處理 ASGI 請求。"""
+        profiler: RequestProfiler | None = (
+            getattr(scope["app"].state, "profiler", None) if scope["type"] == "http" else None
+        )
+        selected = profiler.select(scope) if profiler is not None else None
+        if selected is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_header(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-file", selected.filename.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        async def discard(message: Message) -> None:
+            pass
+
+        session = profiler.start()
+        try:
+            await self.app(scope, receive, discard if selected.inline else send_with_header)
+        finally:
+            content, content_type = profiler.render(session, selected.format)
+
+        if selected.inline:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", content_type.encode()),
+                        (b"content-length", str(len(content)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": content})
+            return
+
+        try:
+            path = await asyncio.to_thread(profiler.save, content, selected.filename)
+            logger.info("Saved request profile for %s to %s", scope["path"], path)
+        except OSError as e:
+            logger.warning("Failed to save request profile: %s", e)
@@ -0,0 +1,133 @@
+"""Rate limit middleware - 依路由設定的 per-IP / per-user token bucket 限流。
+
+以純 ASGI middleware 實作（不使用 BaseHTTPMiddleware），放行的請求只多一次規則比對
+與一至兩次 bucket 計數。RateLimiter 於 app lifespan 建立並放在 ``app.state.rate_limiter``；
+尚未建立時（例如 lifespan 之前）一律放行。
+
+Client IP 取自 ASGI scope；在 reverse proxy 之後請以 ``uvicorn --proxy-headers`` 還原。
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.rate_limit import RateLimitStore, TokenBucket, retry_after_seconds
+from app.use_cases.auth.ports import TokenVerifier
+from app.use_cases.exceptions import InvalidTokenError
+
+
+@dataclass(frozen=True, slots=True)
+class RouteLimit:
+    """單一路由的限流設定（path 結尾為 * 時為前綴比對）。"""
+
+    path: str
+    per_ip: TokenBucket | None = None
+    per_user: TokenBucket | None = None
+    methods: frozenset[str] | None = None
+
+    def matches(self, method: str, path: str) -> bool:
+        """判斷請求是否套用此設定。"""
+        if self.methods is not None and method not in self.methods:
+            return False
+        if self.path.endswith("*"):
+            return path.startswith(self.path[:-1])
+        return path == self.path
+
+
+class RateLimiter:
+    """依路由規則檢查 per-IP 與 per-user bucket（第一條符合的規則生效）。
+
+    每次 ``check`` 從符合規則的 bucket 各取一個 token；批次端點可對同一請求再次呼叫，
+    逐筆計入額度。
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        rules: Sequence[RouteLimit],
+        token_verifier: TokenVerifier | None = None,
+    ):
+        """初始化 RateLimiter.
+
+        Args:
+            store: Token bucket 計數儲存
+            rules: 路由規則（依序比對）
+            token_verifier: 用於取得 per-user key 的 Token verifier（None 時不做 per-user 限流）
+        """
+        self.store = store
+        self.rules = tuple(rules)
+        self.token_verifier = token_verifier
+
+    async def check(self, scope: Scope) -> float:
+        """檢查請求是否超過限制.
+
+        Args:
+            scope: ASGI HTTP scope
+
+        Returns:
+            float: 0 代表放行；否則為建議等待的秒數
+        """
+        method = scope["method"]
+        path = scope["path"]
+        for rule in self.rules:
+            if rule.matches(method, path):
+                break
+        else:
+            return 0.0
+
+        if rule.per_ip is not None:
+            client = scope.get("client")
+            ip = client[0] if client else "unknown"
+            wait = await self.store.acquire(f"ip:{rule.path}:{ip}", rule.per_ip)
+            if wait > 0:
+                return wait
+
+        if rule.per_user is not None and self.token_verifier is not None:
+            user_id = await self._user_id(scope)
+            if user_id is not None:
+                return await self.store.acquire(f"user:{rule.path}:{user_id}", rule.per_user)
+        return 0.0
+
+    async def _user_id(self, scope: Scope) -> str | None:
+        """從 Bearer token 取得使用者 ID（驗證失敗時視為匿名，交由端點回應 401）。"""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() != "bearer" or not token:
+                    return None
+                try:
+                    payload = await self.token_verifier.verify(token)
+                except InvalidTokenError:
+                    return None
+                return payload.get("sub")
+        return None
+
+
+class RateLimitMiddleware:
+    """超過限制時回應 429 與 Retry-After header。"""
+
+    def __init__(self, app: ASGIApp):
+        """初始化 RateLimitMiddleware.
+
+        Args:
+            app: 下一層 ASGI app
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """處理 ASGI 請求。"""
+        if scope["type"] == "http":
+            limiter: RateLimiter | None = getattr(scope["app"].state, "rate_limiter", None)
+            if limiter is not None:
+                wait = await limiter.check(scope)
+                if wait > 0:
+                    response = JSONResponse(
+                        {"detail": "Too Many Requests"},
+                        status_code=429,
+                        headers={"Retry-After": str(retry_after_seconds(wait))},
+                    )
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
@@ -0,0 +1,73 @@
+"""API responses - 直接將 use case 結果（dataclass）編碼為 JSON / NDJSON 的 Response。"""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+
+class DataclassJSONResponse(Response):
+    """以 orjson 直接序列化 dataclass / datetime / dict 的 JSON Response.
+
+    Router 回傳此 Response 時 FastAPI 不再經過 response_model 驗證與轉換，
+    response_model 只用於產生 OpenAPI 文件，因此兩者欄位必須一致。
+    datetime 以 ISO 8601 輸出（與 ``datetime.isoformat()`` 相同）。
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """序列化回應內容。"""
+        return orjson.dumps(content)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def ndjson_stream(
+    items: AsyncIterator[Any], flush_bytes: int = 64 * 1024
+) -> AsyncIterator[bytes]:
+    """將 async iterator 的每個項目編碼為一行 JSON（供 StreamingResponse 使用）.
+
+    第一行立即送出（縮短 time-to-first-byte），之後累積約 ``flush_bytes`` 再送出，
+    避免每行一個 ASGI message。
+
+    Args:
+        items: dataclass / dict 等 orjson 可序列化的項目
+        flush_bytes: 每次送出的大約位元組數
+
+    Yields:
+        bytes: NDJSON 片段
+    """
+    buffer = bytearray()
+    first = True
+    async for item in items:
+        buffer += orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+        if first or len(buffer) >= flush_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+            first = False
+    if buffer:
+        yield bytes(buffer)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """邊讀取 request body 邊串流回應的 Response.
+
+    StreamingResponse 會在背景呼叫 ``receive`` 監聽 client 中斷，與仍在讀取 body 的
+    iterator 搶同一個 receive channel（body 片段會被丟棄）。此類別不另外監聽，
+    client 中斷改由讀取 body 時的 ClientDisconnect 或送出失敗得知。
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """送出串流回應。"""
+        try:
+            await self.stream_response(send)
+        except OSError as e:
+            raise ClientDisconnect() from e
+        if self.background is not None:
+            await self.background()
@@ -1,26 +1,69 @@
 """Authentication API router - Thin adapter layer."""
 
-from fastapi import APIRouter, HTTPException, status
+from collections.abc import AsyncIterator
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import ValidationError
+
+from app.adapters.api.dependencies import (
+    AuthRepositoryDep,
+    CacheDep,
+    CurrentUserDep,
+    RateLimiterDep,
+    SettingsDep,
+    bearer_scheme,
+    require_role,
+)
+from app.adapters.api.middleware.rate_limit import RateLimiter
+from app.adapters.api.responses import (
+    NDJSON_MEDIA_TYPE,
+    DataclassJSONResponse,
+    DuplexStreamingResponse,
+    ndjson_stream,
+)
 from app.adapters.api.schemas.auth import (
+    BulkSignupItem,
+    BulkSignupItemResponse,
+    BulkSignupRequest,
     LoginRequest,
     LoginResponse,
     SignupRequest,
     SignupResponse,
     UserResponse,
 )
-from app.adapters.repositories.supabase_auth_repository import (
-    SupabaseAuthRepository,
+from app.domain.entities.user import User
+from app.infrastructure.config import Settings
+from app.infrastructure.rate_limit import retry_after_seconds
+from app.infrastructure.resilience import is_upstream_failure
+from app.use_cases.auth.bulk_signup_use_case import (
+    AsyncBulkSignupUseCase,
+    InvalidSignupItem,
+    SignupItem,
 )
-from app.infrastructure.supabase_client import get_supabase_client
-from app.use_cases.auth.login_use_case import LoginUseCase
-from app.use_cases.auth.signup_use_case import SignupUseCase
+from app.use_cases.auth.login_use_case import AsyncLoginUseCase
+from app.use_cases.auth.logout_use_case import AsyncLogoutUseCase
+from app.use_cases.auth.signup_use_case import AsyncSignupUseCase
+from app.use_cases.exceptions import UpstreamUnavailableError
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 
-# 建立 Supabase client 和 Repository（module level singleton）
-supabase = get_supabase_client()
-auth_repository = SupabaseAuthRepository(supabase_client=supabase)
+# NDJSON 單行上限：超過時視為格式錯誤並停止讀取（避免無換行的 body 佔滿記憶體）
+MAX_NDJSON_LINE_BYTES = 64 * 1024
+
+# 上游故障訊息不含原始錯誤（連線錯誤可能帶有內部主機資訊）
+UPSTREAM_UNAVAILABLE_DETAIL = "Authentication service unavailable"
+
+# 可批次建立帳號的角色（token 的 app_metadata.role）
+BULK_SIGNUP_ROLES = ("admin", "agency")
+
+
+def _upstream_unavailable(settings: Settings) -> UpstreamUnavailableError:
+    """將上游故障（連線錯誤、逾時、5xx、429）轉為 503，而非當成帳密錯誤回應 4xx。"""
+    return UpstreamUnavailableError(
+        UPSTREAM_UNAVAILABLE_DETAIL, retry_after=settings.upstream_circuit_recovery_seconds
+    )
 
 
 @router.post(
@@ -29,39 +72,219 @@ auth_repository = SupabaseAuthRepository(supabase_client=supabase)
     status_code=status.HTTP_201_CREATED,
     summary="使用者註冊",
 )
-async def signup(request: SignupRequest) -> SignupResponse:
-    """使用者註冊端點。"""
+async def signup(request: SignupRequest, auth_repository: AuthRepositoryDep, settings: SettingsDep):
+    """使用者註冊端點（SignupResult 直接編碼，欄位與 SignupResponse 相同）。"""
     try:
-        use_case = SignupUseCase(auth_repo=auth_repository)
-        result = use_case.execute(email=request.email, password=request.password)
-        return SignupResponse(
-            user=UserResponse(id=result.user.id, email=result.user.email),
-            message=result.message,
-        )
+        use_case = AsyncSignupUseCase(auth_repo=auth_repository)
+        result = await use_case.execute(email=request.email, password=request.password)
+        return DataclassJSONResponse(result, status_code=status.HTTP_201_CREATED)
+    except UpstreamUnavailableError:
+        raise  # 由 app 的 exception handler 回應 503
     except Exception as e:
+        if is_upstream_failure(e):
+            raise _upstream_unavailable(settings) from e
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         ) from e
 
 
+def _to_signup_item(item: BulkSignupItem) -> SignupItem:
+    return SignupItem(
+        email=item.email, password=item.password, idempotency_key=item.idempotency_key
+    )
+
+
+def _parse_line(line: bytes) -> SignupItem | InvalidSignupItem:
+    try:
+        return _to_signup_item(BulkSignupItem.model_validate_json(line))
+    except ValidationError as e:
+        return InvalidSignupItem(error=f"Invalid item: {e.errors()[0]['msg']}")
+
+
+async def _ndjson_items(
+    request: Request, max_items: int
+) -> AsyncIterator[SignupItem | InvalidSignupItem]:
+    """逐行解析 NDJSON body（邊收邊註冊，不等整個 body 上傳完成）。"""
+    buffer = b""
+    count = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > MAX_NDJSON_LINE_BYTES:
+            yield InvalidSignupItem(error="Line too long")
+            return
+        for line in lines:
+            if not line.strip():
+                continue
+            if count >= max_items:
+                yield InvalidSignupItem(error=f"Too many items (max {max_items})")
+                return
+            count += 1
+            yield _parse_line(line)
+    if buffer.strip():
+        yield (
+            _parse_line(buffer)
+            if count < max_items
+            else InvalidSignupItem(error=f"Too many items (max {max_items})")
+        )
+
+
+async def _batch_items(items: list[BulkSignupItem]) -> AsyncIterator[SignupItem]:
+    for item in items:
+        yield _to_signup_item(item)
+
+
+async def _rate_limited_items(
+    items: AsyncIterator[SignupItem | InvalidSignupItem],
+    limiter: RateLimiter | None,
+    request: Request,
+) -> AsyncIterator[SignupItem | InvalidSignupItem]:
+    """逐筆計入呼叫者的批次註冊額度（第一筆已由 middleware 計入）；用完時回報錯誤並停止讀取。"""
+    charged = 0
+    async for item in items:
+        if isinstance(item, SignupItem) and limiter is not None:
+            charged += 1
+            wait = await limiter.check(request.scope) if charged > 1 else 0.0
+            if wait > 0:
+                yield InvalidSignupItem(
+                    error=f"Too Many Requests (retry after {retry_after_seconds(wait)}s)"
+                )
+                return
+        yield item
+
+
+_BULK_ITEM_SCHEMA = BulkSignupItem.model_json_schema()
+
+
+@router.post(
+    "/signup/bulk",
+    response_model=BulkSignupItemResponse,
+    status_code=status.HTTP_200_OK,
+    summary="批次註冊使用者",
+    description=(
+        '以 JSON（`{"users": [...]}`）或 NDJSON（`Content-Type: application/x-ndjson`，'
+        "每行一筆）送出多筆註冊，以有界並行執行，並以 NDJSON 依完成順序逐筆回傳結果"
+        "（`index` 對應輸入順序，單筆失敗不影響其他筆）。帶 `idempotency_key` 的項目"
+        "成功後重送會回傳原結果（`replayed: true`），不會重複建立使用者。"
+        "需 `admin` 或 `agency` 角色；每筆項目計入呼叫者的批次註冊額度，額度用完時"
+        "該筆回傳錯誤並停止處理後續項目"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["users"],
+                        "properties": {"users": {"type": "array", "items": _BULK_ITEM_SCHEMA}},
+                    }
+                },
+                NDJSON_MEDIA_TYPE: {"schema": _BULK_ITEM_SCHEMA},
+            },
+        }
+    },
+)
+async def bulk_signup(
+    request: Request,
+    current_user: Annotated[User, Depends(require_role(*BULK_SIGNUP_ROLES))],
+    auth_repository: AuthRepositoryDep,
+    cache: CacheDep,
+    settings: SettingsDep,
+    rate_limiter: RateLimiterDep,
+):
+    """批次註冊端點（需 admin / agency 角色；冪等 key 以呼叫者區分，結果以 NDJSON 串流）。"""
+    max_items = settings.bulk_signup_max_items
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(NDJSON_MEDIA_TYPE):
+        items = _ndjson_items(request, max_items)
+    else:
+        try:
+            batch = BulkSignupRequest.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=e.errors(include_url=False, include_context=False),
+            ) from e
+        if len(batch.users) > max_items:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"Too many items (max {max_items})",
+            )
+        items = _batch_items(batch.users)
+
+    use_case = AsyncBulkSignupUseCase(
+        auth_repo=auth_repository,
+        cache=cache,
+        concurrency=settings.bulk_signup_concurrency,
+        idempotency_ttl_seconds=settings.bulk_signup_idempotency_ttl_seconds,
+    )
+    items = _rate_limited_items(items, rate_limiter, request)
+    results = use_case.stream(items, scope=current_user.id)
+    # 每筆結果完成即送出（不累積成大區塊）；NDJSON body 於送出回應期間才讀取
+    return DuplexStreamingResponse(
+        ndjson_stream(results, flush_bytes=0), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
 @router.post(
     "/login",
     response_model=LoginResponse,
     status_code=status.HTTP_200_OK,
     summary="使用者登入",
 )
-async def login(request: LoginRequest) -> LoginResponse:
-    """使用者登入端點。"""
+async def login(request: LoginRequest, auth_repository: AuthRepositoryDep, settings: SettingsDep):
+    """使用者登入端點（LoginResult 直接編碼，欄位與 LoginResponse 相同）。"""
     try:
-        use_case = LoginUseCase(auth_repo=auth_repository)
-        result = use_case.execute(email=request.email, password=request.password)
-        return LoginResponse(
-            access_token=result.access_token,
-            user=UserResponse(id=result.user.id, email=result.user.email),
-        )
+        use_case = AsyncLoginUseCase(auth_repo=auth_repository)
+        result = await use_case.execute(email=request.email, password=request.password)
+        return DataclassJSONResponse(result)
+    except UpstreamUnavailableError:
+        raise  # 由 app 的 exception handler 回應 503
     except Exception as e:
+        if is_upstream_failure(e):
+            raise _upstream_unavailable(settings) from e
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
         ) from e
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="使用者登出",
+)
+async def logout(
+    current_user: CurrentUserDep,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
+    auth_repository: AuthRepositoryDep,
+    settings: SettingsDep,
+):
+    """使用者登出端點（需 Bearer token；撤銷所有 session，快取的登入一併失效）。"""
+    try:
+        use_case = AsyncLogoutUseCase(auth_repo=auth_repository)
+        await use_case.execute(credentials.credentials)
+    except UpstreamUnavailableError:
+        raise  # 由 app 的 exception handler 回應 503
+    except Exception as e:
+        if is_upstream_failure(e):
+            raise _upstream_unavailable(settings) from e
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get(
+    "/me",
+    response_model=UserResponse,
+    status_code=status.HTTP_200_OK,
+    summary="取得目前使用者",
+)
+async def me(current_user: CurrentUserDep):
+    """取得目前登入的使用者（需 Bearer token，於本機驗證；User 直接編碼）。"""
+    return DataclassJSONResponse(current_user)
@@ -1,40 +1,66 @@
 """Health check API router - Thin adapter layer."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 
-from app.adapters.repositories.supabase_database_repository import (
-    SupabaseDatabaseRepository,
-)
-from app.infrastructure.supabase_client import get_supabase_client
-from app.use_cases.health.health_check_use_case import HealthCheckUseCase
+from app.adapters.api.dependencies import HealthMonitorDep
+from app.adapters.api.responses import DataclassJSONResponse
 
 router = APIRouter(tags=["System"])
 
-# 建立 Supabase client 和 Repository（module level singleton）
-supabase = get_supabase_client()
-db_repository = SupabaseDatabaseRepository(supabase_client=supabase)
-
 
 @router.get(
     "/health",
     summary="健康檢查",
-    description="檢查 API 服務與資料庫連線是否正常",
+    description="檢查 API 服務與資料庫連線是否正常（資料庫狀態為背景探測的最後結果）",
     response_description="服務健康狀態與當前時間戳記",
 )
-async def health_check():
+async def health_check(health_monitor: HealthMonitorDep):
     """健康檢查端點。
 
     用於監控服務是否正常運作，通常由負載平衡器或監控系統呼叫。
-    包含資料庫連線測試。
+    資料庫狀態取自背景探測（於 app lifespan 啟動）的最後結果，不會在請求中呼叫上游。
+
+    Returns:
+        DataclassJSONResponse: HealthCheckResult（服務狀態、資料庫連線狀態與 UTC 時間戳記）
+    """
+    return DataclassJSONResponse(await health_monitor.latest())
+
+
+@router.get(
+    "/livez",
+    summary="Liveness 檢查",
+    description="程序存活檢查，不檢查任何外部依賴",
+)
+async def liveness():
+    """Liveness 端點（不做任何 I/O）。
+
+    Returns:
+        dict: 固定回傳 {"status": "alive"}
+    """
+    return {"status": "alive"}
+
+
+@router.get(
+    "/readyz",
+    summary="Readiness 檢查",
+    description="回傳最後一次依賴探測結果；資料庫未連線或結果過期時回應 503",
+    responses={503: {"description": "依賴未就緒或探測結果過期"}},
+)
+async def readiness(response: Response, health_monitor: HealthMonitorDep):
+    """Readiness 端點。
 
     Returns:
-        dict: 包含服務狀態、資料庫連線狀態與 UTC 時間戳記
+        dict: 包含 ready 狀態、資料庫狀態、探測時間、結果年齡與是否過期
     """
-    use_case = HealthCheckUseCase(db_repo=db_repository)
-    result = use_case.execute()
+    result = health_monitor.readiness()
+    if not result.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     return {
-        "status": result.status,
+        "status": "ready" if result.ready else "not_ready",
         "database": result.database,
-        "timestamp": result.timestamp.isoformat(),
+        "checked_at": result.checked_at.isoformat() if result.checked_at else None,
+        "age_seconds": round(result.age_seconds, 3) if result.age_seconds is not None else None,
+        "latency_ms": round(result.latency_ms, 3) if result.latency_ms is not None else None,
+        "stale": result.stale,
     }
@@ -0,0 +1,14 @@
+"""Metrics router - Prometheus scrape endpoint."""
+
+from fastapi import APIRouter, Response
+
+from app.adapters.api.dependencies import MetricsDep
+
+router = APIRouter(tags=["System"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(app_metrics: MetricsDep) -> Response:
+    """Prometheus 指標端點（text exposition format）。"""
+    content, content_type = app_metrics.render()
+    return Response(content=content, media_type=content_type)
@@ -0,0 +1,72 @@
+"""Product API router - Thin adapter layer."""
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.adapters.api.dependencies import (
+    CurrentUserDep,
+    ProductRepositoryDep,
+    SnapshotRepositoryDep,
+)
+from app.adapters.api.responses import NDJSON_MEDIA_TYPE, DataclassJSONResponse, ndjson_stream
+from app.adapters.api.schemas.products import HistoryPageResponse
+from app.use_cases.exceptions import InvalidCursorError, ProductNotFoundError
+from app.use_cases.product.get_product_history_use_case import (
+    GetProductHistoryUseCase,
+    decode_cursor,
+)
+
+router = APIRouter(prefix="/api/v1/products", tags=["Products"])
+
+
+@router.get(
+    "/{product_id}/history",
+    response_model=HistoryPageResponse,
+    status_code=status.HTTP_200_OK,
+    summary="產品歷史時序",
+    description=(
+        "依 scraped_at 由舊到新回傳快照時序，以 `cursor`（上一頁的 `next_cursor`）分頁。"
+        "`resolution` 可降採樣為每日 / 每週最後一筆，或以 LTTB 保留 `metric` 的形狀"
+        "（最多 `points` 筆，不分頁）。`stream=true` 時以 NDJSON 串流回傳整個區間（不分頁）。"
+        "產品不存在或不屬於目前使用者時回傳 404"
+    ),
+)
+async def get_product_history(
+    product_id: str,
+    snapshot_repo: SnapshotRepositoryDep,
+    product_repo: ProductRepositoryDep,
+    current_user: CurrentUserDep,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    resolution: Literal["raw", "daily", "weekly", "lttb"] = "raw",
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=10000)] = 1000,
+    points: Annotated[int, Query(ge=3, le=10000)] = 1000,
+    metric: Literal["bsr_main", "bsr_sub", "price", "buybox_price", "rating", "review_count"] = (
+        "bsr_main"
+    ),
+    stream: bool = False,
+):
+    """產品歷史時序端點（需 Bearer token；HistoryPage 直接編碼，欄位與 HistoryPageResponse 相同）。"""
+    use_case = GetProductHistoryUseCase(snapshot_repo=snapshot_repo, product_repo=product_repo)
+    try:
+        await use_case.ensure_owner(product_id, current_user.id)
+    except ProductNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Product not found"
+        ) from e
+    try:
+        if stream:
+            # 游標於開始串流前解碼，格式錯誤時仍可回傳 400
+            after = decode_cursor(cursor) if cursor else None
+            points_iter = use_case.stream(product_id, start, end, resolution, after, points, metric)
+            return StreamingResponse(ndjson_stream(points_iter), media_type=NDJSON_MEDIA_TYPE)
+        page = await use_case.execute(
+            product_id, start, end, resolution, cursor, limit, points, metric
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return DataclassJSONResponse(page)
@@ -0,0 +1,50 @@
+"""Report API router - Thin adapter layer."""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.adapters.api.dependencies import CurrentUserDep, ReportGeneratorDep
+from app.adapters.api.responses import DataclassJSONResponse
+from app.adapters.api.schemas.reports import ReportRequest, ReportResponse
+
+router = APIRouter(prefix="/api/v1/reports", tags=["Reports"])
+
+
+@router.post(
+    "/{kind}",
+    response_model=ReportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="產生報告",
+    description=(
+        "以 LLM 產生報告（competitive-positioning、listing-suggestions）。"
+        "相同輸入與 prompt 版本直接回傳快取；`stream=true` 時以 text/plain 逐段回傳"
+    ),
+)
+async def generate_report(
+    kind: str,
+    request: ReportRequest,
+    generator: ReportGeneratorDep,
+    current_user: CurrentUserDep,
+    stream: bool = False,
+):
+    """產生報告端點（需 Bearer token；Report 直接編碼，欄位與 ReportResponse 相同）。"""
+    try:
+        key, _ = generator.prepare(kind, request.data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    if stream:
+        return StreamingResponse(
+            generator.stream(kind, request.data),
+            media_type="text/plain; charset=utf-8",
+            headers={"X-Report-Key": key},
+        )
+    try:
+        return DataclassJSONResponse(
+            await generator.generate(kind, request.data, tenant=current_user.id)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Report generation failed: {e}",
+        ) from e
@@ -1,6 +1,6 @@
 """Authentication API schemas - Request/Response models."""
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 
 class UserResponse(BaseModel):
@@ -36,3 +36,28 @@ class LoginResponse(BaseModel):
 
     access_token: str
     user: UserResponse
+
+
+class BulkSignupItem(BaseModel):
+    """批次註冊的單筆輸入（NDJSON 每行一筆）。"""
+
+    email: EmailStr
+    password: str
+    idempotency_key: str | None = Field(default=None, min_length=1, max_length=200)
+
+
+class BulkSignupRequest(BaseModel):
+    """批次註冊請求（JSON）。"""
+
+    users: list[BulkSignupItem]
+
+
+class BulkSignupItemResponse(BaseModel):
+    """批次註冊的單筆結果（NDJSON 每行一筆，依完成順序）。"""
+
+    index: int
+    status: str
+    email: str | None = None
+    user: UserResponse | None = None
+    error: str | None = None
+    replayed: bool = False
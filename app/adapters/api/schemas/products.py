@@ -0,0 +1,25 @@
+"""Product API schemas - Request/Response models."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class HistoryPointResponse(BaseModel):
+    """時序中的一個點。"""
+
+    scraped_at: datetime
+    price: float | None
+    buybox_price: float | None
+    currency: str
+    bsr_main: int | None
+    bsr_sub: int | None
+    rating: float | None
+    review_count: int | None
+
+
+class HistoryPageResponse(BaseModel):
+    """一頁產品歷史時序。"""
+
+    items: list[HistoryPointResponse]
+    next_cursor: str | None
@@ -0,0 +1,20 @@
+"""Report API schemas - Request/Response models."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ReportRequest(BaseModel):
+    """報告請求（data 為報告輸入，例如競品比較矩陣或商品資料）。"""
+
+    data: dict[str, Any]
+
+
+class ReportResponse(BaseModel):
+    """報告回應。"""
+
+    kind: str
+    key: str
+    content: str
+    cached: bool
@@ -0,0 +1 @@
+"""External service adapters - 實作 use_cases ports 的外部服務適配器。"""
@@ -0,0 +1,67 @@
+"""Cached Scraper - 以 CachePort 包裝任一 ScraperPort，減少付費爬蟲呼叫。"""
+
+import json
+from dataclasses import asdict
+from decimal import Decimal
+
+from app.use_cases.cache.ports import CachePort
+from app.use_cases.product.ports import ScrapedProductData, ScraperPort
+
+_DECIMAL_FIELDS = ("price", "buybox_price")
+
+
+class CachedScraper(ScraperPort):
+    """快取爬取結果的 Scraper decorator（預設新鮮 24 小時，之後 24 小時內回舊值並背景更新）。"""
+
+    def __init__(
+        self,
+        scraper: ScraperPort,
+        cache: CachePort,
+        ttl_seconds: float = 24 * 3600,
+        stale_seconds: float = 24 * 3600,
+    ):
+        """初始化 CachedScraper.
+
+        Args:
+            scraper: 實際爬取的 Scraper（依賴抽象）
+            cache: 快取實例（依賴抽象）
+            ttl_seconds: 爬取結果視為新鮮的秒數
+            stale_seconds: 過期後仍可回傳舊值（並背景更新）的秒數
+        """
+        self.scraper = scraper
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+
+    def host_for(self, asin: str) -> str:
+        """沿用被包裝 Scraper 的 host 分配（實作）。"""
+        return self.scraper.host_for(asin)
+
+    async def scrape_product(self, asin: str) -> ScrapedProductData:
+        """先查快取，未命中時才爬取（實作，同一 ASIN 同時只會爬取一次）。"""
+
+        async def load() -> bytes:
+            return _encode(await self.scraper.scrape_product(asin))
+
+        payload = await self.cache.get_or_load(
+            f"scrape:{asin}", load, self.ttl_seconds, self.stale_seconds
+        )
+        return _decode(payload)
+
+
+def _encode(data: ScrapedProductData) -> bytes:
+    """序列化爬取結果（Decimal 以字串保存避免精度損失）。"""
+    row = asdict(data)
+    for name in _DECIMAL_FIELDS:
+        if row[name] is not None:
+            row[name] = str(row[name])
+    return json.dumps(row, separators=(",", ":")).encode()
+
+
+def _decode(payload: bytes) -> ScrapedProductData:
+    """反序列化爬取結果。"""
+    row = json.loads(payload)
+    for name in _DECIMAL_FIELDS:
+        if row[name] is not None:
+            row[name] = Decimal(row[name])
+    return ScrapedProductData(**row)
@@ -0,0 +1,81 @@
+"""Email notifier - 以 SMTP 寄出警報摘要。
+
+smtplib 為同步 API：每次寄送在 thread 中執行，同時寄送數由 dispatcher 的 concurrency 限制
+（每封信一條 SMTP 連線，避免共用連線的狀態問題）。
+"""
+
+import asyncio
+import smtplib
+from email.message import EmailMessage
+
+from app.use_cases.exceptions import NotificationDeliveryError
+from app.use_cases.notification.ports import Digest, NotificationChannel, Recipient
+from app.use_cases.notification.templates import render_text
+
+
+class EmailNotifier(NotificationChannel):
+    """SMTP 通知通道。"""
+
+    name = "email"
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 25,
+        sender: str = "alerts@localhost",
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = False,
+        timeout_seconds: float = 10.0,
+    ):
+        """初始化 EmailNotifier.
+
+        Args:
+            host: SMTP 主機
+            port: SMTP port
+            sender: 寄件者地址
+            username: SMTP 帳號（None 時不登入）
+            password: SMTP 密碼
+            use_tls: 是否以 STARTTLS 加密
+            timeout_seconds: 連線逾時秒數
+        """
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout_seconds = timeout_seconds
+
+    def accepts(self, recipient: Recipient) -> bool:
+        """只寄給有 email 的收件者（實作）。"""
+        return recipient.email is not None
+
+    async def send(self, digest: Digest) -> None:
+        """寄出摘要（實作）。"""
+        subject, body = render_text(digest)
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = digest.recipient.email
+        message["Subject"] = subject
+        message["Message-ID"] = f"<{digest.id}@iv-transbiz>"
+        message.set_content(body)
+        await asyncio.to_thread(self._send_sync, message)
+
+    def _send_sync(self, message: EmailMessage) -> None:
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds) as smtp:
+                if self.use_tls:
+                    smtp.starttls()
+                if self.username:
+                    smtp.login(self.username, self.password or "")
+                smtp.send_message(message)
+        except smtplib.SMTPRecipientsRefused as e:
+            raise NotificationDeliveryError(f"Recipient refused: {e}", retryable=False) from e
+        except smtplib.SMTPResponseException as e:
+            # 5xx 為永久錯誤，4xx 為暫時錯誤
+            raise NotificationDeliveryError(
+                f"SMTP error {e.smtp_code}: {e.smtp_error!r}", retryable=e.smtp_code < 500
+            ) from e
+        except (smtplib.SMTPException, OSError) as e:
+            raise NotificationDeliveryError(f"SMTP delivery failed: {e}") from e
@@ -0,0 +1,119 @@
+"""Fake Listing Scraper 實作 - 本機 / benchmark 用，不呼叫 Apify。
+
+依站點輸出當地格式的原始資料（"1.299,99 €"、"4,5 von 5 Sternen"、"5つ星のうち4.5" 等），
+用來驗證正規化階段；延遲、失敗率可調整，相同 ASIN 在同一個 seed 下回傳相同資料。
+"""
+
+import asyncio
+import random
+from decimal import Decimal
+
+from app.use_cases.competitor.ports import ListingScraperPort, ProductRef, RawListing
+
+
+def _format_number(value: Decimal, decimals: int, decimal_comma: bool) -> str:
+    text = f"{value:,.{decimals}f}"
+    if decimal_comma:
+        text = text.replace(",", "_").replace(".", ",").replace("_", ".")
+    return text
+
+
+class FakeListingScraper(ListingScraperPort):
+    """可調整延遲與失敗率、輸出各站點原始格式的假商品頁爬蟲。"""
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.1,
+        jitter_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+        latencies: dict[str, float] | None = None,
+        failing_asins: frozenset[str] = frozenset(),
+        seed: int = 0,
+    ):
+        """初始化 FakeListingScraper.
+
+        Args:
+            latency_seconds: 每次爬取的基本延遲（秒）
+            jitter_seconds: 在基本延遲上額外加入的隨機延遲上限（秒）
+            failure_rate: 每次爬取失敗的機率（0-1）
+            latencies: 指定 ASIN 的固定延遲（秒），優先於 latency_seconds
+            failing_asins: 一定失敗的 ASIN
+            seed: 亂數種子
+        """
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.failure_rate = failure_rate
+        self.latencies = latencies or {}
+        self.failing_asins = failing_asins
+        self.seed = seed
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._random = random.Random(seed)
+
+    async def fetch_listing(self, ref: ProductRef) -> RawListing:
+        """模擬爬取商品頁（實作）。
+
+        Raises:
+            RuntimeError: ASIN 列於 failing_asins，或依 failure_rate 隨機失敗
+        """
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            latency = self.latencies.get(ref.asin)
+            if latency is None:
+                latency = self.latency_seconds + self._random.uniform(0, self.jitter_seconds)
+            await asyncio.sleep(latency)
+            if ref.asin in self.failing_asins or self._random.random() < self.failure_rate:
+                raise RuntimeError(f"Fake fetch failed for {ref.asin}")
+        finally:
+            self.in_flight -= 1
+
+        rng = random.Random(f"{self.seed}:{ref.asin}")
+        price = Decimal(rng.randint(500, 20000)) / 100
+        rating = Decimal(rng.randint(10, 50)) / 10
+        reviews = Decimal(rng.randint(0, 50_000))
+        bsr_main, bsr_sub = rng.randint(1, 500_000), rng.randint(1, 5_000)
+
+        if ref.marketplace == "amazon.co.jp":
+            return RawListing(
+                asin=ref.asin,
+                marketplace=ref.marketplace,
+                title=f"製品 {ref.asin}",
+                price=f"￥{_format_number(price * 150, 0, False)}",
+                currency=None,
+                rating=f"5つ星のうち{rating}",
+                review_count=f"{_format_number(reviews, 0, False)}個の評価",
+                breadcrumbs="家電&カメラ › ヘッドホン・イヤホン",
+            )
+        if ref.marketplace in ("amazon.de", "amazon.fr", "amazon.it", "amazon.es"):
+            return RawListing(
+                asin=ref.asin,
+                marketplace=ref.marketplace,
+                title=f"Produkt {ref.asin}",
+                price=f"{_format_number(price, 2, True)} €",
+                currency="€",
+                rating=f"{_format_number(rating, 1, True)} von 5 Sternen",
+                review_count=f"{_format_number(reviews, 0, True)} Sternebewertungen",
+                bsr=(
+                    f"Nr. {_format_number(Decimal(bsr_main), 0, True)} in Elektronik & Foto "
+                    "(Siehe Top 100 in Elektronik & Foto)",
+                    f"Nr. {_format_number(Decimal(bsr_sub), 0, True)} in Kopfhörer",
+                ),
+            )
+        return RawListing(
+            asin=ref.asin,
+            marketplace=ref.marketplace,
+            title=f"Product {ref.asin}",
+            price=f"${_format_number(price, 2, False)}",
+            currency="$",
+            rating=f"{rating} out of 5 stars",
+            review_count=f"{_format_number(reviews, 0, False)} ratings",
+            bsr=(
+                f"#{_format_number(Decimal(bsr_main), 0, False)} in Electronics "
+                "(See Top 100 in Electronics)",
+                f"#{_format_number(Decimal(bsr_sub), 0, False)} in Earbud & In-Ear Headphones",
+            ),
+            breadcrumbs="Electronics › Headphones, Earbuds & Accessories › Earbud Headphones",
+        )
@@ -0,0 +1,77 @@
+"""Fake Scraper 實作 - 本機 / benchmark 用，不呼叫 Apify。
+
+延遲、失敗率與 host 分布皆可調整；相同 ASIN 回傳的資料在同一個 seed 下可重現。
+"""
+
+import asyncio
+import random
+import zlib
+from decimal import Decimal
+
+from app.use_cases.product.ports import ScrapedProductData, ScraperPort
+
+
+class FakeScraper(ScraperPort):
+    """可調整延遲與失敗率的假爬蟲。"""
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.1,
+        jitter_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+        hosts: tuple[str, ...] = ("default",),
+        seed: int = 0,
+    ):
+        """初始化 FakeScraper.
+
+        Args:
+            latency_seconds: 每次爬取的基本延遲（秒）
+            jitter_seconds: 在基本延遲上額外加入的隨機延遲上限（秒）
+            failure_rate: 每次爬取失敗的機率（0-1）
+            hosts: ASIN 會被分配到的上游 host
+            seed: 亂數種子
+        """
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.failure_rate = failure_rate
+        self.hosts = hosts
+        self.seed = seed
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._random = random.Random(seed)
+
+    def host_for(self, asin: str) -> str:
+        """依 ASIN 固定分配 host（實作）。"""
+        return self.hosts[zlib.crc32(asin.encode()) % len(self.hosts)]
+
+    async def scrape_product(self, asin: str) -> ScrapedProductData:
+        """模擬爬取產品資料（實作）。
+
+        Raises:
+            RuntimeError: 依 failure_rate 隨機失敗
+        """
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency_seconds + self._random.uniform(0, self.jitter_seconds))
+            if self._random.random() < self.failure_rate:
+                raise RuntimeError(f"Fake scrape failed for {asin}")
+        finally:
+            self.in_flight -= 1
+
+        rng = random.Random(f"{self.seed}:{asin}")
+        price = Decimal(rng.randint(500, 20000)) / 100
+        return ScrapedProductData(
+            asin=asin,
+            title=f"Product {asin}",
+            category="Electronics",
+            price=price,
+            currency="USD",
+            bsr_main=rng.randint(1, 500_000),
+            bsr_sub=rng.randint(1, 5_000),
+            rating=round(rng.uniform(1, 5), 1),
+            review_count=rng.randint(0, 50_000),
+            buybox_price=price,
+        )
@@ -0,0 +1,27 @@
+"""Log notifier - 將警報摘要寫入應用程式 log（開發環境與稽核用）。"""
+
+import logging
+
+from app.use_cases.notification.ports import Digest, NotificationChannel
+from app.use_cases.notification.templates import render_text
+
+logger = logging.getLogger(__name__)
+
+
+class LogNotifier(NotificationChannel):
+    """以 logging 輸出的通知通道。"""
+
+    name = "log"
+
+    def __init__(self, level: int = logging.INFO):
+        """初始化 LogNotifier.
+
+        Args:
+            level: log 等級
+        """
+        self.level = level
+
+    async def send(self, digest: Digest) -> None:
+        """寫入 log（實作）。"""
+        subject, body = render_text(digest)
+        logger.log(self.level, "%s for user %s\n%s", subject, digest.recipient.user_id, body)
@@ -0,0 +1,132 @@
+"""OpenAI LLM 實作 - 呼叫 OpenAI 相容的 Chat Completions API。
+
+``complete_batch`` 將同一 tenant 的多個短 prompt 合併為一次呼叫：以 JSON 陣列送出各任務，
+要求模型回傳同樣長度的 JSON 字串陣列；回應無法解析時退回逐一並發呼叫。不同 tenant 的
+prompt 分開呼叫，一個使用者的資料不會出現在另一個使用者的回應中。
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Sequence
+
+import httpx
+
+from app.use_cases.report.ports import LLMPort, LLMRequest
+
+BATCH_SYSTEM_PROMPT = (
+    "You will receive a JSON array of independent tasks, each with a system instruction and "
+    "a prompt. Complete every task on its own, following its system instruction. Reply with "
+    "only a JSON array of strings: one answer per task, in the same order."
+)
+
+
+class OpenAILLM(LLMPort):
+    """OpenAI Chat Completions client（共用連線池）。"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        base_url: str = "https://api.openai.com/v1",
+        timeout_seconds: float = 120.0,
+        max_connections: int = 20,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """初始化 OpenAILLM.
+
+        Args:
+            api_key: API key
+            model: 模型名稱
+            base_url: API base URL（可指向相容服務或本機 stub）
+            timeout_seconds: 單次請求逾時秒數
+            max_connections: 連線池大小
+            transport: HTTP transport（測試可替換，None 時使用預設連線）
+        """
+        self.model = model
+        self.client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_connections=max_connections),
+            transport=transport,
+        )
+
+    def _payload(self, system: str, prompt: str, max_tokens: int, stream: bool = False) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
+            "stream": stream,
+        }
+
+    async def complete(self, request: LLMRequest) -> str:
+        """產生完整回應（實作）。"""
+        response = await self.client.post(
+            "/chat/completions",
+            json=self._payload(request.system, request.prompt, request.max_tokens),
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"] or ""
+
+    async def stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """逐段產生回應（實作，解析 server-sent events）。"""
+        payload = self._payload(request.system, request.prompt, request.max_tokens, stream=True)
+        async with self.client.stream("POST", "/chat/completions", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                content = json.loads(data)["choices"][0]["delta"].get("content")
+                if content:
+                    yield content
+
+    async def complete_batch(self, requests: Sequence[LLMRequest]) -> list[str]:
+        """合併為一次呼叫產生多個回應（實作，只合併 tenant 相同的 prompt）。"""
+        groups: dict[str | None, list[int]] = {}
+        for index, request in enumerate(requests):
+            groups.setdefault(request.tenant, []).append(index)
+        if len(groups) > 1:
+            results = [""] * len(requests)
+            answers = await asyncio.gather(
+                *(
+                    self.complete_batch([requests[i] for i in indices])
+                    for indices in groups.values()
+                )
+            )
+            for indices, group_answers in zip(groups.values(), answers, strict=True):
+                for index, answer in zip(indices, group_answers, strict=True):
+                    results[index] = answer
+            return results
+        if len(requests) == 1:
+            return [await self.complete(requests[0])]
+
+        tasks = [{"system": r.system, "prompt": r.prompt} for r in requests]
+        merged = await self.complete(
+            LLMRequest(
+                system=BATCH_SYSTEM_PROMPT,
+                prompt=json.dumps(tasks, ensure_ascii=False),
+                max_tokens=sum(r.max_tokens for r in requests),
+            )
+        )
+        try:
+            answers = json.loads(merged)
+        except json.JSONDecodeError:
+            answers = None
+        if (
+            isinstance(answers, list)
+            and len(answers) == len(requests)
+            and all(isinstance(a, str) for a in answers)
+        ):
+            return answers
+        # 模型未遵守格式：逐一呼叫，確保每個結果都對應正確的 prompt
+        return list(await asyncio.gather(*(self.complete(r) for r in requests)))
+
+    async def aclose(self) -> None:
+        """關閉連線池（app shutdown 時呼叫）。"""
+        await self.client.aclose()
@@ -0,0 +1,52 @@
+"""Webhook notifier - 以 HTTP POST 將警報摘要送到收件者設定的 URL。
+
+5xx、429 與連線錯誤可重試；其他 4xx 代表接收端拒收，不再重試。
+"""
+
+import httpx
+
+from app.use_cases.exceptions import NotificationDeliveryError
+from app.use_cases.notification.ports import Digest, NotificationChannel, Recipient
+from app.use_cases.notification.templates import to_payload
+
+
+class WebhookNotifier(NotificationChannel):
+    """Webhook 通知通道（共用連線池）。"""
+
+    name = "webhook"
+
+    def __init__(self, timeout_seconds: float = 10.0, max_connections: int = 50):
+        """初始化 WebhookNotifier.
+
+        Args:
+            timeout_seconds: 單次請求逾時秒數
+            max_connections: 連線池大小
+        """
+        self.client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    def accepts(self, recipient: Recipient) -> bool:
+        """只送給有設定 webhook 的收件者（實作）。"""
+        return recipient.webhook_url is not None
+
+    async def send(self, digest: Digest) -> None:
+        """POST 摘要（實作）。"""
+        try:
+            response = await self.client.post(
+                digest.recipient.webhook_url,
+                json=to_payload(digest),
+                headers={"Idempotency-Key": digest.id},
+            )
+        except httpx.HTTPError as e:
+            raise NotificationDeliveryError(f"Webhook request failed: {e!r}") from e
+        if response.status_code >= 400:
+            retryable = response.status_code >= 500 or response.status_code == 429
+            raise NotificationDeliveryError(
+                f"Webhook responded {response.status_code}", retryable=retryable
+            )
+
+    async def aclose(self) -> None:
+        """關閉連線池（實作）。"""
+        await self.client.aclose()
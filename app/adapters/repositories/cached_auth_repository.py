@@ -0,0 +1,243 @@
+"""Cached Auth Repository - 重複登入時重用仍有效的 session，不再向上游驗證密碼。
+
+- 快取 key 為 (email, 密碼) 的 keyed BLAKE2b 摘要，salt 為每個程序隨機產生且只存在記憶體，
+  快取內容不含明文密碼，也無法離線比對
+- 密碼驗證結果最多重用 ``max_age_seconds``：密碼在其他地方變更時，舊密碼最晚在此之後失效；
+  以新密碼向上游登入成功時，立即移除該使用者以其他憑證（例如舊密碼）快取的 session
+- access token 到期前 ``refresh_margin_seconds`` 內被使用時，於背景以 refresh token 換發；
+  換發失敗（例如已登出、refresh token 被撤銷）時移除該筆快取
+- 登出或呼叫 ``invalidate_user``（例如變更密碼後）時移除該使用者的所有快取
+- 共用的 session 不交出 refresh token（回傳的 ``refresh_token`` 為空字串）：refresh token
+  只由快取用於背景換發，避免多個 client 以同一個 token 換發而觸發上游的 reuse detection
+- 同一組憑證同時登入只會有一個上游請求；登入失敗不快取
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from app.domain.entities.user import User
+from app.use_cases.auth.ports import AsyncAuthRepository, AuthSession
+
+logger = logging.getLogger(__name__)
+
+# access token 剩餘有效時間少於此秒數時不再交給 client（避免 client 拿到立即過期的 token）
+MIN_REMAINING_SECONDS = 10.0
+
+
+@dataclass
+class AuthCacheStats:
+    """登入快取統計計數。"""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass(slots=True)
+class _Entry:
+    session: AuthSession
+    verified_at: float  # 上游驗證密碼的時間（換發 token 不會更新）
+
+
+def _token_subject(access_token: str) -> str | None:
+    """取得 JWT payload 的 sub（不驗證簽章：只在上游已接受此 token 後使用）。"""
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    subject = claims.get("sub") if isinstance(claims, dict) else None
+    return subject if isinstance(subject, str) else None
+
+
+def _shared(session: AuthSession) -> AuthSession:
+    """交給呼叫者的 session（移除只供快取換發使用的 refresh token）。"""
+    return replace(session, refresh_token="")
+
+
+class CachedAuthRepository(AsyncAuthRepository):
+    """快取登入 session 的 AuthRepository decorator（須為 Singleton）。"""
+
+    def __init__(
+        self,
+        auth_repo: AsyncAuthRepository,
+        max_entries: int = 10_000,
+        max_age_seconds: float = 3600.0,
+        refresh_margin_seconds: float = 60.0,
+        salt: bytes | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """初始化 CachedAuthRepository.
+
+        Args:
+            auth_repo: 實際呼叫上游的 AuthRepository（依賴抽象）
+            max_entries: 最多快取的 session 數（超過時淘汰最久未使用者）
+            max_age_seconds: 一次密碼驗證最多重用的秒數
+            refresh_margin_seconds: access token 到期前多少秒開始背景換發
+            salt: 快取 key 的 salt（None 時每個程序隨機產生）
+            clock: 取得 Unix 時間（秒）的函式，測試時可替換
+        """
+        self.auth_repo = auth_repo
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.clock = clock
+        self.stats = AuthCacheStats()
+        self._salt = salt or secrets.token_bytes(32)
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._by_user: dict[str, set[bytes]] = {}
+        self._inflight: dict[bytes, asyncio.Task[AuthSession]] = {}
+        self._refreshing: dict[bytes, asyncio.Task[None]] = {}
+
+    def _key(self, email: str, password: str) -> bytes:
+        credentials = f"{email.strip().lower()}\0{password}".encode()
+        return hashlib.blake2b(credentials, key=self._salt, digest_size=32).digest()
+
+    async def signup(self, email: str, password: str) -> User:
+        """註冊新使用者（不快取，實作）。"""
+        return await self.auth_repo.signup(email, password)
+
+    async def login(self, email: str, password: str) -> tuple[str, User]:
+        """使用者登入（優先重用快取的 session，實作）。"""
+        session = await self.login_session(email, password)
+        return (session.access_token, session.user)
+
+    async def login_session(self, email: str, password: str) -> AuthSession:
+        """使用者登入並取得 session（優先重用快取，不含 refresh token，實作）。"""
+        key = self._key(email, password)
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._usable(entry, now):
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                if entry.session.expires_at - now <= self.refresh_margin_seconds:
+                    self._schedule_refresh(key, entry)
+                return _shared(entry.session)
+            self._remove(key)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            task = asyncio.create_task(self._login_upstream(key, email, password))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return _shared(await asyncio.shield(task))
+
+    async def refresh_session(self, refresh_token: str) -> AuthSession:
+        """以 refresh token 換發 session（不快取，實作）。"""
+        return await self.auth_repo.refresh_session(refresh_token)
+
+    async def logout(self, access_token: str) -> None:
+        """登出並移除該使用者的所有快取 session（上游失敗時仍移除，實作）。"""
+        user_ids = {
+            entry.session.user.id
+            for entry in self._entries.values()
+            if entry.session.access_token == access_token
+        }
+        try:
+            await self.auth_repo.logout(access_token)
+            # 上游已接受此 token：也移除同一使用者以其他 token（例如換發前）登入的 session
+            subject = _token_subject(access_token)
+            if subject is not None:
+                user_ids.add(subject)
+        finally:
+            for user_id in user_ids:
+                self.invalidate_user(user_id)
+
+    def invalidate_user(self, user_id: str) -> int:
+        """移除使用者的所有快取 session（例如變更密碼後呼叫）.
+
+        Args:
+            user_id: 使用者 ID
+
+        Returns:
+            int: 移除筆數
+        """
+        keys = self._by_user.pop(user_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+            task = self._refreshing.pop(key, None)
+            if task is not None:
+                task.cancel()
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    async def aclose(self) -> None:
+        """取消進行中的背景換發。"""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshing.clear()
+
+    def _usable(self, entry: _Entry, now: float) -> bool:
+        return (
+            entry.session.expires_at - now > MIN_REMAINING_SECONDS
+            and now - entry.verified_at < self.max_age_seconds
+        )
+
+    async def _login_upstream(self, key: bytes, email: str, password: str) -> AuthSession:
+        verified_at = self.clock()
+        session = await self.auth_repo.login_session(email, password)
+        # 上游剛驗證過密碼：同一使用者以其他憑證（例如變更前的密碼）快取的 session 一併移除
+        self.invalidate_user(session.user.id)
+        self._store(key, _Entry(session=session, verified_at=verified_at))
+        return session
+
+    def _store(self, key: bytes, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._by_user.setdefault(entry.session.user.id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._unindex(evicted_key, evicted)
+            self.stats.evictions += 1
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry)
+
+    def _unindex(self, key: bytes, entry: _Entry) -> None:
+        # 進行中的背景換發不取消：寫回前會確認快取仍是同一筆
+        keys = self._by_user.get(entry.session.user.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry.session.user.id]
+
+    def _schedule_refresh(self, key: bytes, entry: _Entry) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, entry))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: bytes, entry: _Entry) -> None:
+        try:
+            session = await self.auth_repo.refresh_session(entry.session.refresh_token)
+        except Exception as e:
+            self.stats.refresh_errors += 1
+            logger.info("Dropping cached session after refresh failure: %r", e)
+            if self._entries.get(key) is entry:
+                self._remove(key)
+            return
+        self.stats.refreshes += 1
+        # 換發期間被登出 / 淘汰 / 重新登入時不寫回
+        if self._entries.get(key) is entry:
+            entry.session = session
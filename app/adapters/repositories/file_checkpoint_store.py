@@ -0,0 +1,60 @@
+"""File Checkpoint Store 實作 - 以 append-only 檔案記錄批次更新進度。
+
+每個 run_id 一個檔案：第一行為 header（scraped_at），之後每行一個已完成的 product_id。
+只做 append，crash 時最多遺失最後一行未寫完的紀錄（該產品會在續跑時重做）。
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from app.use_cases.product.ports import BatchCheckpoint, CheckpointStore
+
+
+class FileCheckpointStore(CheckpointStore):
+    """使用本機檔案的 Checkpoint Store 實作。"""
+
+    def __init__(self, directory: str | Path):
+        """初始化 Checkpoint Store.
+
+        Args:
+            directory: checkpoint 檔案存放目錄
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, run_id: str) -> Path:
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", run_id)
+        return self.directory / f"{safe_name}.checkpoint"
+
+    async def load(self, run_id: str) -> BatchCheckpoint | None:
+        """讀取 checkpoint（實作）。"""
+        path = self._path(run_id)
+        if not path.exists():
+            return None
+        lines = path.read_text().splitlines()
+        header = json.loads(lines[0])
+        return BatchCheckpoint(
+            run_id=run_id,
+            scraped_at=datetime.fromisoformat(header["scraped_at"]),
+            done={line for line in lines[1:] if line},
+        )
+
+    async def start(self, run_id: str, scraped_at: datetime) -> None:
+        """建立新的 checkpoint（實作）。"""
+        header = json.dumps({"run_id": run_id, "scraped_at": scraped_at.isoformat()})
+        self._path(run_id).write_text(header + "\n")
+
+    async def mark_done(self, run_id: str, product_ids: Iterable[str]) -> None:
+        """記錄已完成的產品（實作，append 後 fsync）。"""
+        with self._path(run_id).open("a") as f:
+            f.write("".join(f"{product_id}\n" for product_id in product_ids))
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def clear(self, run_id: str) -> None:
+        """刪除 checkpoint（實作）。"""
+        self._path(run_id).unlink(missing_ok=True)
@@ -0,0 +1,103 @@
+"""File Dead Letter Store 實作 - 以 JSON Lines 檔案保存送不出的通知。
+
+每筆 dead letter 一行，只做 append；``take`` 取出後以剩餘內容改寫檔案
+（dead letter 應該很少，改寫成本可忽略）。
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from app.domain.entities.product import ChangeAlert
+from app.use_cases.notification.ports import DeadLetter, DeadLetterStore, Digest, Recipient
+
+
+class FileDeadLetterStore(DeadLetterStore):
+    """使用本機檔案的 Dead Letter Store 實作。"""
+
+    def __init__(self, path: str | Path):
+        """初始化 Dead Letter Store.
+
+        Args:
+            path: JSON Lines 檔案路徑
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def add(self, letter: DeadLetter) -> None:
+        """保存一筆 dead letter（實作）。"""
+        with self.path.open("a") as f:
+            f.write(json.dumps(_to_record(letter)) + "\n")
+
+    async def take(self, limit: int = 100) -> list[DeadLetter]:
+        """取出並移除最舊的 dead letters（實作）。"""
+        lines = self._lines()
+        taken, rest = lines[:limit], lines[limit:]
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text("".join(f"{line}\n" for line in rest))
+        os.replace(tmp_path, self.path)
+        return [_to_letter(json.loads(line)) for line in taken]
+
+    async def count(self) -> int:
+        """目前保存的筆數（實作）。"""
+        return len(self._lines())
+
+    def _lines(self) -> list[str]:
+        if not self.path.exists():
+            return []
+        return [line for line in self.path.read_text().splitlines() if line]
+
+
+def _to_record(letter: DeadLetter) -> dict:
+    """將 DeadLetter 轉換為 JSON 物件。"""
+    digest = letter.digest
+    return {
+        "channel": letter.channel,
+        "error": letter.error,
+        "attempts": letter.attempts,
+        "failed_at": letter.failed_at.isoformat(),
+        "digest": {
+            "id": digest.id,
+            "created_at": digest.created_at.isoformat(),
+            "recipient": {
+                "user_id": digest.recipient.user_id,
+                "email": digest.recipient.email,
+                "webhook_url": digest.recipient.webhook_url,
+            },
+            "alerts": [
+                {
+                    "id": alert.id,
+                    "product_id": alert.product_id,
+                    "alert_type": alert.alert_type,
+                    "change_percentage": alert.change_percentage,
+                    "old_value": alert.old_value,
+                    "new_value": alert.new_value,
+                    "triggered_at": alert.triggered_at.isoformat(),
+                }
+                for alert in digest.alerts
+            ],
+        },
+    }
+
+
+def _to_letter(record: dict) -> DeadLetter:
+    """將 JSON 物件轉換為 DeadLetter。"""
+    digest = record["digest"]
+    return DeadLetter(
+        channel=record["channel"],
+        error=record["error"],
+        attempts=record["attempts"],
+        failed_at=datetime.fromisoformat(record["failed_at"]),
+        digest=Digest(
+            id=digest["id"],
+            created_at=datetime.fromisoformat(digest["created_at"]),
+            recipient=Recipient(**digest["recipient"]),
+            alerts=[
+                ChangeAlert(
+                    **{**alert, "triggered_at": datetime.fromisoformat(alert["triggered_at"])}
+                )
+                for alert in digest["alerts"]
+            ],
+        ),
+    )
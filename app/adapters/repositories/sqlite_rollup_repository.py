@@ -0,0 +1,163 @@
+"""SQLite Rollup Repository 實作 - 本機 / 測試 / benchmark 用的替代實作。
+
+與 Supabase 的 ``product_rollups`` 相同欄位；window 以 JSON 字串儲存，
+時間一律轉為 UTC ISO 8601 字串（字串排序即時間排序）。
+"""
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from app.domain.entities.product import ProductRollup
+from app.use_cases.product.ports import ROLLUP_SORT_COLUMNS, RollupRepository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS product_rollups (
+    product_id TEXT PRIMARY KEY,
+    asin TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    latest_at TEXT NOT NULL,
+    price REAL,
+    buybox_price REAL,
+    bsr_main INTEGER,
+    bsr_sub INTEGER,
+    rating REAL,
+    review_count INTEGER,
+    price_change_7d REAL,
+    price_change_30d REAL,
+    bsr_change_7d REAL,
+    bsr_change_30d REAL,
+    price_min_30d REAL,
+    price_max_30d REAL,
+    price_mean_30d REAL,
+    bsr_min_30d REAL,
+    bsr_max_30d REAL,
+    bsr_mean_30d REAL,
+    last_alert_type TEXT,
+    last_alert_at TEXT,
+    last_alert_change REAL,
+    window TEXT NOT NULL
+);
+"""
+
+COLUMNS = (
+    "product_id",
+    "asin",
+    "currency",
+    "latest_at",
+    "price",
+    "buybox_price",
+    "bsr_main",
+    "bsr_sub",
+    "rating",
+    "review_count",
+    "price_change_7d",
+    "price_change_30d",
+    "bsr_change_7d",
+    "bsr_change_30d",
+    "price_min_30d",
+    "price_max_30d",
+    "price_mean_30d",
+    "bsr_min_30d",
+    "bsr_max_30d",
+    "bsr_mean_30d",
+    "last_alert_type",
+    "last_alert_at",
+    "last_alert_change",
+    "window",
+)
+
+_SELECT = f"SELECT {', '.join(COLUMNS)} FROM product_rollups"
+_UPSERT = (
+    f"INSERT OR REPLACE INTO product_rollups ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+)
+
+
+class SQLiteRollupRepository(RollupRepository):
+    """使用 SQLite 的 Rollup Repository 實作（預設為 in-memory）。"""
+
+    def __init__(self, database: str = ":memory:"):
+        """初始化 Repository.
+
+        Args:
+            database: SQLite 資料庫路徑，預設 in-memory
+        """
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    async def get_many(self, product_ids: Sequence[str]) -> dict[str, ProductRollup]:
+        """批次取得彙總（實作）。"""
+        rollups: dict[str, ProductRollup] = {}
+        # SQLite 參數上限為 32766，以 500 筆為一組
+        for start in range(0, len(product_ids), 500):
+            chunk = list(product_ids[start : start + 500])
+            rows = self.connection.execute(
+                f"{_SELECT} WHERE product_id IN ({', '.join('?' for _ in chunk)})", chunk
+            ).fetchall()
+            for row in rows:
+                rollups[row[0]] = _to_entity(row)
+        return rollups
+
+    async def save_many(self, rollups: Sequence[ProductRollup]) -> int:
+        """批次 upsert 彙總（實作）。"""
+        with self.connection:
+            self.connection.executemany(_UPSERT, (_to_row(r) for r in rollups))
+        return len(rollups)
+
+    async def list_page(
+        self,
+        product_ids: Sequence[str] | None = None,
+        sort_by: str = "latest_at",
+        descending: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[ProductRollup], int]:
+        """排序分頁查詢彙總（實作）。"""
+        if sort_by not in ROLLUP_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        where, params = "", []
+        if product_ids is not None:
+            where = f" WHERE product_id IN ({', '.join('?' for _ in product_ids)})"
+            params = list(product_ids)
+        direction = "DESC" if descending else "ASC"
+        rows = self.connection.execute(
+            f"{_SELECT}{where} ORDER BY {sort_by} {direction} NULLS LAST, product_id "
+            "LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        (total,) = self.connection.execute(
+            f"SELECT COUNT(*) FROM product_rollups{where}", params
+        ).fetchone()
+        return [_to_entity(row) for row in rows], total
+
+
+def _to_text(value: datetime) -> str:
+    """轉為 UTC ISO 8601 字串（naive datetime 視為 UTC）。"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def _to_row(rollup: ProductRollup) -> tuple:
+    """將 Entity 轉換為資料庫 row。"""
+    values = []
+    for name in COLUMNS:
+        value = getattr(rollup, name)
+        if isinstance(value, datetime):
+            value = _to_text(value)
+        elif name == "window":
+            value = json.dumps(value)
+        values.append(value)
+    return tuple(values)
+
+
+def _to_entity(row: tuple) -> ProductRollup:
+    """將資料庫 row 轉換為 Entity。"""
+    fields = dict(zip(COLUMNS, row, strict=True))
+    fields["latest_at"] = datetime.fromisoformat(fields["latest_at"])
+    if fields["last_alert_at"] is not None:
+        fields["last_alert_at"] = datetime.fromisoformat(fields["last_alert_at"])
+    fields["window"] = [tuple(sample) for sample in json.loads(fields["window"])]
+    return ProductRollup(**fields)
@@ -0,0 +1,157 @@
+"""SQLite Snapshot Repository 實作 - 本機 / 測試 / benchmark 用的替代實作。
+
+與 Supabase schema 相同的鍵與索引（(product_id, scraped_at) 主鍵、DESC 覆蓋索引），
+但不分區。時間一律轉為 UTC ISO 8601 字串儲存，字串排序即時間排序。
+"""
+
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from app.domain.entities.product import ProductSnapshot
+from app.use_cases.product.ports import SnapshotRepository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS product_snapshots (
+    id TEXT NOT NULL,
+    product_id TEXT NOT NULL,
+    asin TEXT NOT NULL,
+    price TEXT,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    bsr_main INTEGER,
+    bsr_sub INTEGER,
+    rating REAL,
+    review_count INTEGER,
+    buybox_price TEXT,
+    scraped_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (product_id, scraped_at)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_snapshots_product_latest
+    ON product_snapshots (product_id, scraped_at DESC);
+"""
+
+COLUMNS = (
+    "id, product_id, asin, price, currency, bsr_main, bsr_sub, rating, "
+    "review_count, buybox_price, scraped_at, created_at"
+)
+
+UPSERT_SQL = f"""
+INSERT INTO product_snapshots ({COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (product_id, scraped_at) DO UPDATE SET
+    price = excluded.price,
+    currency = excluded.currency,
+    bsr_main = excluded.bsr_main,
+    bsr_sub = excluded.bsr_sub,
+    rating = excluded.rating,
+    review_count = excluded.review_count,
+    buybox_price = excluded.buybox_price
+"""
+
+
+class SQLiteSnapshotRepository(SnapshotRepository):
+    """使用 SQLite 的 Snapshot Repository 實作（預設為 in-memory）。"""
+
+    def __init__(self, database: str = ":memory:"):
+        """初始化 Repository.
+
+        Args:
+            database: SQLite 資料庫路徑，預設 in-memory
+        """
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    async def save_many(self, snapshots: Sequence[ProductSnapshot]) -> int:
+        """批次 upsert 快照（實作，單一 transaction + executemany）。"""
+        with self.connection:
+            self.connection.executemany(UPSERT_SQL, (_to_row(s) for s in snapshots))
+        return len(snapshots)
+
+    async def find_latest_by_product(self, product_id: str) -> ProductSnapshot | None:
+        """取得產品最新快照（實作）。"""
+        row = self.connection.execute(
+            f"SELECT {COLUMNS} FROM product_snapshots WHERE product_id = ? "
+            "ORDER BY scraped_at DESC LIMIT 1",
+            (product_id,),
+        ).fetchone()
+        return _to_entity(row) if row else None
+
+    async def find_latest_by_products(
+        self, product_ids: Sequence[str]
+    ) -> dict[str, ProductSnapshot]:
+        """批次取得多個產品的最新快照（實作，每個產品走一次索引查詢）。"""
+        latest: dict[str, ProductSnapshot] = {}
+        for product_id in product_ids:
+            snapshot = await self.find_latest_by_product(product_id)
+            if snapshot is not None:
+                latest[product_id] = snapshot
+        return latest
+
+    async def find_range(
+        self,
+        product_id: str,
+        start: datetime,
+        end: datetime,
+        limit: int | None = None,
+        after: datetime | None = None,
+    ) -> list[ProductSnapshot]:
+        """取得產品在時間區間內的快照（實作，游標走主鍵索引）。"""
+        rows = self.connection.execute(
+            f"SELECT {COLUMNS} FROM product_snapshots "
+            "WHERE product_id = ? AND scraped_at >= ? AND scraped_at < ? AND scraped_at > ? "
+            "ORDER BY scraped_at LIMIT ?",
+            (
+                product_id,
+                _to_text(start),
+                _to_text(end),
+                "" if after is None else _to_text(after),
+                -1 if limit is None else limit,
+            ),
+        ).fetchall()
+        return [_to_entity(row) for row in rows]
+
+
+def _to_text(value: datetime) -> str:
+    """轉為 UTC ISO 8601 字串（naive datetime 視為 UTC）。"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def _to_row(snapshot: ProductSnapshot) -> tuple:
+    """將 Entity 轉換為資料庫 row。"""
+    return (
+        snapshot.id,
+        snapshot.product_id,
+        snapshot.asin,
+        str(snapshot.price) if snapshot.price is not None else None,
+        snapshot.currency,
+        snapshot.bsr_main,
+        snapshot.bsr_sub,
+        snapshot.rating,
+        snapshot.review_count,
+        str(snapshot.buybox_price) if snapshot.buybox_price is not None else None,
+        _to_text(snapshot.scraped_at),
+        _to_text(snapshot.created_at),
+    )
+
+
+def _to_entity(row: tuple) -> ProductSnapshot:
+    """將資料庫 row 轉換為 Entity。"""
+    return ProductSnapshot(
+        id=row[0],
+        product_id=row[1],
+        asin=row[2],
+        price=Decimal(row[3]) if row[3] is not None else None,
+        currency=row[4],
+        bsr_main=row[5],
+        bsr_sub=row[6],
+        rating=row[7],
+        review_count=row[8],
+        buybox_price=Decimal(row[9]) if row[9] is not None else None,
+        scraped_at=datetime.fromisoformat(row[10]),
+        created_at=datetime.fromisoformat(row[11]),
+    )
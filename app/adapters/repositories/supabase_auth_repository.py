@@ -1,9 +1,16 @@
 """Supabase Auth Repository 實作。"""
 
-from supabase import Client
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from app.domain.entities.user import User
-from app.use_cases.auth.ports import AuthRepository
+from app.use_cases.auth.ports import AsyncAuthRepository, AuthRepository, AuthSession
+
+if TYPE_CHECKING:
+    from supabase import Client
+    from supabase_auth import AsyncGoTrueClient
+    from supabase_auth.types import AuthResponse
 
 
 class SupabaseAuthRepository(AuthRepository):
@@ -49,3 +56,76 @@ class SupabaseAuthRepository(AuthRepository):
         response = self.supabase.auth.sign_in_with_password({"email": email, "password": password})
         user = User(id=response.user.id, email=response.user.email)
         return (response.session.access_token, user)
+
+
+class AsyncSupabaseAuthRepository(AsyncAuthRepository):
+    """使用 Supabase Auth（GoTrue）async client 的 Auth Repository 實作。
+
+    使用獨立的 GoTrue client（``SupabaseClientProvider.get_auth_client``），不與資料查詢共用
+    ``AsyncClient``：登入事件不會把資料查詢的身分換成剛登入的使用者。
+    """
+
+    def __init__(self, auth_client: AsyncGoTrueClient):
+        """初始化 Repository.
+
+        Args:
+            auth_client: Supabase Auth（GoTrue）async client 實例
+        """
+        self.auth = auth_client
+
+    async def signup(self, email: str, password: str) -> User:
+        """註冊新使用者（實作）。
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            User: 建立的使用者
+
+        Raises:
+            Exception: 當 email 已存在時
+        """
+        response = await self.auth.sign_up({"email": email, "password": password})
+        return User(id=response.user.id, email=response.user.email)
+
+    async def login(self, email: str, password: str) -> tuple[str, User]:
+        """使用者登入（實作）。
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            tuple[str, User]: (access_token, user)
+
+        Raises:
+            Exception: 當憑證無效時
+        """
+        session = await self.login_session(email, password)
+        return (session.access_token, session.user)
+
+    async def login_session(self, email: str, password: str) -> AuthSession:
+        """使用者登入並取得完整 session（實作）。"""
+        response = await self.auth.sign_in_with_password({"email": email, "password": password})
+        return _to_session(response)
+
+    async def refresh_session(self, refresh_token: str) -> AuthSession:
+        """以 refresh token 換發 session（實作）。"""
+        response = await self.auth.refresh_session(refresh_token)
+        return _to_session(response)
+
+    async def logout(self, access_token: str) -> None:
+        """登出，撤銷使用者所有 session（實作）。"""
+        await self.auth.admin.sign_out(access_token, scope="global")
+
+
+def _to_session(response: AuthResponse) -> AuthSession:
+    """將 Supabase AuthResponse 轉換為 AuthSession。"""
+    session = response.session
+    return AuthSession(
+        access_token=session.access_token,
+        refresh_token=session.refresh_token,
+        expires_at=float(session.expires_at),
+        user=User(id=response.user.id, email=response.user.email),
+    )
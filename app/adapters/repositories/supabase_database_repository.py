@@ -1,20 +1,33 @@
-"""Supabase Database Repository 實作。"""
+"""Supabase Database Repository 實作。
 
-from supabase import Client
+連線檢查實際對 Supabase 送出一次請求（``GET /auth/v1/health``），而不是讀取 client 的記憶體狀態；
+使用 client 的連線池與較短的逾時。
+"""
 
-from app.use_cases.health.ports import DatabaseRepository
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+
+from app.use_cases.health.ports import AsyncDatabaseRepository, DatabaseRepository
+
+if TYPE_CHECKING:
+    from supabase import AsyncClient, Client
 
 
 class SupabaseDatabaseRepository(DatabaseRepository):
     """使用 Supabase 的 Database Repository 實作。"""
 
-    def __init__(self, supabase_client: Client):
+    def __init__(self, supabase_client: Client, timeout_seconds: float = 2.0):
         """初始化 Repository.
 
         Args:
             supabase_client: Supabase client 實例
+            timeout_seconds: 連線檢查的逾時（秒）
         """
         self.supabase = supabase_client
+        self.timeout_seconds = timeout_seconds
 
     def check_connection(self) -> str:
         """檢查 Supabase 連線狀態（實作）。
@@ -23,8 +36,59 @@ class SupabaseDatabaseRepository(DatabaseRepository):
             str: "connected" 或錯誤訊息
         """
         try:
-            # 測試 Supabase 連線
-            self.supabase.auth.get_session()
+            http = self.supabase.options.httpx_client
+            if http is None:
+                with httpx.Client() as client:
+                    response = self._get_health(client)
+            else:
+                response = self._get_health(http)
+            response.raise_for_status()
             return "connected"
         except Exception as e:
             return f"error: {str(e)}"
+
+    def _get_health(self, http: httpx.Client) -> httpx.Response:
+        return http.get(
+            f"{self.supabase.auth_url}/health",
+            headers={"apikey": self.supabase.supabase_key},
+            timeout=self.timeout_seconds,
+        )
+
+
+class AsyncSupabaseDatabaseRepository(AsyncDatabaseRepository):
+    """使用 Supabase async client 的 Database Repository 實作。"""
+
+    def __init__(self, supabase_client: AsyncClient, timeout_seconds: float = 2.0):
+        """初始化 Repository.
+
+        Args:
+            supabase_client: Supabase async client 實例
+            timeout_seconds: 連線檢查的逾時（秒）
+        """
+        self.supabase = supabase_client
+        self.timeout_seconds = timeout_seconds
+
+    async def check_connection(self) -> str:
+        """檢查 Supabase 連線狀態（實作，失敗時拋出例外）。
+
+        Returns:
+            str: "connected"
+
+        Raises:
+            httpx.HTTPError: 無法連線、逾時或回應錯誤狀態碼時
+        """
+        http = self.supabase.options.httpx_client
+        if http is None:
+            async with httpx.AsyncClient() as client:
+                response = await self._get_health(client)
+        else:
+            response = await self._get_health(http)
+        response.raise_for_status()
+        return "connected"
+
+    async def _get_health(self, http: httpx.AsyncClient) -> httpx.Response:
+        return await http.get(
+            f"{self.supabase.auth_url}/health",
+            headers={"apikey": self.supabase.supabase_key},
+            timeout=self.timeout_seconds,
+        )
@@ -0,0 +1,58 @@
+"""Supabase Product Repository 實作。
+
+資料表 schema 見 ``supabase/migrations``：``products`` 啟用 RLS，以使用者身分查詢時
+只看得到自己的產品。
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from app.domain.entities.product import Product
+from app.use_cases.product.ports import ProductRepository
+
+if TYPE_CHECKING:
+    from postgrest import AsyncPostgrestClient
+    from supabase import AsyncClient
+
+PRODUCTS_TABLE = "products"
+
+
+class SupabaseProductRepository(ProductRepository):
+    """使用 Supabase 的 Product Repository 實作。"""
+
+    def __init__(self, supabase_client: AsyncClient | AsyncPostgrestClient):
+        """初始化 Repository.
+
+        Args:
+            supabase_client: Supabase async client，或以使用者身分查詢的 PostgREST client
+                （``SupabaseClientProvider.get_user_data_client``）
+        """
+        self.supabase = supabase_client
+
+    async def find_by_id(self, product_id: str) -> Product | None:
+        """取得產品（實作）。"""
+        try:
+            uuid.UUID(product_id)
+        except ValueError:
+            # 不是 UUID 的 ID 不可能存在；不送出查詢（PostgREST 會回應 400）
+            return None
+        response = await (
+            self.supabase.table(PRODUCTS_TABLE).select("*").eq("id", product_id).limit(1).execute()
+        )
+        return _to_entity(response.data[0]) if response.data else None
+
+
+def _to_entity(row: dict) -> Product:
+    """將資料庫 row 轉換為 Entity。"""
+    return Product(
+        id=row["id"],
+        asin=row["asin"],
+        title=row["title"],
+        category=row["category"] or "",
+        user_id=row["user_id"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+    )
@@ -0,0 +1,99 @@
+"""Supabase Rollup Repository 實作。
+
+資料表 schema 見 ``supabase/migrations``：``product_rollups`` 每個產品一筆，
+排序欄位各有 (欄位, product_id) 索引，產品列表只讀這張表。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from app.domain.entities.product import ProductRollup
+from app.use_cases.product.ports import ROLLUP_SORT_COLUMNS, RollupRepository
+
+if TYPE_CHECKING:
+    from supabase import AsyncClient
+
+ROLLUPS_TABLE = "product_rollups"
+
+
+class SupabaseRollupRepository(RollupRepository):
+    """使用 Supabase 的 Rollup Repository 實作。"""
+
+    def __init__(self, supabase_client: AsyncClient, chunk_size: int = 500):
+        """初始化 Repository.
+
+        Args:
+            supabase_client: Supabase async client 實例
+            chunk_size: 每個請求的最大筆數
+        """
+        self.supabase = supabase_client
+        self.chunk_size = chunk_size
+
+    async def get_many(self, product_ids: Sequence[str]) -> dict[str, ProductRollup]:
+        """批次取得彙總（實作）。"""
+        rollups: dict[str, ProductRollup] = {}
+        for start in range(0, len(product_ids), self.chunk_size):
+            response = await (
+                self.supabase.table(ROLLUPS_TABLE)
+                .select("*")
+                .in_("product_id", list(product_ids[start : start + self.chunk_size]))
+                .execute()
+            )
+            for row in response.data:
+                rollups[row["product_id"]] = _to_entity(row)
+        return rollups
+
+    async def save_many(self, rollups: Sequence[ProductRollup]) -> int:
+        """批次 upsert 彙總（實作）。"""
+        for start in range(0, len(rollups), self.chunk_size):
+            rows = [_to_row(r) for r in rollups[start : start + self.chunk_size]]
+            await (
+                self.supabase.table(ROLLUPS_TABLE)
+                .upsert(rows, on_conflict="product_id", returning="minimal")
+                .execute()
+            )
+        return len(rollups)
+
+    async def list_page(
+        self,
+        product_ids: Sequence[str] | None = None,
+        sort_by: str = "latest_at",
+        descending: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[ProductRollup], int]:
+        """排序分頁查詢彙總（實作）。"""
+        if sort_by not in ROLLUP_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        query = self.supabase.table(ROLLUPS_TABLE).select("*", count="exact")
+        if product_ids is not None:
+            query = query.in_("product_id", list(product_ids))
+        response = await (
+            query.order(sort_by, desc=descending, nullsfirst=False)
+            .order("product_id")
+            .range(offset, offset + limit - 1)
+            .execute()
+        )
+        return [_to_entity(row) for row in response.data], response.count or 0
+
+
+def _to_row(rollup: ProductRollup) -> dict:
+    """將 Entity 轉換為資料庫 row（window 以 JSON 陣列儲存）。"""
+    row = {name: getattr(rollup, name) for name in ProductRollup.__slots__}
+    row["latest_at"] = rollup.latest_at.isoformat()
+    row["last_alert_at"] = rollup.last_alert_at.isoformat() if rollup.last_alert_at else None
+    row["window"] = [list(sample) for sample in rollup.window]
+    return row
+
+
+def _to_entity(row: dict) -> ProductRollup:
+    """將資料庫 row 轉換為 Entity。"""
+    fields = {name: row[name] for name in ProductRollup.__slots__}
+    fields["latest_at"] = datetime.fromisoformat(row["latest_at"])
+    if row["last_alert_at"] is not None:
+        fields["last_alert_at"] = datetime.fromisoformat(row["last_alert_at"])
+    fields["window"] = [tuple(sample) for sample in row["window"]]
+    return ProductRollup(**fields)
@@ -0,0 +1,145 @@
+"""Supabase Snapshot Repository 實作。
+
+資料表 schema 見 ``supabase/migrations``：``product_snapshots`` 依 scraped_at 按月分區，
+主鍵為 (product_id, scraped_at)，批次寫入以單一 upsert 請求處理一整個 chunk。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from app.domain.entities.product import ProductSnapshot
+from app.use_cases.product.ports import SnapshotRepository
+
+if TYPE_CHECKING:
+    from postgrest import AsyncPostgrestClient
+    from supabase import AsyncClient
+
+SNAPSHOTS_TABLE = "product_snapshots"
+LATEST_SNAPSHOTS_VIEW = "latest_product_snapshots"
+
+
+class SupabaseSnapshotRepository(SnapshotRepository):
+    """使用 Supabase 的 Snapshot Repository 實作。"""
+
+    def __init__(self, supabase_client: AsyncClient | AsyncPostgrestClient, chunk_size: int = 1000):
+        """初始化 Repository.
+
+        Args:
+            supabase_client: Supabase async client，或以使用者身分查詢的 PostgREST client
+                （``SupabaseClientProvider.get_user_data_client``）
+            chunk_size: 每個 upsert 請求的最大筆數
+        """
+        self.supabase = supabase_client
+        self.chunk_size = chunk_size
+
+    async def save_many(self, snapshots: Sequence[ProductSnapshot]) -> int:
+        """批次 upsert 快照（實作）。
+
+        Args:
+            snapshots: 要寫入的快照
+
+        Returns:
+            int: 寫入的筆數
+        """
+        written = 0
+        for start in range(0, len(snapshots), self.chunk_size):
+            rows = [_to_row(s) for s in snapshots[start : start + self.chunk_size]]
+            await (
+                self.supabase.table(SNAPSHOTS_TABLE)
+                .upsert(rows, on_conflict="product_id,scraped_at", returning="minimal")
+                .execute()
+            )
+            written += len(rows)
+        return written
+
+    async def find_latest_by_product(self, product_id: str) -> ProductSnapshot | None:
+        """取得產品最新快照（實作）。"""
+        response = await (
+            self.supabase.table(SNAPSHOTS_TABLE)
+            .select("*")
+            .eq("product_id", product_id)
+            .order("scraped_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return _to_entity(response.data[0]) if response.data else None
+
+    async def find_latest_by_products(
+        self, product_ids: Sequence[str]
+    ) -> dict[str, ProductSnapshot]:
+        """批次取得多個產品的最新快照（實作，使用 DISTINCT ON view）。"""
+        latest: dict[str, ProductSnapshot] = {}
+        for start in range(0, len(product_ids), self.chunk_size):
+            response = await (
+                self.supabase.table(LATEST_SNAPSHOTS_VIEW)
+                .select("*")
+                .in_("product_id", list(product_ids[start : start + self.chunk_size]))
+                .execute()
+            )
+            for row in response.data:
+                latest[row["product_id"]] = _to_entity(row)
+        return latest
+
+    async def find_range(
+        self,
+        product_id: str,
+        start: datetime,
+        end: datetime,
+        limit: int | None = None,
+        after: datetime | None = None,
+    ) -> list[ProductSnapshot]:
+        """取得產品在時間區間內的快照（實作）。"""
+        query = (
+            self.supabase.table(SNAPSHOTS_TABLE)
+            .select("*")
+            .eq("product_id", product_id)
+            .gte("scraped_at", start.isoformat())
+            .lt("scraped_at", end.isoformat())
+            .order("scraped_at")
+        )
+        if after is not None:
+            query = query.gt("scraped_at", after.isoformat())
+        if limit is not None:
+            query = query.limit(limit)
+        response = await query.execute()
+        return [_to_entity(row) for row in response.data]
+
+
+def _to_row(snapshot: ProductSnapshot) -> dict:
+    """將 Entity 轉換為資料庫 row（Decimal 以字串傳遞避免精度遺失）。"""
+    return {
+        "id": snapshot.id,
+        "product_id": snapshot.product_id,
+        "asin": snapshot.asin,
+        "price": str(snapshot.price) if snapshot.price is not None else None,
+        "currency": snapshot.currency,
+        "bsr_main": snapshot.bsr_main,
+        "bsr_sub": snapshot.bsr_sub,
+        "rating": snapshot.rating,
+        "review_count": snapshot.review_count,
+        "buybox_price": str(snapshot.buybox_price) if snapshot.buybox_price is not None else None,
+        "scraped_at": snapshot.scraped_at.isoformat(),
+        "created_at": snapshot.created_at.isoformat(),
+    }
+
+
+def _to_entity(row: dict) -> ProductSnapshot:
+    """將資料庫 row 轉換為 Entity。"""
+    return ProductSnapshot(
+        id=row["id"],
+        product_id=row["product_id"],
+        asin=row["asin"],
+        price=Decimal(str(row["price"])) if row["price"] is not None else None,
+        currency=row["currency"],
+        bsr_main=row["bsr_main"],
+        bsr_sub=row["bsr_sub"],
+        rating=float(row["rating"]) if row["rating"] is not None else None,
+        review_count=row["review_count"],
+        buybox_price=Decimal(str(row["buybox_price"])) if row["buybox_price"] is not None else None,
+        scraped_at=datetime.fromisoformat(row["scraped_at"]),
+        created_at=datetime.fromisoformat(row["created_at"]),
+    )
@@ -0,0 +1 @@
+"""Security adapters - token 驗證等安全相關實作。"""
@@ -0,0 +1,204 @@
+"""JWT Token Verifier 實作 - 於本機驗證 Supabase access token。"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+import httpx
+import jwt
+
+from app.use_cases.auth.ports import TokenVerifier
+from app.use_cases.exceptions import InvalidTokenError
+
+# 遇到未知 kid 時，兩次強制 refresh 之間的最短間隔（避免偽造 kid 打爆 JWKS 端點）
+MIN_FORCED_REFRESH_INTERVAL_SECONDS = 30.0
+
+
+class SigningKeyCache:
+    """簽章金鑰快取：共用密鑰（HS256）或 JWKS 公鑰，含 TTL 與背景更新。
+
+    - 快取過期時仍先使用舊金鑰，並於背景更新（不阻塞請求）
+    - 只有第一次載入或遇到未知 kid 時才會等待網路請求
+    """
+
+    def __init__(
+        self,
+        jwks_url: str | None = None,
+        shared_secret: str | None = None,
+        ttl_seconds: float = 600.0,
+        fetch_timeout_seconds: float = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """初始化 SigningKeyCache.
+
+        Args:
+            jwks_url: JWKS 端點 URL
+            shared_secret: JWT 共用密鑰（HS256）
+            ttl_seconds: JWKS 快取存活時間（秒）
+            fetch_timeout_seconds: 取得 JWKS 的逾時（秒）
+            transport: 取得 JWKS 的 httpx transport（None 時使用預設；測試可替換）
+        """
+        self.jwks_url = jwks_url
+        self.shared_secret = shared_secret
+        self.ttl_seconds = ttl_seconds
+        self.fetch_timeout_seconds = fetch_timeout_seconds
+        self.transport = transport
+        self._keys: dict[str | None, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._last_forced_refresh = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    def is_stale(self) -> bool:
+        """JWKS 是否已超過 TTL（或尚未載入）。"""
+        return self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl_seconds
+
+    async def get_key(self, kid: str | None, alg: str | None) -> tuple[object, str]:
+        """取得驗證用的金鑰與演算法.
+
+        Args:
+            kid: JWT header 的 key id
+            alg: JWT header 的演算法
+
+        Returns:
+            tuple[object, str]: (金鑰, 演算法)
+
+        Raises:
+            InvalidTokenError: 找不到對應的金鑰時
+        """
+        if alg == "HS256":
+            if self.shared_secret is None:
+                raise InvalidTokenError("HS256 token requires a shared JWT secret")
+            return self.shared_secret, "HS256"
+
+        if self.jwks_url is None:
+            raise InvalidTokenError(f"Unsupported token algorithm: {alg}")
+
+        if self._fetched_at is None:
+            try:
+                await self.refresh()
+            except httpx.HTTPError as e:
+                raise InvalidTokenError(f"Signing keys unavailable: {e}") from e
+        elif self.is_stale():
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and self._may_force_refresh():
+            # 金鑰輪替：未知 kid 時立即更新一次
+            try:
+                await self.refresh()
+            except (httpx.HTTPError, InvalidTokenError):
+                pass
+            key = self._keys.get(kid)
+        if key is None:
+            raise InvalidTokenError(f"Unknown signing key: {kid}")
+        return key.key, key.algorithm_name
+
+    async def refresh(self) -> None:
+        """重新取得 JWKS（同一時間只會有一個請求在進行）。"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+        await asyncio.shield(self._refresh_task)
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+            # 背景更新失敗時沿用舊金鑰，下次存取再重試
+            self._refresh_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def _may_force_refresh(self) -> bool:
+        now = time.monotonic()
+        if now - self._last_forced_refresh < MIN_FORCED_REFRESH_INTERVAL_SECONDS:
+            return False
+        self._last_forced_refresh = now
+        return True
+
+    async def _fetch(self) -> None:
+        async with httpx.AsyncClient(
+            timeout=self.fetch_timeout_seconds, transport=self.transport
+        ) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+        try:
+            entries = response.json()["keys"]
+            if not isinstance(entries, list):
+                raise TypeError("keys is not a list")
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidTokenError(f"Signing keys unavailable: malformed JWKS ({e})") from e
+
+        keys: dict[str | None, jwt.PyJWK] = {}
+        for data in entries:
+            try:
+                key = jwt.PyJWK(data)
+            except (jwt.PyJWTError, AttributeError):
+                continue  # 略過不支援或格式錯誤的金鑰
+            keys[key.key_id] = key
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+
+
+class JwtTokenVerifier(TokenVerifier):
+    """本機 JWT 驗證實作，已驗證的 token 以 digest 存入有上限的 LRU 快取。"""
+
+    def __init__(
+        self,
+        signing_keys: SigningKeyCache,
+        audience: str = "authenticated",
+        cache_size: int = 10_000,
+    ):
+        """初始化 JwtTokenVerifier.
+
+        Args:
+            signing_keys: 簽章金鑰快取
+            audience: 預期的 aud claim
+            cache_size: 已驗證 token 快取的最大筆數
+        """
+        self.signing_keys = signing_keys
+        self.audience = audience
+        self.cache_size = cache_size
+        # token digest -> (payload, exp)；不保存原始 token
+        self._verified: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+
+    async def verify(self, token: str) -> dict:
+        """驗證 access token 並回傳 payload（實作）。
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            dict: 驗證後的 JWT payload
+
+        Raises:
+            InvalidTokenError: 當 token 無效或已過期時
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = self._verified.get(digest)
+        if cached is not None:
+            payload, expires_at = cached
+            if expires_at > time.time():
+                self._verified.move_to_end(digest)
+                return payload
+            del self._verified[digest]
+
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+        key, algorithm = await self.signing_keys.get_key(header.get("kid"), header.get("alg"))
+        # User 需要 email claim（Supabase 的 access token 一定帶有，phone 登入時為空字串）
+        try:
+            payload = jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                audience=self.audience,
+                options={"require": ["exp", "sub", "email"]},
+            )
+        except jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+        self._verified[digest] = (payload, float(payload["exp"]))
+        if len(self._verified) > self.cache_size:
+            self._verified.popitem(last=False)
+        return payload
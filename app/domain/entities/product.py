@@ -0,0 +1,121 @@
+"""Product entities."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    """產品主實體。"""
+
+    id: str
+    asin: str
+    title: str
+    category: str
+    user_id: str
+    created_at: datetime
+    updated_at: datetime
+
+    def __post_init__(self):
+        """驗證業務規則。"""
+        if not self.asin or len(self.asin) != 10:
+            raise ValueError("ASIN must be 10 characters")
+
+
+# 快照與警報會一次建立數十萬到上百萬筆：只用 slots，不用 frozen
+# （frozen 的 __init__ 逐欄呼叫 object.__setattr__，建立成本約為 5 倍）
+@dataclass(slots=True)
+class ProductSnapshot:
+    """產品快照 - 時序資料（同一產品同一 scraped_at 只有一筆）。"""
+
+    id: str
+    product_id: str
+    asin: str
+
+    # 追蹤項目
+    price: Decimal | None
+    currency: str
+    bsr_main: int | None
+    bsr_sub: int | None
+    rating: float | None
+    review_count: int | None
+    buybox_price: Decimal | None
+
+    # 元資料
+    scraped_at: datetime
+    created_at: datetime
+
+    def calculate_price_change_percentage(self, previous_snapshot: "ProductSnapshot") -> float:
+        """計算價格變化百分比（任一方缺值或為 0 時回傳 0.0）。"""
+        if not self.price or not previous_snapshot.price:
+            return 0.0
+        return float((self.price - previous_snapshot.price) / previous_snapshot.price * 100)
+
+    def calculate_bsr_change_percentage(self, previous_snapshot: "ProductSnapshot") -> float:
+        """計算小類別 BSR 變化百分比（任一方缺值或為 0 時回傳 0.0）。"""
+        if not self.bsr_sub or not previous_snapshot.bsr_sub:
+            return 0.0
+        return float((self.bsr_sub - previous_snapshot.bsr_sub) / previous_snapshot.bsr_sub * 100)
+
+
+@dataclass(slots=True)
+class ChangeAlert:
+    """變化警報實體。"""
+
+    id: str
+    product_id: str
+    alert_type: str  # PRICE_CHANGE, BSR_CHANGE, ...
+    change_percentage: float
+    old_value: float
+    new_value: float
+    triggered_at: datetime
+    notified: bool = False
+
+
+@dataclass(slots=True)
+class ProductRollup:
+    """產品彙總 - 產品列表所需的最新值、近 7 / 30 日變化、近 30 日統計與最後一次警報.
+
+    由每批快照增量更新（見 ``app.domain.services.rollup``），讀取時不需掃描快照。
+    金額與統計值為 float（僅供顯示與排序）。
+    """
+
+    product_id: str
+    asin: str
+    currency: str
+    latest_at: datetime
+
+    # 最新快照的值（欄位名稱與 ProductSnapshot 相同，可直接用於變化偵測）
+    price: float | None
+    buybox_price: float | None
+    bsr_main: int | None
+    bsr_sub: int | None
+    rating: float | None
+    review_count: int | None
+
+    # 變化百分比（與期間內最早的每日樣本比較，沒有樣本時為 None）
+    price_change_7d: float | None = None
+    price_change_30d: float | None = None
+    bsr_change_7d: float | None = None
+    bsr_change_30d: float | None = None
+
+    # 近 30 日每日樣本的統計（BSR 為小類別 bsr_sub，與警報規則一致）
+    price_min_30d: float | None = None
+    price_max_30d: float | None = None
+    price_mean_30d: float | None = None
+    bsr_min_30d: float | None = None
+    bsr_max_30d: float | None = None
+    bsr_mean_30d: float | None = None
+
+    # 最後一次警報
+    last_alert_type: str | None = None
+    last_alert_at: datetime | None = None
+    last_alert_change: float | None = None
+
+    # 增量更新用的每日樣本：(scraped_at Unix 秒, price, bsr_sub)，每個 UTC 日一筆，依時間排序
+    window: list[tuple[float, float | None, float | None]] = field(default_factory=list)
+
+    def has_recent_alert(self, now: datetime, within: timedelta = timedelta(days=7)) -> bool:
+        """是否在 within 期間內觸發過警報（產品列表的警報標記）。"""
+        return self.last_alert_at is not None and now - self.last_alert_at <= within
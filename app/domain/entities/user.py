@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class User:
     """使用者實體（從 JWT payload 建立）。"""
 
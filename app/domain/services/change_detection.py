@@ -0,0 +1,241 @@
+"""Change detection - 以 NumPy 向量化比對前後兩批快照並產生 ChangeAlert。
+
+前後快照先轉成欄式批次（每個追蹤欄位一個 float64 陣列，缺值為 NaN），
+每個欄位的變化百分比只計算一次，所有規則的門檻比對都在陣列上完成，
+只有真正觸發的列才會建立 ChangeAlert 物件。
+
+變化百分比的定義與 ``ProductSnapshot.calculate_*_change_percentage`` 相同：
+任一方缺值或為 0 時不比較。
+"""
+
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from operator import attrgetter
+from typing import Literal
+
+import numpy as np
+
+from app.domain.entities.product import ChangeAlert, ProductSnapshot
+
+ALERT_PRICE_CHANGE = "PRICE_CHANGE"
+ALERT_BSR_CHANGE = "BSR_CHANGE"
+ALERT_RATING_CHANGE = "RATING_CHANGE"
+
+TRACKED_COLUMNS = ("price", "buybox_price", "bsr_main", "bsr_sub", "rating", "review_count")
+
+
+@dataclass(frozen=True)
+class ChangeRule:
+    """警報規則：某欄位變化百分比超過門檻（不含等於）時觸發。"""
+
+    alert_type: str
+    column: str
+    threshold_percentage: float
+    direction: Literal["any", "increase", "decrease"] = "any"
+
+    def __post_init__(self):
+        """驗證規則設定。"""
+        if self.column not in TRACKED_COLUMNS:
+            raise ValueError(f"Unknown snapshot column: {self.column}")
+        if self.threshold_percentage < 0:
+            raise ValueError("threshold_percentage must be >= 0")
+
+
+# 價格變動 > 10%、小類別 BSR 變動 > 30%
+DEFAULT_RULES = (
+    ChangeRule(ALERT_PRICE_CHANGE, "price", 10.0),
+    ChangeRule(ALERT_BSR_CHANGE, "bsr_sub", 30.0),
+)
+
+
+@dataclass
+class SnapshotBatch:
+    """欄式快照批次（第 i 列屬於 product_ids[i]，缺值為 NaN）。"""
+
+    product_ids: Sequence[str]
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """驗證欄位長度一致。"""
+        for name, values in self.columns.items():
+            if name not in TRACKED_COLUMNS:
+                raise ValueError(f"Unknown snapshot column: {name}")
+            if len(values) != len(self.product_ids):
+                raise ValueError(f"Column {name} has {len(values)} rows, expected {len(self)}")
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def column(self, name: str) -> np.ndarray:
+        """取得欄位陣列（批次未提供的欄位視為全部缺值）。"""
+        values = self.columns.get(name)
+        if values is None:
+            return np.full(len(self), np.nan)
+        return values
+
+    @classmethod
+    def from_snapshots(
+        cls, snapshots: Sequence[ProductSnapshot], columns: Sequence[str] = TRACKED_COLUMNS
+    ) -> "SnapshotBatch":
+        """由快照 Entity 建立欄式批次.
+
+        Args:
+            snapshots: 快照
+            columns: 要轉換的欄位（只轉換規則用到的欄位可省下大部分成本）
+
+        Returns:
+            SnapshotBatch: 欄式批次
+        """
+        return cls(
+            product_ids=[s.product_id for s in snapshots],
+            columns={
+                name: np.array(
+                    [np.nan if v is None else float(v) for v in map(attrgetter(name), snapshots)],
+                    dtype=np.float64,
+                )
+                for name in columns
+            },
+        )
+
+
+def align_pairs(
+    current: Sequence[ProductSnapshot],
+    previous: Mapping[str, ProductSnapshot],
+    columns: Sequence[str] = TRACKED_COLUMNS,
+) -> tuple[SnapshotBatch, SnapshotBatch]:
+    """將本次快照與各產品前一筆快照對齊成兩個批次（沒有前一筆的產品略過）.
+
+    Args:
+        current: 本次快照
+        previous: product_id -> 前一筆快照
+        columns: 要轉換的欄位（通常為 ChangeDetector.columns）
+
+    Returns:
+        tuple[SnapshotBatch, SnapshotBatch]: (current, previous)，列依 product 對齊
+    """
+    paired = [s for s in current if s.product_id in previous]
+    return (
+        SnapshotBatch.from_snapshots(paired, columns),
+        SnapshotBatch.from_snapshots([previous[s.product_id] for s in paired], columns),
+    )
+
+
+@dataclass
+class RuleBreaches:
+    """單一規則的觸發結果（陣列形式，尚未建立 ChangeAlert）。"""
+
+    rule: ChangeRule
+    indices: np.ndarray
+    change_percentage: np.ndarray
+    old_values: np.ndarray
+    new_values: np.ndarray
+
+
+class ChangeDetector:
+    """向量化變化偵測器。"""
+
+    def __init__(self, rules: Sequence[ChangeRule] = DEFAULT_RULES):
+        """初始化 ChangeDetector.
+
+        Args:
+            rules: 警報規則
+        """
+        self.rules = tuple(rules)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """規則用到的欄位（不重複，依規則順序）。"""
+        return tuple(dict.fromkeys(rule.column for rule in self.rules))
+
+    def evaluate(self, current: SnapshotBatch, previous: SnapshotBatch) -> list[RuleBreaches]:
+        """計算所有規則的觸發列（不建立物件）.
+
+        Args:
+            current: 本次快照批次
+            previous: 前一次快照批次（列需與 current 對齊）
+
+        Returns:
+            list[RuleBreaches]: 每條規則一筆結果
+
+        Raises:
+            ValueError: 兩個批次列數不同時
+        """
+        if len(current) != len(previous):
+            raise ValueError(f"Batch size mismatch: {len(current)} != {len(previous)}")
+
+        changes: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        results = []
+        for rule in self.rules:
+            if rule.column not in changes:
+                changes[rule.column] = _change_percentage(
+                    current.column(rule.column), previous.column(rule.column)
+                )
+            pct, valid = changes[rule.column]
+
+            if rule.direction == "increase":
+                breached = pct > rule.threshold_percentage
+            elif rule.direction == "decrease":
+                breached = pct < -rule.threshold_percentage
+            else:
+                breached = np.abs(pct) > rule.threshold_percentage
+            indices = np.flatnonzero(breached & valid)
+            results.append(
+                RuleBreaches(
+                    rule=rule,
+                    indices=indices,
+                    change_percentage=pct[indices],
+                    old_values=previous.column(rule.column)[indices],
+                    new_values=current.column(rule.column)[indices],
+                )
+            )
+        return results
+
+    def detect(
+        self, current: SnapshotBatch, previous: SnapshotBatch, triggered_at: datetime
+    ) -> list[ChangeAlert]:
+        """比對前後批次並產生 ChangeAlert.
+
+        Args:
+            current: 本次快照批次
+            previous: 前一次快照批次（列需與 current 對齊）
+            triggered_at: 警報觸發時間
+
+        Returns:
+            list[ChangeAlert]: 依規則順序排列的警報
+
+        Raises:
+            ValueError: 兩個批次列數不同時
+        """
+        alerts = []
+        for breaches in self.evaluate(current, previous):
+            for index, pct, old, new in zip(
+                breaches.indices.tolist(),
+                breaches.change_percentage.tolist(),
+                breaches.old_values.tolist(),
+                breaches.new_values.tolist(),
+                strict=True,
+            ):
+                alerts.append(
+                    ChangeAlert(
+                        id=str(uuid.uuid4()),
+                        product_id=current.product_ids[index],
+                        alert_type=breaches.rule.alert_type,
+                        change_percentage=pct,
+                        old_value=old,
+                        new_value=new,
+                        triggered_at=triggered_at,
+                    )
+                )
+        return alerts
+
+
+def _change_percentage(current: np.ndarray, previous: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """計算變化百分比與可比較的遮罩（任一方缺值或為 0 時不可比較）。"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (current - previous) / previous * 100
+    # 四捨五入到 1e-6，避免 float 誤差讓剛好等於門檻的變化被誤判為超過
+    pct = np.round(pct, 6)
+    valid = np.isfinite(pct) & (current != 0)
+    return pct, valid
@@ -0,0 +1,222 @@
+"""Product rollups - 以快照增量維護 ProductRollup，並比對兩份彙總的差異。
+
+增量更新與一致性檢查的重建都只透過 ``apply_snapshot`` / ``record_alert``，
+兩者依時間順序套用相同快照時結果必然相同：
+
+- 最新值：scraped_at 不早於目前最新值的快照才會覆蓋
+- 每日樣本：每個 UTC 日保留 scraped_at 最晚的一筆，只保留最近 ``WINDOW_DAYS`` 日
+- 變化百分比：與期間內（含當日往前 7 / 30 日）最早的每日樣本比較
+- 警報：只比對「新快照 vs 前一個最新值」；最後一次警報取時間最晚者，同時觸發多條規則時
+  取變化幅度最大者
+"""
+
+import math
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from app.domain.entities.product import ChangeAlert, ProductRollup, ProductSnapshot
+from app.domain.services.change_detection import ChangeDetector, SnapshotBatch
+
+WINDOW_DAYS = 30
+
+_DAY_SECONDS = 86400
+
+# 一致性檢查比對的欄位（window 為內部狀態，只要這些欄位一致即視為一致）
+COMPARED_FIELDS = (
+    "latest_at",
+    "currency",
+    "price",
+    "buybox_price",
+    "bsr_main",
+    "bsr_sub",
+    "rating",
+    "review_count",
+    "price_change_7d",
+    "price_change_30d",
+    "bsr_change_7d",
+    "bsr_change_30d",
+    "price_min_30d",
+    "price_max_30d",
+    "price_mean_30d",
+    "bsr_min_30d",
+    "bsr_max_30d",
+    "bsr_mean_30d",
+    "last_alert_type",
+    "last_alert_at",
+    "last_alert_change",
+)
+
+
+def _float(value) -> float | None:
+    return float(value) if value is not None else None
+
+
+def _day(timestamp: float) -> int:
+    return int(timestamp // _DAY_SECONDS)
+
+
+def _change(current: float | None, baseline: float | None) -> float | None:
+    if current is None or not baseline:
+        return None
+    return (current - baseline) / baseline * 100
+
+
+def apply_snapshot(rollup: ProductRollup | None, snapshot: ProductSnapshot) -> ProductRollup:
+    """將一筆快照套用到彙總（就地更新）.
+
+    Args:
+        rollup: 既有彙總，None 時以此快照建立
+        snapshot: 快照（可為任意順序；較舊的快照只影響每日樣本）
+
+    Returns:
+        ProductRollup: 更新後的彙總
+    """
+    if rollup is None:
+        rollup = ProductRollup(
+            product_id=snapshot.product_id,
+            asin=snapshot.asin,
+            currency=snapshot.currency,
+            latest_at=snapshot.scraped_at,
+            price=None,
+            buybox_price=None,
+            bsr_main=None,
+            bsr_sub=None,
+            rating=None,
+            review_count=None,
+        )
+    if snapshot.scraped_at >= rollup.latest_at:
+        rollup.asin = snapshot.asin
+        rollup.currency = snapshot.currency
+        rollup.latest_at = snapshot.scraped_at
+        rollup.price = _float(snapshot.price)
+        rollup.buybox_price = _float(snapshot.buybox_price)
+        rollup.bsr_main = snapshot.bsr_main
+        rollup.bsr_sub = snapshot.bsr_sub
+        rollup.rating = snapshot.rating
+        rollup.review_count = snapshot.review_count
+
+    timestamp = snapshot.scraped_at.timestamp()
+    sample = (timestamp, _float(snapshot.price), _float(snapshot.bsr_sub))
+    day = _day(timestamp)
+    samples = [s for s in rollup.window if _day(s[0]) != day]
+    existing = [s for s in rollup.window if _day(s[0]) == day]
+    samples.append(max([*existing, sample], key=lambda s: s[0]))
+    first_day = _day(rollup.latest_at.timestamp()) - WINDOW_DAYS
+    rollup.window = sorted(s for s in samples if _day(s[0]) >= first_day)
+    _refresh_aggregates(rollup)
+    return rollup
+
+
+def _refresh_aggregates(rollup: ProductRollup) -> None:
+    latest_day = _day(rollup.latest_at.timestamp())
+    for prefix, index, current in (("price", 1, rollup.price), ("bsr", 2, rollup.bsr_sub)):
+        for days in (7, 30):
+            baseline = next(
+                (s[index] for s in rollup.window if latest_day - days <= _day(s[0]) < latest_day),
+                None,
+            )
+            setattr(rollup, f"{prefix}_change_{days}d", _change(current, baseline))
+        values = [
+            s[index]
+            for s in rollup.window
+            if s[index] is not None and latest_day - WINDOW_DAYS < _day(s[0]) <= latest_day
+        ]
+        setattr(rollup, f"{prefix}_min_{WINDOW_DAYS}d", min(values) if values else None)
+        setattr(rollup, f"{prefix}_max_{WINDOW_DAYS}d", max(values) if values else None)
+        setattr(
+            rollup,
+            f"{prefix}_mean_{WINDOW_DAYS}d",
+            math.fsum(values) / len(values) if values else None,
+        )
+
+
+def detect_alerts(
+    detector: ChangeDetector,
+    current: Sequence[ProductSnapshot],
+    previous: Sequence[ProductSnapshot | ProductRollup],
+) -> list[ChangeAlert]:
+    """比對每筆快照與其前一個值（彙總的最新值或前一筆快照），警報時間為快照的 scraped_at.
+
+    Args:
+        detector: 變化偵測器
+        current: 新快照
+        previous: 與 current 對齊的前一個值
+
+    Returns:
+        list[ChangeAlert]: 觸發的警報
+    """
+    if not current:
+        return []
+    columns = detector.columns
+    alerts = []
+    for breaches in detector.evaluate(
+        SnapshotBatch.from_snapshots(current, columns),
+        SnapshotBatch.from_snapshots(previous, columns),  # type: ignore[arg-type]
+    ):
+        for index, pct, old, new in zip(
+            breaches.indices.tolist(),
+            breaches.change_percentage.tolist(),
+            breaches.old_values.tolist(),
+            breaches.new_values.tolist(),
+            strict=True,
+        ):
+            alerts.append(
+                ChangeAlert(
+                    id=str(uuid.uuid4()),
+                    product_id=current[index].product_id,
+                    alert_type=breaches.rule.alert_type,
+                    change_percentage=pct,
+                    old_value=old,
+                    new_value=new,
+                    triggered_at=current[index].scraped_at,
+                )
+            )
+    return alerts
+
+
+def record_alert(rollup: ProductRollup, alert: ChangeAlert) -> None:
+    """若警報比目前記錄的更新（或同時間但變化更大）則記錄為最後一次警報。"""
+    if rollup.last_alert_at is not None:
+        if alert.triggered_at < rollup.last_alert_at:
+            return
+        if alert.triggered_at == rollup.last_alert_at and abs(alert.change_percentage) <= abs(
+            rollup.last_alert_change or 0.0
+        ):
+            return
+    rollup.last_alert_type = alert.alert_type
+    rollup.last_alert_at = alert.triggered_at
+    rollup.last_alert_change = alert.change_percentage
+
+
+def rollup_drift(
+    expected: ProductRollup | None, actual: ProductRollup | None, tolerance: float = 1e-6
+) -> list[str]:
+    """列出兩份彙總不一致的欄位.
+
+    Args:
+        expected: 由原始快照重建的彙總
+        actual: 彙總表中的彙總
+        tolerance: float 欄位允許的相對誤差
+
+    Returns:
+        list[str]: 不一致的欄位名稱（任一方不存在時為 ["missing"] 或 ["orphan"]）
+    """
+    if expected is None and actual is None:
+        return []
+    if actual is None:
+        return ["missing"]
+    if expected is None:
+        return ["orphan"]
+    drift = []
+    for name in COMPARED_FIELDS:
+        a, b = getattr(expected, name), getattr(actual, name)
+        if isinstance(a, datetime) and isinstance(b, datetime):
+            equal = a.astimezone(UTC) == b.astimezone(UTC)
+        elif isinstance(a, float) and isinstance(b, int | float):
+            equal = math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance)
+        else:
+            equal = a == b
+        if not equal:
+            drift.append(name)
+    return drift
@@ -0,0 +1,224 @@
+"""Two-tier cache - 程序內 LRU + Redis 相容後端（CachePort 實作）。
+
+讀取順序為 local LRU -> Redis -> loader。每筆值前面帶 8 bytes 的「新鮮至」時間戳
+（wall clock，跨程序一致），後端實際保存 ttl + stale 秒，因此過期但仍在 stale 區間內
+的值可以先回傳、再於背景更新。
+
+單一飛行（single-flight）只在程序內合併；多個 worker 同時 miss 時各自最多載入一次。
+Redis 故障時降級為只用 local LRU，不影響請求。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.use_cases.cache.ports import CachePort, Loader
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">d")
+
+
+@dataclass
+class CacheStats:
+    """快取統計計數。"""
+
+    local_hits: int = 0
+    remote_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    load_errors: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    remote_errors: int = 0
+
+    @property
+    def hits(self) -> int:
+        """新鮮命中數（local + remote）。"""
+        return self.local_hits + self.remote_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """命中率（stale 命中也算命中）。"""
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+class TwoTierCache(CachePort):
+    """程序內 LRU 在前、Redis 相容後端在後的兩層快取。"""
+
+    def __init__(
+        self,
+        remote: Redis | None = None,
+        local_max_entries: int = 10_000,
+        key_prefix: str = "cache:",
+        clock: Callable[[], float] = time.time,
+    ):
+        """初始化 TwoTierCache.
+
+        Args:
+            remote: Redis 相容的 async client（None 時只使用程序內 LRU）
+            local_max_entries: 程序內 LRU 最多保存筆數
+            key_prefix: 後端 key 前綴
+            clock: 取得目前時間（秒）的函式，測試時可替換
+        """
+        self.remote = remote
+        self.local_max_entries = local_max_entries
+        self.key_prefix = key_prefix
+        self.clock = clock
+        self.stats = CacheStats()
+        # key -> (fresh_until, expires_at, value)
+        self._local: OrderedDict[str, tuple[float, float, bytes]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """取得未過期的快取值（實作）。"""
+        entry = await self._lookup(key)
+        if entry is None or entry[0] <= self.clock():
+            self.stats.misses += 1
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """設定快取（實作）。"""
+        await self._store(key, value, ttl_seconds, 0.0)
+
+    async def delete(self, key: str) -> None:
+        """刪除快取（實作）。"""
+        self._local.pop(key, None)
+        if self.remote is not None:
+            try:
+                await self.remote.delete(self.key_prefix + key)
+            except Exception as e:
+                self._remote_failed("delete", e)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Loader,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+    ) -> bytes:
+        """取得快取，未命中時以 single-flight 載入（實作）。"""
+        entry = await self._lookup(key)
+        if entry is not None:
+            fresh_until, value = entry
+            if fresh_until > self.clock():
+                return value
+            # stale-while-revalidate：先回舊值，背景重新載入（同 key 只有一個）
+            self.stats.stale_hits += 1
+            self._load(key, loader, ttl_seconds, stale_seconds)
+            return value
+
+        self.stats.misses += 1
+        return await asyncio.shield(self._load(key, loader, ttl_seconds, stale_seconds))
+
+    def _load(
+        self, key: str, loader: Loader, ttl_seconds: float, stale_seconds: float
+    ) -> asyncio.Task[bytes]:
+        """取得（或建立）此 key 進行中的載入 task。"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            return task
+
+        async def run() -> bytes:
+            self.stats.loads += 1
+            try:
+                value = await loader()
+            except Exception:
+                self.stats.load_errors += 1
+                raise
+            await self._store(key, value, ttl_seconds, stale_seconds)
+            return value
+
+        task = asyncio.create_task(run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._load_done(key, t))
+        return task
+
+    def _load_done(self, key: str, task: asyncio.Task[bytes]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 背景更新沒有人 await，於此取出例外避免 "never retrieved" 警告
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Cache load failed for %s: %s", key, task.exception())
+
+    async def _lookup(self, key: str) -> tuple[float, bytes] | None:
+        """依序查詢 local LRU 與後端，回傳 (fresh_until, value)。"""
+        now = self.clock()
+        stale: tuple[float, bytes] | None = None
+        entry = self._local.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._local.move_to_end(key)
+                self.stats.local_hits += 1
+                return entry[0], entry[2]
+            if entry[1] > now:
+                # local 已過新鮮期：先確認其他 worker 是否已更新後端
+                stale = entry[0], entry[2]
+            else:
+                del self._local[key]
+
+        if self.remote is None:
+            return stale
+        try:
+            payload = await self.remote.get(self.key_prefix + key)
+        except Exception as e:
+            self._remote_failed("get", e)
+            return stale
+        if payload is None:
+            return stale
+
+        (fresh_until,) = _HEADER.unpack_from(payload)
+        value = bytes(payload[_HEADER.size :])
+        if fresh_until > now:
+            self.stats.remote_hits += 1
+        # 後端剩餘存活時間未知，local 只保留到新鮮期結束（過期後再回後端確認）
+        self._put_local(key, fresh_until, max(fresh_until, now + 1.0), value)
+        return fresh_until, value
+
+    async def _store(
+        self, key: str, value: bytes, ttl_seconds: float, stale_seconds: float
+    ) -> None:
+        fresh_until = self.clock() + ttl_seconds
+        self._put_local(key, fresh_until, fresh_until + stale_seconds, value)
+        if self.remote is None:
+            return
+        try:
+            await self.remote.set(
+                self.key_prefix + key,
+                _HEADER.pack(fresh_until) + value,
+                px=max(1, int((ttl_seconds + stale_seconds) * 1000)),
+            )
+        except Exception as e:
+            self._remote_failed("set", e)
+
+    def _put_local(self, key: str, fresh_until: float, expires_at: float, value: bytes) -> None:
+        self._local[key] = (fresh_until, expires_at, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _remote_failed(self, operation: str, error: Exception) -> None:
+        self.stats.remote_errors += 1
+        logger.warning("Cache backend %s failed: %s", operation, error)
+
+    async def aclose(self) -> None:
+        """取消進行中的載入並關閉後端連線（app shutdown 時呼叫）。"""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self.remote is not None:
+            await self.remote.aclose()
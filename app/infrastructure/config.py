@@ -1,34 +1,233 @@
-"""Application configuration with fail-fast validation."""
+"""Application configuration with fail-fast validation.
+
+設定集中於 `Settings`，由 `get_settings()` 於 app lifespan 啟動時載入並驗證一次；
+import 本模組不會讀取環境變數或終止程式。
+"""
 
 import os
-import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+class ConfigError(Exception):
+    """環境變數缺少或格式錯誤。"""
+
+
+@dataclass(frozen=True)
+class Settings:
+    """應用程式設定（型別化，啟動時驗證）。"""
+
+    # Supabase 設定
+    supabase_url: str
+    supabase_anon_key: str
+
+    # JWT 本機驗證設定（選填）
+    # 設定 SUPABASE_JWT_SECRET 時以共用密鑰（HS256）驗證，否則使用專案 JWKS 公鑰
+    supabase_jwt_secret: str | None = None
+    jwt_keys_ttl_seconds: float = 600.0
+    jwt_verified_cache_size: int = 10_000
+
+    # 登入 session 快取設定（0 為停用）：一次密碼驗證最多重用的秒數、到期前多久背景換發 token
+    auth_session_cache_size: int = 10_000
+    auth_session_max_age_seconds: float = 3600.0
+    auth_session_refresh_margin_seconds: float = 60.0
+
+    # 批次註冊設定：單一請求最多筆數、同時進行的註冊數、冪等紀錄保存秒數
+    bulk_signup_max_items: int = 1000
+    bulk_signup_concurrency: int = 8
+    bulk_signup_idempotency_ttl_seconds: float = 24 * 3600
+
+    # Health probe 設定：背景探測間隔、單次逾時、結果視為過期的秒數
+    health_probe_interval_seconds: float = 10.0
+    health_probe_timeout_seconds: float = 2.0
+    health_probe_stale_after_seconds: float = 30.0
+
+    # Supabase HTTP 連線池設定（每個 worker 程序各自一個連線池）
+    supabase_http_max_connections: int = 100
+    supabase_http_max_keepalive: int = 20
+    supabase_http_keepalive_expiry_seconds: float = 30.0
+    supabase_http_timeout_seconds: float = 10.0
+
+    # 上游韌性設定：每次 port 呼叫的 deadline（0 為不限制）、斷路器連續失敗門檻（0 為停用）
+    # 與開啟秒數、冪等讀取送出第二次呼叫前的等待秒數（0 為不 hedge）
+    upstream_deadline_seconds: float = 5.0
+    upstream_circuit_failure_threshold: int = 5
+    upstream_circuit_recovery_seconds: float = 30.0
+    upstream_hedge_delay_seconds: float = 0.0
 
-from dotenv import load_dotenv
+    # 快取設定：未設定 REDIS_URL 時只使用程序內 LRU
+    redis_url: str | None = None
+    cache_local_max_entries: int = 10_000
 
-# 載入環境變數
-load_dotenv()
+    # 限流設定（每分鐘請求數，0 為不限制）；設定 REDIS_URL 時由所有副本共用計數
+    rate_limit_auth_ip_per_minute: int = 10
+    rate_limit_api_ip_per_minute: int = 600
+    rate_limit_api_user_per_minute: int = 300
+    # 批次註冊以呼叫者（token 的 sub）計數、每筆項目一個 token，與匿名註冊的 per-IP 額度分開
+    rate_limit_bulk_signup_user_per_minute: int = 100
+    rate_limit_bulk_signup_user_burst: int = 1000
 
+    # HTTP 回應快取設定：程序內保存的已序列化回應筆數與單筆 body 上限
+    http_cache_max_entries: int = 1000
+    http_cache_max_body_bytes: int = 1 << 20
 
-def get_required_env(key: str) -> str:
-    """取得必要的環境變數，若缺少則立即終止程式。
+    # Profiling 設定：admin token 啟用 X-Profile header 觸發；sample rate > 0 時隨機取樣存檔
+    profiling_admin_token: str | None = None
+    profiling_sample_rate: float = 0.0
+    profiling_output_dir: str = "profiles"
+    profiling_interval_seconds: float = 0.001
 
-    Args:
-        key: 環境變數名稱
+    # LLM 報告設定：未設定 OPENAI_API_KEY 時停用報告端點（回應 503）
+    openai_api_key: str | None = None
+    openai_base_url: str = "https://api.openai.com/v1"
+    openai_model: str = "gpt-4o-mini"
+    report_cache_ttl_seconds: float = 7 * 24 * 3600
+    report_batch_window_seconds: float = 0.02
+    report_batch_max_size: int = 8
+
+    # 伺服器設定（python -m app.server）：worker 數 0 表示依可用 CPU 數；
+    # keep-alive 須大於前端 load balancer 的 idle timeout；max requests 0 為不回收 worker
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 0
+    server_loop: str = "uvloop"
+    server_http: str = "httptools"
+    server_backlog: int = 2048
+    server_keepalive_seconds: int = 75
+    server_graceful_timeout_seconds: int = 30
+    server_max_requests: int = 10_000
+    server_max_requests_jitter: int = 1000
+    server_limit_concurrency: int = 0
+    server_forwarded_allow_ips: str = "127.0.0.1"
+    server_access_log: bool = True
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str]) -> "Settings":
+        """從環境變數建立設定，一次回報所有缺少或格式錯誤的項目.
+
+        Args:
+            environ: 環境變數
+
+        Returns:
+            Settings: 驗證後的設定
+
+        Raises:
+            ConfigError: 當必要環境變數缺少或數值格式錯誤時
+        """
+        errors: list[str] = []
+
+        def required(key: str) -> str:
+            value = environ.get(key)
+            if not value:
+                errors.append(f"缺少必要環境變數 {key}（請在 .env 檔案中設定）")
+            return value or ""
+
+        def optional(key: str, cast: type, default):
+            value = environ.get(key)
+            if not value:
+                return default
+            try:
+                return cast(value)
+            except ValueError:
+                errors.append(f"環境變數 {key} 格式錯誤：{value!r}")
+                return default
+
+        def choice(key: str, choices: tuple[str, ...], default: str) -> str:
+            value = environ.get(key) or default
+            if value not in choices:
+                errors.append(f"環境變數 {key} 須為 {' / '.join(choices)}：{value!r}")
+                return default
+            return value
+
+        settings = cls(
+            supabase_url=required("SUPABASE_URL"),
+            supabase_anon_key=required("SUPABASE_ANON_KEY"),
+            supabase_jwt_secret=environ.get("SUPABASE_JWT_SECRET") or None,
+            jwt_keys_ttl_seconds=optional("JWT_KEYS_TTL_SECONDS", float, 600.0),
+            jwt_verified_cache_size=optional("JWT_VERIFIED_CACHE_SIZE", int, 10_000),
+            auth_session_cache_size=optional("AUTH_SESSION_CACHE_SIZE", int, 10_000),
+            auth_session_max_age_seconds=optional("AUTH_SESSION_MAX_AGE_SECONDS", float, 3600.0),
+            auth_session_refresh_margin_seconds=optional(
+                "AUTH_SESSION_REFRESH_MARGIN_SECONDS", float, 60.0
+            ),
+            bulk_signup_max_items=optional("BULK_SIGNUP_MAX_ITEMS", int, 1000),
+            bulk_signup_concurrency=optional("BULK_SIGNUP_CONCURRENCY", int, 8),
+            bulk_signup_idempotency_ttl_seconds=optional(
+                "BULK_SIGNUP_IDEMPOTENCY_TTL_SECONDS", float, 24 * 3600
+            ),
+            health_probe_interval_seconds=optional("HEALTH_PROBE_INTERVAL_SECONDS", float, 10.0),
+            health_probe_timeout_seconds=optional("HEALTH_PROBE_TIMEOUT_SECONDS", float, 2.0),
+            health_probe_stale_after_seconds=optional(
+                "HEALTH_PROBE_STALE_AFTER_SECONDS", float, 30.0
+            ),
+            supabase_http_max_connections=optional("SUPABASE_HTTP_MAX_CONNECTIONS", int, 100),
+            supabase_http_max_keepalive=optional("SUPABASE_HTTP_MAX_KEEPALIVE", int, 20),
+            supabase_http_keepalive_expiry_seconds=optional(
+                "SUPABASE_HTTP_KEEPALIVE_EXPIRY_SECONDS", float, 30.0
+            ),
+            supabase_http_timeout_seconds=optional("SUPABASE_HTTP_TIMEOUT_SECONDS", float, 10.0),
+            upstream_deadline_seconds=optional("UPSTREAM_DEADLINE_SECONDS", float, 5.0),
+            upstream_circuit_failure_threshold=optional(
+                "UPSTREAM_CIRCUIT_FAILURE_THRESHOLD", int, 5
+            ),
+            upstream_circuit_recovery_seconds=optional(
+                "UPSTREAM_CIRCUIT_RECOVERY_SECONDS", float, 30.0
+            ),
+            upstream_hedge_delay_seconds=optional("UPSTREAM_HEDGE_DELAY_SECONDS", float, 0.0),
+            redis_url=environ.get("REDIS_URL") or None,
+            cache_local_max_entries=optional("CACHE_LOCAL_MAX_ENTRIES", int, 10_000),
+            rate_limit_auth_ip_per_minute=optional("RATE_LIMIT_AUTH_IP_PER_MINUTE", int, 10),
+            rate_limit_api_ip_per_minute=optional("RATE_LIMIT_API_IP_PER_MINUTE", int, 600),
+            rate_limit_api_user_per_minute=optional("RATE_LIMIT_API_USER_PER_MINUTE", int, 300),
+            rate_limit_bulk_signup_user_per_minute=optional(
+                "RATE_LIMIT_BULK_SIGNUP_USER_PER_MINUTE", int, 100
+            ),
+            rate_limit_bulk_signup_user_burst=optional(
+                "RATE_LIMIT_BULK_SIGNUP_USER_BURST", int, 1000
+            ),
+            http_cache_max_entries=optional("HTTP_CACHE_MAX_ENTRIES", int, 1000),
+            http_cache_max_body_bytes=optional("HTTP_CACHE_MAX_BODY_BYTES", int, 1 << 20),
+            profiling_admin_token=environ.get("PROFILING_ADMIN_TOKEN") or None,
+            profiling_sample_rate=optional("PROFILING_SAMPLE_RATE", float, 0.0),
+            profiling_output_dir=environ.get("PROFILING_OUTPUT_DIR") or "profiles",
+            profiling_interval_seconds=optional("PROFILING_INTERVAL_SECONDS", float, 0.001),
+            openai_api_key=environ.get("OPENAI_API_KEY") or None,
+            openai_base_url=environ.get("OPENAI_BASE_URL") or "https://api.openai.com/v1",
+            openai_model=environ.get("OPENAI_MODEL") or "gpt-4o-mini",
+            report_cache_ttl_seconds=optional("REPORT_CACHE_TTL_SECONDS", float, 7 * 24 * 3600),
+            report_batch_window_seconds=optional("REPORT_BATCH_WINDOW_SECONDS", float, 0.02),
+            report_batch_max_size=optional("REPORT_BATCH_MAX_SIZE", int, 8),
+            server_host=environ.get("SERVER_HOST") or "0.0.0.0",
+            server_port=optional("SERVER_PORT", int, 8000),
+            server_workers=optional("SERVER_WORKERS", int, 0),
+            server_loop=choice("SERVER_LOOP", ("auto", "asyncio", "uvloop"), "uvloop"),
+            server_http=choice("SERVER_HTTP", ("auto", "h11", "httptools"), "httptools"),
+            server_backlog=optional("SERVER_BACKLOG", int, 2048),
+            server_keepalive_seconds=optional("SERVER_KEEPALIVE_SECONDS", int, 75),
+            server_graceful_timeout_seconds=optional("SERVER_GRACEFUL_TIMEOUT_SECONDS", int, 30),
+            server_max_requests=optional("SERVER_MAX_REQUESTS", int, 10_000),
+            server_max_requests_jitter=optional("SERVER_MAX_REQUESTS_JITTER", int, 1000),
+            server_limit_concurrency=optional("SERVER_LIMIT_CONCURRENCY", int, 0),
+            server_forwarded_allow_ips=environ.get("SERVER_FORWARDED_ALLOW_IPS") or "127.0.0.1",
+            server_access_log=choice("SERVER_ACCESS_LOG", ("true", "false"), "true") == "true",
+        )
+        if errors:
+            raise ConfigError("❌ 設定錯誤：\n" + "\n".join(f"  - {e}" for e in errors))
+        return settings
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """載入 .env 並取得設定（每個程序只驗證一次）.
 
     Returns:
-        環境變數值
+        Settings: 驗證後的設定
 
     Raises:
-        SystemExit: 當環境變數不存在或為空時
+        ConfigError: 當必要環境變數缺少或數值格式錯誤時
     """
-    value = os.getenv(key)
-    if not value:
-        print(f"❌ 錯誤：缺少必要環境變數 {key}", file=sys.stderr)
-        print(f"請在 .env 檔案中設定 {key}", file=sys.stderr)
-        sys.exit(1)
-    return value
-
+    from dotenv import load_dotenv
 
-# Supabase 設定
-SUPABASE_URL = get_required_env("SUPABASE_URL")
-SUPABASE_ANON_KEY = get_required_env("SUPABASE_ANON_KEY")
+    load_dotenv()
+    return Settings.from_env(os.environ)
@@ -0,0 +1,212 @@
+"""Cron scheduling - 解析 5 欄位 cron 運算式，並依排程將工作放入 JobQueue。
+
+支援 ``*``、``*/n``、``a-b``、``a-b/n``、``a,b,c``；星期 0 與 7 皆為週日。
+日期與星期同時指定時依 cron 慣例為「任一符合」。
+
+每次觸發以 ``cron:<name>:<觸發時間>`` 為 idempotency key，多個排程器（多副本）
+同時執行也只會加入一次。
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from app.use_cases.jobs.ports import JobQueue
+
+logger = logging.getLogger(__name__)
+
+# (最小值, 最大值)：分、時、日、月、星期
+_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_field(text: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.split(","):
+        body, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if body == "*":
+            start, end = low, high
+        elif "-" in body:
+            start, end = (int(v) for v in body.split("-", 1))
+        else:
+            start = int(body)
+            end = high if step_text else start
+        if not (low <= start <= end <= high) or step < 1:
+            raise ValueError(f"Cron field out of range: {part!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True, slots=True)
+class CronSchedule:
+    """已解析的 cron 排程。"""
+
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]  # 0 = 週日
+    any_day: bool
+    any_weekday: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        """解析 cron 運算式.
+
+        Args:
+            expression: 5 欄位 cron 運算式，例如 "0 2 * * *"（每日 02:00）
+
+        Returns:
+            CronSchedule: 解析結果
+
+        Raises:
+            ValueError: 格式錯誤
+        """
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+        try:
+            minutes, hours, days, months, weekdays = (
+                _parse_field(part, low, high)
+                for part, (low, high) in zip(parts, _FIELDS, strict=True)
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression {expression!r}: {e}") from e
+        return cls(
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=frozenset(d % 7 for d in weekdays),
+            any_day=parts[2] == "*",
+            any_weekday=parts[4] == "*",
+        )
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """取得 moment 之後（不含）的下一個觸發時間（以 moment 的時區計算牆上時間）.
+
+        Args:
+            moment: 基準時間
+
+        Returns:
+            datetime: 下一個觸發時間（與 moment 相同時區）
+
+        Raises:
+            ValueError: 排程永遠不會觸發（例如 2 月 30 日）
+        """
+        tz = moment.tzinfo
+        t = moment.replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        # 以欄位為單位跳躍，最多檢查約 5 年
+        for _ in range(5 * 366 * 24):
+            if t.month not in self.months:
+                t = (t.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(t):
+                t = (t + timedelta(days=1)).replace(hour=0, minute=0)
+            elif t.hour not in self.hours:
+                t = (t + timedelta(hours=1)).replace(minute=0)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t.replace(tzinfo=tz)
+        raise ValueError("Cron schedule never fires")
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledJob:
+    """排程工作設定。"""
+
+    name: str
+    cron: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    timezone: str = "UTC"
+    max_attempts: int = 3
+
+
+class Scheduler:
+    """依 cron 排程將工作放入佇列。"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        entries: Sequence[ScheduledJob],
+        clock: Callable[[], float] = time.time,
+    ):
+        """初始化 Scheduler.
+
+        Args:
+            queue: 工作佇列（依賴抽象）
+            entries: 排程工作
+            clock: 取得目前 Unix 時間（秒）的函式，測試時可替換
+        """
+        self.queue = queue
+        self.entries = list(entries)
+        self.clock = clock
+        self._schedules = [CronSchedule.parse(entry.cron) for entry in self.entries]
+        now = datetime.fromtimestamp(clock(), UTC)
+        self._next = [
+            schedule.next_after(now.astimezone(ZoneInfo(entry.timezone)))
+            for entry, schedule in zip(self.entries, self._schedules, strict=True)
+        ]
+
+    async def tick(self) -> list[str]:
+        """加入所有已到期的排程工作（錯過多次時只補一次）.
+
+        Returns:
+            list[str]: 加入（或已存在）的工作 ID
+        """
+        now = datetime.fromtimestamp(self.clock(), UTC)
+        job_ids = []
+        for index, entry in enumerate(self.entries):
+            fire_at = self._next[index]
+            if fire_at > now:
+                continue
+            job_ids.append(
+                await self.queue.enqueue(
+                    entry.name,
+                    {**entry.payload, "scheduled_for": fire_at.isoformat()},
+                    idempotency_key=f"cron:{entry.name}:{fire_at.isoformat()}",
+                    max_attempts=entry.max_attempts,
+                )
+            )
+            logger.info("Scheduled job %s for %s", entry.name, fire_at.isoformat())
+            self._next[index] = self._schedules[index].next_after(
+                now.astimezone(ZoneInfo(entry.timezone))
+            )
+        return job_ids
+
+    def seconds_until_next(self) -> float:
+        """距離下一個觸發時間的秒數。"""
+        if not self._next:
+            return float("inf")
+        return max(0.0, min(t.timestamp() for t in self._next) - self.clock())
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """持續排程直到 stop 被設定.
+
+        Args:
+            stop: 停止事件
+        """
+        while not stop.is_set():
+            try:
+                await self.tick()
+                # 最多等 60 秒重新檢查（系統時鐘調整時不會錯過太久）
+                delay = min(60.0, self.seconds_until_next())
+            except Exception as e:
+                logger.warning("Scheduler tick failed: %s", e)
+                delay = 5.0
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except TimeoutError:
+                pass
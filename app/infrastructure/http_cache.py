@@ -0,0 +1,105 @@
+"""HTTP response cache - strong ETag 計算、If-None-Match 比對與已序列化回應的程序內 LRU。
+
+- ETag：body 的 BLAKE2b 摘要（strong validator，同一 body 在所有 worker 得到相同 ETag）
+- If-None-Match：依 RFC 9110 使用 weak comparison（``W/`` 前綴忽略），``*`` 符合任何回應
+- 回應快取：以 (path, query) 為 key，只保存程序存活期間不變的回應（首頁、OpenAPI、
+  文件頁等）；會隨資料變動的回應不保存，只以 ETag 讓 client 重新驗證
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+def strong_etag(body: bytes) -> str:
+    """計算 body 的 strong ETag（含雙引號）。"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """判斷 If-None-Match header 是否符合 ETag（weak comparison）.
+
+    Args:
+        if_none_match: If-None-Match header 值（可為逗號分隔的多個 ETag 或 ``*``）
+        etag: 目前回應的 ETag
+
+    Returns:
+        bool: 符合時應回應 304
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """已序列化的 200 回應。"""
+
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+
+
+@dataclass
+class ResponseCacheStats:
+    """回應快取統計計數。"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ResponseCache:
+    """已序列化回應的 LRU（只用於程序存活期間不變的回應）。"""
+
+    def __init__(self, max_entries: int = 1000, max_body_bytes: int = 1 << 20):
+        """初始化 ResponseCache.
+
+        Args:
+            max_entries: 最多保存筆數（超過時淘汰最久未使用者）
+            max_body_bytes: 單筆 body 上限，超過的回應不保存
+        """
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self.stats = ResponseCacheStats()
+        self._entries: OrderedDict[tuple[str, bytes], CachedResponse] = OrderedDict()
+
+    def get(self, path: str, query: bytes) -> CachedResponse | None:
+        """取得已保存的回應."""
+        key = (path, query)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def put(
+        self,
+        path: str,
+        query: bytes,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+        etag: str,
+    ) -> None:
+        """保存回應.
+
+        Args:
+            path: 請求 path
+            query: 原始 query string
+            headers: 回應 headers（已含 ETag 與 Cache-Control）
+            body: 回應 body
+            etag: 回應的 ETag
+        """
+        if len(body) > self.max_body_bytes:
+            return
+        key = (path, query)
+        self._entries[key] = CachedResponse(headers, body, etag)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
@@ -0,0 +1,450 @@
+"""Job queues - 持久化工作佇列（SQLite 單機 / Redis 多副本，JobQueue 實作）。
+
+兩者語意相同：
+
+- reserve 以租約（lease）取出工作，``visibility_timeout`` 秒內未 ack 即重新交付
+- 逾時且已達 ``max_attempts`` 的工作於下次 reserve 時移入 dead
+- idempotency key 於 ``idempotency_ttl_seconds`` 內重複 enqueue 只回傳既有工作 ID
+  （工作完成後 key 仍保留，避免排程重送造成重複執行）
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from app.use_cases.jobs.ports import Job, JobQueue, QueueStats
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+_VISIBILITY_TIMEOUT_ERROR = "Visibility timeout exceeded"
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    lease TEXT,
+    last_error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_available ON jobs (state, available_at);
+
+CREATE TABLE IF NOT EXISTS job_idempotency_keys (
+    key TEXT PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteJobQueue(JobQueue):
+    """SQLite 工作佇列（WAL 模式，同一台機器上的多個 worker 程序可共用同一個檔案）。
+
+    每個操作是一個 ``BEGIN IMMEDIATE`` transaction；SQLite 呼叫於 thread 執行，
+    等待其他程序的寫入鎖時不會阻塞 event loop。
+    """
+
+    def __init__(
+        self,
+        database: str = ":memory:",
+        idempotency_ttl_seconds: float = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        """初始化 SQLiteJobQueue.
+
+        Args:
+            database: SQLite 資料庫路徑，預設 in-memory（僅限單一程序）
+            idempotency_ttl_seconds: idempotency key 保留秒數
+            clock: 取得目前 Unix 時間（秒）的函式，測試時可替換
+        """
+        self.idempotency_ttl_seconds = idempotency_ttl_seconds
+        self.clock = clock
+        self.connection = sqlite3.connect(
+            database, check_same_thread=False, isolation_level=None, timeout=30.0
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SQLITE_SCHEMA)
+        self._lock = threading.Lock()
+        self._enqueued = 0
+
+    async def _run(self, operation: Callable[[sqlite3.Connection, float], Any]) -> Any:
+        def transaction():
+            with self._lock:
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                    result = operation(self.connection, self.clock())
+                except BaseException:
+                    self.connection.execute("ROLLBACK")
+                    raise
+                self.connection.execute("COMMIT")
+                return result
+
+        return await asyncio.to_thread(transaction)
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int = 3,
+    ) -> str:
+        """加入工作（實作）。"""
+        job_id = uuid.uuid4().hex
+        body = json.dumps(payload or {})
+        self._enqueued += 1
+        purge = self._enqueued % 1000 == 0
+
+        def operation(db: sqlite3.Connection, now: float) -> str:
+            if purge:
+                db.execute("DELETE FROM job_idempotency_keys WHERE expires_at <= ?", (now,))
+            if idempotency_key is not None:
+                row = db.execute(
+                    "SELECT job_id FROM job_idempotency_keys WHERE key = ? AND expires_at > ?",
+                    (idempotency_key, now),
+                ).fetchone()
+                if row is not None:
+                    return row[0]
+                db.execute(
+                    "INSERT OR REPLACE INTO job_idempotency_keys VALUES (?, ?, ?)",
+                    (idempotency_key, job_id, now + self.idempotency_ttl_seconds),
+                )
+            db.execute(
+                "INSERT INTO jobs (id, name, payload, max_attempts, available_at, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, name, body, max_attempts, now + delay_seconds, now),
+            )
+            return job_id
+
+        return await self._run(operation)
+
+    async def reserve(self, max_jobs: int, visibility_timeout: float) -> list[Job]:
+        """取出可執行的工作（實作）。"""
+        lease = uuid.uuid4().hex
+
+        def operation(db: sqlite3.Connection, now: float) -> list[Job]:
+            db.execute(
+                "UPDATE jobs SET state = 'dead', lease = NULL, last_error = ? "
+                "WHERE state = 'queued' AND lease IS NOT NULL AND available_at <= ? "
+                "AND attempts >= max_attempts",
+                (_VISIBILITY_TIMEOUT_ERROR, now),
+            )
+            rows = db.execute(
+                "UPDATE jobs SET attempts = attempts + 1, lease = ?, available_at = ? "
+                "WHERE id IN (SELECT id FROM jobs WHERE state = 'queued' AND available_at <= ? "
+                "ORDER BY available_at LIMIT ?) "
+                "RETURNING id, name, payload, attempts, max_attempts, enqueued_at",
+                (lease, now + visibility_timeout, now, max_jobs),
+            ).fetchall()
+            return [
+                Job(
+                    id=row[0],
+                    name=row[1],
+                    payload=json.loads(row[2]),
+                    attempts=row[3],
+                    max_attempts=row[4],
+                    enqueued_at=row[5],
+                    lease=lease,
+                )
+                for row in sorted(rows, key=lambda r: r[5])
+            ]
+
+        return await self._run(operation)
+
+    async def ack(self, job: Job) -> bool:
+        """標記工作完成（實作）。"""
+
+        def operation(db: sqlite3.Connection, now: float) -> bool:
+            cursor = db.execute("DELETE FROM jobs WHERE id = ? AND lease = ?", (job.id, job.lease))
+            return cursor.rowcount == 1
+
+        return await self._run(operation)
+
+    async def nack(self, job: Job, error: str, retry_delay_seconds: float = 0.0) -> bool:
+        """標記工作失敗（實作）。"""
+
+        def operation(db: sqlite3.Connection, now: float) -> bool:
+            cursor = db.execute(
+                "UPDATE jobs SET lease = NULL, last_error = ?, available_at = ?, "
+                "state = CASE WHEN attempts >= max_attempts THEN 'dead' ELSE 'queued' END "
+                "WHERE id = ? AND lease = ?",
+                (error, now + retry_delay_seconds, job.id, job.lease),
+            )
+            return cursor.rowcount == 1
+
+        return await self._run(operation)
+
+    async def release(self, job: Job) -> bool:
+        """歸還未執行的工作（實作）。"""
+
+        def operation(db: sqlite3.Connection, now: float) -> bool:
+            cursor = db.execute(
+                "UPDATE jobs SET lease = NULL, attempts = attempts - 1, available_at = ? "
+                "WHERE id = ? AND lease = ?",
+                (now, job.id, job.lease),
+            )
+            return cursor.rowcount == 1
+
+        return await self._run(operation)
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        """延長租約（實作）。"""
+
+        def operation(db: sqlite3.Connection, now: float) -> bool:
+            cursor = db.execute(
+                "UPDATE jobs SET available_at = ? WHERE id = ? AND lease = ?",
+                (now + visibility_timeout, job.id, job.lease),
+            )
+            return cursor.rowcount == 1
+
+        return await self._run(operation)
+
+    async def stats(self) -> QueueStats:
+        """取得佇列狀態（實作）。"""
+
+        def operation(db: sqlite3.Connection, now: float) -> QueueStats:
+            row = db.execute(
+                "SELECT "
+                "COUNT(*) FILTER (WHERE state = 'queued' AND available_at <= ?), "
+                "COUNT(*) FILTER (WHERE state = 'queued' AND available_at > ? AND lease IS NULL), "
+                "COUNT(*) FILTER (WHERE state = 'queued' AND available_at > ? "
+                "AND lease IS NOT NULL), "
+                "COUNT(*) FILTER (WHERE state = 'dead') "
+                "FROM jobs",
+                (now, now, now),
+            ).fetchone()
+            return QueueStats(ready=row[0], delayed=row[1], in_flight=row[2], dead=row[3])
+
+        return await self._run(operation)
+
+    async def aclose(self) -> None:
+        """關閉資料庫連線。"""
+        self.connection.close()
+
+
+# 所有時間以 Redis 伺服器時間計算，避免多副本間時鐘不一致；
+# 工作本體為 hash，ready（含延遲）與 inflight 為以可執行時間 / 租約到期時間排序的 sorted set
+_ENQUEUE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local job_id = ARGV[1]
+if ARGV[5] ~= '' then
+    local key = KEYS[3] .. ARGV[5]
+    local existing = redis.call('GET', key)
+    if existing then
+        return existing
+    end
+    redis.call('SET', key, job_id, 'PX', ARGV[6])
+end
+redis.call('HSET', KEYS[2] .. job_id, 'name', ARGV[2], 'payload', ARGV[3],
+    'attempts', 0, 'max_attempts', ARGV[4], 'enqueued_at', tostring(now))
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[7]), job_id)
+return job_id
+"""
+
+_RESERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)
+for _, job_id in ipairs(expired) do
+    local job_key = KEYS[4] .. job_id
+    redis.call('ZREM', KEYS[2], job_id)
+    redis.call('HDEL', job_key, 'lease')
+    local attempts = tonumber(redis.call('HGET', job_key, 'attempts'))
+    if attempts >= tonumber(redis.call('HGET', job_key, 'max_attempts')) then
+        redis.call('HSET', job_key, 'error', ARGV[4])
+        redis.call('ZADD', KEYS[3], now, job_id)
+    else
+        redis.call('ZADD', KEYS[1], now, job_id)
+    end
+end
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, tonumber(ARGV[1]))
+local result = {}
+for _, job_id in ipairs(ids) do
+    local job_key = KEYS[4] .. job_id
+    redis.call('ZREM', KEYS[1], job_id)
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), job_id)
+    redis.call('HINCRBY', job_key, 'attempts', 1)
+    redis.call('HSET', job_key, 'lease', ARGV[3])
+    local fields = redis.call('HMGET', job_key, 'name', 'payload', 'attempts',
+        'max_attempts', 'enqueued_at')
+    table.insert(result, {job_id, fields[1], fields[2], fields[3], fields[4], fields[5]})
+end
+return result
+"""
+
+# ARGV[2]: "ack" / "nack" / "release" / "extend"
+_SETTLE_SCRIPT = """
+local job_key = KEYS[4] .. ARGV[1]
+if redis.call('HGET', job_key, 'lease') ~= ARGV[3] then
+    return 0
+end
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local action = ARGV[2]
+if action == 'extend' then
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[4]), ARGV[1])
+    return 1
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+if action == 'ack' then
+    redis.call('DEL', job_key)
+    return 1
+end
+redis.call('HDEL', job_key, 'lease')
+if action == 'release' then
+    redis.call('HINCRBY', job_key, 'attempts', -1)
+    redis.call('ZADD', KEYS[1], now, ARGV[1])
+    return 1
+end
+redis.call('HSET', job_key, 'error', ARGV[5])
+local attempts = tonumber(redis.call('HGET', job_key, 'attempts'))
+if attempts >= tonumber(redis.call('HGET', job_key, 'max_attempts')) then
+    redis.call('ZADD', KEYS[3], now, ARGV[1])
+else
+    redis.call('ZADD', KEYS[1], now + tonumber(ARGV[4]), ARGV[1])
+end
+return 1
+"""
+
+_STATS_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+return {
+    redis.call('ZCOUNT', KEYS[1], '-inf', now),
+    redis.call('ZCOUNT', KEYS[1], '(' .. now, '+inf'),
+    redis.call('ZCARD', KEYS[2]),
+    redis.call('ZCARD', KEYS[3]),
+}
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """Redis 工作佇列（Lua script 原子操作，多台機器的 worker 可共用）。"""
+
+    def __init__(
+        self,
+        redis: Redis,
+        key_prefix: str = "jobs:",
+        idempotency_ttl_seconds: float = 7 * 24 * 3600,
+    ):
+        """初始化 RedisJobQueue.
+
+        Args:
+            redis: Redis 相容的 async client
+            key_prefix: key 前綴（不同佇列使用不同前綴）
+            idempotency_ttl_seconds: idempotency key 保留秒數
+        """
+        self.redis = redis
+        self.idempotency_ttl_seconds = idempotency_ttl_seconds
+        self._keys = [
+            f"{key_prefix}ready",
+            f"{key_prefix}inflight",
+            f"{key_prefix}dead",
+            f"{key_prefix}job:",
+        ]
+        self._idempotency_prefix = f"{key_prefix}idempotency:"
+        self._enqueue = redis.register_script(_ENQUEUE_SCRIPT)
+        self._reserve = redis.register_script(_RESERVE_SCRIPT)
+        self._settle = redis.register_script(_SETTLE_SCRIPT)
+        self._stats = redis.register_script(_STATS_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> RedisJobQueue:
+        """以連線 URL 建立（供 worker 程序於 fork / spawn 後各自建立連線）."""
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), **kwargs)
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int = 3,
+    ) -> str:
+        """加入工作（實作）。"""
+        job_id = await self._enqueue(
+            keys=[self._keys[0], self._keys[3], self._idempotency_prefix],
+            args=[
+                uuid.uuid4().hex,
+                name,
+                json.dumps(payload or {}),
+                max_attempts,
+                idempotency_key or "",
+                int(self.idempotency_ttl_seconds * 1000),
+                delay_seconds,
+            ],
+        )
+        return job_id.decode() if isinstance(job_id, bytes) else job_id
+
+    async def reserve(self, max_jobs: int, visibility_timeout: float) -> list[Job]:
+        """取出可執行的工作（實作）。"""
+        lease = uuid.uuid4().hex
+        rows = await self._reserve(
+            keys=self._keys,
+            args=[max_jobs, visibility_timeout, lease, _VISIBILITY_TIMEOUT_ERROR],
+        )
+        return [
+            Job(
+                id=_text(row[0]),
+                name=_text(row[1]),
+                payload=json.loads(row[2]),
+                attempts=int(row[3]),
+                max_attempts=int(row[4]),
+                enqueued_at=float(row[5]),
+                lease=lease,
+            )
+            for row in rows
+        ]
+
+    async def _settle_job(
+        self, job: Job, action: str, seconds: float = 0.0, error: str = ""
+    ) -> bool:
+        return bool(
+            await self._settle(keys=self._keys, args=[job.id, action, job.lease, seconds, error])
+        )
+
+    async def ack(self, job: Job) -> bool:
+        """標記工作完成（實作）。"""
+        return await self._settle_job(job, "ack")
+
+    async def nack(self, job: Job, error: str, retry_delay_seconds: float = 0.0) -> bool:
+        """標記工作失敗（實作）。"""
+        return await self._settle_job(job, "nack", retry_delay_seconds, error)
+
+    async def release(self, job: Job) -> bool:
+        """歸還未執行的工作（實作）。"""
+        return await self._settle_job(job, "release")
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        """延長租約（實作）。"""
+        return await self._settle_job(job, "extend", visibility_timeout)
+
+    async def stats(self) -> QueueStats:
+        """取得佇列狀態（實作）。"""
+        ready, delayed, in_flight, dead = await self._stats(keys=self._keys[:3])
+        return QueueStats(ready=ready, delayed=delayed, in_flight=in_flight, dead=dead)
+
+    async def aclose(self) -> None:
+        """關閉 Redis 連線。"""
+        await self.redis.aclose()
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
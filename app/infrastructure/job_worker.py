@@ -0,0 +1,336 @@
+"""Job worker - 從 JobQueue 取出工作執行的 worker 與多程序 worker pool。
+
+每個 worker 程序：
+
+- 最多持有 ``prefetch`` 個工作（執行中 + 已取出待執行），避免單一程序囤積工作，
+  也讓已取出的工作在 visibility timeout 內來得及執行
+- 同時執行 ``concurrency`` 個工作（handler 為 async，適合 I/O 為主的爬取 / 寫入）
+- 執行中的工作每 ``visibility_timeout / 3`` 秒延長租約；程序 crash 時租約到期，工作重新交付
+- 失敗時以指數 backoff 重試，超過 max_attempts 移入 dead
+- 收到 SIGTERM / SIGINT 時停止取新工作、歸還預取的工作，等待執行中的工作完成
+
+WorkerPool 以 spawn 啟動 N 個 worker 程序，異常結束時自動重啟，並在主程序執行 cron 排程。
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from app.infrastructure.cron import ScheduledJob, Scheduler
+from app.use_cases.jobs.ports import Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Job], Awaitable[None]]
+
+
+class JobRegistry:
+    """工作名稱 -> handler 對照表。"""
+
+    def __init__(self):
+        """初始化 JobRegistry."""
+        self._handlers: dict[str, Handler] = {}
+
+    def register(self, name: str, handler: Handler) -> None:
+        """註冊 handler.
+
+        Args:
+            name: 工作名稱
+            handler: 接收 Job 的 async 函式（需可重複執行：交付語意為 at-least-once）
+        """
+        self._handlers[name] = handler
+
+    def handler(self, name: str) -> Callable[[Handler], Handler]:
+        """以 decorator 註冊 handler。"""
+
+        def decorator(handler: Handler) -> Handler:
+            self.register(name, handler)
+            return handler
+
+        return decorator
+
+    def get(self, name: str) -> Handler | None:
+        """取得 handler（未註冊時為 None）。"""
+        return self._handlers.get(name)
+
+
+@dataclass
+class WorkerStats:
+    """Worker 統計計數。"""
+
+    succeeded: int = 0
+    failed: int = 0
+    lost_leases: int = 0  # 完成時租約已逾時（工作可能已被其他 worker 重複執行）
+    queue_latency_seconds: float = 0.0  # 累計：enqueue 到開始執行
+
+
+class Worker:
+    """單一程序內的工作執行迴圈。"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        registry: JobRegistry,
+        concurrency: int = 10,
+        prefetch: int | None = None,
+        visibility_timeout: float = 60.0,
+        poll_interval_seconds: float = 0.5,
+        retry_base_seconds: float = 5.0,
+        retry_max_seconds: float = 600.0,
+        shutdown_timeout_seconds: float = 30.0,
+    ):
+        """初始化 Worker.
+
+        Args:
+            queue: 工作佇列（依賴抽象）
+            registry: handler 對照表
+            concurrency: 同時執行的工作數
+            prefetch: 最多持有的工作數（執行中 + 待執行，預設等於 concurrency）
+            visibility_timeout: 租約秒數（執行中會定期延長）
+            poll_interval_seconds: 佇列為空時重新查詢的間隔
+            retry_base_seconds: 失敗重試 backoff 基準秒數（每次加倍）
+            retry_max_seconds: 單次 backoff 上限秒數
+            shutdown_timeout_seconds: 關閉時等待執行中工作完成的秒數
+        """
+        self.queue = queue
+        self.registry = registry
+        self.concurrency = concurrency
+        self.prefetch = max(prefetch or concurrency, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval_seconds = poll_interval_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+        self.stats = WorkerStats()
+        self._held = 0
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """執行直到 stop 被設定.
+
+        Args:
+            stop: 停止事件
+        """
+        buffer: asyncio.Queue[Job] = asyncio.Queue()
+        freed = asyncio.Event()
+
+        async def consume() -> None:
+            while True:
+                job = await buffer.get()
+                try:
+                    await self._execute(job)
+                finally:
+                    self._held -= 1
+                    freed.set()
+
+        consumers = [asyncio.create_task(consume()) for _ in range(self.concurrency)]
+        try:
+            while not stop.is_set():
+                free = self.prefetch - self._held
+                jobs: list[Job] = []
+                if free > 0:
+                    try:
+                        jobs = await self.queue.reserve(free, self.visibility_timeout)
+                    except Exception as e:
+                        logger.warning("Failed to reserve jobs: %s", e)
+                    self._held += len(jobs)
+                    for job in jobs:
+                        buffer.put_nowait(job)
+                if free == 0:
+                    # 已達 prefetch 上限：等待任一工作完成
+                    freed.clear()
+                    await _wait_first(stop, freed)
+                elif len(jobs) < free:
+                    # 佇列已空：等待下一次查詢
+                    await _wait_first(stop, timeout=self.poll_interval_seconds)
+        finally:
+            await self._drain(buffer, freed)
+            for consumer in consumers:
+                consumer.cancel()
+
+    async def _drain(self, buffer: asyncio.Queue[Job], freed: asyncio.Event) -> None:
+        """歸還尚未開始的預取工作，等待執行中的工作完成。"""
+        pending = []
+        while not buffer.empty():
+            pending.append(buffer.get_nowait())
+        for job in pending:
+            self._held -= 1
+            try:
+                await self.queue.release(job)
+            except Exception as e:
+                logger.warning("Failed to release job %s: %s", job.id, e)
+        deadline = time.monotonic() + self.shutdown_timeout_seconds
+        while self._held > 0 and (remaining := deadline - time.monotonic()) > 0:
+            freed.clear()
+            await _wait_first(freed, timeout=remaining)
+
+    async def _execute(self, job: Job) -> None:
+        self.stats.queue_latency_seconds += max(0.0, time.time() - job.enqueued_at)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            handler = self.registry.get(job.name)
+            if handler is None:
+                raise LookupError(f"No handler registered for job {job.name!r}")
+            await handler(job)
+        except Exception as e:
+            self.stats.failed += 1
+            delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (job.attempts - 1))
+            logger.warning(
+                "Job %s (%s) failed on attempt %d/%d: %s",
+                job.id,
+                job.name,
+                job.attempts,
+                job.max_attempts,
+                e,
+            )
+            await self._settle(self.queue.nack(job, f"{type(e).__name__}: {e}", delay), job)
+        else:
+            self.stats.succeeded += 1
+            await self._settle(self.queue.ack(job), job)
+        finally:
+            heartbeat.cancel()
+
+    async def _settle(self, operation: Awaitable[bool], job: Job) -> None:
+        try:
+            if not await operation:
+                self.stats.lost_leases += 1
+                logger.warning("Lease for job %s expired before completion", job.id)
+        except Exception as e:
+            # 佇列暫時無法連線：租約到期後工作會重新交付
+            logger.warning("Failed to settle job %s: %s", job.id, e)
+
+    async def _heartbeat(self, job: Job) -> None:
+        interval = self.visibility_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.queue.extend(job, self.visibility_timeout)
+            except Exception as e:
+                logger.warning("Failed to extend lease for job %s: %s", job.id, e)
+
+
+async def _wait_first(*events: asyncio.Event, timeout: float | None = None) -> None:
+    """等待任一事件被設定或逾時。"""
+    waiters = [asyncio.create_task(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+async def _worker_main(
+    queue_factory: Callable[[], JobQueue],
+    registry_factory: Callable[[], JobRegistry],
+    options: dict[str, Any],
+) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    queue = queue_factory()
+    worker = Worker(queue, registry_factory(), **options)
+    try:
+        await worker.run(stop)
+    finally:
+        await queue.aclose()
+        logger.info(
+            "Worker %d stopped: %d succeeded, %d failed",
+            os.getpid(),
+            worker.stats.succeeded,
+            worker.stats.failed,
+        )
+
+
+def _worker_process(
+    queue_factory: Callable[[], JobQueue],
+    registry_factory: Callable[[], JobRegistry],
+    options: dict[str, Any],
+) -> None:
+    asyncio.run(_worker_main(queue_factory, registry_factory, options))
+
+
+class WorkerPool:
+    """多程序 worker pool（主程序負責監控、重啟與 cron 排程）。"""
+
+    def __init__(
+        self,
+        queue_factory: Callable[[], JobQueue],
+        registry_factory: Callable[[], JobRegistry],
+        processes: int | None = None,
+        worker_options: dict[str, Any] | None = None,
+        schedule: Sequence[ScheduledJob] = (),
+    ):
+        """初始化 WorkerPool.
+
+        Args:
+            queue_factory: 建立佇列的函式（於各程序內呼叫，需可 pickle，例如
+                ``functools.partial(SQLiteJobQueue, "jobs.sqlite3")``）
+            registry_factory: 建立 handler 對照表的函式（需可 pickle）
+            processes: worker 程序數（預設為 CPU 數）
+            worker_options: 傳給 Worker 的參數（concurrency、prefetch、visibility_timeout 等）
+            schedule: cron 排程工作（由主程序加入佇列）
+        """
+        self.queue_factory = queue_factory
+        self.registry_factory = registry_factory
+        self.processes = processes or os.cpu_count() or 1
+        self.worker_options = worker_options or {}
+        self.schedule = schedule
+        self._context = multiprocessing.get_context("spawn")
+
+    def _spawn(self) -> multiprocessing.process.BaseProcess:
+        process = self._context.Process(
+            target=_worker_process,
+            args=(self.queue_factory, self.registry_factory, self.worker_options),
+            daemon=False,
+        )
+        process.start()
+        return process
+
+    def run(self, stop: asyncio.Event | None = None) -> None:
+        """啟動 worker 程序並阻塞直到收到 SIGTERM / SIGINT（或 stop 被設定）.
+
+        Args:
+            stop: 停止事件（測試 / benchmark 用，None 時只依 signal 停止）
+        """
+        asyncio.run(self._supervise(stop or asyncio.Event()))
+
+    async def _supervise(self, stop: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+        workers = [self._spawn() for _ in range(self.processes)]
+        queue = self.queue_factory() if self.schedule else None
+        scheduler = (
+            asyncio.create_task(Scheduler(queue, self.schedule).run(stop)) if queue else None
+        )
+        logger.info("Worker pool started with %d processes", self.processes)
+        try:
+            while not stop.is_set():
+                for index, process in enumerate(workers):
+                    if not process.is_alive():
+                        logger.warning(
+                            "Worker %d exited with code %s, restarting",
+                            process.pid,
+                            process.exitcode,
+                        )
+                        workers[index] = self._spawn()
+                await _wait_first(stop, timeout=1.0)
+        finally:
+            for process in workers:
+                if process.is_alive():
+                    process.terminate()  # SIGTERM：worker 歸還預取工作並等待執行中的工作
+            for process in workers:
+                await asyncio.to_thread(process.join, 60.0)
+                if process.is_alive():
+                    process.kill()
+            if scheduler is not None:
+                await scheduler
+            if queue is not None:
+                await queue.aclose()
@@ -0,0 +1,233 @@
+"""Prometheus metrics - HTTP 請求、Repository port 呼叫與上游斷路器的指標。
+
+``prometheus_client`` 於建立 Metrics 時才匯入（app lifespan 內），``import app.main`` 保持輕量。
+每個 app 一個 CollectorRegistry（測試 / benchmark 可建立多個 app 而不互相衝突）。
+
+多 worker 部署時設定 ``PROMETHEUS_MULTIPROC_DIR``，``render`` 會彙總所有 worker 的數值。
+"""
+
+import functools
+import inspect
+import os
+import time
+from abc import ABC
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
+T = TypeVar("T")
+
+# 延遲分布：1ms ~ 10s（上游 Supabase 呼叫通常落在 10ms ~ 1s）
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+    """應用程式指標集合。"""
+
+    def __init__(self, registry: "CollectorRegistry | None" = None):
+        """初始化 Metrics.
+
+        Args:
+            registry: Prometheus registry（None 時建立獨立的 registry）
+        """
+        from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+        self.registry = registry or CollectorRegistry(auto_describe=True)
+        self.http_requests = Counter(
+            "http_requests_total",
+            "HTTP requests by route and status code",
+            ["method", "route", "status"],
+            registry=self.registry,
+        )
+        self.http_duration = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route",
+            ["method", "route"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.http_in_flight = Gauge(
+            "http_requests_in_flight",
+            "HTTP requests currently being processed",
+            ["method"],
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+        self.repository_duration = Histogram(
+            "repository_call_duration_seconds",
+            "Repository port call latency",
+            ["port", "method"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.repository_errors = Counter(
+            "repository_call_errors_total",
+            "Repository port calls that raised",
+            ["port", "method", "error"],
+            registry=self.registry,
+        )
+        self.circuit_state = Gauge(
+            "upstream_circuit_state",
+            "Circuit breaker state by port (0 closed, 1 half-open, 2 open)",
+            ["port"],
+            registry=self.registry,
+            multiprocess_mode="livemax",
+        )
+        self.circuit_trips = Counter(
+            "upstream_circuit_trips_total",
+            "Times the circuit breaker opened",
+            ["port"],
+            registry=self.registry,
+        )
+        self.circuit_rejections = Counter(
+            "upstream_circuit_rejections_total",
+            "Port calls failed fast while the circuit breaker was open",
+            ["port"],
+            registry=self.registry,
+        )
+        self.hedged_calls = Counter(
+            "upstream_hedged_calls_total",
+            "Second attempts sent for slow idempotent reads",
+            ["port", "method"],
+            registry=self.registry,
+        )
+        self._request_children: dict[tuple[str, str, str], tuple] = {}
+        self._in_flight_children: dict[str, Any] = {}
+
+    def in_flight(self, method: str):
+        """取得該 method 的進行中請求 gauge（快取 label child）。"""
+        gauge = self._in_flight_children.get(method)
+        if gauge is None:
+            gauge = self._in_flight_children[method] = self.http_in_flight.labels(method)
+        return gauge
+
+    def observe_request(self, method: str, route: str, status: str, seconds: float) -> None:
+        """記錄一個完成的 HTTP 請求（label child 快取於 dict，省去每次 labels() 的 lock）.
+
+        Args:
+            method: HTTP method
+            route: 路由樣板
+            status: HTTP 狀態碼
+            seconds: 請求耗時（秒）
+        """
+        key = (method, route, status)
+        children = self._request_children.get(key)
+        if children is None:
+            children = self._request_children[key] = (
+                self.http_duration.labels(method, route),
+                self.http_requests.labels(method, route, status),
+            )
+        children[0].observe(seconds)
+        children[1].inc()
+
+    def render(self) -> tuple[bytes, str]:
+        """輸出 Prometheus text format.
+
+        Returns:
+            tuple[bytes, str]: (內容, Content-Type)
+        """
+        from prometheus_client import (
+            CONTENT_TYPE_LATEST,
+            CollectorRegistry,
+            generate_latest,
+            multiprocess,
+        )
+
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+    def instrument(self, target: T, port: str | None = None) -> T:
+        """包裝 Repository，所有公開方法自動計時並記錄例外.
+
+        Args:
+            target: Repository 實例
+            port: 指標中的 port 名稱（預設為實作的第一個 ABC，例如 "AsyncAuthRepository"）
+
+        Returns:
+            與 target 介面相同的 proxy
+        """
+        return _InstrumentedProxy(target, port or _port_name(target), self)  # type: ignore[return-value]
+
+
+class _InstrumentedProxy:
+    """轉送屬性存取的 proxy；方法於第一次存取時包裝並快取。"""
+
+    def __init__(self, target: Any, port: str, metrics: Metrics):
+        self._target = target
+        self._port = port
+        self._metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        wrapped = _timed(attr, self._port, name, self._metrics)
+        # 快取於 instance，之後的存取不再經過 __getattr__
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def __repr__(self) -> str:
+        return f"Instrumented({self._target!r})"
+
+
+def _timed(method: Any, port: str, name: str, metrics: Metrics) -> Any:
+    """為單一方法加上計時（label child 預先取得，呼叫時只剩 observe）。"""
+    observe = metrics.repository_duration.labels(port, name).observe
+    errors = metrics.repository_errors
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            except Exception as e:
+                errors.labels(port, name, type(e).__name__).inc()
+                raise
+            finally:
+                observe(time.perf_counter() - start)
+
+        return async_wrapper
+
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def async_gen_wrapper(*args, **kwargs):
+            # 串流呼叫計時到最後一個片段為止
+            start = time.perf_counter()
+            try:
+                async for item in method(*args, **kwargs):
+                    yield item
+            except Exception as e:
+                errors.labels(port, name, type(e).__name__).inc()
+                raise
+            finally:
+                observe(time.perf_counter() - start)
+
+        return async_gen_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        except Exception as e:
+            errors.labels(port, name, type(e).__name__).inc()
+            raise
+        finally:
+            observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+def _port_name(target: Any) -> str:
+    """取得實作的 port 名稱（MRO 中第一個直接繼承 ABC 的類別）。"""
+    for cls in type(target).__mro__:
+        if ABC in cls.__bases__:
+            return cls.__name__
+    return type(target).__name__
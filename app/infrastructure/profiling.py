@@ -0,0 +1,135 @@
+"""Request profiler - 以取樣式 profiler（pyinstrument）記錄單一請求的耗時分布。
+
+兩種觸發方式：
+- 管理者於請求加上 ``X-Profile: <PROFILING_ADMIN_TOKEN>``（可再加 ``X-Profile-Output: inline``
+  直接以回應取得結果，否則存檔）
+- 設定 ``PROFILING_SAMPLE_RATE`` 時，依比例隨機取樣請求並存檔
+
+輸出為 speedscope JSON（可於 https://www.speedscope.app 以 flamegraph 檢視）或 HTML。
+``pyinstrument`` 只在第一次實際 profile 時匯入；未觸發的請求只多一次 header 比對與亂數。
+"""
+
+import hmac
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+PROFILE_HEADER = b"x-profile"
+OUTPUT_HEADER = b"x-profile-output"
+FORMAT_HEADER = b"x-profile-format"
+
+FORMATS = {
+    "speedscope": ("application/json", "speedscope.json"),
+    "html": ("text/html; charset=utf-8", "html"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileRequest:
+    """單一請求的 profile 設定。"""
+
+    inline: bool
+    format: str
+    filename: str
+
+
+class RequestProfiler:
+    """決定哪些請求要 profile，並建立 / 輸出 profiler。"""
+
+    def __init__(
+        self,
+        output_dir: str = "profiles",
+        sample_rate: float = 0.0,
+        admin_token: str | None = None,
+        interval_seconds: float = 0.001,
+    ):
+        """初始化 RequestProfiler.
+
+        Args:
+            output_dir: profile 檔案輸出目錄
+            sample_rate: 隨機取樣比例（0-1，0 為不取樣）
+            admin_token: ``X-Profile`` header 需符合的管理者 token（None 時停用 header 觸發）
+            interval_seconds: 取樣間隔（秒）
+        """
+        self.output_dir = Path(output_dir)
+        self.sample_rate = sample_rate
+        self.admin_token = admin_token.encode() if admin_token else None
+        self.interval_seconds = interval_seconds
+
+    @property
+    def enabled(self) -> bool:
+        """是否可能 profile 任何請求。"""
+        return self.sample_rate > 0 or self.admin_token is not None
+
+    def select(self, scope: dict) -> ProfileRequest | None:
+        """判斷此請求是否要 profile.
+
+        Args:
+            scope: ASGI HTTP scope
+
+        Returns:
+            ProfileRequest | None: 要 profile 時的設定，否則為 None
+        """
+        requested = False
+        inline = False
+        fmt = "speedscope"
+        if self.admin_token is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    requested = hmac.compare_digest(value, self.admin_token)
+                elif name == OUTPUT_HEADER:
+                    inline = value == b"inline"
+                elif name == FORMAT_HEADER and value.decode("latin-1") in FORMATS:
+                    fmt = value.decode("latin-1")
+        if not requested:
+            if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+                return None
+            inline = False
+
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        path = scope["path"].strip("/").replace("/", "_") or "root"
+        filename = f"{stamp}-{path[:60]}-{uuid.uuid4().hex[:8]}.{FORMATS[fmt][1]}"
+        return ProfileRequest(inline=requested and inline, format=fmt, filename=filename)
+
+    def start(self) -> Any:
+        """建立並啟動 profiler（只記錄目前 async context，不含同時間的其他請求）."""
+        from pyinstrument import Profiler
+
+        profiler = Profiler(interval=self.interval_seconds, async_mode="enabled")
+        profiler.start()
+        return profiler
+
+    @staticmethod
+    def render(profiler: Any, fmt: str) -> tuple[bytes, str]:
+        """停止 profiler 並輸出結果.
+
+        Args:
+            profiler: ``start()`` 回傳的 profiler
+            fmt: 輸出格式（speedscope 或 html）
+
+        Returns:
+            tuple[bytes, str]: (內容, Content-Type)
+        """
+        from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+
+        session = profiler.stop()
+        renderer = SpeedscopeRenderer() if fmt == "speedscope" else HTMLRenderer()
+        return renderer.render(session).encode(), FORMATS[fmt][0]
+
+    def save(self, content: bytes, filename: str) -> Path:
+        """寫入 profile 檔案（由呼叫端放到 thread 執行，避免阻塞 event loop）.
+
+        Args:
+            content: profile 內容
+            filename: 檔名
+
+        Returns:
+            Path: 檔案路徑
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / filename
+        path.write_bytes(content)
+        return path
@@ -0,0 +1,148 @@
+"""Rate limit stores - token bucket 計數（程序內 / Redis 共用）。
+
+每個 key 一個 token bucket：以 ``rate`` 每秒補充，最多累積 ``burst`` 個 token，
+每次請求消耗一個。``acquire`` 回傳需要等待的秒數，0 代表放行。
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TokenBucket:
+    """Token bucket 設定。"""
+
+    rate: float  # 每秒補充的 token 數
+    burst: int  # 最多累積的 token 數（允許的瞬間突發請求數）
+
+    @classmethod
+    def per_minute(cls, requests: int, burst: int | None = None) -> TokenBucket:
+        """以「每分鐘請求數」建立設定（burst 預設等於每分鐘請求數）."""
+        return cls(rate=requests / 60, burst=burst if burst is not None else requests)
+
+
+class RateLimitStore(ABC):
+    """Token bucket 計數儲存介面。"""
+
+    @abstractmethod
+    async def acquire(self, key: str, bucket: TokenBucket) -> float:
+        """嘗試從 key 的 bucket 取一個 token.
+
+        Args:
+            key: bucket key（例如 "ip:/api/v1/auth/login:203.0.113.7"）
+            bucket: bucket 設定
+
+        Returns:
+            float: 0 代表放行；否則為下一個 token 可用前需等待的秒數
+        """
+        pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """程序內 token bucket（每個 worker 各自計數，適合單一副本）。"""
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        """初始化 InMemoryRateLimitStore.
+
+        Args:
+            max_keys: 最多保存的 bucket 數，超過時清除已補滿（閒置）的 bucket
+            clock: 取得目前時間（秒）的函式，測試時可替換
+        """
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> [tokens, updated_at, seconds_to_full]
+        self._buckets: dict[str, list[float]] = {}
+
+    async def acquire(self, key: str, bucket: TokenBucket) -> float:
+        """嘗試取一個 token（實作，不需 lock：期間沒有 await）。"""
+        now = self.clock()
+        state = self._buckets.get(key)
+        if state is None:
+            if len(self._buckets) >= self.max_keys:
+                self._sweep(now)
+            state = self._buckets[key] = [float(bucket.burst), now, bucket.burst / bucket.rate]
+        else:
+            state[0] = min(bucket.burst, state[0] + (now - state[1]) * bucket.rate)
+            state[1] = now
+
+        if state[0] >= 1:
+            state[0] -= 1
+            return 0.0
+        return (1 - state[0]) / bucket.rate
+
+    def _sweep(self, now: float) -> None:
+        """清除已補滿的 bucket；仍超過上限時清除最早建立的一半。"""
+        idle = [k for k, (_, updated, to_full) in self._buckets.items() if now - updated >= to_full]
+        for key in idle:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_keys:
+            for key in list(self._buckets)[: len(self._buckets) // 2]:
+                del self._buckets[key]
+
+
+# 以 Redis 伺服器時間計算，避免多副本間時鐘不一致；回傳字串避免 Lua number 被截成整數
+_ACQUIRE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 't', 'u')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 't', tostring(tokens), 'u', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """以 Redis（Lua script，原子操作）共用的 token bucket，適合多副本部署。
+
+    Redis 無法連線時放行請求（fail open），避免限流元件成為單點故障。
+    """
+
+    def __init__(self, redis: Redis, key_prefix: str = "ratelimit:"):
+        """初始化 RedisRateLimitStore.
+
+        Args:
+            redis: Redis 相容的 async client
+            key_prefix: key 前綴
+        """
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self._script = redis.register_script(_ACQUIRE_SCRIPT)
+
+    async def acquire(self, key: str, bucket: TokenBucket) -> float:
+        """嘗試取一個 token（實作）。"""
+        try:
+            wait = await self._script(
+                keys=[self.key_prefix + key], args=[bucket.rate, bucket.burst]
+            )
+        except Exception as e:
+            logger.warning("Rate limit store unavailable, allowing request: %s", e)
+            return 0.0
+        return float(wait)
+
+
+def retry_after_seconds(wait: float) -> int:
+    """將等待秒數轉為 Retry-After header 值（無條件進位，至少 1 秒）。"""
+    return max(1, math.ceil(wait))
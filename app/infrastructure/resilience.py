@@ -0,0 +1,336 @@
+"""Upstream resilience - Repository port 呼叫的 deadline、斷路器與 hedged 讀取。
+
+Supabase 變慢時，每個呼叫都會等滿 HTTP client timeout，worker 內的請求隨之堆積。
+``Resilience.wrap`` 以 proxy 包裝 Repository（與 ``Metrics.instrument`` 相同方式），
+每個公開的 async 方法：
+
+- 超過 ``deadline_seconds`` 即取消並拋出 ``UpstreamUnavailableError``
+- 經過 port 共用的 ``CircuitBreaker``：連續 ``failure_threshold`` 次失敗後開啟，
+  ``recovery_seconds`` 內直接拋出 ``UpstreamUnavailableError``（不呼叫上游）；之後進入
+  half-open 放行一個試探呼叫，成功則關閉、失敗則再次開啟
+- 列於 ``hedged`` 的冪等讀取在 ``hedge_delay_seconds`` 內未完成時再送出一次，
+  取先成功的結果（另一個取消）
+
+上游回應 4xx（例如密碼錯誤，429 除外）代表上游正常運作，不計為失敗。斷路器狀態與開啟
+次數記錄於 ``Metrics``（``upstream_circuit_state`` / ``upstream_circuit_trips_total``）。
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from app.use_cases.exceptions import UpstreamUnavailableError
+
+if TYPE_CHECKING:
+    from app.infrastructure.metrics import Metrics
+
+T = TypeVar("T")
+
+
+class CircuitState(IntEnum):
+    """斷路器狀態（數值即 metrics gauge 的值）。"""
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    """以連續失敗次數判斷的斷路器（只在單一 event loop 內使用，不需要 lock）。"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        on_change: Callable[[str, CircuitState], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """初始化 CircuitBreaker.
+
+        Args:
+            name: 名稱（錯誤訊息與指標用，通常為 port 名稱）
+            failure_threshold: 連續失敗幾次後開啟
+            recovery_seconds: 開啟後多久進入 half-open
+            on_change: 狀態改變時的 callback（name, 新狀態）
+            clock: 時間來源（測試可替換）
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.trips = 0
+        self.rejections = 0
+        self._on_change = on_change
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """目前狀態（開啟超過 recovery_seconds 時於讀取時轉為 half-open）。"""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """距離進入 half-open 的秒數（未開啟時為 0）。"""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_seconds - self._clock())
+
+    def acquire(self) -> bool:
+        """取得呼叫許可.
+
+        Returns:
+            bool: 是否為 half-open 的試探呼叫（結束時傳回 record_* / release）
+
+        Raises:
+            UpstreamUnavailableError: 斷路器開啟，或 half-open 時已有試探呼叫進行中
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return False
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejections += 1
+        raise UpstreamUnavailableError(
+            f"{self.name} is unavailable (circuit open)", retry_after=self.retry_after()
+        )
+
+    def record_success(self, probe: bool) -> None:
+        """記錄成功的呼叫（試探成功時關閉斷路器）。"""
+        if probe:
+            self._probing = False
+            self._transition(CircuitState.CLOSED)
+        if self._state is CircuitState.CLOSED:
+            self._failures = 0
+
+    def record_failure(self, probe: bool) -> None:
+        """記錄失敗的呼叫（試探失敗或連續失敗達門檻時開啟斷路器）。"""
+        if probe:
+            self._probing = False
+            self._trip()
+        elif self._state is CircuitState.CLOSED:
+            # 開啟前已送出的呼叫稍後失敗時不重複計入
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._trip()
+
+    def release(self, probe: bool) -> None:
+        """呼叫結束但不計成敗（例如呼叫端取消）時釋放試探名額。"""
+        if probe:
+            self._probing = False
+
+    def _trip(self) -> None:
+        self._failures = 0
+        self._opened_at = self._clock()
+        self.trips += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if self._state is state:
+            return
+        self._state = state
+        if self._on_change is not None:
+            self._on_change(self.name, state)
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """判斷例外是否代表上游故障（4xx 回應表示上游正常運作，429 除外）。"""
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    return not (isinstance(status, int) and 400 <= status < 500 and status != 429)
+
+
+async def hedged(call: Callable[[], Awaitable[T]], delay: float, on_hedge: Callable[[], None]) -> T:
+    """執行呼叫；``delay`` 秒內未完成時再送出一次，回傳先成功的結果.
+
+    Args:
+        call: 建立一次呼叫的 factory（必須是冪等操作）
+        delay: 送出第二次呼叫前等待的秒數
+        on_hedge: 送出第二次呼叫時的 callback（統計用）
+
+    Returns:
+        T: 先成功的結果
+
+    Raises:
+        Exception: 兩次呼叫都失敗時，拋出第一個完成的例外
+    """
+    pending = {asyncio.ensure_future(call())}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return done.pop().result()
+        on_hedge()
+        pending.add(asyncio.ensure_future(call()))
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            results = [(task, task.exception()) for task in done]
+            for task, error in results:
+                if error is None:
+                    return task.result()
+            errors.extend(error for _, error in results)
+        raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class Resilience:
+    """Repository port 的韌性設定與各 port 共用的斷路器。"""
+
+    def __init__(
+        self,
+        deadline_seconds: float = 5.0,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        hedge_delay_seconds: float = 0.0,
+        metrics: "Metrics | None" = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """初始化 Resilience.
+
+        Args:
+            deadline_seconds: 每次呼叫的 deadline（0 為不限制）
+            failure_threshold: 斷路器連續失敗門檻（0 為停用斷路器）
+            recovery_seconds: 斷路器開啟後進入 half-open 的秒數
+            hedge_delay_seconds: 冪等讀取送出第二次呼叫前等待的秒數（0 為停用）
+            metrics: 記錄斷路器狀態與 hedge 次數的 Metrics（None 時不記錄）
+            clock: 時間來源（測試可替換）
+        """
+        self.deadline_seconds = deadline_seconds
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.hedge_delay_seconds = hedge_delay_seconds
+        self.metrics = metrics
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, port: str) -> CircuitBreaker | None:
+        """取得 port 的斷路器（第一次取得時建立；停用時為 None）。"""
+        if self.failure_threshold <= 0:
+            return None
+        breaker = self._breakers.get(port)
+        if breaker is None:
+            breaker = self._breakers[port] = CircuitBreaker(
+                port,
+                failure_threshold=self.failure_threshold,
+                recovery_seconds=self.recovery_seconds,
+                on_change=self._state_changed,
+                clock=self._clock,
+            )
+            self._state_changed(port, CircuitState.CLOSED)
+        return breaker
+
+    def wrap(self, target: T, port: str, hedged_methods: Iterable[str] = ()) -> T:
+        """包裝 Repository，所有公開 async 方法套用 deadline 與斷路器.
+
+        Args:
+            target: Repository 實例（通常已經過 ``Metrics.instrument``，只計入實際送出的呼叫）
+            port: port 名稱（同名的 port 共用斷路器）
+            hedged_methods: 可 hedge 的冪等讀取方法名稱
+
+        Returns:
+            與 target 介面相同的 proxy
+        """
+        return _ResilientProxy(target, port, frozenset(hedged_methods), self)  # type: ignore[return-value]
+
+    def _state_changed(self, port: str, state: CircuitState) -> None:
+        if self.metrics is None:
+            return
+        self.metrics.circuit_state.labels(port).set(state)
+        if state is CircuitState.OPEN:
+            self.metrics.circuit_trips.labels(port).inc()
+
+    def _rejected(self, port: str) -> None:
+        if self.metrics is not None:
+            self.metrics.circuit_rejections.labels(port).inc()
+
+    def _hedged(self, port: str, method: str) -> None:
+        if self.metrics is not None:
+            self.metrics.hedged_calls.labels(port, method).inc()
+
+
+class _ResilientProxy:
+    """轉送屬性存取的 proxy；async 方法於第一次存取時包裝並快取。"""
+
+    def __init__(
+        self, target: Any, port: str, hedged_methods: frozenset[str], resilience: Resilience
+    ):
+        self._target = target
+        self._port = port
+        self._hedged_methods = hedged_methods
+        self._resilience = resilience
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attr):
+            return attr
+        wrapped = _guarded(attr, self._port, name, name in self._hedged_methods, self._resilience)
+        # 快取於 instance，之後的存取不再經過 __getattr__
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def __repr__(self) -> str:
+        return f"Resilient({self._target!r})"
+
+
+def _guarded(method: Any, port: str, name: str, hedge: bool, resilience: Resilience) -> Any:
+    """為單一 async 方法加上斷路器、deadline 與 hedge。"""
+    breaker = resilience.breaker(port)
+    deadline = resilience.deadline_seconds or None
+    hedge_delay = resilience.hedge_delay_seconds if hedge else 0.0
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        probe = False
+        if breaker is not None:
+            try:
+                probe = breaker.acquire()
+            except UpstreamUnavailableError:
+                resilience._rejected(port)
+                raise
+        try:
+            async with asyncio.timeout(deadline):
+                if hedge_delay > 0:
+                    result = await hedged(
+                        lambda: method(*args, **kwargs),
+                        hedge_delay,
+                        lambda: resilience._hedged(port, name),
+                    )
+                else:
+                    result = await method(*args, **kwargs)
+        except TimeoutError as e:
+            if breaker is not None:
+                breaker.record_failure(probe)
+            raise UpstreamUnavailableError(
+                f"{port}.{name} exceeded {deadline}s deadline",
+                retry_after=breaker.retry_after() if breaker is not None else None,
+            ) from e
+        except Exception as e:
+            if breaker is not None:
+                if is_upstream_failure(e):
+                    breaker.record_failure(probe)
+                else:
+                    breaker.record_success(probe)
+            raise
+        except BaseException:
+            # 呼叫端取消：不計成敗
+            if breaker is not None:
+                breaker.release(probe)
+            raise
+        if breaker is not None:
+            breaker.record_success(probe)
+        return result
+
+    return wrapper
@@ -0,0 +1,230 @@
+"""Production server - 多 worker 的 uvicorn 程序管理（worker 數、回收與平順關閉）。
+
+uvicorn 0.27 的 ``--workers`` 不會重啟結束的 worker，搭配 ``--limit-max-requests`` 時
+worker 會逐一結束而不補上。此模組改由 ``WorkerSupervisor`` 管理：
+
+- 父程序綁定 listening socket，以 spawn 啟動 N 個 worker 共用（kernel 分配連線）
+- worker 處理 ``max_requests``（加上隨機 jitter，避免同時重啟）個請求後自行平順結束，
+  父程序立即補上新的 worker；其餘 worker 持續服務，回收期間不中斷
+- 收到 SIGTERM / SIGINT 時先關閉父程序的 socket，再通知所有 worker 停止接受新連線、
+  等待進行中的請求完成（最多 ``graceful_timeout_seconds``），逾時仍未結束的 worker 強制終止
+- worker 啟動失敗（例如 lifespan 設定錯誤、app 匯入失敗）或啟動後
+  ``MIN_WORKER_UPTIME_SECONDS`` 內異常結束時，整個服務以 exit code 3 結束，不無限重啟
+"""
+
+import importlib.util
+import logging
+import math
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+
+import uvicorn
+
+from app.infrastructure.config import Settings
+
+logger = logging.getLogger("uvicorn.error")
+
+# uvicorn worker 啟動失敗時的 exit code（uvicorn.main.STARTUP_FAILURE）
+STARTUP_FAILURE = 3
+# worker 存活少於此秒數即異常結束時視為啟動失敗
+MIN_WORKER_UPTIME_SECONDS = 10.0
+# 強制終止前，超過 graceful timeout 再多等的秒數（lifespan shutdown 與程序結束）
+KILL_GRACE_SECONDS = 5.0
+
+
+def available_cpus() -> int:
+    """取得程序可用的 CPU 數（考慮 CPU affinity 與 cgroup v2 的 CPU 配額，至少為 1）。"""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+@dataclass(frozen=True)
+class ServerOptions:
+    """伺服器程序設定。"""
+
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    loop: str = "uvloop"
+    http: str = "httptools"
+    backlog: int = 2048
+    keepalive_seconds: int = 75
+    graceful_timeout_seconds: int = 30
+    max_requests: int = 0  # 0 為不回收
+    max_requests_jitter: int = 0
+    limit_concurrency: int = 0  # 0 為不限制
+    forwarded_allow_ips: str = "127.0.0.1"
+    access_log: bool = True
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ServerOptions":
+        """從 Settings 建立設定（worker 數 0 時依可用 CPU 數）。
+
+        多 worker 且未設定 ``REDIS_URL`` 時記錄警告：限流改用程序內計數，實際額度為設定值
+        乘以 worker 數；登入 session 快取與程序內快取也不跨 worker 共用。
+        """
+        workers = settings.server_workers or available_cpus()
+        if workers > 1 and not settings.redis_url:
+            logger.warning(
+                "Starting %d workers without REDIS_URL: rate limits are counted per worker "
+                "(up to %dx the configured limits) and caches are not shared",
+                workers,
+                workers,
+            )
+        return cls(
+            host=settings.server_host,
+            port=settings.server_port,
+            workers=workers,
+            loop=_available("uvloop", settings.server_loop),
+            http=_available("httptools", settings.server_http),
+            backlog=settings.server_backlog,
+            keepalive_seconds=settings.server_keepalive_seconds,
+            graceful_timeout_seconds=settings.server_graceful_timeout_seconds,
+            max_requests=settings.server_max_requests,
+            max_requests_jitter=settings.server_max_requests_jitter,
+            limit_concurrency=settings.server_limit_concurrency,
+            forwarded_allow_ips=settings.server_forwarded_allow_ips,
+            access_log=settings.server_access_log,
+        )
+
+    def uvicorn_kwargs(self, rng: random.Random | None = None) -> dict:
+        """單一 worker 的 uvicorn.Config 參數（每次呼叫重新抽 max requests jitter）."""
+        max_requests = None
+        if self.max_requests > 0:
+            max_requests = self.max_requests + (rng or random).randint(0, self.max_requests_jitter)
+        return {
+            "host": self.host,
+            "port": self.port,
+            "loop": self.loop,
+            "http": self.http,
+            "backlog": self.backlog,
+            "timeout_keep_alive": self.keepalive_seconds,
+            "timeout_graceful_shutdown": self.graceful_timeout_seconds,
+            "limit_max_requests": max_requests,
+            "limit_concurrency": self.limit_concurrency or None,
+            "proxy_headers": True,
+            "forwarded_allow_ips": self.forwarded_allow_ips,
+            "access_log": self.access_log,
+            "lifespan": "on",
+        }
+
+
+def _available(module: str, choice: str) -> str:
+    # uvloop / httptools 未安裝時（例如 Windows）退回 auto，不讓服務無法啟動
+    if choice == module and importlib.util.find_spec(module) is None:
+        logger.warning("%s is not installed; falling back to auto", module)
+        return "auto"
+    return choice
+
+
+def _serve(app: str, kwargs: dict, sock: socket.socket) -> None:
+    """Worker 程序進入點（於 spawn 的子程序執行）。"""
+    server = uvicorn.Server(uvicorn.Config(app, **kwargs))
+    server.run(sockets=[sock])
+    if not server.started:
+        sys.exit(STARTUP_FAILURE)
+
+
+class WorkerSupervisor:
+    """啟動並維持固定數量的 uvicorn worker。"""
+
+    def __init__(self, options: ServerOptions, app: str = "app.main:app"):
+        """初始化 WorkerSupervisor.
+
+        Args:
+            options: 伺服器設定
+            app: ASGI app 的 import 字串（worker 於子程序內匯入）
+        """
+        self.options = options
+        self.app = app
+        self.recycled = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: list[SpawnProcess] = []
+        self._started_at: dict[int, float] = {}  # worker pid -> 啟動時間
+        self._stopping = threading.Event()
+        self._rng = random.Random()
+
+    def run(self) -> int:
+        """啟動 worker 並持續監控直到收到停止訊號.
+
+        Returns:
+            int: 程序 exit code（worker 啟動失敗時為 3）
+        """
+        # 建立 Config 同時套用 uvicorn 的 logging 設定
+        config = uvicorn.Config(self.app, **self.options.uvicorn_kwargs())
+        sock = config.bind_socket()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: self._stopping.set())
+        logger.info(
+            "Starting %d workers (loop=%s, http=%s, max_requests=%d+%d)",
+            self.options.workers,
+            self.options.loop,
+            self.options.http,
+            self.options.max_requests,
+            self.options.max_requests_jitter,
+        )
+        self._workers = [self._spawn(sock) for _ in range(self.options.workers)]
+        exit_code = 0
+        while not self._stopping.wait(0.2):
+            for index, worker in enumerate(self._workers):
+                if worker.is_alive():
+                    continue
+                uptime = time.monotonic() - self._started_at.pop(worker.pid)
+                if worker.exitcode == STARTUP_FAILURE or (
+                    worker.exitcode != 0 and uptime < MIN_WORKER_UPTIME_SECONDS
+                ):
+                    logger.error("Worker [%d] failed to start; shutting down", worker.pid)
+                    exit_code = STARTUP_FAILURE
+                    self._stopping.set()
+                    break
+                if worker.exitcode == 0:
+                    self.recycled += 1
+                    logger.info("Worker [%d] recycled", worker.pid)
+                else:
+                    logger.warning("Worker [%d] died (exit code %s)", worker.pid, worker.exitcode)
+                self._workers[index] = self._spawn(sock)
+        # 不再補 worker：父程序先釋放 socket，worker 各自關閉後 kernel 即不再接受新連線
+        sock.close()
+        self._shutdown()
+        return exit_code
+
+    def _spawn(self, sock: socket.socket) -> SpawnProcess:
+        worker = self._context.Process(
+            target=_serve,
+            args=(self.app, self.options.uvicorn_kwargs(self._rng), sock),
+            daemon=False,
+        )
+        worker.start()
+        self._started_at[worker.pid] = time.monotonic()
+        return worker
+
+    def _shutdown(self) -> None:
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()  # SIGTERM：uvicorn 停止接受連線並等待進行中的請求
+        deadline = time.monotonic() + self.options.graceful_timeout_seconds + KILL_GRACE_SECONDS
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+            if worker.is_alive():
+                logger.warning("Worker [%d] did not stop in time; killing", worker.pid)
+                worker.kill()
+                worker.join()
+        logger.info("Stopped %d workers", len(self._workers))
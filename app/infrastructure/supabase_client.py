@@ -1,20 +1,169 @@
-"""Supabase client singleton - 供所有 repositories 共用。"""
+"""Supabase client provider - 供所有 repositories 共用（由 app lifespan 管理）。
 
-from supabase import Client, create_client
+`supabase` SDK 匯入成本高，只在第一次建立 client 時才匯入。
+"""
 
-from app.infrastructure.config import SUPABASE_ANON_KEY, SUPABASE_URL
+from __future__ import annotations
 
-# Module-level singleton
-_supabase_client: Client | None = None
+import os
+from typing import TYPE_CHECKING
 
+import httpx
 
-def get_supabase_client() -> Client:
-    """取得 Supabase client singleton.
+if TYPE_CHECKING:
+    from postgrest import AsyncPostgrestClient
+    from supabase import AsyncClient, Client
+    from supabase_auth import AsyncGoTrueClient
 
-    Returns:
-        Client: Supabase client 實例
+
+class SupabaseClientProvider:
+    """Supabase client 提供者：延遲建立、fork-safe、共用 HTTP 連線池。
+
+    - client 於第一次取用時才建立（import 與 app 建立時不做任何連線）
+    - 記錄建立時的 PID；fork 後的子程序會丟棄繼承來的 client 重新建立
+    - 伺服器端不保存 session、不自動 refresh token，避免背景 task 與跨請求狀態
+    - Auth 呼叫使用獨立的 GoTrue client：``AsyncClient`` 會在登入 / 換發 token 時把
+      ``Authorization`` header 換成該使用者的 token，共用時資料查詢會以最後登入的使用者身分執行
     """
-    global _supabase_client
-    if _supabase_client is None:
-        _supabase_client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-    return _supabase_client
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 30.0,
+        timeout_seconds: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """初始化 SupabaseClientProvider.
+
+        Args:
+            url: Supabase 專案 URL
+            key: Supabase anon key
+            max_connections: 連線池最大連線數
+            max_keepalive_connections: 最多保留的 keep-alive 連線數
+            keepalive_expiry_seconds: 閒置 keep-alive 連線保留秒數
+            timeout_seconds: HTTP 請求逾時（秒）
+            transport: async HTTP transport（測試可替換，None 時使用預設連線）
+        """
+        self.url = url
+        self.key = key
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self.timeout = httpx.Timeout(timeout_seconds)
+        self.transport = transport
+        self._pid: int | None = None
+        self._async_http: httpx.AsyncClient | None = None
+        self._async_client: AsyncClient | None = None
+        self._auth_client: AsyncGoTrueClient | None = None
+        self._sync_http: httpx.Client | None = None
+        self._sync_client: Client | None = None
+
+    def _ensure_process(self) -> None:
+        """fork 後丟棄從父程序繼承的 client（連線不可跨程序共用）。"""
+        pid = os.getpid()
+        if self._pid != pid:
+            self._async_http = self._async_client = self._auth_client = None
+            self._sync_http = self._sync_client = None
+            self._pid = pid
+
+    def get_async_client(self) -> AsyncClient:
+        """取得 Supabase async client（第一次呼叫時建立）.
+
+        Returns:
+            AsyncClient: Supabase async client 實例
+        """
+        self._ensure_process()
+        if self._async_client is None:
+            from supabase import AsyncClient, AsyncClientOptions
+
+            options = AsyncClientOptions(
+                auto_refresh_token=False,
+                persist_session=False,
+                httpx_client=self._get_async_http(),
+            )
+            self._async_client = AsyncClient(self.url, self.key, options)
+        return self._async_client
+
+    def get_auth_client(self) -> AsyncGoTrueClient:
+        """取得 Supabase Auth（GoTrue）async client（第一次呼叫時建立）.
+
+        與 ``get_async_client`` 共用連線池，但不訂閱 auth 事件：登入、換發 token 不會改變
+        資料查詢使用的 ``Authorization`` header。
+
+        Returns:
+            AsyncGoTrueClient: GoTrue async client 實例
+        """
+        self._ensure_process()
+        if self._auth_client is None:
+            from supabase_auth import AsyncGoTrueClient
+
+            self._auth_client = AsyncGoTrueClient(
+                url=f"{self.url.rstrip('/')}/auth/v1",
+                headers={"apikey": self.key, "Authorization": f"Bearer {self.key}"},
+                auto_refresh_token=False,
+                persist_session=False,
+                http_client=self._get_async_http(),
+            )
+        return self._auth_client
+
+    def get_user_data_client(self, access_token: str) -> AsyncPostgrestClient:
+        """建立以使用者身分查詢的 PostgREST client（每個請求一個，共用連線池）.
+
+        資料表啟用 RLS，``get_async_client`` 的 anon 身分讀不到任何使用者的資料；
+        以呼叫者的 access token 查詢時，PostgREST 依 ``auth.uid()`` 套用 policy。
+
+        Args:
+            access_token: 已驗證的使用者 access token
+
+        Returns:
+            AsyncPostgrestClient: 只屬於該請求的 PostgREST client
+        """
+        self._ensure_process()
+        from postgrest import AsyncPostgrestClient
+
+        return AsyncPostgrestClient(
+            f"{self.url.rstrip('/')}/rest/v1",
+            headers={"apikey": self.key, "Authorization": f"Bearer {access_token}"},
+            http_client=self._get_async_http(),
+        )
+
+    def _get_async_http(self) -> httpx.AsyncClient:
+        """取得共用的 async HTTP 連線池。"""
+        if self._async_http is None:
+            self._async_http = httpx.AsyncClient(
+                limits=self.limits, timeout=self.timeout, transport=self.transport
+            )
+        return self._async_http
+
+    def get_client(self) -> Client:
+        """取得 Supabase sync client（第一次呼叫時建立）.
+
+        Returns:
+            Client: Supabase client 實例
+        """
+        self._ensure_process()
+        if self._sync_client is None:
+            from supabase import ClientOptions, create_client
+
+            self._sync_http = httpx.Client(limits=self.limits, timeout=self.timeout)
+            options = ClientOptions(
+                auto_refresh_token=False,
+                persist_session=False,
+                httpx_client=self._sync_http,
+            )
+            self._sync_client = create_client(self.url, self.key, options)
+        return self._sync_client
+
+    async def aclose(self) -> None:
+        """關閉連線池（app shutdown 時呼叫）。"""
+        if self._async_http is not None and self._pid == os.getpid():
+            await self._async_http.aclose()
+        if self._sync_http is not None and self._pid == os.getpid():
+            self._sync_http.close()
+        self._async_http = self._async_client = self._auth_client = None
+        self._sync_http = self._sync_client = None
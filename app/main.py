@@ -1,12 +1,203 @@
 """FastAPI application - Clean Architecture entry point."""
 
+import math
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from scalar_fastapi import get_scalar_api_reference
 
-from app.adapters.api.routers import auth, health, system
+from app.adapters.api.middleware.http_cache import CacheRule, HttpCache, HttpCacheMiddleware
+from app.adapters.api.middleware.metrics import MetricsMiddleware
+from app.adapters.api.middleware.profiling import ProfilingMiddleware
+from app.adapters.api.middleware.rate_limit import RateLimiter, RateLimitMiddleware, RouteLimit
+from app.adapters.api.routers import auth, health, metrics, products, reports, system
+from app.infrastructure.config import get_settings
+from app.use_cases.exceptions import UpstreamUnavailableError
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """應用程式 lifespan - 於每個 worker 程序內驗證設定並建立 Singleton 依賴，關閉時清理。"""
+    # Startup：設定只在此驗證一次（缺少必要環境變數時啟動失敗）
+    settings = get_settings()
+
+    # Adapter / SDK 於啟動時才匯入，import app.main 保持輕量
+    from app.adapters.repositories.cached_auth_repository import CachedAuthRepository
+    from app.adapters.repositories.supabase_auth_repository import AsyncSupabaseAuthRepository
+    from app.adapters.repositories.supabase_database_repository import (
+        AsyncSupabaseDatabaseRepository,
+    )
+    from app.adapters.security.jwt_token_verifier import JwtTokenVerifier, SigningKeyCache
+    from app.infrastructure.cache import TwoTierCache
+    from app.infrastructure.http_cache import ResponseCache
+    from app.infrastructure.metrics import Metrics
+    from app.infrastructure.profiling import RequestProfiler
+    from app.infrastructure.rate_limit import (
+        InMemoryRateLimitStore,
+        RedisRateLimitStore,
+        TokenBucket,
+    )
+    from app.infrastructure.resilience import Resilience
+    from app.infrastructure.supabase_client import SupabaseClientProvider
+    from app.use_cases.health.health_monitor import HealthMonitor
+
+    # client 於 worker 內（fork 之後）才建立，連線池由 provider 管理
+    supabase_provider = SupabaseClientProvider(
+        url=settings.supabase_url,
+        key=settings.supabase_anon_key,
+        max_connections=settings.supabase_http_max_connections,
+        max_keepalive_connections=settings.supabase_http_max_keepalive,
+        keepalive_expiry_seconds=settings.supabase_http_keepalive_expiry_seconds,
+        timeout_seconds=settings.supabase_http_timeout_seconds,
+    )
+    token_verifier = JwtTokenVerifier(
+        SigningKeyCache(
+            jwks_url=f"{settings.supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json",
+            shared_secret=settings.supabase_jwt_secret,
+            ttl_seconds=settings.jwt_keys_ttl_seconds,
+        ),
+        cache_size=settings.jwt_verified_cache_size,
+    )
+    app_metrics = Metrics()
+    resilience = Resilience(
+        deadline_seconds=settings.upstream_deadline_seconds,
+        failure_threshold=settings.upstream_circuit_failure_threshold,
+        recovery_seconds=settings.upstream_circuit_recovery_seconds,
+        hedge_delay_seconds=settings.upstream_hedge_delay_seconds,
+        metrics=app_metrics,
+    )
+    # 指標只計入實際的上游呼叫（快取命中與斷路器開啟時的快速失敗不計）
+    auth_repository = resilience.wrap(
+        app_metrics.instrument(
+            AsyncSupabaseAuthRepository(auth_client=supabase_provider.get_auth_client())
+        ),
+        port="AsyncAuthRepository",
+    )
+    auth_cache = None
+    if settings.auth_session_cache_size > 0:
+        auth_repository = auth_cache = CachedAuthRepository(
+            auth_repository,
+            max_entries=settings.auth_session_cache_size,
+            max_age_seconds=settings.auth_session_max_age_seconds,
+            refresh_margin_seconds=settings.auth_session_refresh_margin_seconds,
+        )
+    health_monitor = HealthMonitor(
+        db_repo=resilience.wrap(
+            app_metrics.instrument(
+                AsyncSupabaseDatabaseRepository(
+                    supabase_client=supabase_provider.get_async_client(),
+                    timeout_seconds=settings.health_probe_timeout_seconds,
+                )
+            ),
+            port="AsyncDatabaseRepository",
+            hedged_methods=("check_connection",),
+        ),
+        interval_seconds=settings.health_probe_interval_seconds,
+        timeout_seconds=settings.health_probe_timeout_seconds,
+        stale_after_seconds=settings.health_probe_stale_after_seconds,
+    )
+    redis = None
+    if settings.redis_url:
+        from redis.asyncio import Redis
+
+        redis = Redis.from_url(settings.redis_url)
+    cache = TwoTierCache(remote=redis, local_max_entries=settings.cache_local_max_entries)
+
+    def per_minute(requests: int) -> TokenBucket | None:
+        return TokenBucket.per_minute(requests) if requests > 0 else None
+
+    auth_limit = per_minute(settings.rate_limit_auth_ip_per_minute)
+    bulk_signup_limit = None
+    if settings.rate_limit_bulk_signup_user_per_minute > 0:
+        bulk_signup_limit = TokenBucket.per_minute(
+            settings.rate_limit_bulk_signup_user_per_minute,
+            burst=settings.rate_limit_bulk_signup_user_burst,
+        )
+    rate_limiter = RateLimiter(
+        store=RedisRateLimitStore(redis) if redis is not None else InMemoryRateLimitStore(),
+        rules=[
+            RouteLimit("/api/v1/auth/login", per_ip=auth_limit),
+            RouteLimit("/api/v1/auth/signup", per_ip=auth_limit),
+            # 批次註冊只計入呼叫者自己的額度：請求本身計一筆，其餘項目由端點逐筆計入
+            RouteLimit("/api/v1/auth/signup/bulk", per_user=bulk_signup_limit),
+            RouteLimit(
+                "/api/*",
+                per_ip=per_minute(settings.rate_limit_api_ip_per_minute),
+                per_user=per_minute(settings.rate_limit_api_user_per_minute),
+            ),
+        ],
+        token_verifier=token_verifier,
+    )
+    app.state.settings = settings
+    app.state.metrics = app_metrics
+    app.state.resilience = resilience
+    app.state.supabase_provider = supabase_provider
+    app.state.token_verifier = token_verifier
+    app.state.auth_repository = auth_repository
+    app.state.health_monitor = health_monitor
+    app.state.cache = cache
+    app.state.rate_limiter = rate_limiter
+
+    # OpenAPI schema 每個程序只產生一次（FastAPI 會保留結果），序列化後的 JSON 由回應快取保存
+    app.openapi()
+    static_policy = "public, max-age=300"
+    app.state.http_cache = HttpCache(
+        rules=[
+            CacheRule("/", static_policy, store_body=True),
+            CacheRule(app.openapi_url, static_policy, store_body=True),
+            CacheRule("/docs", static_policy, store_body=True),
+            CacheRule("/favicon.ico", "public, max-age=86400", store_body=True),
+            CacheRule("/static/*", "public, max-age=86400"),
+            # 使用者資料：每次都要重新驗證，ETag 相同時回 304 省下傳輸
+            CacheRule("/api/v1/products/*", "private, no-cache"),
+        ],
+        store=ResponseCache(
+            max_entries=settings.http_cache_max_entries,
+            max_body_bytes=settings.http_cache_max_body_bytes,
+        ),
+    )
+    profiler = RequestProfiler(
+        output_dir=settings.profiling_output_dir,
+        sample_rate=settings.profiling_sample_rate,
+        admin_token=settings.profiling_admin_token,
+        interval_seconds=settings.profiling_interval_seconds,
+    )
+    app.state.profiler = profiler if profiler.enabled else None
+    llm = None
+    app.state.report_generator = None
+    if settings.openai_api_key:
+        from app.adapters.external.openai_llm import OpenAILLM
+        from app.use_cases.report.report_generator import ReportGenerator
+
+        llm = OpenAILLM(
+            api_key=settings.openai_api_key,
+            model=settings.openai_model,
+            base_url=settings.openai_base_url,
+        )
+        app.state.report_generator = ReportGenerator(
+            llm=app_metrics.instrument(llm),
+            cache=cache,
+            ttl_seconds=settings.report_cache_ttl_seconds,
+            batch_window_seconds=settings.report_batch_window_seconds,
+            max_batch_size=settings.report_batch_max_size,
+        )
+    health_monitor.start()
+
+    yield
+
+    # Shutdown：停止背景探測並關閉連線池
+    await health_monitor.stop()
+    if auth_cache is not None:
+        await auth_cache.aclose()
+    if llm is not None:
+        await app.state.report_generator.aclose()
+        await llm.aclose()
+    await cache.aclose()
+    await supabase_provider.aclose()
+
 
 app = FastAPI(
     title="Amazon Product Monitoring API",
@@ -14,12 +205,37 @@ app = FastAPI(
     description="Amazon 產品監控與優化工具 - 追蹤產品表現、分析競爭對手並提供優化建議",
     docs_url=None,  # 停用 Swagger UI - 使用 Scalar 取代
     redoc_url=None,  # 停用 ReDoc
+    lifespan=lifespan,
 )
 
+# HTTP 快取在最內層：profiling 與 inline profile 輸出不會被保存
+app.add_middleware(HttpCacheMiddleware)
+# Profiling：只量 app 本身（含快取命中），不含限流與指標
+app.add_middleware(ProfilingMiddleware)
+# 限流（RateLimiter 於 lifespan 建立，之前的請求一律放行）
+app.add_middleware(RateLimitMiddleware)
+# 最外層：被限流（429）的請求也計入指標
+app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable(request: Request, exc: UpstreamUnavailableError):
+    """上游斷路器開啟或超過 deadline 時快速回應 503（斷路器開啟時附 Retry-After）。"""
+    headers = {"Retry-After": str(math.ceil(exc.retry_after))} if exc.retry_after else None
+    return JSONResponse(
+        {"detail": str(exc)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers=headers,
+    )
+
+
 # 註冊 routers
 app.include_router(system.router)
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(auth.router)
+app.include_router(reports.router)
+app.include_router(products.router)
 
 
 @app.get("/docs", include_in_schema=False)
@@ -0,0 +1,24 @@
+"""Production server entry point - 以多 worker 執行 app.main:app。
+
+Usage::
+
+    python -m app.server
+
+設定來自環境變數 / .env 的 ``SERVER_*``（見 ``.env.example``）；開發時請改用
+``uvicorn app.main:app --reload``。
+"""
+
+import sys
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.server import ServerOptions, WorkerSupervisor
+
+
+def main() -> int:
+    """驗證設定後啟動 worker（設定錯誤時在 fork 之前就失敗）。"""
+    settings = get_settings()
+    return WorkerSupervisor(ServerOptions.from_settings(settings)).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
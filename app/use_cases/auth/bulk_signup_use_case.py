@@ -0,0 +1,175 @@
+"""Bulk signup use case - 以有界並行批次註冊使用者，逐筆串流回傳結果。
+
+- 輸入為 async iterator（JSON 陣列或 NDJSON 串流皆可），最多同時 ``concurrency`` 筆註冊；
+  並行已滿時不再讀取輸入，串流輸入的記憶體用量與批次大小無關
+- 結果依完成順序逐筆產生（以 ``index`` 對應輸入順序），不等整批完成
+- 冪等：帶 idempotency key 的項目成功後保存結果 ``idempotency_ttl_seconds`` 秒，
+  重試時直接回傳保存的結果（``replayed``），不會重複建立使用者；失敗的項目不保存，可直接重試。
+  同一個 key 同時只會有一個註冊在執行
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import asdict, dataclass
+from typing import Literal
+
+from app.domain.entities.user import User
+from app.use_cases.auth.ports import AsyncAuthRepository
+from app.use_cases.cache.ports import CachePort
+
+
+@dataclass(frozen=True, slots=True)
+class SignupItem:
+    """批次註冊的單筆輸入。"""
+
+    email: str
+    password: str
+    idempotency_key: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidSignupItem:
+    """格式錯誤的單筆輸入（不註冊，直接回報失敗）。"""
+
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class BulkSignupItemResult:
+    """批次註冊的單筆結果。"""
+
+    index: int  # 輸入順序（由 0 起算）
+    status: Literal["created", "failed"]
+    email: str | None = None
+    user: User | None = None
+    error: str | None = None
+    replayed: bool = False  # 由冪等紀錄回傳，本次未呼叫上游
+
+
+@dataclass
+class BulkSignupStats:
+    """批次註冊統計計數。"""
+
+    items: int = 0
+    created: int = 0
+    failed: int = 0
+    replayed: int = 0
+
+
+class AsyncBulkSignupUseCase:
+    """批次註冊 Use Case（非同步版本）- 供 async 路由使用。"""
+
+    def __init__(
+        self,
+        auth_repo: AsyncAuthRepository,
+        cache: CachePort,
+        concurrency: int = 8,
+        idempotency_ttl_seconds: float = 24 * 3600,
+    ):
+        """初始化 AsyncBulkSignupUseCase.
+
+        Args:
+            auth_repo: Async Auth Repository 實例（依賴抽象）
+            cache: 保存冪等紀錄的快取（依賴抽象）
+            concurrency: 同時進行的註冊數
+            idempotency_ttl_seconds: 冪等紀錄保存秒數
+        """
+        self.auth_repo = auth_repo
+        self.cache = cache
+        self.concurrency = concurrency
+        self.idempotency_ttl_seconds = idempotency_ttl_seconds
+        self.stats = BulkSignupStats()
+
+    async def stream(
+        self,
+        items: AsyncIterable[SignupItem | InvalidSignupItem],
+        scope: str = "",
+    ) -> AsyncIterator[BulkSignupItemResult]:
+        """執行批次註冊並依完成順序逐筆產生結果.
+
+        Args:
+            items: 輸入項目（依序讀取）
+            scope: 冪等 key 的命名空間（例如呼叫者的使用者 ID，不同呼叫者的 key 互不影響）
+
+        Yields:
+            BulkSignupItemResult: 單筆結果（單筆失敗不會中斷整批）
+        """
+        pending: set[asyncio.Task[BulkSignupItemResult]] = set()
+        source = aiter(items)
+        index = 0
+        exhausted = False
+        try:
+            while not exhausted or pending:
+                # 並行未滿時才讀取下一筆輸入（背壓）
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        item = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.create_task(self._signup(index, item, scope)))
+                    index += 1
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    self._count(result)
+                    yield result
+        finally:
+            # client 中斷串流時取消尚未完成的註冊
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _signup(
+        self, index: int, item: SignupItem | InvalidSignupItem, scope: str
+    ) -> BulkSignupItemResult:
+        if isinstance(item, InvalidSignupItem):
+            return BulkSignupItemResult(index=index, status="failed", error=item.error)
+        try:
+            if item.idempotency_key is None:
+                user = await self.auth_repo.signup(item.email, item.password)
+                replayed = False
+            else:
+                user, replayed = await self._signup_once(item, scope)
+        except Exception as e:
+            return BulkSignupItemResult(
+                index=index, status="failed", email=item.email, error=str(e)
+            )
+        return BulkSignupItemResult(
+            index=index, status="created", email=item.email, user=user, replayed=replayed
+        )
+
+    async def _signup_once(self, item: SignupItem, scope: str) -> tuple[User, bool]:
+        digest = hashlib.sha256(f"{scope}\0{item.idempotency_key}".encode()).hexdigest()
+        key = f"signup:idempotency:{digest}"
+        stored = await self.cache.get(key)
+        if stored is not None:
+            return self._decode(stored, item), True
+
+        async def load() -> bytes:
+            user = await self.auth_repo.signup(item.email, item.password)
+            return json.dumps({"email": item.email.lower(), "user": asdict(user)}).encode()
+
+        return self._decode(
+            await self.cache.get_or_load(key, load, self.idempotency_ttl_seconds), item
+        ), False
+
+    @staticmethod
+    def _decode(stored: bytes, item: SignupItem) -> User:
+        record = json.loads(stored)
+        # 同一個 key 用於不同 email 時視為呼叫端錯誤，不回傳其他使用者的資料
+        if record["email"] != item.email.lower():
+            raise ValueError("Idempotency key was already used for a different email")
+        return User(**record["user"])
+
+    def _count(self, result: BulkSignupItemResult) -> None:
+        self.stats.items += 1
+        if result.status == "created":
+            self.stats.created += 1
+            self.stats.replayed += result.replayed
+        else:
+            self.stats.failed += 1
@@ -3,10 +3,10 @@
 from dataclasses import dataclass
 
 from app.domain.entities.user import User
-from app.use_cases.auth.ports import AuthRepository
+from app.use_cases.auth.ports import AsyncAuthRepository, AuthRepository
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoginResult:
     """登入結果。"""
 
@@ -43,3 +43,31 @@ class LoginUseCase:
 
         # 返回結果
         return LoginResult(access_token=access_token, user=user)
+
+
+class AsyncLoginUseCase:
+    """登入 Use Case（非同步版本）- 供 async 路由使用。"""
+
+    def __init__(self, auth_repo: AsyncAuthRepository):
+        """初始化 AsyncLoginUseCase.
+
+        Args:
+            auth_repo: Async Auth Repository 實例（依賴抽象）
+        """
+        self.auth_repo = auth_repo
+
+    async def execute(self, email: str, password: str) -> LoginResult:
+        """執行登入邏輯.
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            LoginResult: 登入結果（包含 access token 和使用者資訊）
+
+        Raises:
+            Exception: 當登入失敗時（例如密碼錯誤）
+        """
+        access_token, user = await self.auth_repo.login(email, password)
+        return LoginResult(access_token=access_token, user=user)
@@ -0,0 +1,26 @@
+"""Logout use case - 處理使用者登出邏輯。"""
+
+from app.use_cases.auth.ports import AsyncAuthRepository
+
+
+class AsyncLogoutUseCase:
+    """登出 Use Case（非同步版本）- 供 async 路由使用。"""
+
+    def __init__(self, auth_repo: AsyncAuthRepository):
+        """初始化 AsyncLogoutUseCase.
+
+        Args:
+            auth_repo: Async Auth Repository 實例（依賴抽象）
+        """
+        self.auth_repo = auth_repo
+
+    async def execute(self, access_token: str) -> None:
+        """執行登出邏輯（撤銷使用者所有 session，已快取的登入一併失效）.
+
+        Args:
+            access_token: 使用者的 access token
+
+        Raises:
+            Exception: 當 token 無效時
+        """
+        await self.auth_repo.logout(access_token)
@@ -1,10 +1,21 @@
 """Auth Repository 抽象介面（Ports）。"""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 from app.domain.entities.user import User
 
 
+@dataclass(frozen=True, slots=True)
+class AuthSession:
+    """登入 session（access token 到期前可用 refresh token 換發）。"""
+
+    access_token: str
+    refresh_token: str
+    expires_at: float  # access token 到期的 Unix 時間（秒）
+    user: User
+
+
 class AuthRepository(ABC):
     """認證 Repository 介面。"""
 
@@ -39,3 +50,101 @@ class AuthRepository(ABC):
             Exception: 當憑證無效時
         """
         pass
+
+
+class AsyncAuthRepository(ABC):
+    """認證 Repository 非同步介面（供 async 路由使用，不阻塞 event loop）。"""
+
+    @abstractmethod
+    async def signup(self, email: str, password: str) -> User:
+        """註冊新使用者。
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            User: 建立的使用者
+
+        Raises:
+            Exception: 當 email 已存在時
+        """
+        pass
+
+    @abstractmethod
+    async def login(self, email: str, password: str) -> tuple[str, User]:
+        """使用者登入。
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            tuple[str, User]: (access_token, user)
+
+        Raises:
+            Exception: 當憑證無效時
+        """
+        pass
+
+    @abstractmethod
+    async def login_session(self, email: str, password: str) -> AuthSession:
+        """使用者登入並取得完整 session.
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            AuthSession: 含 refresh token 與到期時間的 session
+
+        Raises:
+            Exception: 當憑證無效時
+        """
+        pass
+
+    @abstractmethod
+    async def refresh_session(self, refresh_token: str) -> AuthSession:
+        """以 refresh token 換發 session.
+
+        Args:
+            refresh_token: refresh token（換發後即失效）
+
+        Returns:
+            AuthSession: 新的 session
+
+        Raises:
+            Exception: 當 refresh token 無效或已撤銷時（例如已登出）
+        """
+        pass
+
+    @abstractmethod
+    async def logout(self, access_token: str) -> None:
+        """登出：撤銷使用者所有 session 的 refresh token.
+
+        Args:
+            access_token: 使用者的 access token
+
+        Raises:
+            Exception: 當 token 無效時
+        """
+        pass
+
+
+class TokenVerifier(ABC):
+    """Access token 驗證介面（於本機驗證，不呼叫 Supabase）。"""
+
+    @abstractmethod
+    async def verify(self, token: str) -> dict:
+        """驗證 access token 並回傳 payload。
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            dict: 驗證後的 JWT payload
+
+        Raises:
+            InvalidTokenError: 當 token 無效或已過期時
+        """
+        pass
@@ -3,10 +3,10 @@
 from dataclasses import dataclass
 
 from app.domain.entities.user import User
-from app.use_cases.auth.ports import AuthRepository
+from app.use_cases.auth.ports import AsyncAuthRepository, AuthRepository
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SignupResult:
     """註冊結果。"""
 
@@ -43,3 +43,31 @@ class SignupUseCase:
 
         # 返回結果
         return SignupResult(user=user, message="User created successfully")
+
+
+class AsyncSignupUseCase:
+    """註冊 Use Case（非同步版本）- 供 async 路由使用。"""
+
+    def __init__(self, auth_repo: AsyncAuthRepository):
+        """初始化 AsyncSignupUseCase。
+
+        Args:
+            auth_repo: Async Auth Repository 實例（依賴抽象）
+        """
+        self.auth_repo = auth_repo
+
+    async def execute(self, email: str, password: str) -> SignupResult:
+        """執行註冊邏輯。
+
+        Args:
+            email: 使用者 email
+            password: 使用者密碼
+
+        Returns:
+            SignupResult: 註冊結果（包含使用者資訊和訊息）
+
+        Raises:
+            Exception: 當註冊失敗時（例如 email 已存在）
+        """
+        user = await self.auth_repo.signup(email, password)
+        return SignupResult(user=user, message="User created successfully")
@@ -0,0 +1,31 @@
+"""Verify token use case - 驗證 access token 並取得目前使用者。"""
+
+from app.domain.entities.user import User
+from app.use_cases.auth.ports import TokenVerifier
+
+
+class VerifyTokenUseCase:
+    """驗證 Token Use Case - 主程式邏輯。"""
+
+    def __init__(self, token_verifier: TokenVerifier):
+        """初始化 VerifyTokenUseCase.
+
+        Args:
+            token_verifier: Token Verifier 實例（依賴抽象）
+        """
+        self.token_verifier = token_verifier
+
+    async def execute(self, token: str) -> User:
+        """執行 token 驗證邏輯.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            User: token 所屬的使用者
+
+        Raises:
+            InvalidTokenError: 當 token 無效或已過期時
+        """
+        payload = await self.token_verifier.verify(token)
+        return User.from_jwt_payload(payload)
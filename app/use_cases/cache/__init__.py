@@ -0,0 +1 @@
+"""Cache use case ports."""
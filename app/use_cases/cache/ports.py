@@ -0,0 +1,69 @@
+"""Cache 抽象介面（Ports）。"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+Loader = Callable[[], Awaitable[bytes]]
+
+
+class CachePort(ABC):
+    """快取服務介面（值一律為 bytes，序列化由呼叫端負責）。"""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """取得未過期的快取值。
+
+        Args:
+            key: 快取 key
+
+        Returns:
+            bytes | None: 快取值，不存在或已過期時為 None
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """設定快取。
+
+        Args:
+            key: 快取 key
+            value: 快取值
+            ttl_seconds: 存活秒數
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """刪除快取。
+
+        Args:
+            key: 快取 key
+        """
+        pass
+
+    @abstractmethod
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Loader,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+    ) -> bytes:
+        """取得快取，未命中時呼叫 loader 載入並寫入快取。
+
+        同一個 key 同時只會有一個 loader 在執行，其餘呼叫等待同一個結果。
+        過期未超過 stale_seconds 的值會直接回傳，並在背景重新載入（stale-while-revalidate）。
+
+        Args:
+            key: 快取 key
+            loader: 載入原始資料的函式
+            ttl_seconds: 值視為新鮮的秒數
+            stale_seconds: 過期後仍可回傳舊值的秒數
+
+        Returns:
+            bytes: 快取值或 loader 載入的值
+
+        Raises:
+            Exception: 未命中且 loader 失敗時
+        """
+        pass
@@ -0,0 +1 @@
+"""Competitor analysis use cases."""
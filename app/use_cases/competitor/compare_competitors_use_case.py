@@ -0,0 +1,177 @@
+"""Compare competitors use case - 並發爬取主產品與競品並產生比較矩陣。
+
+資料流::
+
+    URLs --parse--> ProductRef（去重）--> 全部同時 fetch_listing --as_completed--> normalize --> matrix
+
+所有產品同時爬取，先回來的先正規化，總延遲接近最慢的單次爬取而不是所有爬取的總和。
+單一競品失敗只會記錄在 errors；主產品失敗時取消其餘爬取並拋出 ProductFetchError。
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from app.use_cases.competitor.normalization import (
+    ListingNormalizer,
+    NormalizedListing,
+    parse_product_url,
+)
+from app.use_cases.competitor.ports import ListingScraperPort, ProductRef, RawListing
+from app.use_cases.exceptions import ProductFetchError
+
+logger = logging.getLogger(__name__)
+
+COMPARISON_METRICS = ("price", "rating", "review_count", "bsr_main", "bsr_sub")
+
+
+@dataclass(frozen=True, slots=True)
+class ComparisonMatrix:
+    """主產品與競品的比較矩陣。"""
+
+    currency: str
+    main: NormalizedListing
+    competitors: list[NormalizedListing]
+    metrics: tuple[str, ...]
+    # metric -> [主產品, 競品 1, 競品 2, ...]
+    values: dict[str, list[float | None]]
+    # metric -> [競品 1, 競品 2, ...] 相對主產品的差異百分比（BSR 為正代表排名較差）
+    vs_main: dict[str, list[float | None]]
+    errors: list[dict] = field(default_factory=list)
+
+
+class CompareCompetitorsUseCase:
+    """競品比較 Use Case - 主程式邏輯。"""
+
+    def __init__(
+        self,
+        scraper: ListingScraperPort,
+        normalizer: ListingNormalizer | None = None,
+        max_competitors: int = 5,
+        fetch_timeout_seconds: float = 30.0,
+        max_concurrency: int | None = None,
+    ):
+        """初始化 CompareCompetitorsUseCase.
+
+        Args:
+            scraper: 商品頁爬蟲實例（依賴抽象）
+            normalizer: 格式統一器（預設換算為 USD，只接受 USD 價格）
+            max_competitors: 競品 URL 數量上限
+            fetch_timeout_seconds: 單一產品爬取逾時秒數
+            max_concurrency: 同時進行的爬取數上限（None 為全部同時）
+        """
+        self.scraper = scraper
+        self.normalizer = normalizer or ListingNormalizer()
+        self.max_competitors = max_competitors
+        self.fetch_timeout_seconds = fetch_timeout_seconds
+        self.max_concurrency = max_concurrency
+
+    async def execute(self, main_url: str, competitor_urls: Sequence[str]) -> ComparisonMatrix:
+        """執行競品比較.
+
+        Args:
+            main_url: 主產品 URL 或 ASIN
+            competitor_urls: 競品 URL 或 ASIN（只輸入 ASIN 時沿用主產品的站點）
+
+        Returns:
+            ComparisonMatrix: 比較矩陣（爬取失敗的競品列於 errors）
+
+        Raises:
+            ValueError: 競品數量超過上限
+            InvalidProductUrlError: 任一 URL 無法解析
+            ProductFetchError: 主產品爬取失敗
+        """
+        if len(competitor_urls) > self.max_competitors:
+            raise ValueError(f"At most {self.max_competitors} competitors are allowed")
+
+        main_ref = parse_product_url(main_url)
+        competitor_refs = [parse_product_url(url, main_ref.marketplace) for url in competitor_urls]
+        listings: dict[ProductRef, NormalizedListing] = {}
+        failures: dict[ProductRef, str] = {}
+
+        limit = (
+            asyncio.Semaphore(self.max_concurrency)
+            if self.max_concurrency
+            else contextlib.nullcontext()
+        )
+        # 同一產品只爬一次（競品重複或與主產品相同時）
+        tasks = [
+            asyncio.create_task(self._fetch(ref, limit))
+            for ref in dict.fromkeys([main_ref, *competitor_refs])
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                ref, raw, error = await next_done
+                if raw is not None:
+                    listings[ref] = self.normalizer.normalize(raw)
+                    continue
+                if ref == main_ref:
+                    raise ProductFetchError(f"Failed to fetch main product {ref.asin}: {error}")
+                failures[ref] = error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        competitors = [
+            listings[ref]
+            for ref in dict.fromkeys(competitor_refs)
+            if ref != main_ref and ref in listings
+        ]
+        errors = [
+            {"url": url, "asin": ref.asin, "marketplace": ref.marketplace, "error": failures[ref]}
+            for url, ref in zip(competitor_urls, competitor_refs, strict=True)
+            if ref in failures
+        ]
+        return _build_matrix(self.normalizer.currency, listings[main_ref], competitors, errors)
+
+    async def _fetch(
+        self, ref: ProductRef, limit: asyncio.Semaphore | contextlib.nullcontext
+    ) -> tuple[ProductRef, RawListing | None, str]:
+        """爬取單一產品；錯誤與逾時以回傳值表示，不中斷其他爬取。"""
+        try:
+            async with limit, asyncio.timeout(self.fetch_timeout_seconds):
+                return ref, await self.scraper.fetch_listing(ref), ""
+        except TimeoutError:
+            error = f"Timed out after {self.fetch_timeout_seconds}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        logger.warning("Failed to fetch %s on %s: %s", ref.asin, ref.marketplace, error)
+        return ref, None, error
+
+
+def _build_matrix(
+    currency: str,
+    main: NormalizedListing,
+    competitors: list[NormalizedListing],
+    errors: list[dict],
+) -> ComparisonMatrix:
+    """由正規化後的資料建立比較矩陣。"""
+    columns = [main, *competitors]
+    values: dict[str, list[float | None]] = {}
+    vs_main: dict[str, list[float | None]] = {}
+    for metric in COMPARISON_METRICS:
+        row = [_as_float(getattr(listing, metric)) for listing in columns]
+        values[metric] = row
+        vs_main[metric] = [_percent_change(row[0], value) for value in row[1:]]
+    return ComparisonMatrix(
+        currency=currency,
+        main=main,
+        competitors=competitors,
+        metrics=COMPARISON_METRICS,
+        values=values,
+        vs_main=vs_main,
+        errors=errors,
+    )
+
+
+def _as_float(value) -> float | None:
+    return None if value is None else float(value)
+
+
+def _percent_change(base: float | None, value: float | None) -> float | None:
+    """計算相對主產品的差異百分比（任一方缺值或主產品為 0 時為 None）。"""
+    if base is None or value is None or base == 0:
+        return None
+    return round((value - base) / base * 100, 2)
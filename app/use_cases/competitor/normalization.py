@@ -0,0 +1,254 @@
+"""Listing normalization - 產品 URL 解析與各站點商品頁格式統一。
+
+各 Amazon 站點的數字格式不同（"1,299.99" vs "1.299,99"）、評分文字不同
+（"4.5 out of 5 stars"、"4,5 von 5 Sternen"、"5つ星のうち4.5"）、BSR 類別路徑分隔符號也不同。
+此模組把 RawListing 轉為單一幣別、0-5 分評分、整數 BSR 與類別路徑 tuple 的 NormalizedListing。
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from urllib.parse import parse_qs, urlsplit
+
+from app.use_cases.competitor.ports import ProductRef, RawListing
+from app.use_cases.exceptions import InvalidProductUrlError
+
+# 站點 -> (預設幣別, 小數點是否為逗號)
+MARKETPLACES: dict[str, tuple[str, bool]] = {
+    "amazon.com": ("USD", False),
+    "amazon.ca": ("CAD", False),
+    "amazon.com.mx": ("MXN", False),
+    "amazon.co.uk": ("GBP", False),
+    "amazon.de": ("EUR", True),
+    "amazon.fr": ("EUR", True),
+    "amazon.it": ("EUR", True),
+    "amazon.es": ("EUR", True),
+    "amazon.nl": ("EUR", True),
+    "amazon.co.jp": ("JPY", False),
+    "amazon.com.au": ("AUD", False),
+    "amazon.in": ("INR", False),
+}
+
+# "$" 在多個站點共用，交給站點預設幣別判斷
+_CURRENCY_SYMBOLS = {
+    "US$": "USD",
+    "CDN$": "CAD",
+    "C$": "CAD",
+    "A$": "AUD",
+    "€": "EUR",
+    "£": "GBP",
+    "¥": "JPY",
+    "￥": "JPY",
+    "₹": "INR",
+}
+
+_ASIN = re.compile(r"[A-Z0-9]{10}")
+_ASIN_IN_PATH = re.compile(
+    r"/(?:dp|gp/product|gp/aw/d|product|exec/obidos/asin)/([A-Z0-9]{10})(?:[/?#]|$)",
+    re.IGNORECASE,
+)
+_NUMBER = re.compile(r"\d[\d.,\u00a0\u202f']*")
+_ISO_CODE = re.compile(r"\b([A-Z]{3})\b")
+_BSR_ENTRY = re.compile(r"(\d[\d.,\u00a0\u202f']*)\s+(?:in|en|dans|su|em)\s+(.+)", re.IGNORECASE)
+_PARENTHESES = re.compile(r"\s*\([^)]*\)")
+_PATH_SEPARATOR = re.compile(r"\s*[›>»]\s*")
+_CENTS = Decimal("0.01")
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedListing:
+    """統一格式後的商品資料。"""
+
+    asin: str
+    marketplace: str
+    title: str
+    currency: str  # 換算後的幣別
+    price: Decimal | None  # 已換算為 currency；缺少匯率時為 None
+    original_price: Decimal | None
+    original_currency: str
+    rating: float | None  # 0-5 分
+    review_count: int | None
+    bsr_main: int | None
+    bsr_sub: int | None
+    category_path: tuple[str, ...]
+
+
+def parse_product_url(url: str, default_marketplace: str = "amazon.com") -> ProductRef:
+    """從 Amazon 產品 URL（或直接輸入的 ASIN）解析出 ASIN 與站點.
+
+    Args:
+        url: 產品 URL，例如 "https://www.amazon.de/dp/B0ABCDEFGH?th=1"
+        default_marketplace: 只輸入 ASIN 時使用的站點
+
+    Returns:
+        ProductRef: ASIN 與站點
+
+    Raises:
+        InvalidProductUrlError: 非 Amazon 網域或 URL 中找不到 ASIN
+    """
+    text = url.strip()
+    if _ASIN.fullmatch(text):
+        return ProductRef(asin=text, marketplace=default_marketplace)
+
+    parts = urlsplit(text if "://" in text else f"https://{text}")
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "smile.", "m."):
+        host = host.removeprefix(prefix)
+    if host not in MARKETPLACES:
+        # amzn.to / a.co 等短網址需要實際連線才能展開，不在此處理
+        raise InvalidProductUrlError(f"Not a supported Amazon product URL: {url}")
+
+    match = _ASIN_IN_PATH.search(parts.path)
+    asin = match.group(1) if match else next(iter(parse_qs(parts.query).get("asin", [])), "")
+    asin = asin.upper()
+    if not _ASIN.fullmatch(asin):
+        raise InvalidProductUrlError(f"No ASIN found in URL: {url}")
+    return ProductRef(asin=asin, marketplace=host)
+
+
+class ListingNormalizer:
+    """將 RawListing 統一為 NormalizedListing（幣別換算、評分、BSR、類別路徑）。"""
+
+    def __init__(self, currency: str = "USD", exchange_rates: Mapping[str, Decimal] | None = None):
+        """初始化 ListingNormalizer.
+
+        Args:
+            currency: 換算後的目標幣別
+            exchange_rates: 各幣別 1 單位等於多少目標幣別（目標幣別本身不需列出）
+        """
+        self.currency = currency
+        self.exchange_rates = {currency: Decimal(1), **(exchange_rates or {})}
+
+    def normalize(self, raw: RawListing) -> NormalizedListing:
+        """統一單一商品頁資料.
+
+        Args:
+            raw: 爬蟲回傳的原始資料
+
+        Returns:
+            NormalizedListing: 統一格式後的資料（無法解析的欄位為 None）
+        """
+        default_currency, decimal_comma = MARKETPLACES.get(raw.marketplace, ("USD", False))
+        original_currency = _currency_of(raw, default_currency)
+        original_price = (
+            raw.price
+            if isinstance(raw.price, Decimal) or raw.price is None
+            else _parse_number(raw.price, decimal_comma)
+        )
+        rate = self.exchange_rates.get(original_currency)
+        price = (
+            (original_price * rate).quantize(_CENTS)
+            if original_price is not None and rate is not None
+            else None
+        )
+
+        ranks = [entry for entry in map(_parse_bsr_entry, raw.bsr) if entry is not None]
+        if raw.breadcrumbs:
+            category_path = tuple(p for p in _PATH_SEPARATOR.split(raw.breadcrumbs.strip()) if p)
+        else:
+            category_path = tuple(dict.fromkeys(part for _, path in ranks for part in path))
+
+        return NormalizedListing(
+            asin=raw.asin,
+            marketplace=raw.marketplace,
+            title=raw.title.strip(),
+            currency=self.currency,
+            price=price,
+            original_price=original_price,
+            original_currency=original_currency,
+            rating=_parse_rating(raw.rating, decimal_comma),
+            review_count=_parse_count(raw.review_count),
+            # Amazon 先列主類別排名，最後一筆是最細的子類別
+            bsr_main=ranks[0][0] if ranks else None,
+            bsr_sub=ranks[-1][0] if len(ranks) > 1 else None,
+            category_path=category_path,
+        )
+
+
+def _currency_of(raw: RawListing, default: str) -> str:
+    """依 currency 欄位、價格文字中的代碼 / 符號、站點預設幣別的順序判斷幣別。"""
+    if raw.currency:
+        code = raw.currency.strip()
+        if _ISO_CODE.fullmatch(code):
+            return code
+        if code in _CURRENCY_SYMBOLS:
+            return _CURRENCY_SYMBOLS[code]
+    if isinstance(raw.price, str):
+        match = _ISO_CODE.search(raw.price)
+        if match:
+            return match.group(1)
+        for symbol, code in _CURRENCY_SYMBOLS.items():
+            if symbol in raw.price:
+                return code
+    return default
+
+
+def _parse_number(text: str, decimal_comma: bool) -> Decimal | None:
+    """解析文字中的第一個數字（自動判斷千分位與小數點）。"""
+    match = _NUMBER.search(text)
+    if match is None:
+        return None
+    token = re.sub(r"[\s\u00a0\u202f']", "", match.group()).rstrip(".,")
+    last_dot, last_comma = token.rfind("."), token.rfind(",")
+    if last_dot >= 0 and last_comma >= 0:
+        # 兩種符號都出現時，最後出現的是小數點
+        decimal = "." if last_dot > last_comma else ","
+    elif last_dot >= 0 or last_comma >= 0:
+        separator = "." if last_dot >= 0 else ","
+        digits_after = len(token) - token.rfind(separator) - 1
+        if token.count(separator) > 1:
+            decimal = None
+        elif digits_after != 3:
+            decimal = separator
+        else:
+            # "1.299" / "1,299" 無法從字面判斷，依站點慣例
+            decimal = separator if (separator == ",") == decimal_comma else None
+    else:
+        decimal = None
+
+    thousands = {".", ","} - {decimal}
+    for symbol in thousands:
+        token = token.replace(symbol, "")
+    if decimal == ",":
+        token = token.replace(",", ".")
+    try:
+        return Decimal(token)
+    except InvalidOperation:
+        return None
+
+
+def _parse_rating(value: str | float | None, decimal_comma: bool) -> float | None:
+    """解析評分並換算為 0-5 分（文字中較大的數字視為滿分）。"""
+    if value is None or isinstance(value, int | float):
+        return None if value is None else float(value)
+    numbers = [
+        n
+        for n in (_parse_number(m.group(), decimal_comma) for m in _NUMBER.finditer(value))
+        if n is not None
+    ]
+    if not numbers:
+        return None
+    score = min(numbers[:2])
+    scale = max(numbers[:2]) if len(numbers) > 1 else Decimal(5)
+    if scale <= 0 or score > scale:
+        return None
+    return round(float(score / scale * 5), 2)
+
+
+def _parse_count(value: str | int | None) -> int | None:
+    """解析評論數（只保留數字，千分位符號一律移除）。"""
+    if value is None or isinstance(value, int):
+        return value
+    match = _NUMBER.search(value)
+    return int(re.sub(r"\D", "", match.group())) if match else None
+
+
+def _parse_bsr_entry(text: str) -> tuple[int, tuple[str, ...]] | None:
+    """解析單筆 BSR（"#1,234 in Electronics (See Top 100 in Electronics)"）。"""
+    match = _BSR_ENTRY.search(text)
+    if match is None:
+        return None
+    rank = int(re.sub(r"\D", "", match.group(1)))
+    category = _PARENTHESES.sub("", match.group(2)).strip()
+    return rank, tuple(p for p in _PATH_SEPARATOR.split(category) if p)
@@ -0,0 +1,47 @@
+"""Competitor 抽象介面（Ports）。"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class ProductRef:
+    """由產品 URL 解析出的 ASIN 與站點。"""
+
+    asin: str
+    marketplace: str  # 例如 "amazon.com"、"amazon.de"
+
+
+@dataclass(frozen=True, slots=True)
+class RawListing:
+    """爬蟲回傳的原始商品頁資料（各站點格式不一，由 ListingNormalizer 統一）。"""
+
+    asin: str
+    marketplace: str
+    title: str
+    price: str | Decimal | None  # 例如 "$1,299.99"、"1.299,99 €"
+    currency: str | None  # ISO 代碼或符號（"EUR"、"€"）；None 時依站點推定
+    rating: str | float | None  # 例如 "4.5 out of 5 stars"、"4,5 von 5 Sternen"
+    review_count: str | int | None  # 例如 "1,234 ratings"、"1.234 Sternebewertungen"
+    bsr: tuple[str, ...] = ()  # 例如 ("#1,234 in Electronics", "#12 in Earbud Headphones")
+    breadcrumbs: str | None = None  # 例如 "Electronics › Headphones › Earbud Headphones"
+
+
+class ListingScraperPort(ABC):
+    """商品頁爬蟲介面（可指定站點）。"""
+
+    @abstractmethod
+    async def fetch_listing(self, ref: ProductRef) -> RawListing:
+        """爬取商品頁原始資料。
+
+        Args:
+            ref: 產品 ASIN 與站點
+
+        Returns:
+            RawListing: 原始資料
+
+        Raises:
+            Exception: 當爬取失敗時
+        """
+        pass
@@ -0,0 +1,37 @@
+"""Use case 層共用例外。"""
+
+
+class InvalidTokenError(Exception):
+    """Access token 無效（簽章錯誤、過期或格式不符）。"""
+
+
+class InvalidProductUrlError(Exception):
+    """無法從 URL 解析出 Amazon 產品（非 Amazon 網域或找不到 ASIN）。"""
+
+
+class ProductFetchError(Exception):
+    """產品資料爬取失敗（逾時或上游錯誤）。"""
+
+
+class ProductNotFoundError(Exception):
+    """產品不存在或不屬於目前使用者（兩者不區分，避免洩漏產品是否存在）。"""
+
+
+class InvalidCursorError(Exception):
+    """分頁游標格式錯誤。"""
+
+
+class NotificationDeliveryError(Exception):
+    """通知送出失敗；retryable 為 False 時（例如收件端拒收）不再重試。"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class UpstreamUnavailableError(Exception):
+    """上游服務暫時無法使用（斷路器開啟或超過呼叫 deadline）；retry_after 為建議的重試秒數。"""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
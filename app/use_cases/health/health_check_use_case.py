@@ -6,7 +6,7 @@ from datetime import UTC, datetime
 from app.use_cases.health.ports import DatabaseRepository
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HealthCheckResult:
     """健康檢查結果。"""
 
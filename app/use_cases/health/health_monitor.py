@@ -0,0 +1,136 @@
+"""Health monitor - 背景定期探測依賴，健康檢查端點只讀取最後一次結果。"""
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.use_cases.health.health_check_use_case import HealthCheckResult
+from app.use_cases.health.ports import AsyncDatabaseRepository
+
+
+@dataclass(frozen=True, slots=True)
+class ReadinessResult:
+    """Readiness 結果（含探測時間與是否過期）。"""
+
+    ready: bool
+    database: str
+    checked_at: datetime | None
+    age_seconds: float | None
+    latency_ms: float | None
+    stale: bool
+
+
+class HealthMonitor:
+    """依賴探測 Monitor - 由背景 task 定期更新結果，請求只讀取快取。"""
+
+    def __init__(
+        self,
+        db_repo: AsyncDatabaseRepository,
+        interval_seconds: float = 10.0,
+        timeout_seconds: float = 2.0,
+        stale_after_seconds: float = 30.0,
+    ):
+        """初始化 HealthMonitor.
+
+        Args:
+            db_repo: Async Database Repository 實例（依賴抽象）
+            interval_seconds: 背景探測間隔（秒）
+            timeout_seconds: 單次探測逾時（秒）
+            stale_after_seconds: 結果超過此秒數視為過期
+        """
+        self.db_repo = db_repo
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self._last: HealthCheckResult | None = None
+        self._last_monotonic: float | None = None
+        self._last_latency_ms: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def probe(self) -> HealthCheckResult:
+        """立即探測一次依賴並更新快取結果.
+
+        Returns:
+            HealthCheckResult: 探測結果
+        """
+        started = time.monotonic()
+        try:
+            db_status = await asyncio.wait_for(
+                self.db_repo.check_connection(), timeout=self.timeout_seconds
+            )
+        except TimeoutError:
+            db_status = f"error: timeout after {self.timeout_seconds}s"
+        except Exception as e:
+            # 斷路器開啟（UpstreamUnavailableError）或上游故障：記錄為錯誤狀態，不拋出
+            db_status = f"error: {e}"
+        finished = time.monotonic()
+
+        self._last = HealthCheckResult(
+            status="healthy",
+            database=db_status,
+            timestamp=datetime.now(UTC),
+        )
+        self._last_monotonic = finished
+        self._last_latency_ms = (finished - started) * 1000
+        return self._last
+
+    async def latest(self) -> HealthCheckResult:
+        """取得最後一次探測結果；尚未探測過時才實際探測（同時只探測一次）.
+
+        Returns:
+            HealthCheckResult: 最後一次探測結果
+        """
+        if self._last is None:
+            async with self._lock:
+                if self._last is None:
+                    await self.probe()
+        return self._last
+
+    def readiness(self) -> ReadinessResult:
+        """依最後一次探測結果判斷是否 ready（不做任何 I/O）.
+
+        Returns:
+            ReadinessResult: Readiness 結果
+        """
+        if self._last is None:
+            return ReadinessResult(
+                ready=False,
+                database="unknown",
+                checked_at=None,
+                age_seconds=None,
+                latency_ms=None,
+                stale=True,
+            )
+
+        age = time.monotonic() - self._last_monotonic
+        stale = age > self.stale_after_seconds
+        return ReadinessResult(
+            ready=self._last.database == "connected" and not stale,
+            database=self._last.database,
+            checked_at=self._last.timestamp,
+            age_seconds=age,
+            latency_ms=self._last_latency_ms,
+            stale=stale,
+        )
+
+    def start(self) -> None:
+        """啟動背景探測 task（需在 event loop 中呼叫）。"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止背景探測 task。"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            async with self._lock:
+                await self.probe()
+            await asyncio.sleep(self.interval_seconds)
@@ -14,3 +14,22 @@ class DatabaseRepository(ABC):
             str: 連線狀態訊息（"connected" 或錯誤訊息）
         """
         pass
+
+
+class AsyncDatabaseRepository(ABC):
+    """資料庫連線檢查 Repository 非同步介面。"""
+
+    @abstractmethod
+    async def check_connection(self) -> str:
+        """檢查資料庫連線狀態。
+
+        失敗時拋出例外（不轉成字串），讓斷路器與 hedge 看得到上游故障；
+        由 ``HealthMonitor`` 轉為錯誤狀態。
+
+        Returns:
+            str: "connected"
+
+        Raises:
+            Exception: 無法連線或上游回應錯誤時
+        """
+        pass
@@ -0,0 +1 @@
+"""Background job use case ports."""
@@ -0,0 +1,135 @@
+"""Job queue 抽象介面（Ports）。
+
+交付語意為 at-least-once：worker 在 visibility timeout 內沒有 ack（crash、卡住）的工作
+會重新交給其他 worker，因此 handler 必須可重複執行（例如以 upsert 寫入）。
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class Job:
+    """已取出（reserve）的工作。"""
+
+    id: str
+    name: str
+    payload: dict[str, Any]
+    attempts: int  # 含本次在內的執行次數
+    max_attempts: int
+    enqueued_at: float  # Unix 時間（秒）
+    lease: str = field(default="", repr=False)  # 本次取出的租約，ack / nack 時比對
+
+
+@dataclass(frozen=True, slots=True)
+class QueueStats:
+    """佇列狀態。"""
+
+    ready: int  # 可立即取出
+    delayed: int  # 尚未到執行時間（延遲 / 重試等待）
+    in_flight: int  # 已被 worker 取出、尚未完成
+    dead: int  # 超過重試次數
+
+
+class JobQueue(ABC):
+    """持久化工作佇列介面。"""
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int = 3,
+    ) -> str:
+        """加入工作。
+
+        Args:
+            name: 工作名稱（對應 handler）
+            payload: 工作參數（需可 JSON 序列化）
+            idempotency_key: 冪等 key；key 有效期間內重複加入只回傳既有的工作 ID
+            delay_seconds: 延遲執行秒數
+            max_attempts: 最多執行次數（含第一次）
+
+        Returns:
+            str: 工作 ID
+        """
+        pass
+
+    @abstractmethod
+    async def reserve(self, max_jobs: int, visibility_timeout: float) -> list[Job]:
+        """取出可執行的工作（取出後 visibility_timeout 秒內其他 worker 看不到）。
+
+        Args:
+            max_jobs: 最多取出筆數
+            visibility_timeout: 租約秒數；逾時未 ack 的工作會重新交付
+
+        Returns:
+            list[Job]: 取出的工作（可能少於 max_jobs 或為空）
+        """
+        pass
+
+    @abstractmethod
+    async def ack(self, job: Job) -> bool:
+        """標記工作完成並移除。
+
+        Args:
+            job: reserve 取出的工作
+
+        Returns:
+            bool: 租約仍有效時為 True；已逾時並被重新交付時為 False
+        """
+        pass
+
+    @abstractmethod
+    async def nack(self, job: Job, error: str, retry_delay_seconds: float = 0.0) -> bool:
+        """標記工作失敗；未超過 max_attempts 時於 retry_delay_seconds 後重試，否則移入 dead。
+
+        Args:
+            job: reserve 取出的工作
+            error: 失敗原因
+            retry_delay_seconds: 重試前等待秒數
+
+        Returns:
+            bool: 租約仍有效時為 True
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, job: Job) -> bool:
+        """歸還未執行的工作（不計入執行次數，例如 worker 關閉時歸還預取的工作）。
+
+        Args:
+            job: reserve 取出的工作
+
+        Returns:
+            bool: 租約仍有效時為 True
+        """
+        pass
+
+    @abstractmethod
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        """延長租約（長時間執行的工作定期呼叫）。
+
+        Args:
+            job: reserve 取出的工作
+            visibility_timeout: 自現在起的租約秒數
+
+        Returns:
+            bool: 租約仍有效時為 True
+        """
+        pass
+
+    @abstractmethod
+    async def stats(self) -> QueueStats:
+        """取得佇列狀態。
+
+        Returns:
+            QueueStats: 各狀態的工作數
+        """
+        pass
+
+    async def aclose(self) -> None:  # noqa: B027 - 無外部連線的實作不需覆寫
+        """關閉連線。"""
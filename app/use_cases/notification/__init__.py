@@ -0,0 +1 @@
+"""Notification use cases."""
@@ -0,0 +1,304 @@
+"""Notification dispatcher - 警報緩衝、依使用者彙整為摘要，並由各通道並行送出。
+
+流程：``submit`` -> 緩衝 -> 每 ``digest_window_seconds`` 彙整一次 -> 每個通道一個有界佇列
+-> 每個通道 ``concurrency`` 個 worker 送出。
+
+- 背壓：緩衝滿時 ``submit`` 直接彙整；通道佇列滿時彙整會等待，因此上游被拖慢而不是吃光記憶體
+- 通道互相獨立：某個通道變慢或故障只會塞住自己的佇列
+- 重試：可重試的失敗以指數退避重新排入佇列（不占用 worker），超過 ``max_attempts`` 或
+  不可重試的失敗移入 DeadLetterStore，可用 ``redrive`` 重送
+- 收件者查詢失敗時警報放回緩衝，下一次彙整重試；查詢持續失敗使緩衝超過 ``max_buffer`` 時
+  丟棄最舊的警報（計入 ``stats.dropped``），``submit`` 不因查詢失敗拋出例外
+- 交付語意為 at-most-once per attempt：程序結束時尚在緩衝或佇列中的通知會遺失，
+  ``stop`` 預設會先送完（drain）
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from app.domain.entities.product import ChangeAlert
+from app.use_cases.exceptions import NotificationDeliveryError
+from app.use_cases.notification.ports import (
+    DeadLetter,
+    DeadLetterStore,
+    Digest,
+    NotificationChannel,
+    Recipient,
+    RecipientDirectory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatchStats:
+    """通知派送統計計數。"""
+
+    submitted: int = 0  # 收到的警報數
+    unrouted: int = 0  # 沒有收件者的警報數
+    digests: int = 0  # 彙整出的摘要數
+    delivered: dict[str, int] = field(default_factory=dict)  # 通道 -> 送達摘要數
+    retries: int = 0
+    dead_lettered: int = 0
+    dropped: int = 0  # 收件者查詢持續失敗、緩衝超過上限而丟棄的警報數
+    # 最近送達的端到端延遲（警報進入 dispatcher 到通道送出完成，秒）
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=10_000))
+
+
+@dataclass(slots=True)
+class _Delivery:
+    digest: Digest
+    attempts: int = 0
+
+
+class NotificationDispatcher:
+    """警報通知派送器。"""
+
+    def __init__(
+        self,
+        directory: RecipientDirectory,
+        channels: Sequence[NotificationChannel],
+        dead_letters: DeadLetterStore,
+        digest_window_seconds: float = 1.0,
+        max_buffer: int = 10_000,
+        queue_size: int = 1000,
+        concurrency: int = 8,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 0.5,
+        send_timeout_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """初始化 NotificationDispatcher.
+
+        Args:
+            directory: 收件者查詢（依賴抽象）
+            channels: 通知通道（名稱不可重複）
+            dead_letters: Dead letter 保存（依賴抽象）
+            digest_window_seconds: 彙整視窗秒數（同一使用者在視窗內的警報合併為一則）
+            max_buffer: 緩衝的警報上限（滿了立即彙整）
+            queue_size: 每個通道佇列的摘要上限
+            concurrency: 每個通道同時送出的摘要數
+            max_attempts: 每則摘要在每個通道最多嘗試次數（含第一次）
+            retry_base_seconds: 第一次重試的等待秒數（之後每次加倍）
+            send_timeout_seconds: 單次送出逾時秒數（逾時視為可重試的失敗）
+            clock: 取得 monotonic 時間（秒）的函式，測試時可替換
+        """
+        self.directory = directory
+        self.channels = {channel.name: channel for channel in channels}
+        self.dead_letters = dead_letters
+        self.digest_window_seconds = digest_window_seconds
+        self.max_buffer = max_buffer
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.send_timeout_seconds = send_timeout_seconds
+        self.clock = clock
+        self.stats = DispatchStats(delivered=dict.fromkeys(self.channels, 0))
+        self._buffer: list[tuple[ChangeAlert, float]] = []
+        self._queues: dict[str, asyncio.Queue[_Delivery]] = {
+            name: asyncio.Queue(maxsize=queue_size) for name in self.channels
+        }
+        self._flush_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task] = []
+        self._retries: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """啟動彙整迴圈與各通道的 worker。"""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._flush_loop()))
+        for name in self.channels:
+            for _ in range(self.concurrency):
+                self._tasks.append(asyncio.create_task(self._worker(name)))
+
+    async def stop(self, drain: bool = True, timeout: float = 30.0) -> None:
+        """停止派送.
+
+        Args:
+            drain: 是否先送完緩衝、佇列與等待中的重試
+            timeout: drain 最多等待秒數（逾時後剩餘的通知直接丟棄）
+        """
+        if drain:
+            try:
+                async with asyncio.timeout(timeout):
+                    await self.flush()
+                    # 重試在 task_done 之前排定：佇列清空且沒有等待中的重試即全部送完
+                    while True:
+                        for queue in self._queues.values():
+                            await queue.join()
+                        if not self._retries:
+                            break
+                        await asyncio.gather(*self._retries, return_exceptions=True)
+            except TimeoutError:
+                logger.warning("Notification drain timed out; pending notifications dropped")
+            except Exception:
+                # 例如收件者查詢失敗：記錄後照常停止 worker，不讓 task 繼續執行
+                logger.exception("Notification drain failed; pending notifications dropped")
+        for task in [*self._tasks, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks.clear()
+        self._retries.clear()
+
+    async def submit(self, alerts: Sequence[ChangeAlert]) -> None:
+        """加入警報（緩衝已滿時立即彙整，通道佇列滿時會等待）.
+
+        警報加入緩衝即視為已接收：彙整時收件者查詢失敗只記錄，警報留在緩衝等下一次彙整，
+        呼叫端不需（也不應）重送。
+
+        Args:
+            alerts: 變化警報
+        """
+        now = self.clock()
+        self._buffer.extend((alert, now) for alert in alerts)
+        self.stats.submitted += len(alerts)
+        if len(self._buffer) >= self.max_buffer:
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush notification buffer")
+
+    async def flush(self) -> int:
+        """將緩衝中的警報依使用者彙整為摘要並排入各通道佇列.
+
+        Returns:
+            int: 彙整出的摘要數
+
+        Raises:
+            Exception: 收件者查詢失敗時（警報已放回緩衝，超過 ``max_buffer`` 的最舊警報被丟棄）
+        """
+        async with self._flush_lock:
+            buffered, self._buffer = self._buffer, []
+            if not buffered:
+                return 0
+            product_ids = list(dict.fromkeys(alert.product_id for alert, _ in buffered))
+            try:
+                recipients = await self.directory.find_recipients(product_ids)
+            except BaseException:
+                # 放回緩衝最前面（保留原本的順序與進入時間），下一次彙整重試
+                self._buffer[:0] = buffered
+                self._trim_buffer()
+                raise
+
+            grouped: dict[str, tuple[Recipient, list[ChangeAlert], float]] = {}
+            for alert, submitted_at in buffered:
+                targets = recipients.get(alert.product_id)
+                if not targets:
+                    self.stats.unrouted += 1
+                    continue
+                for recipient in targets:
+                    entry = grouped.get(recipient.user_id)
+                    if entry is None:
+                        # 摘要的延遲由最早進入的警報起算
+                        entry = grouped[recipient.user_id] = (recipient, [], submitted_at)
+                    entry[1].append(alert)
+
+            created_at = datetime.now(UTC)
+            for recipient, alerts, first_at in grouped.values():
+                digest = Digest(
+                    id=str(uuid.uuid4()),
+                    recipient=recipient,
+                    alerts=alerts,
+                    created_at=created_at,
+                    enqueued_at=first_at,
+                )
+                for name, channel in self.channels.items():
+                    if channel.accepts(recipient):
+                        await self._queues[name].put(_Delivery(digest))
+            self.stats.digests += len(grouped)
+            return len(grouped)
+
+    async def redrive(self, limit: int = 100) -> int:
+        """將 dead letters 重新排入原通道的佇列（重試次數重新計算）.
+
+        Args:
+            limit: 最多重送筆數
+
+        Returns:
+            int: 重送筆數
+        """
+        letters = await self.dead_letters.take(limit)
+        for letter in letters:
+            queue = self._queues.get(letter.channel)
+            if queue is None:
+                logger.warning("Dropping dead letter for unknown channel %s", letter.channel)
+                continue
+            await queue.put(_Delivery(letter.digest))
+        return len(letters)
+
+    def _trim_buffer(self) -> None:
+        """緩衝超過 ``max_buffer`` 時丟棄最舊的警報（收件者查詢持續失敗時限制記憶體）。"""
+        excess = len(self._buffer) - self.max_buffer
+        if excess > 0:
+            del self._buffer[:excess]
+            self.stats.dropped += excess
+            logger.warning("Notification buffer full; dropped %d oldest alerts", excess)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.digest_window_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                # 收件者查詢失敗：警報已放回緩衝，記錄後繼續（不讓迴圈停止）
+                logger.exception("Failed to flush notification buffer")
+
+    async def _worker(self, name: str) -> None:
+        channel = self.channels[name]
+        queue = self._queues[name]
+        while True:
+            delivery = await queue.get()
+            try:
+                await self._deliver(name, channel, delivery)
+            except Exception:
+                # 例如 DeadLetterStore 寫入失敗：記錄後繼續，worker 不可停止
+                logger.exception(
+                    "Failed to handle notification %s via %s", delivery.digest.id, name
+                )
+            finally:
+                queue.task_done()
+
+    async def _deliver(self, name: str, channel: NotificationChannel, delivery: _Delivery) -> None:
+        delivery.attempts += 1
+        try:
+            async with asyncio.timeout(self.send_timeout_seconds):
+                await channel.send(delivery.digest)
+        except Exception as e:
+            retryable = e.retryable if isinstance(e, NotificationDeliveryError) else True
+            if retryable and delivery.attempts < self.max_attempts:
+                self.stats.retries += 1
+                delay = self.retry_base_seconds * 2 ** (delivery.attempts - 1)
+                task = asyncio.create_task(self._retry_later(name, delivery, delay))
+                self._retries.add(task)
+                task.add_done_callback(self._retries.discard)
+                return
+            logger.warning(
+                "Notification %s via %s failed after %d attempts: %r",
+                delivery.digest.id,
+                name,
+                delivery.attempts,
+                e,
+            )
+            self.stats.dead_lettered += 1
+            await self.dead_letters.add(
+                DeadLetter(
+                    channel=name,
+                    digest=delivery.digest,
+                    error=repr(e),
+                    attempts=delivery.attempts,
+                    failed_at=datetime.now(UTC),
+                )
+            )
+            return
+        self.stats.delivered[name] += 1
+        self.stats.latencies.append(self.clock() - delivery.digest.enqueued_at)
+
+    async def _retry_later(self, name: str, delivery: _Delivery, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queues[name].put(delivery)
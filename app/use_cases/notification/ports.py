@@ -0,0 +1,111 @@
+"""Notification 抽象介面（Ports）。
+
+警報以「摘要」（Digest）為單位送出：同一使用者在同一個彙整視窗內的警報合併為一則通知，
+每個通道（log / email / webhook）各自送出一次。
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.domain.entities.product import ChangeAlert
+
+
+@dataclass(frozen=True, slots=True)
+class Recipient:
+    """通知收件者（沒有設定的通道不送出）。"""
+
+    user_id: str
+    email: str | None = None
+    webhook_url: str | None = None
+
+
+@dataclass(slots=True)
+class Digest:
+    """單一使用者在一個彙整視窗內的警報摘要。"""
+
+    id: str
+    recipient: Recipient
+    alerts: list[ChangeAlert]
+    created_at: datetime
+    # 摘要中最早的警報進入 dispatcher 的時間（monotonic 秒，用於量測端到端延遲）
+    enqueued_at: float = field(default=0.0, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class DeadLetter:
+    """重試後仍送不出的通知。"""
+
+    channel: str
+    digest: Digest
+    error: str
+    attempts: int
+    failed_at: datetime
+
+
+class NotificationChannel(ABC):
+    """通知通道介面。"""
+
+    name: str
+
+    def accepts(self, recipient: Recipient) -> bool:
+        """收件者是否可由此通道送達（預設為全部）。"""
+        return True
+
+    @abstractmethod
+    async def send(self, digest: Digest) -> None:
+        """送出一則摘要.
+
+        Args:
+            digest: 警報摘要
+
+        Raises:
+            NotificationDeliveryError: 當送出失敗時（retryable 決定是否重試）
+        """
+        pass
+
+    async def aclose(self) -> None:  # noqa: B027 - 無外部連線的實作不需覆寫
+        """釋放連線等資源。"""
+
+
+class RecipientDirectory(ABC):
+    """警報收件者查詢介面。"""
+
+    @abstractmethod
+    async def find_recipients(self, product_ids: Sequence[str]) -> dict[str, list[Recipient]]:
+        """批次查詢訂閱產品警報的收件者.
+
+        Args:
+            product_ids: 產品 ID（不重複）
+
+        Returns:
+            dict[str, list[Recipient]]: product_id -> 收件者（沒有收件者的產品可省略）
+        """
+        pass
+
+
+class DeadLetterStore(ABC):
+    """Dead letter 保存介面（供人工檢查與重送）。"""
+
+    @abstractmethod
+    async def add(self, letter: DeadLetter) -> None:
+        """保存一筆 dead letter。"""
+        pass
+
+    @abstractmethod
+    async def take(self, limit: int = 100) -> list[DeadLetter]:
+        """取出並移除最舊的 dead letters（重送用）.
+
+        Args:
+            limit: 最多筆數
+
+        Returns:
+            list[DeadLetter]: 依加入順序排列
+        """
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """目前保存的筆數。"""
+        pass
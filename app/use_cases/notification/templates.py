@@ -0,0 +1,43 @@
+"""Notification templates - 將警報摘要轉為各通道共用的文字與 JSON 內容。"""
+
+from app.use_cases.notification.ports import Digest
+
+
+def render_text(digest: Digest) -> tuple[str, str]:
+    """轉為純文字通知.
+
+    Args:
+        digest: 警報摘要
+
+    Returns:
+        tuple[str, str]: (主旨, 內文)
+    """
+    count = len(digest.alerts)
+    subject = f"[IV-TransBiz] {count} product alert{'s' if count != 1 else ''}"
+    lines = [
+        f"- {alert.product_id} {alert.alert_type}: {alert.old_value:g} -> {alert.new_value:g} "
+        f"({alert.change_percentage:+.1f}%) at {alert.triggered_at.isoformat()}"
+        for alert in digest.alerts
+    ]
+    return subject, "\n".join(lines)
+
+
+def to_payload(digest: Digest) -> dict:
+    """轉為 webhook 的 JSON 內容（id 可供接收端去除重送造成的重複）。"""
+    return {
+        "id": digest.id,
+        "user_id": digest.recipient.user_id,
+        "created_at": digest.created_at.isoformat(),
+        "alerts": [
+            {
+                "id": alert.id,
+                "product_id": alert.product_id,
+                "alert_type": alert.alert_type,
+                "change_percentage": alert.change_percentage,
+                "old_value": alert.old_value,
+                "new_value": alert.new_value,
+                "triggered_at": alert.triggered_at.isoformat(),
+            }
+            for alert in digest.alerts
+        ],
+    }
@@ -0,0 +1 @@
+"""Product use cases."""
@@ -0,0 +1,238 @@
+"""Batch update snapshots use case - 並發爬取所有產品並分批寫入快照。
+
+資料流（每一段都是有上限的 queue，下游變慢時上游自動等待 = backpressure）::
+
+    products --(input queue)--> N 個 scrape worker --(result queue)--> writer
+                                 per-host rate limit                    每 chunk_size 筆
+                                 retry + jittered backoff               save_many + checkpoint
+
+writer 寫入 chunk 後（若有設定）增量更新產品彙總並收集變化警報。
+checkpoint 只在 chunk 寫入 Repository 成功後才更新；crash 後以相同 run_id 重跑時，
+已完成的產品會被略過，且沿用同一個 scraped_at，重複寫入也只會 upsert 同一筆。
+"""
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from app.domain.entities.product import ChangeAlert, Product, ProductSnapshot
+from app.use_cases.product.ports import CheckpointStore, ScraperPort, SnapshotRepository
+from app.use_cases.product.update_rollups_use_case import UpdateRollupsUseCase
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class BatchUpdateResult:
+    """批次更新結果。"""
+
+    total: int = 0
+    success: int = 0
+    failed: int = 0
+    skipped: int = 0
+    retries: int = 0
+    errors: list[dict] = field(default_factory=list)
+    alerts: list[ChangeAlert] = field(default_factory=list)
+
+
+class _HostRateLimiter:
+    """每個 host 一個 token bucket；rate 為每秒請求數，burst 為最多累積的 token。"""
+
+    def __init__(self, rates: dict[str, float], default_rate: float | None, burst: int):
+        self.rates = rates
+        self.default_rate = default_rate
+        self.burst = burst
+        self._tokens: dict[str, float] = {}
+        self._updated: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        rate = self.rates.get(host, self.default_rate)
+        if not rate:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            while True:
+                now = time.monotonic()
+                tokens = self._tokens.get(host, float(self.burst))
+                tokens = min(self.burst, tokens + (now - self._updated.get(host, now)) * rate)
+                self._updated[host] = now
+                if tokens >= 1:
+                    self._tokens[host] = tokens - 1
+                    return
+                self._tokens[host] = tokens
+                await asyncio.sleep((1 - tokens) / rate)
+
+
+class BatchUpdateSnapshotsUseCase:
+    """批次更新產品快照 Use Case - 主程式邏輯。"""
+
+    def __init__(
+        self,
+        scraper: ScraperPort,
+        snapshot_repo: SnapshotRepository,
+        checkpoint_store: CheckpointStore,
+        concurrency: int = 20,
+        chunk_size: int = 500,
+        max_retries: int = 3,
+        backoff_base_seconds: float = 0.5,
+        backoff_max_seconds: float = 30.0,
+        host_rate_limits: dict[str, float] | None = None,
+        default_rate_limit: float | None = None,
+        rate_limit_burst: int = 1,
+        rollup_updater: UpdateRollupsUseCase | None = None,
+    ):
+        """初始化 BatchUpdateSnapshotsUseCase.
+
+        Args:
+            scraper: Scraper 實例（依賴抽象）
+            snapshot_repo: Snapshot Repository 實例（依賴抽象）
+            checkpoint_store: Checkpoint Store 實例（依賴抽象）
+            concurrency: 同時進行的爬取數上限
+            chunk_size: 每次寫入 Repository 的快照筆數
+            max_retries: 單一產品失敗後最多重試次數
+            backoff_base_seconds: 重試 backoff 基準秒數（每次加倍，full jitter）
+            backoff_max_seconds: 單次 backoff 上限秒數
+            host_rate_limits: 各 host 每秒請求數上限
+            default_rate_limit: 未列在 host_rate_limits 的 host 之每秒請求數上限（None 為不限制）
+            rate_limit_burst: rate limit 允許的瞬間突發請求數
+            rollup_updater: 每個 chunk 寫入後更新產品彙總（None 為不更新）
+        """
+        self.scraper = scraper
+        self.snapshot_repo = snapshot_repo
+        self.checkpoint_store = checkpoint_store
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.rate_limiter = _HostRateLimiter(
+            host_rate_limits or {}, default_rate_limit, rate_limit_burst
+        )
+        self.rollup_updater = rollup_updater
+
+    async def execute(self, products: Iterable[Product], run_id: str) -> BatchUpdateResult:
+        """執行批次更新（可重複呼叫以從 checkpoint 續跑）.
+
+        Args:
+            products: 要更新的產品（可為 lazy iterable，不需一次載入）
+            run_id: 批次執行 ID（例如 "daily-2025-10-10"）
+
+        Returns:
+            BatchUpdateResult: 成功、失敗、略過（已於先前執行完成）的統計
+        """
+        checkpoint = await self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            scraped_at = datetime.now(UTC)
+            await self.checkpoint_store.start(run_id, scraped_at)
+            done: set[str] = set()
+        else:
+            scraped_at = checkpoint.scraped_at
+            done = checkpoint.done
+            logger.info("Resuming batch %s: %d products already done", run_id, len(done))
+
+        result = BatchUpdateResult()
+        inputs: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        outputs: asyncio.Queue = asyncio.Queue(maxsize=self.chunk_size * 2)
+
+        async def produce() -> None:
+            for product in products:
+                result.total += 1
+                if product.id in done:
+                    result.skipped += 1
+                    continue
+                await inputs.put(product)
+            for _ in range(self.concurrency):
+                await inputs.put(_DONE)
+
+        async def work() -> None:
+            while (product := await inputs.get()) is not _DONE:
+                snapshot = await self._scrape_with_retry(product, scraped_at, result)
+                if snapshot is not None:
+                    await outputs.put(snapshot)
+
+        async def write() -> None:
+            chunk: list[ProductSnapshot] = []
+            while (snapshot := await outputs.get()) is not _DONE:
+                chunk.append(snapshot)
+                if len(chunk) >= self.chunk_size:
+                    await self._flush(run_id, chunk, result)
+                    chunk = []
+            if chunk:
+                await self._flush(run_id, chunk, result)
+
+        async def scrape_all() -> None:
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(self.concurrency):
+                    workers.create_task(work())
+            await outputs.put(_DONE)
+
+        # 任一段失敗（例如 Repository 寫入錯誤）時取消整條 pipeline，checkpoint 保留供續跑
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                group.create_task(scrape_all())
+                group.create_task(write())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from eg
+
+        if result.failed == 0:
+            await self.checkpoint_store.clear(run_id)
+        return result
+
+    async def _scrape_with_retry(
+        self, product: Product, scraped_at: datetime, result: BatchUpdateResult
+    ) -> ProductSnapshot | None:
+        host = self.scraper.host_for(product.asin)
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(host)
+            try:
+                data = await self.scraper.scrape_product(product.asin)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error("Failed to update %s (%s): %s", product.id, product.asin, e)
+                    result.failed += 1
+                    result.errors.append(
+                        {"product_id": product.id, "asin": product.asin, "error": str(e)}
+                    )
+                    return None
+                result.retries += 1
+                backoff = min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt)
+                await asyncio.sleep(random.uniform(0, backoff))
+                continue
+
+            return ProductSnapshot(
+                id=str(uuid.uuid4()),
+                product_id=product.id,
+                asin=product.asin,
+                price=data.price,
+                currency=data.currency,
+                bsr_main=data.bsr_main,
+                bsr_sub=data.bsr_sub,
+                rating=data.rating,
+                review_count=data.review_count,
+                buybox_price=data.buybox_price,
+                scraped_at=scraped_at,
+                created_at=datetime.now(UTC),
+            )
+        return None
+
+    async def _flush(
+        self, run_id: str, chunk: list[ProductSnapshot], result: BatchUpdateResult
+    ) -> None:
+        await self.snapshot_repo.save_many(chunk)
+        await self.checkpoint_store.mark_done(run_id, (s.product_id for s in chunk))
+        result.success += len(chunk)
+        if self.rollup_updater is not None:
+            try:
+                result.alerts.extend(await self.rollup_updater.execute(chunk))
+            except Exception as e:
+                # 快照已寫入：彙總的差異由一致性檢查（CheckRollupsUseCase）修復
+                logger.warning("Failed to update rollups for batch %s: %s", run_id, e)
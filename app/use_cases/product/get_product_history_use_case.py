@@ -0,0 +1,323 @@
+"""Get product history use case - 以 keyset 游標分頁、可降採樣的產品快照時序。
+
+快照每次以 ``batch_size`` 筆向 Repository 取出（游標為上一批最後一筆的 scraped_at），
+降採樣也逐批進行，記憶體只與批次大小有關、與序列長度無關：
+
+- ``raw``: 原始快照
+- ``daily`` / ``weekly``: 每個 UTC 日 / ISO 週只保留最後一筆（收盤值）
+- ``lttb``: Largest-Triangle-Three-Buckets，依時間將區間等分為 ``points - 2`` 個桶，
+  每桶保留與前一個選取點、下一桶平均值構成三角形面積最大的點（保留峰谷形狀）；
+  只需暫存兩個桶，回傳最多 ``points`` 筆，因此不分頁
+
+分頁游標為最後一筆 scraped_at 的 base64url 編碼（對 client 為不透明字串）。
+查詢前以 ``ensure_owner`` 確認產品屬於請求的使用者。
+"""
+
+import base64
+import binascii
+from collections.abc import AsyncIterator, Callable, Hashable
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.domain.entities.product import ProductSnapshot
+from app.use_cases.exceptions import InvalidCursorError, ProductNotFoundError
+from app.use_cases.product.ports import ProductRepository, SnapshotRepository
+
+RESOLUTIONS = ("raw", "daily", "weekly", "lttb")
+LTTB_METRICS = ("bsr_main", "bsr_sub", "price", "buybox_price", "rating", "review_count")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@dataclass(slots=True)
+class HistoryPoint:
+    """時序中的一個點（圖表用，金額轉為 float）。"""
+
+    scraped_at: datetime
+    price: float | None
+    buybox_price: float | None
+    currency: str
+    bsr_main: int | None
+    bsr_sub: int | None
+    rating: float | None
+    review_count: int | None
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ProductSnapshot) -> "HistoryPoint":
+        """由快照建立。"""
+        return cls(
+            scraped_at=snapshot.scraped_at,
+            price=float(snapshot.price) if snapshot.price is not None else None,
+            buybox_price=(
+                float(snapshot.buybox_price) if snapshot.buybox_price is not None else None
+            ),
+            currency=snapshot.currency,
+            bsr_main=snapshot.bsr_main,
+            bsr_sub=snapshot.bsr_sub,
+            rating=snapshot.rating,
+            review_count=snapshot.review_count,
+        )
+
+
+@dataclass(slots=True)
+class HistoryPage:
+    """一頁時序資料。"""
+
+    items: list[HistoryPoint]
+    next_cursor: str | None  # 沒有下一頁時為 None
+
+
+def encode_cursor(moment: datetime) -> str:
+    """將最後一筆的 scraped_at 編碼為分頁游標。"""
+    return base64.urlsafe_b64encode(moment.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """解碼分頁游標.
+
+    Args:
+        cursor: encode_cursor 產生的游標
+
+    Returns:
+        datetime: 上一頁最後一筆的 scraped_at
+
+    Raises:
+        InvalidCursorError: 游標格式錯誤
+    """
+    try:
+        text = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        return datetime.fromisoformat(text)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def _utc(moment: datetime) -> datetime:
+    return moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment.astimezone(UTC)
+
+
+def _day_key(point: HistoryPoint) -> Hashable:
+    return _utc(point.scraped_at).date()
+
+
+def _week_key(point: HistoryPoint) -> Hashable:
+    year, week, _ = _utc(point.scraped_at).isocalendar()
+    return year, week
+
+
+async def _last_per_bucket(
+    points: AsyncIterator[HistoryPoint], key: Callable[[HistoryPoint], Hashable]
+) -> AsyncIterator[HistoryPoint]:
+    """每個桶只保留最後一筆（輸入依時間排序，桶連續出現）。"""
+    last: HistoryPoint | None = None
+    async for point in points:
+        if last is not None and key(point) != key(last):
+            yield last
+        last = point
+    if last is not None:
+        yield last
+
+
+def _select(
+    bucket: list[tuple[float, float, HistoryPoint]],
+    anchor: tuple[float, float],
+    target: tuple[float, float],
+) -> tuple[float, float, HistoryPoint]:
+    """選出與 anchor、target 構成三角形面積最大的點。"""
+    ax, ay = anchor
+    tx, ty = target
+    return max(bucket, key=lambda p: abs((ax - tx) * (p[1] - ay) - (ax - p[0]) * (ty - ay)))
+
+
+async def _lttb(
+    points: AsyncIterator[HistoryPoint], end: datetime, threshold: int, metric: str
+) -> AsyncIterator[HistoryPoint]:
+    """以時間分桶的串流 LTTB（metric 缺值的點不納入）。"""
+    anchor: tuple[float, float] | None = None
+    width = 0.0
+    pending: list[tuple[float, float, HistoryPoint]] = []  # 等待下一桶平均值的桶
+    current: list[tuple[float, float, HistoryPoint]] = []
+    current_index = -1
+    async for point in points:
+        value = getattr(point, metric)
+        if value is None:
+            continue
+        x, y = point.scraped_at.timestamp(), float(value)
+        if anchor is None:
+            # 第一個點一定保留，並作為分桶起點
+            anchor = (x, y)
+            width = max(_utc(end).timestamp() - x, 1.0) / (threshold - 2)
+            origin = x
+            yield point
+            continue
+        index = int((x - origin) // width)
+        if current and index != current_index:
+            if pending:
+                average = (
+                    sum(p[0] for p in current) / len(current),
+                    sum(p[1] for p in current) / len(current),
+                )
+                selected = _select(pending, anchor, average)
+                anchor = selected[:2]
+                yield selected[2]
+            pending, current = current, []
+        current_index = index
+        current.append((x, y, point))
+    if pending:
+        target = current[-1][:2] if current else pending[-1][:2]
+        yield _select(pending, anchor, target)[2]
+    if current:
+        # 最後一個點一定保留
+        yield current[-1][2]
+
+
+class GetProductHistoryUseCase:
+    """產品歷史時序查詢。"""
+
+    def __init__(
+        self,
+        snapshot_repo: SnapshotRepository,
+        batch_size: int = 1000,
+        product_repo: ProductRepository | None = None,
+    ):
+        """初始化 GetProductHistoryUseCase.
+
+        Args:
+            snapshot_repo: 快照 Repository（依賴抽象）
+            batch_size: 每次向 Repository 取出的筆數
+            product_repo: 產品 Repository（``ensure_owner`` 用，依賴抽象）
+        """
+        self.snapshot_repo = snapshot_repo
+        self.batch_size = batch_size
+        self.product_repo = product_repo
+
+    async def ensure_owner(self, product_id: str, user_id: str) -> None:
+        """確認產品屬於該使用者.
+
+        Args:
+            product_id: 產品 ID
+            user_id: 請求的使用者 ID
+
+        Raises:
+            ProductNotFoundError: 產品不存在或不屬於該使用者
+            RuntimeError: 未設定 product_repo
+        """
+        if self.product_repo is None:
+            raise RuntimeError("ProductRepository not configured")
+        product = await self.product_repo.find_by_id(product_id)
+        if product is None or product.user_id != user_id:
+            raise ProductNotFoundError(f"Product not found: {product_id}")
+
+    async def _points(
+        self,
+        product_id: str,
+        start: datetime,
+        end: datetime,
+        after: datetime | None,
+        batch_size: int,
+    ) -> AsyncIterator[HistoryPoint]:
+        while True:
+            batch = await self.snapshot_repo.find_range(
+                product_id, start, end, limit=batch_size, after=after
+            )
+            for snapshot in batch:
+                yield HistoryPoint.from_snapshot(snapshot)
+            if len(batch) < batch_size:
+                return
+            after = batch[-1].scraped_at
+
+    def stream(
+        self,
+        product_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        resolution: str = "raw",
+        after: datetime | None = None,
+        points: int = 1000,
+        metric: str = "bsr_main",
+        batch_size: int | None = None,
+    ) -> AsyncIterator[HistoryPoint]:
+        """依時間由舊到新逐筆產生時序（不保留整個序列）.
+
+        Args:
+            product_id: 產品 ID
+            start: 起始時間（含），None 表示從最早的資料開始
+            end: 結束時間（不含），None 表示到現在
+            resolution: raw、daily、weekly 或 lttb
+            after: 分頁游標（只回傳 scraped_at 大於此時間的點）
+            points: lttb 模式最多回傳的點數（至少 3）
+            metric: lttb 模式用來選點的欄位
+            batch_size: 每次向 Repository 取出的筆數（預設為建構時的設定）
+
+        Returns:
+            AsyncIterator[HistoryPoint]: 時序點
+
+        Raises:
+            ValueError: resolution、metric 或 points 不合法
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution!r}")
+        if resolution == "lttb" and (metric not in LTTB_METRICS or points < 3):
+            raise ValueError("LTTB requires a numeric metric and at least 3 points")
+        end = end or datetime.now(UTC)
+        source = self._points(product_id, start or EPOCH, end, after, batch_size or self.batch_size)
+        if resolution == "daily":
+            return _last_per_bucket(source, _day_key)
+        if resolution == "weekly":
+            return _last_per_bucket(source, _week_key)
+        if resolution == "lttb":
+            return _lttb(source, end, points, metric)
+        return source
+
+    async def execute(
+        self,
+        product_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        resolution: str = "raw",
+        cursor: str | None = None,
+        limit: int = 1000,
+        points: int = 1000,
+        metric: str = "bsr_main",
+    ) -> HistoryPage:
+        """取得一頁時序.
+
+        Args:
+            product_id: 產品 ID
+            start: 起始時間（含）
+            end: 結束時間（不含）
+            resolution: raw、daily、weekly 或 lttb
+            cursor: 上一頁回傳的 next_cursor
+            limit: 每頁筆數（lttb 模式不分頁，改以 points 限制）
+            points: lttb 模式最多回傳的點數
+            metric: lttb 模式用來選點的欄位
+
+        Returns:
+            HistoryPage: 本頁資料與下一頁游標
+
+        Raises:
+            InvalidCursorError: 游標格式錯誤
+            ValueError: resolution、metric 或 points 不合法
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if resolution == "lttb":
+            items = [
+                p async for p in self.stream(product_id, start, end, "lttb", after, points, metric)
+            ]
+            return HistoryPage(items=items, next_cursor=None)
+
+        # 多取一筆判斷是否還有下一頁；raw 模式不需要整批 batch_size
+        batch_size = min(self.batch_size, limit + 1) if resolution == "raw" else None
+        items: list[HistoryPoint] = []
+        source = self.stream(
+            product_id, start, end, resolution, after, points, metric, batch_size=batch_size
+        )
+        async with aclosing(source):
+            async for point in source:
+                items.append(point)
+                if len(items) > limit:
+                    break
+        if len(items) <= limit:
+            return HistoryPage(items=items, next_cursor=None)
+        del items[limit:]
+        return HistoryPage(items=items, next_cursor=encode_cursor(items[-1].scraped_at))
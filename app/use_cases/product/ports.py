@@ -0,0 +1,256 @@
+"""Product Repository 抽象介面（Ports）。"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+
+from app.domain.entities.product import Product, ProductRollup, ProductSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class ScrapedProductData:
+    """爬蟲回傳的產品資料。"""
+
+    asin: str
+    title: str
+    category: str
+    price: Decimal | None
+    currency: str
+    bsr_main: int | None
+    bsr_sub: int | None
+    rating: float | None
+    review_count: int | None
+    buybox_price: Decimal | None
+
+
+class ScraperPort(ABC):
+    """爬蟲服務介面。"""
+
+    @abstractmethod
+    async def scrape_product(self, asin: str) -> ScrapedProductData:
+        """爬取產品資料。
+
+        Args:
+            asin: Amazon 產品 ID
+
+        Returns:
+            ScrapedProductData: 爬取結果
+
+        Raises:
+            Exception: 當爬取失敗時
+        """
+        pass
+
+    def host_for(self, asin: str) -> str:
+        """回傳此 ASIN 的請求會打到的上游 host（供 per-host rate limit 使用）。
+
+        Args:
+            asin: Amazon 產品 ID
+
+        Returns:
+            str: 上游 host，預設所有請求共用同一個 host
+        """
+        return "default"
+
+
+@dataclass
+class BatchCheckpoint:
+    """批次更新的 checkpoint（用於 crash 後續跑）。"""
+
+    run_id: str
+    scraped_at: datetime
+    done: set[str] = field(default_factory=set)
+
+
+class CheckpointStore(ABC):
+    """批次更新 checkpoint 儲存介面。"""
+
+    @abstractmethod
+    async def load(self, run_id: str) -> BatchCheckpoint | None:
+        """讀取 checkpoint。
+
+        Args:
+            run_id: 批次執行 ID
+
+        Returns:
+            BatchCheckpoint | None: 既有 checkpoint，沒有時為 None
+        """
+        pass
+
+    @abstractmethod
+    async def start(self, run_id: str, scraped_at: datetime) -> None:
+        """建立新的 checkpoint。
+
+        Args:
+            run_id: 批次執行 ID
+            scraped_at: 本次批次所有快照共用的 scraped_at
+        """
+        pass
+
+    @abstractmethod
+    async def mark_done(self, run_id: str, product_ids: Iterable[str]) -> None:
+        """記錄已寫入 Repository 的產品。
+
+        Args:
+            run_id: 批次執行 ID
+            product_ids: 已完成的產品 ID
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self, run_id: str) -> None:
+        """批次完成後刪除 checkpoint。
+
+        Args:
+            run_id: 批次執行 ID
+        """
+        pass
+
+
+class ProductRepository(ABC):
+    """產品 Repository 介面。"""
+
+    @abstractmethod
+    async def find_by_id(self, product_id: str) -> Product | None:
+        """取得產品。
+
+        Args:
+            product_id: 產品 ID
+
+        Returns:
+            Product | None: 產品，不存在時為 None
+        """
+        pass
+
+
+class SnapshotRepository(ABC):
+    """產品快照 Repository 介面（時序資料）。"""
+
+    @abstractmethod
+    async def save_many(self, snapshots: Sequence[ProductSnapshot]) -> int:
+        """批次寫入快照（以 product_id + scraped_at 為鍵 upsert）。
+
+        Args:
+            snapshots: 要寫入的快照
+
+        Returns:
+            int: 寫入（新增或更新）的筆數
+        """
+        pass
+
+    @abstractmethod
+    async def find_latest_by_product(self, product_id: str) -> ProductSnapshot | None:
+        """取得產品最新快照。
+
+        Args:
+            product_id: 產品 ID
+
+        Returns:
+            ProductSnapshot | None: 最新快照，沒有資料時為 None
+        """
+        pass
+
+    @abstractmethod
+    async def find_latest_by_products(
+        self, product_ids: Sequence[str]
+    ) -> dict[str, ProductSnapshot]:
+        """批次取得多個產品各自的最新快照。
+
+        Args:
+            product_ids: 產品 ID 清單
+
+        Returns:
+            dict[str, ProductSnapshot]: product_id -> 最新快照（沒有資料的產品不會出現）
+        """
+        pass
+
+    @abstractmethod
+    async def find_range(
+        self,
+        product_id: str,
+        start: datetime,
+        end: datetime,
+        limit: int | None = None,
+        after: datetime | None = None,
+    ) -> list[ProductSnapshot]:
+        """取得產品在時間區間內的快照（依 scraped_at 由舊到新）。
+
+        Args:
+            product_id: 產品 ID
+            start: 起始時間（含）
+            end: 結束時間（不含）
+            limit: 最多回傳筆數
+            after: keyset 分頁游標，只回傳 scraped_at 大於此時間的快照（不含）
+
+        Returns:
+            list[ProductSnapshot]: 區間內的快照
+        """
+        pass
+
+
+# 產品列表可排序的欄位（缺值一律排在最後）
+ROLLUP_SORT_COLUMNS = (
+    "latest_at",
+    "price",
+    "bsr_main",
+    "bsr_sub",
+    "price_change_7d",
+    "bsr_change_7d",
+    "last_alert_at",
+)
+
+
+class RollupRepository(ABC):
+    """產品彙總 Repository 介面（每個產品一筆，產品列表直接讀取）。"""
+
+    @abstractmethod
+    async def get_many(self, product_ids: Sequence[str]) -> dict[str, ProductRollup]:
+        """批次取得彙總。
+
+        Args:
+            product_ids: 產品 ID 清單
+
+        Returns:
+            dict[str, ProductRollup]: product_id -> 彙總（沒有彙總的產品不會出現）
+        """
+        pass
+
+    @abstractmethod
+    async def save_many(self, rollups: Sequence[ProductRollup]) -> int:
+        """批次寫入彙總（以 product_id 為鍵 upsert）。
+
+        Args:
+            rollups: 要寫入的彙總
+
+        Returns:
+            int: 寫入的筆數
+        """
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self,
+        product_ids: Sequence[str] | None = None,
+        sort_by: str = "latest_at",
+        descending: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[ProductRollup], int]:
+        """排序分頁查詢彙總（產品列表）。
+
+        Args:
+            product_ids: 只查詢這些產品（例如使用者追蹤的產品），None 表示全部
+            sort_by: 排序欄位（ROLLUP_SORT_COLUMNS 之一，相同值再依 product_id 排序）
+            descending: 是否由大到小
+            limit: 每頁筆數
+            offset: 略過筆數
+
+        Returns:
+            tuple[list[ProductRollup], int]: (本頁彙總, 符合條件的總筆數)
+
+        Raises:
+            ValueError: sort_by 不在 ROLLUP_SORT_COLUMNS
+        """
+        pass
@@ -0,0 +1,87 @@
+"""Update rollups use case - 快照寫入後增量更新產品彙總並產生變化警報。
+
+每批只讀寫一次彙總表（get_many + save_many），不掃描快照；警報以彙總中的最新值
+作為「前一筆」比對，因此也不需要再查詢前一筆快照。
+
+同一產品的彙總更新必須依序執行（例如批次更新的單一 writer），並發更新會互相覆蓋；
+漏更新或覆蓋造成的差異由 CheckRollupsUseCase 偵測與修復。
+"""
+
+from collections.abc import Sequence
+
+from app.domain.entities.product import ChangeAlert, ProductRollup, ProductSnapshot
+from app.domain.services.change_detection import ChangeDetector
+from app.domain.services.rollup import apply_snapshot, detect_alerts, record_alert
+from app.use_cases.product.ports import RollupRepository
+
+
+def apply_layer(
+    rollups: dict[str, ProductRollup],
+    snapshots: Sequence[ProductSnapshot],
+    detector: ChangeDetector,
+) -> list[ChangeAlert]:
+    """套用一層快照（每個產品最多一筆）：先與目前最新值比對產生警報，再更新彙總.
+
+    Args:
+        rollups: product_id -> 彙總（就地更新，新產品會被加入）
+        snapshots: 快照（product_id 不重複）
+        detector: 變化偵測器
+
+    Returns:
+        list[ChangeAlert]: 觸發的警報（只比對比目前最新值更新的快照）
+    """
+    newer = [
+        s
+        for s in snapshots
+        if s.product_id in rollups and s.scraped_at > rollups[s.product_id].latest_at
+    ]
+    alerts = detect_alerts(detector, newer, [rollups[s.product_id] for s in newer])
+    for snapshot in snapshots:
+        rollups[snapshot.product_id] = apply_snapshot(rollups.get(snapshot.product_id), snapshot)
+    for alert in alerts:
+        record_alert(rollups[alert.product_id], alert)
+    return alerts
+
+
+class UpdateRollupsUseCase:
+    """產品彙總增量更新 Use Case。"""
+
+    def __init__(self, rollup_repo: RollupRepository, detector: ChangeDetector | None = None):
+        """初始化 UpdateRollupsUseCase.
+
+        Args:
+            rollup_repo: 彙總 Repository（依賴抽象）
+            detector: 變化偵測器（預設為 DEFAULT_RULES）
+        """
+        self.rollup_repo = rollup_repo
+        self.detector = detector or ChangeDetector()
+
+    async def execute(self, snapshots: Sequence[ProductSnapshot]) -> list[ChangeAlert]:
+        """以一批已寫入的快照更新彙總.
+
+        Args:
+            snapshots: 快照（同一產品可有多筆，依 scraped_at 順序套用）
+
+        Returns:
+            list[ChangeAlert]: 本批觸發的警報
+        """
+        if not snapshots:
+            return []
+        pending = sorted(snapshots, key=lambda s: s.scraped_at)
+        product_ids = list(dict.fromkeys(s.product_id for s in pending))
+        rollups = await self.rollup_repo.get_many(product_ids)
+
+        # 每層每個產品最多一筆（一般批次每個產品只有一筆，只有一層）
+        alerts: list[ChangeAlert] = []
+        while pending:
+            layer: list[ProductSnapshot] = []
+            rest: list[ProductSnapshot] = []
+            seen: set[str] = set()
+            for snapshot in pending:
+                (rest if snapshot.product_id in seen else layer).append(snapshot)
+                seen.add(snapshot.product_id)
+            alerts.extend(apply_layer(rollups, layer, self.detector))
+            pending = rest
+
+        await self.rollup_repo.save_many([rollups[product_id] for product_id in product_ids])
+        return alerts
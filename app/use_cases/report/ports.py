@@ -0,0 +1,67 @@
+"""LLM 抽象介面（Ports）。"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class LLMRequest:
+    """單一 LLM 呼叫的內容（tenant 不同的呼叫不會合併到同一次批次呼叫）。"""
+
+    system: str
+    prompt: str
+    max_tokens: int = 1024
+    tenant: str | None = None
+
+
+class LLMPort(ABC):
+    """大型語言模型服務介面。"""
+
+    @abstractmethod
+    async def complete(self, request: LLMRequest) -> str:
+        """產生完整回應。
+
+        Args:
+            request: 呼叫內容
+
+        Returns:
+            str: 模型回應
+
+        Raises:
+            Exception: 當呼叫失敗時
+        """
+        pass
+
+    @abstractmethod
+    def stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """逐段產生回應（async generator）。
+
+        Args:
+            request: 呼叫內容
+
+        Yields:
+            str: 回應片段
+
+        Raises:
+            Exception: 當呼叫失敗時
+        """
+        pass
+
+    async def complete_batch(self, requests: Sequence[LLMRequest]) -> list[str]:
+        """一次產生多個回應（順序與 requests 相同）。
+
+        預設為各自並發呼叫 ``complete``；支援合併呼叫的實作可覆寫以減少 API 請求數，
+        但只能合併 ``tenant`` 相同的呼叫（一個使用者的資料不可出現在另一個使用者的回應中）。
+
+        Args:
+            requests: 呼叫內容
+
+        Returns:
+            list[str]: 各呼叫的回應
+
+        Raises:
+            Exception: 當任一呼叫失敗時
+        """
+        return list(await asyncio.gather(*(self.complete(r) for r in requests)))
@@ -0,0 +1,97 @@
+"""Report prompts - 各類報告的 prompt 樣板與輸入資料正規化。
+
+修改 system / template 內容時必須同時更新 version，快取 key 才會跟著改變
+（舊版本的結果不會再被讀到，於 TTL 後自然過期）。
+"""
+
+import json
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from app.use_cases.report.ports import LLMRequest
+
+
+@dataclass(frozen=True, slots=True)
+class ReportPrompt:
+    """報告 prompt 樣板。"""
+
+    kind: str
+    version: str
+    system: str
+    template: str  # 以 {data} 代入正規化後的 JSON
+    max_tokens: int = 1024
+
+    def build(self, data: str) -> LLMRequest:
+        """以正規化後的輸入資料建立 LLM 呼叫內容。"""
+        return LLMRequest(
+            system=self.system,
+            prompt=self.template.format(data=data),
+            max_tokens=self.max_tokens,
+        )
+
+
+PROMPTS: dict[str, ReportPrompt] = {
+    prompt.kind: prompt
+    for prompt in (
+        ReportPrompt(
+            kind="competitive-positioning",
+            version="competitive-positioning-v1",
+            system=(
+                "You are an Amazon marketplace analyst. Be concise and specific, "
+                "and base every claim on the data provided."
+            ),
+            template=(
+                "Write a competitive positioning report for the main product against its "
+                "competitors. Cover price position, rating and review strength, sales rank, "
+                "and three concrete recommendations.\n\nComparison data (JSON):\n{data}"
+            ),
+            max_tokens=1500,
+        ),
+        ReportPrompt(
+            kind="listing-suggestions",
+            version="listing-suggestions-v1",
+            system="You are an Amazon listing optimization expert. Reply in short bullet points.",
+            template=(
+                "Suggest improvements to this product listing's title, bullet points and "
+                "pricing.\n\nListing data (JSON):\n{data}"
+            ),
+            max_tokens=600,
+        ),
+    )
+}
+
+
+def canonical_json(data: Any) -> str:
+    """將輸入資料轉為正規化 JSON（key 排序、去除 None 與前後空白、數字統一格式）。
+
+    內容相同的資料（例如 key 順序不同、Decimal("10.50") 與 10.5）會得到相同字串，
+    用於快取 key 與 prompt 內容。
+
+    Args:
+        data: dict / list / dataclass 組成的輸入資料
+
+    Returns:
+        str: 正規化 JSON
+    """
+    return json.dumps(_normalize(data), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _normalize(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list | tuple):
+        return [_normalize(v) for v in value]
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, Decimal | float):
+        number = round(float(value), 6)
+        return int(number) if number.is_integer() else number
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return value
@@ -0,0 +1,291 @@
+"""Report generator - 以 LLM 產生報告，結果依內容定址快取。
+
+- 快取 key 為 ``report:<prompt version>:<sha256(正規化輸入)>``，輸入內容與 prompt 版本相同即命中
+- 相同 key 同時只會有一個 LLM 呼叫：一般請求交給 CachePort 的 single-flight，
+  串流請求則共用同一個 ``_SharedStream``（後到的訂閱者先重播已產生的片段）
+- 短 prompt 於 ``batch_window_seconds`` 內累積後，依 tenant 分組以 ``complete_batch`` 送出
+  （不同使用者的 prompt 不會合併到同一次 LLM 呼叫）
+- 串流由獨立 task 產生，client 中途斷線不影響其他訂閱者，完成後照常寫入快取
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from app.use_cases.cache.ports import CachePort
+from app.use_cases.report.ports import LLMPort, LLMRequest
+from app.use_cases.report.prompts import PROMPTS, ReportPrompt, canonical_json
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Report:
+    """產生的報告。"""
+
+    kind: str
+    key: str
+    content: str
+    cached: bool
+
+
+@dataclass
+class ReportStats:
+    """報告產生統計計數。"""
+
+    requests: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0  # 共用進行中串流的請求數
+    llm_prompts: int = 0  # 實際送給 LLM 的 prompt 數
+    llm_calls: int = 0  # LLM API 呼叫數（批次呼叫算一次）
+
+    @property
+    def hit_ratio(self) -> float:
+        """快取命中率。"""
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+
+class _SharedStream:
+    """同一份串流輸出的多個訂閱者共用緩衝。"""
+
+    def __init__(self):
+        self.chunks: list[str] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self._changed = asyncio.Event()
+
+    def append(self, chunk: str) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def finish(self, error: BaseException | None = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+    async def text(self) -> str:
+        return "".join([chunk async for chunk in self.subscribe()])
+
+
+class ReportGenerator:
+    """報告產生器（Singleton：快取、進行中的呼叫與批次佇列跨請求共用）。"""
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        cache: CachePort,
+        ttl_seconds: float = 7 * 24 * 3600,
+        batch_window_seconds: float = 0.02,
+        max_batch_size: int = 8,
+        batch_max_chars: int = 4000,
+        prompts: Mapping[str, ReportPrompt] = PROMPTS,
+    ):
+        """初始化 ReportGenerator.
+
+        Args:
+            llm: LLM 實例（依賴抽象）
+            cache: 快取實例（依賴抽象）
+            ttl_seconds: 報告快取秒數
+            batch_window_seconds: 短 prompt 等待合併的秒數
+            max_batch_size: 單次批次呼叫最多的 prompt 數（1 為停用批次）
+            batch_max_chars: 可合併的 prompt 長度上限（字元）
+            prompts: 報告類型 -> prompt 樣板
+        """
+        self.llm = llm
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.batch_window_seconds = batch_window_seconds
+        self.max_batch_size = max_batch_size
+        self.batch_max_chars = batch_max_chars
+        self.prompts = prompts
+        self.stats = ReportStats()
+        self._streams: dict[str, _SharedStream] = {}
+        self._pending: list[tuple[LLMRequest, asyncio.Future[str]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def prepare(self, kind: str, data: Any) -> tuple[str, LLMRequest]:
+        """建立快取 key 與 LLM 呼叫內容.
+
+        Args:
+            kind: 報告類型
+            data: 輸入資料
+
+        Returns:
+            tuple[str, LLMRequest]: (快取 key, 呼叫內容)
+
+        Raises:
+            ValueError: 未知的報告類型
+        """
+        prompt = self.prompts.get(kind)
+        if prompt is None:
+            raise ValueError(f"Unknown report kind: {kind}")
+        normalized = canonical_json(data)
+        digest = hashlib.sha256(f"{prompt.version}\n{normalized}".encode()).hexdigest()
+        return f"report:{prompt.version}:{digest}", prompt.build(normalized)
+
+    async def generate(self, kind: str, data: Any, tenant: str | None = None) -> Report:
+        """產生完整報告（快取命中時不呼叫 LLM）.
+
+        Args:
+            kind: 報告類型
+            data: 輸入資料
+            tenant: 請求者（通常為使用者 ID）；只和同一 tenant 的 prompt 合併批次呼叫
+
+        Returns:
+            Report: 報告內容
+
+        Raises:
+            ValueError: 未知的報告類型
+            Exception: LLM 呼叫失敗時
+        """
+        key, request = self.prepare(kind, data)
+        self.stats.requests += 1
+        cached = await self.cache.get(key)
+        if cached is not None:
+            self.stats.cache_hits += 1
+            return Report(kind=kind, key=key, content=cached.decode(), cached=True)
+
+        shared = self._streams.get(key)
+        if shared is not None:
+            self.stats.coalesced += 1
+            return Report(kind=kind, key=key, content=await shared.text(), cached=False)
+
+        request = dataclasses.replace(request, tenant=tenant)
+
+        async def load() -> bytes:
+            return (await self._complete(request)).encode()
+
+        content = await self.cache.get_or_load(key, load, self.ttl_seconds)
+        return Report(kind=kind, key=key, content=content.decode(), cached=False)
+
+    async def stream(self, kind: str, data: Any) -> AsyncIterator[str]:
+        """逐段產生報告（快取命中時一次回傳全文）.
+
+        Args:
+            kind: 報告類型
+            data: 輸入資料
+
+        Yields:
+            str: 報告片段
+
+        Raises:
+            ValueError: 未知的報告類型
+            Exception: LLM 呼叫失敗時
+        """
+        key, request = self.prepare(kind, data)
+        self.stats.requests += 1
+        cached = await self.cache.get(key)
+        if cached is not None:
+            self.stats.cache_hits += 1
+            yield cached.decode()
+            return
+
+        shared = self._streams.get(key)
+        if shared is None:
+            shared = self._streams[key] = _SharedStream()
+            self._spawn(self._produce(key, request, shared))
+        else:
+            self.stats.coalesced += 1
+        async for chunk in shared.subscribe():
+            yield chunk
+
+    async def _produce(self, key: str, request: LLMRequest, shared: _SharedStream) -> None:
+        self.stats.llm_calls += 1
+        self.stats.llm_prompts += 1
+        try:
+            async for chunk in self.llm.stream(request):
+                shared.append(chunk)
+            await self.cache.set(key, "".join(shared.chunks).encode(), self.ttl_seconds)
+        except asyncio.CancelledError:
+            shared.finish(RuntimeError("Report generation cancelled"))
+            raise
+        except Exception as e:
+            logger.warning("Report stream failed for %s: %s", key, e)
+            shared.finish(e)
+        else:
+            shared.finish()
+        finally:
+            # 寫入快取後才移除，之後的請求直接命中快取
+            del self._streams[key]
+
+    async def _complete(self, request: LLMRequest) -> str:
+        """呼叫 LLM；短 prompt 放入批次佇列等待合併。"""
+        if self.max_batch_size <= 1 or len(request.system) + len(request.prompt) > (
+            self.batch_max_chars
+        ):
+            self.stats.llm_calls += 1
+            self.stats.llm_prompts += 1
+            return await self.llm.complete(request)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.batch_window_seconds, self._flush
+            )
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        groups: dict[str | None, list[tuple[LLMRequest, asyncio.Future[str]]]] = {}
+        for item in batch:
+            groups.setdefault(item[0].tenant, []).append(item)
+        for group in groups.values():
+            self._spawn(self._run_batch(group))
+
+    async def _run_batch(self, batch: list[tuple[LLMRequest, asyncio.Future[str]]]) -> None:
+        self.stats.llm_calls += 1
+        self.stats.llm_prompts += len(batch)
+        requests = [request for request, _ in batch]
+        try:
+            if len(requests) == 1:
+                results = [await self.llm.complete(requests[0])]
+            else:
+                results = await self.llm.complete_batch(requests)
+            if len(results) != len(batch):
+                raise RuntimeError(f"Expected {len(batch)} batch results, got {len(results)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+    def _spawn(self, coro) -> None:
+        # 保留 task 參照，避免執行中被 GC
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """取消進行中的串流與批次（app shutdown 時呼叫）。"""
+        for task in list(self._tasks):
+            task.cancel()
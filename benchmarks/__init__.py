@@ -0,0 +1 @@
+"""Performance benchmarks - 離線可執行的效能基準測試腳本。"""
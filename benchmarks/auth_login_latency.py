@@ -0,0 +1,108 @@
+"""Login latency benchmark - 比較同步（阻塞）與非同步 auth 路徑的 p50/p99。
+
+以固定到達率（open-loop）對完整 ASGI app（``app.main``）發出登入請求，
+上游為本機 stub auth server。延遲由「排定送出時間」起算，因此 event loop
+被阻塞時排隊等待的時間也會計入（避免 coordinated omission）。分別量測：
+
+- ``blocking``: 改版前行為，async 路由中直接呼叫同步 Supabase client
+- ``async``: 改版後行為，使用 Supabase async client + 連線池
+
+Usage::
+
+    python -m benchmarks.auth_login_latency --requests 300 --rate 100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import asgi_client, configure_env, latency_summary, print_table
+from benchmarks.stub_auth_server import StubAuthServer
+
+
+async def _run_load(app, total: int, rate: float) -> dict:
+    latencies: list[float] = []
+
+    async with asgi_client(app) as client:
+        started = time.perf_counter()
+
+        async def one(i: int) -> None:
+            scheduled = started + i / rate
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            response = await client.post(
+                "/api/v1/auth/login",
+                json={"email": f"user{i}@example.com", "password": "password123"},
+            )
+            latencies.append(time.perf_counter() - scheduled)
+            response.raise_for_status()
+
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+
+    return latency_summary(latencies, elapsed)
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--rate", type=float, default=100.0, help="每秒送出的登入請求數")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub 上游延遲（秒）")
+    args = parser.parse_args()
+
+    with StubAuthServer(latency=args.latency) as stub:
+        configure_env(stub.url)
+
+        from supabase import ClientOptions, create_client
+
+        from app.adapters.api.dependencies import get_auth_repository
+        from app.adapters.repositories.supabase_auth_repository import SupabaseAuthRepository
+        from app.main import app
+        from app.use_cases.auth.ports import AsyncAuthRepository
+
+        class BlockingAuthRepository(AsyncAuthRepository):
+            """改版前行為：在 event loop 中直接呼叫同步 client。"""
+
+            def __init__(self):
+                sync_client = create_client(
+                    stub.url,
+                    "benchmark-anon-key",
+                    ClientOptions(auto_refresh_token=False, persist_session=False),
+                )
+                self._repo = SupabaseAuthRepository(supabase_client=sync_client)
+
+            async def signup(self, email, password):
+                return self._repo.signup(email, password)
+
+            async def login(self, email, password):
+                return self._repo.login(email, password)
+
+            # 以下為 session 快取使用的方法，改版前不存在，此 benchmark 也不會呼叫
+            async def login_session(self, email, password):
+                raise NotImplementedError
+
+            async def refresh_session(self, refresh_token):
+                raise NotImplementedError
+
+            async def logout(self, access_token):
+                raise NotImplementedError
+
+        blocking_repository = BlockingAuthRepository()
+        rows = []
+        for name in ("blocking", "async"):
+            if name == "blocking":
+                app.dependency_overrides[get_auth_repository] = lambda: blocking_repository
+            else:
+                app.dependency_overrides.clear()
+            summary = asyncio.run(_run_load(app, args.requests, args.rate))
+            rows.append({"mode": name, **summary})
+
+    print(
+        f"login storm: {args.requests} requests at {args.rate:.0f} req/s, "
+        f"upstream latency={args.latency * 1000:.0f}ms"
+    )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Auth session cache benchmark - 比較有無登入 session 快取時的上游呼叫數與登入延遲。
+
+以固定到達率（open-loop）對完整 ASGI app（``app.main``）發出登入請求，
+請求平均分配給 ``--users`` 個帳號（模擬腳本與儀表板反覆登入），上游為本機
+stub auth server。分別量測：
+
+- ``uncached``: ``AUTH_SESSION_CACHE_SIZE=0``，每次登入都向上游驗證密碼
+- ``cached``: 預設設定，同一帳號重用仍有效的 session
+
+Usage::
+
+    python -m benchmarks.auth_session_cache --requests 500 --rate 200 --users 20 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import asgi_client, configure_env, latency_summary, print_table
+from benchmarks.stub_auth_server import StubAuthServer
+
+
+async def _run_load(app, total: int, rate: float, users: int) -> dict:
+    latencies: list[float] = []
+
+    async with asgi_client(app) as client:
+        started = time.perf_counter()
+
+        async def one(i: int) -> None:
+            scheduled = started + i / rate
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            response = await client.post(
+                "/api/v1/auth/login",
+                json={"email": f"user{i % users}@example.com", "password": "password123"},
+            )
+            latencies.append(time.perf_counter() - scheduled)
+            response.raise_for_status()
+
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+
+    return latency_summary(latencies, elapsed)
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=200.0, help="每秒送出的登入請求數")
+    parser.add_argument("--users", type=int, default=20, help="登入的帳號數")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub 上游延遲（秒）")
+    args = parser.parse_args()
+
+    with StubAuthServer(latency=args.latency) as stub:
+        configure_env(stub.url)
+        # 所有請求來自同一個 IP：關閉登入限流，只量測快取的效果
+        os.environ["RATE_LIMIT_AUTH_IP_PER_MINUTE"] = "0"
+
+        from app.infrastructure.config import get_settings
+        from app.main import app
+
+        rows = []
+        for name, cache_size in (("uncached", "0"), ("cached", "10000")):
+            os.environ["AUTH_SESSION_CACHE_SIZE"] = cache_size
+            get_settings.cache_clear()
+            before = stub.calls["token"]
+            summary = asyncio.run(_run_load(app, args.requests, args.rate, args.users))
+            rows.append({"mode": name, "upstream": stub.calls["token"] - before, **summary})
+
+    print(
+        f"login storm: {args.requests} requests for {args.users} users at "
+        f"{args.rate:.0f} req/s, upstream latency={args.latency * 1000:.0f}ms"
+    )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
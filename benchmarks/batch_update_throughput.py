@@ -0,0 +1,155 @@
+"""Batch update throughput - 並發批次更新快照 vs 逐一更新（FakeScraper + SQLite stand-in）。
+
+- ``sequential``: concurrency=1，相當於原本的逐一 for-loop
+- ``concurrent``: 依 ``--concurrency`` 指定的並發數
+- ``resume``: 第一次執行在寫入一半時中斷，以相同 run_id 續跑，確認只補爬剩下的產品
+
+Usage::
+
+    python -m benchmarks.batch_update_throughput --products 1000 --latency 0.1 --concurrency 10 50
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import UTC, datetime
+
+from app.adapters.external.fake_scraper import FakeScraper
+from app.adapters.repositories.file_checkpoint_store import FileCheckpointStore
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import Product
+from app.use_cases.product.batch_update_snapshots_use_case import BatchUpdateSnapshotsUseCase
+from benchmarks.common import print_table
+
+
+def _products(count: int) -> list[Product]:
+    now = datetime.now(UTC)
+    return [
+        Product(
+            id=f"product-{i}",
+            asin=f"B{i:09d}",
+            title=f"Product {i}",
+            category="Electronics",
+            user_id="benchmark",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+class _CrashingRepository(SQLiteSnapshotRepository):
+    """寫入 crash_after 筆後拋出例外，模擬批次中途中斷。"""
+
+    def __init__(self, crash_after: int):
+        super().__init__()
+        self.crash_after = crash_after
+        self.saved = 0
+
+    async def save_many(self, snapshots):
+        if self.saved >= self.crash_after:
+            raise ConnectionError("simulated crash")
+        self.saved += len(snapshots)
+        return await super().save_many(snapshots)
+
+
+async def _run_once(args, concurrency: int, checkpoint_dir: str) -> dict:
+    scraper = FakeScraper(
+        latency_seconds=args.latency,
+        jitter_seconds=args.jitter,
+        failure_rate=args.failure_rate,
+        hosts=("amazon.com", "amazon.co.jp", "amazon.de"),
+    )
+    use_case = BatchUpdateSnapshotsUseCase(
+        scraper=scraper,
+        snapshot_repo=SQLiteSnapshotRepository(),
+        checkpoint_store=FileCheckpointStore(checkpoint_dir),
+        concurrency=concurrency,
+        chunk_size=args.chunk_size,
+        backoff_base_seconds=args.latency,
+    )
+    products = _products(args.products)
+    start = time.perf_counter()
+    result = await use_case.execute(products, run_id=f"bench-{concurrency}")
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": "sequential" if concurrency == 1 else f"concurrent ({concurrency})",
+        "products": result.total,
+        "success": result.success,
+        "failed": result.failed,
+        "retries": result.retries,
+        "max_in_flight": scraper.max_in_flight,
+        "seconds": round(elapsed, 2),
+        "products_per_s": round(result.total / elapsed, 1),
+    }
+
+
+async def _run_resume(args, checkpoint_dir: str) -> dict:
+    products = _products(args.products)
+    store = FileCheckpointStore(checkpoint_dir)
+    concurrency = max(args.concurrency)
+    crashing = BatchUpdateSnapshotsUseCase(
+        scraper=FakeScraper(latency_seconds=args.latency),
+        snapshot_repo=_CrashingRepository(crash_after=args.products // 2),
+        checkpoint_store=store,
+        concurrency=concurrency,
+        chunk_size=args.chunk_size,
+    )
+    try:
+        await crashing.execute(products, run_id="bench-resume")
+    except ConnectionError:
+        pass
+
+    scraper = FakeScraper(latency_seconds=args.latency)
+    resumed = BatchUpdateSnapshotsUseCase(
+        scraper=scraper,
+        snapshot_repo=SQLiteSnapshotRepository(),
+        checkpoint_store=store,
+        concurrency=concurrency,
+        chunk_size=args.chunk_size,
+    )
+    start = time.perf_counter()
+    result = await resumed.execute(products, run_id="bench-resume")
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": f"resume ({concurrency})",
+        "products": result.total,
+        "success": result.success,
+        "failed": result.failed,
+        "retries": result.retries,
+        "max_in_flight": scraper.max_in_flight,
+        "seconds": round(elapsed, 2),
+        "products_per_s": f"skipped {result.skipped}",
+    }
+
+
+async def _run(args) -> list[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        if not args.skip_sequential:
+            rows.append(await _run_once(args, 1, tmp))
+        for concurrency in args.concurrency:
+            rows.append(await _run_once(args, concurrency, tmp))
+        rows.append(await _run_resume(args, tmp))
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.1, help="每次爬取延遲（秒）")
+    parser.add_argument("--jitter", type=float, default=0.05, help="額外隨機延遲上限（秒）")
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    rows = asyncio.run(_run(args))
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
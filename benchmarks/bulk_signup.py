@@ -0,0 +1,125 @@
+"""Bulk signup benchmark - 比較逐筆註冊請求與批次註冊端點（NDJSON 串流）的總耗時。
+
+對完整 ASGI app（``app.main``）註冊 ``--users`` 個帳號，上游為本機 stub auth server：
+
+- ``sequential``: 改版前的做法，每個帳號一個 ``POST /api/v1/auth/signup``，依序送出
+- ``bulk``: 一個 ``POST /api/v1/auth/signup/bulk``（NDJSON），伺服器端有界並行註冊，
+  另記錄第一筆結果送達的時間（time-to-first-result）
+
+Usage::
+
+    python -m benchmarks.bulk_signup --users 300 --concurrency 8 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from benchmarks.common import asgi_client, configure_env, print_table
+from benchmarks.stub_auth_server import StubAuthServer
+
+
+async def _sequential(app, users: int) -> dict:
+    async with asgi_client(app) as client:
+        started = time.perf_counter()
+        first = None
+        for i in range(users):
+            response = await client.post(
+                "/api/v1/auth/signup",
+                json={"email": f"seq{i}@example.com", "password": "password123"},
+            )
+            response.raise_for_status()
+            first = first or time.perf_counter() - started
+        elapsed = time.perf_counter() - started
+    return {"created": users, "first_ms": round(first * 1000, 2), "elapsed_s": round(elapsed, 2)}
+
+
+async def _bulk(app, users: int, token: str, chunk_lines: int = 50) -> dict:
+    # 直接以 ASGI 訊息呼叫 app：httpx 的 ASGITransport 會等整個回應完成才回傳，
+    # 量不到第一筆結果的時間；body 也分段送出，模擬 client 邊上傳邊收結果
+    lines = [
+        json.dumps({"email": f"bulk{i}@example.com", "password": "password123"}).encode() + b"\n"
+        for i in range(users)
+    ]
+    chunks = [b"".join(lines[i : i + chunk_lines]) for i in range(0, users, chunk_lines)]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/auth/signup/bulk",
+        "raw_path": b"/api/v1/auth/signup/bulk",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"authorization", f"Bearer {token}".encode()),
+            (b"content-type", b"application/x-ndjson"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+        "app": app,
+    }
+    created = 0
+    first = None
+    pending = b""
+
+    async def receive() -> dict:
+        if chunks:
+            return {"type": "http.request", "body": chunks.pop(0), "more_body": bool(chunks)}
+        await asyncio.Event().wait()  # 回應完成前不會再呼叫
+
+    async def send(message: dict) -> None:
+        nonlocal created, first, pending
+        if message["type"] != "http.response.body" or not message.get("body"):
+            return
+        first = first or time.perf_counter() - started
+        *results, pending = (pending + message["body"]).split(b"\n")
+        created += sum(json.loads(line)["status"] == "created" for line in results)
+
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        elapsed = time.perf_counter() - started
+    return {"created": created, "first_ms": round(first * 1000, 2), "elapsed_s": round(elapsed, 2)}
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8, help="批次註冊的並行數")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub 上游延遲（秒）")
+    args = parser.parse_args()
+
+    with StubAuthServer(latency=args.latency) as stub:
+        configure_env(stub.url)
+        # 所有請求來自同一個 IP / 使用者：關閉限流，只量測註冊本身
+        for key in (
+            "RATE_LIMIT_AUTH_IP_PER_MINUTE",
+            "RATE_LIMIT_API_IP_PER_MINUTE",
+            "RATE_LIMIT_API_USER_PER_MINUTE",
+            "RATE_LIMIT_BULK_SIGNUP_USER_PER_MINUTE",
+        ):
+            os.environ[key] = "0"
+        os.environ["BULK_SIGNUP_CONCURRENCY"] = str(args.concurrency)
+
+        from app.main import app
+
+        token = stub.issue_token("agency@example.com", role="agency")
+        rows = [
+            {"mode": "sequential", **asyncio.run(_sequential(app, args.users))},
+            {"mode": "bulk", **asyncio.run(_bulk(app, args.users, token))},
+        ]
+
+    print(
+        f"provision {args.users} users, bulk concurrency={args.concurrency}, "
+        f"upstream latency={args.latency * 1000:.0f}ms"
+    )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
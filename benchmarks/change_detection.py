@@ -0,0 +1,182 @@
+"""Change detection - 向量化（NumPy）vs 逐筆物件迴圈的變化偵測效能。
+
+- ``per-object loop``: 對每一對 ProductSnapshot 呼叫 ``calculate_*_change_percentage``
+  並逐筆判斷門檻（快照物件分 chunk 產生，建立物件的時間不計入）
+- ``vectorized evaluate``: ``ChangeDetector.evaluate``，只算出觸發列
+- ``vectorized detect``: 另外為觸發列建立 ChangeAlert
+- ``from_snapshots``: 將快照 Entity 轉成欄式批次（只轉規則用到的欄位）的成本；
+  資料來源已是物件時需要加上這段，直接從資料庫讀成欄式時則不需要
+
+Usage::
+
+    python -m benchmarks.change_detection --pairs 1000000
+"""
+
+import argparse
+import time
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import numpy as np
+
+from app.domain.entities.product import ChangeAlert, ProductSnapshot
+from app.domain.services.change_detection import (
+    ALERT_BSR_CHANGE,
+    ALERT_PRICE_CHANGE,
+    ChangeDetector,
+    SnapshotBatch,
+)
+from benchmarks.common import print_table
+
+NOW = datetime(2025, 10, 10, tzinfo=UTC)
+
+
+def _columns(pairs: int, seed: int = 42) -> tuple[dict, dict]:
+    """產生前後兩批欄位：價格以分為單位、約 5% 缺值，約 3% 價格與 BSR 大幅變動。"""
+    rng = np.random.default_rng(seed)
+    prev_cents = rng.integers(500, 20_000, pairs)
+    prev_bsr = rng.integers(1, 5_000, pairs)
+    price_jump = rng.random(pairs) < 0.03
+    bsr_jump = rng.random(pairs) < 0.03
+    cur_cents = np.where(
+        price_jump,
+        prev_cents * rng.uniform(0.5, 1.5, pairs),
+        prev_cents * rng.uniform(0.95, 1.05, pairs),
+    ).astype(np.int64)
+    cur_bsr = np.where(
+        bsr_jump,
+        prev_bsr * rng.uniform(0.2, 3.0, pairs),
+        prev_bsr * rng.uniform(0.9, 1.1, pairs),
+    ).astype(np.int64)
+    missing = rng.random(pairs) < 0.05
+    previous = {"price": prev_cents, "bsr_sub": prev_bsr, "missing": np.zeros(pairs, bool)}
+    current = {"price": cur_cents, "bsr_sub": cur_bsr, "missing": missing}
+    return current, previous
+
+
+def _to_batch(product_ids: list[str], columns: dict) -> SnapshotBatch:
+    price = columns["price"] / 100
+    bsr = columns["bsr_sub"].astype(np.float64)
+    price[columns["missing"]] = np.nan
+    bsr[columns["missing"]] = np.nan
+    return SnapshotBatch(product_ids, {"price": price, "bsr_sub": bsr})
+
+
+def _to_snapshots(product_ids: list[str], columns: dict, start: int, stop: int) -> list:
+    cents = columns["price"][start:stop].tolist()
+    bsr = columns["bsr_sub"][start:stop].tolist()
+    missing = columns["missing"][start:stop].tolist()
+    return [
+        ProductSnapshot(
+            id=product_ids[start + i],
+            product_id=product_ids[start + i],
+            asin="B000000000",
+            price=None if missing[i] else Decimal(cents[i]) / 100,
+            currency="USD",
+            bsr_main=None,
+            bsr_sub=None if missing[i] else bsr[i],
+            rating=None,
+            review_count=None,
+            buybox_price=None,
+            scraped_at=NOW,
+            created_at=NOW,
+        )
+        for i in range(stop - start)
+    ]
+
+
+def _naive(current: list[ProductSnapshot], previous: list[ProductSnapshot]) -> list[ChangeAlert]:
+    alerts = []
+    for cur, prev in zip(current, previous, strict=True):
+        price_change = cur.calculate_price_change_percentage(prev)
+        if abs(price_change) > 10:
+            alerts.append(
+                ChangeAlert(
+                    id=str(uuid.uuid4()),
+                    product_id=cur.product_id,
+                    alert_type=ALERT_PRICE_CHANGE,
+                    change_percentage=price_change,
+                    old_value=float(prev.price),
+                    new_value=float(cur.price),
+                    triggered_at=NOW,
+                )
+            )
+        bsr_change = cur.calculate_bsr_change_percentage(prev)
+        if abs(bsr_change) > 30:
+            alerts.append(
+                ChangeAlert(
+                    id=str(uuid.uuid4()),
+                    product_id=cur.product_id,
+                    alert_type=ALERT_BSR_CHANGE,
+                    change_percentage=bsr_change,
+                    old_value=float(prev.bsr_sub),
+                    new_value=float(cur.bsr_sub),
+                    triggered_at=NOW,
+                )
+            )
+    return alerts
+
+
+def _row(mode: str, pairs: int, seconds: float, alerts: int | str) -> dict:
+    return {
+        "mode": mode,
+        "pairs": pairs,
+        "seconds": round(seconds, 3),
+        "pairs_per_s": f"{pairs / seconds:,.0f}",
+        "alerts": alerts,
+    }
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=1_000_000)
+    parser.add_argument("--chunk", type=int, default=100_000, help="逐筆迴圈每次產生的物件數")
+    args = parser.parse_args()
+
+    product_ids = [f"product-{i}" for i in range(args.pairs)]
+    current_cols, previous_cols = _columns(args.pairs)
+    detector = ChangeDetector()
+    rows = []
+
+    naive_seconds = 0.0
+    naive_alerts = 0
+    convert_seconds = 0.0
+    for start in range(0, args.pairs, args.chunk):
+        stop = min(start + args.chunk, args.pairs)
+        current = _to_snapshots(product_ids, current_cols, start, stop)
+        previous = _to_snapshots(product_ids, previous_cols, start, stop)
+        begin = time.perf_counter()
+        naive_alerts += len(_naive(current, previous))
+        naive_seconds += time.perf_counter() - begin
+        begin = time.perf_counter()
+        SnapshotBatch.from_snapshots(current, detector.columns)
+        SnapshotBatch.from_snapshots(previous, detector.columns)
+        convert_seconds += time.perf_counter() - begin
+    rows.append(_row("per-object loop", args.pairs, naive_seconds, naive_alerts))
+
+    current_batch = _to_batch(product_ids, current_cols)
+    previous_batch = _to_batch(product_ids, previous_cols)
+    begin = time.perf_counter()
+    breaches = detector.evaluate(current_batch, previous_batch)
+    rows.append(
+        _row(
+            "vectorized evaluate",
+            args.pairs,
+            time.perf_counter() - begin,
+            sum(len(b.indices) for b in breaches),
+        )
+    )
+    begin = time.perf_counter()
+    alerts = detector.detect(current_batch, previous_batch, NOW)
+    rows.append(_row("vectorized detect", args.pairs, time.perf_counter() - begin, len(alerts)))
+    rows.append(_row("from_snapshots (x2)", args.pairs, convert_seconds, "-"))
+
+    print_table(rows)
+    if len(alerts) != naive_alerts:
+        raise SystemExit(f"alert count mismatch: vectorized={len(alerts)} naive={naive_alerts}")
+
+
+if __name__ == "__main__":
+    main()
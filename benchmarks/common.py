@@ -0,0 +1,85 @@
+"""Benchmark 共用工具：延遲統計與報表輸出。"""
+
+import math
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+
+def configure_env(supabase_url: str = "http://127.0.0.1:9") -> None:
+    """設定匯入 app 所需的環境變數（benchmark 不需要真實 Supabase）。
+
+    Args:
+        supabase_url: 指向本機 stub 伺服器的 Supabase URL
+    """
+    os.environ["SUPABASE_URL"] = supabase_url
+    os.environ.setdefault("SUPABASE_ANON_KEY", "benchmark-anon-key")
+
+
+@asynccontextmanager
+async def asgi_client(app) -> AsyncIterator[httpx.AsyncClient]:
+    """執行 app lifespan 並回傳直接呼叫 ASGI app 的 HTTP client（不經過網路）。
+
+    Args:
+        app: FastAPI application
+
+    Yields:
+        httpx.AsyncClient: 以 ASGITransport 連到 app 的 client
+    """
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """計算百分位數（nearest-rank）。
+
+    Args:
+        samples: 樣本
+        pct: 百分位（0-100）
+
+    Returns:
+        float: 對應百分位的樣本值
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(latencies: list[float], elapsed: float) -> dict:
+    """將延遲樣本（秒）整理為 p50/p99/吞吐量摘要（毫秒）。
+
+    Args:
+        latencies: 每個請求的延遲（秒）
+        elapsed: 整體耗時（秒）
+
+    Returns:
+        dict: 包含 count、p50_ms、p99_ms、max_ms、rps
+    """
+    return {
+        "count": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def print_table(rows: list[dict]) -> None:
+    """以對齊的表格輸出 benchmark 結果。
+
+    Args:
+        rows: 每列結果（所有列的 key 相同）
+    """
+    if not rows:
+        return
+    headers = list(rows[0])
+    widths = {h: max(len(h), *(len(str(r[h])) for r in rows)) for h in headers}
+    print("  ".join(h.ljust(widths[h]) for h in headers))
+    for row in rows:
+        print("  ".join(str(row[h]).ljust(widths[h]) for h in headers))
@@ -0,0 +1,86 @@
+"""Competitor fetch latency - 主產品 + N 個競品並發爬取 vs 循序爬取（FakeListingScraper）。
+
+每一輪為每個產品隨機指定延遲，記錄：
+
+- ``slowest_ms``: 該輪最慢的單次爬取（並發的理論下限）
+- ``sum_ms``: 該輪所有爬取延遲總和（循序的理論值）
+- ``p50_ms`` / ``p95_ms``: Use case 實際耗時（含 URL 解析、正規化、矩陣建立）
+
+Usage::
+
+    python -m benchmarks.competitor_fetch --rounds 50 --competitors 5 --latency 0.2 --jitter 0.3
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from app.adapters.external.fake_listing_scraper import FakeListingScraper
+from app.use_cases.competitor.compare_competitors_use_case import CompareCompetitorsUseCase
+from app.use_cases.competitor.normalization import ListingNormalizer
+from benchmarks.common import percentile, print_table
+
+_MARKETPLACES = ("amazon.com", "amazon.de", "amazon.co.jp")
+
+
+async def _run(args) -> list[dict]:
+    rng = random.Random(0)
+    normalizer = ListingNormalizer(
+        currency="USD", exchange_rates={"EUR": Decimal("1.08"), "JPY": Decimal("0.0067")}
+    )
+    rows = []
+    for mode, concurrency in (("sequential", 1), ("concurrent", None)):
+        totals, slowest, sums = [], [], []
+        for round_index in range(args.rounds):
+            asins = [f"B{round_index:04d}{i:05d}" for i in range(args.competitors + 1)]
+            latencies = {asin: args.latency + rng.uniform(0, args.jitter) for asin in asins}
+            urls = [
+                f"https://www.{_MARKETPLACES[i % len(_MARKETPLACES)]}/dp/{asin}"
+                for i, asin in enumerate(asins)
+            ]
+            use_case = CompareCompetitorsUseCase(
+                scraper=FakeListingScraper(latencies=latencies),
+                normalizer=normalizer,
+                max_competitors=args.competitors,
+                max_concurrency=concurrency,
+            )
+            start = time.perf_counter()
+            await use_case.execute(urls[0], urls[1:])
+            totals.append(time.perf_counter() - start)
+            slowest.append(max(latencies.values()))
+            sums.append(sum(latencies.values()))
+
+        rows.append(
+            {
+                "mode": mode,
+                "products": args.competitors + 1,
+                "slowest_ms": round(statistics.median(slowest) * 1000, 1),
+                "sum_ms": round(statistics.median(sums) * 1000, 1),
+                "p50_ms": round(percentile(totals, 50) * 1000, 1),
+                "p95_ms": round(percentile(totals, 95) * 1000, 1),
+                "overhead_vs_slowest_ms": round(
+                    statistics.median(t - s for t, s in zip(totals, slowest, strict=True)) * 1000,
+                    2,
+                ),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--competitors", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2, help="每次爬取的基本延遲（秒）")
+    parser.add_argument("--jitter", type=float, default=0.3, help="額外隨機延遲上限（秒）")
+    args = parser.parse_args()
+
+    print_table(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""End-to-end benchmark suite - 以程序內 fake 上游對完整 ASGI app（``app.main``）跑情境負載。
+
+- ``fakes``: ``AuthRepository`` / ``DatabaseRepository`` 的程序內實作，可注入延遲與錯誤率
+- ``harness``: 以 fake 取代 Supabase adapter 後執行 app lifespan（其餘 wiring 與正式環境相同）
+- ``scenarios``: 登入風暴、health probe flood、混合讀取流量
+- ``python -m benchmarks.e2e``: 執行情境、輸出 JSON，並與 ``baseline.json`` 比較
+
+不需要網路或任何外部服務。
+"""
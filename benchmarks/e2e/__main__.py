@@ -0,0 +1,114 @@
+"""End-to-end benchmark - 以程序內 fake 上游對完整 app 執行情境負載，並與 baseline 比較。
+
+結果（每個情境的 count、p50/p99、rps、error_rate 與上游呼叫數）寫入 ``--output`` 的 JSON，
+並與 ``baseline.json`` 比較；任一情境符合下列條件即視為退化，以 exit code 1 結束：
+
+- ``rps`` 低於 baseline 的 ``1 - tolerance`` 倍
+- ``p99_ms`` 高於 baseline 的 ``1 + tolerance`` 倍
+- ``error_rate`` 比 baseline 高出 0.01 以上
+
+baseline 只在同一台機器上有意義；換機器或預期的效能改變後以 ``--update-baseline`` 重新產生。
+
+Usage::
+
+    python -m benchmarks.e2e --output e2e-results.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+
+from benchmarks.common import print_table
+from benchmarks.e2e.scenarios import SCENARIOS, ScenarioConfig
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+ERROR_RATE_SLACK = 0.01
+
+
+def _regressions(name: str, result: dict, baseline: dict, tolerance: float) -> list[str]:
+    failures = []
+    if result["rps"] < baseline["rps"] * (1 - tolerance):
+        failures.append(f"{name}: rps {result['rps']} < baseline {baseline['rps']}")
+    if result["p99_ms"] > baseline["p99_ms"] * (1 + tolerance):
+        failures.append(f"{name}: p99 {result['p99_ms']}ms > baseline {baseline['p99_ms']}ms")
+    if result["error_rate"] > baseline["error_rate"] + ERROR_RATE_SLACK:
+        failures.append(
+            f"{name}: error rate {result['error_rate']} > baseline {baseline['error_rate']}"
+        )
+    return failures
+
+
+def main() -> None:
+    """執行 benchmark、輸出結果並檢查退化。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="以逗號分隔的情境")
+    parser.add_argument("--concurrency", type=int, default=32, help="並行 client 數")
+    parser.add_argument("--duration", type=float, default=5.0, help="時間制情境的量測秒數")
+    parser.add_argument("--warmup", type=float, default=1.0, help="時間制情境的暖機秒數")
+    parser.add_argument("--users", type=int, default=200, help="帳號數")
+    parser.add_argument("--repeats", type=int, default=5, help="login_storm 每個帳號的登入次數")
+    parser.add_argument("--output", type=Path, help="結果 JSON 的輸出路徑")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="rps / p99 容許的變動比例")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="以本次結果覆寫 baseline，不做比較"
+    )
+    args = parser.parse_args()
+    config = ScenarioConfig(
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        warmup_seconds=args.warmup,
+        users=args.users,
+        repeats=args.repeats,
+    )
+
+    results = {}
+    for name in args.scenarios.split(","):
+        results[name] = asyncio.run(SCENARIOS[name](config))
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": vars(config),
+        "scenarios": results,
+    }
+    rows = [
+        {"scenario": name, **{k: v for k, v in result.items() if k != "upstream_calls"}}
+        for name, result in results.items()
+    ]
+    print_table(rows)
+    for name, result in results.items():
+        print(f"{name} upstream calls: {result['upstream_calls']}")
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nbaseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"\nno baseline at {args.baseline}; run with --update-baseline first")
+        return
+    baseline = json.loads(args.baseline.read_text())["scenarios"]
+    failures = [
+        failure
+        for name, result in results.items()
+        if name in baseline
+        for failure in _regressions(name, result, baseline[name], args.tolerance)
+    ]
+    if failures:
+        print("\nend-to-end regression against baseline:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nend-to-end baseline OK")
+
+
+if __name__ == "__main__":
+    main()
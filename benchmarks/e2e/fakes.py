@@ -0,0 +1,202 @@
+"""In-process fake repositories - 行為接近 Supabase 的程序內上游，可注入延遲與錯誤率。
+
+- ``FaultInjector``: 每次呼叫 sleep ``latency_ms``（加上均勻分布的 ``jitter_ms``），
+  並以 ``error_rate`` 的機率拋出 ``FakeUpstreamError``；亂數有固定種子，結果可重現
+- ``FakeAuthRepository``: 以記憶體保存帳號，簽發 HS256 access token
+  （app 以 ``SUPABASE_JWT_SECRET`` 在本機驗證），支援 refresh token 換發與登出撤銷
+- ``FakeDatabaseRepository``: 連線檢查，錯誤時與 Supabase adapter 相同回傳 ``error: ...``
+- ``FakeProductRepository``: 以記憶體保存產品（產品歷史查詢的擁有者檢查）
+"""
+
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import jwt
+
+from app.domain.entities.product import Product
+from app.domain.entities.user import User
+from app.use_cases.auth.ports import AsyncAuthRepository, AuthSession
+from app.use_cases.health.ports import AsyncDatabaseRepository
+from app.use_cases.product.ports import ProductRepository
+
+
+class FakeUpstreamError(Exception):
+    """注入的上游錯誤；status 為 4xx 時代表上游拒絕請求（例如帳密錯誤），不是故障。"""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class FaultInjector:
+    """延遲與錯誤注入（每個 fake 一個，統計各操作的呼叫數與錯誤數）。"""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+    calls: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    async def __call__(self, operation: str) -> None:
+        """模擬一次上游呼叫.
+
+        Args:
+            operation: 操作名稱（統計用）
+
+        Raises:
+            FakeUpstreamError: 依 error_rate 隨機拋出
+        """
+        self.calls[operation] += 1
+        delay = self.latency_ms + self._random.uniform(0.0, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self._random.random() < self.error_rate:
+            self.errors[operation] += 1
+            raise FakeUpstreamError(f"injected {operation} failure")
+
+
+class FakeAuthRepository(AsyncAuthRepository):
+    """程序內的 Supabase Auth。"""
+
+    def __init__(
+        self,
+        jwt_secret: str,
+        injector: FaultInjector | None = None,
+        expires_in: int = 3600,
+    ):
+        """初始化 FakeAuthRepository.
+
+        Args:
+            jwt_secret: 簽發 access token 的共用密鑰（與 app 的 SUPABASE_JWT_SECRET 相同）
+            injector: 延遲與錯誤注入（None 時不注入）
+            expires_in: access token 有效秒數
+        """
+        self.jwt_secret = jwt_secret
+        self.injector = injector or FaultInjector()
+        self.expires_in = expires_in
+        self._passwords: dict[str, str] = {}
+        self._users: dict[str, User] = {}
+        self._refresh_tokens: dict[str, str] = {}  # refresh token -> email
+
+    def add_user(self, email: str, password: str) -> User:
+        """直接建立帳號（準備資料用，不經過注入）。"""
+        user = User(id=str(uuid.uuid5(uuid.NAMESPACE_DNS, email)), email=email)
+        self._passwords[email] = password
+        self._users[email] = user
+        return user
+
+    def issue_session(self, email: str) -> AuthSession:
+        """直接簽發 session（準備資料用，不經過注入）。"""
+        user = self._users[email]
+        now = int(time.time())
+        claims = {
+            "sub": user.id,
+            "email": email,
+            "aud": "authenticated",
+            "role": "authenticated",
+            "iat": now,
+            "exp": now + self.expires_in,
+        }
+        refresh_token = uuid.uuid4().hex
+        self._refresh_tokens[refresh_token] = email
+        return AuthSession(
+            access_token=jwt.encode(claims, self.jwt_secret, algorithm="HS256"),
+            refresh_token=refresh_token,
+            expires_at=now + self.expires_in,
+            user=user,
+        )
+
+    async def signup(self, email: str, password: str) -> User:
+        """註冊新使用者（實作）。"""
+        await self.injector("signup")
+        if email in self._users:
+            raise FakeUpstreamError("User already registered", status=422)
+        return self.add_user(email, password)
+
+    async def login(self, email: str, password: str) -> tuple[str, User]:
+        """使用者登入（實作）。"""
+        session = await self.login_session(email, password)
+        return (session.access_token, session.user)
+
+    async def login_session(self, email: str, password: str) -> AuthSession:
+        """使用者登入並取得完整 session（實作）。"""
+        await self.injector("login")
+        if self._passwords.get(email) != password:
+            raise FakeUpstreamError("Invalid login credentials", status=400)
+        return self.issue_session(email)
+
+    async def refresh_session(self, refresh_token: str) -> AuthSession:
+        """以 refresh token 換發 session（實作，refresh token 只能用一次）。"""
+        await self.injector("refresh")
+        email = self._refresh_tokens.pop(refresh_token, None)
+        if email is None:
+            raise FakeUpstreamError("Invalid Refresh Token", status=400)
+        return self.issue_session(email)
+
+    async def logout(self, access_token: str) -> None:
+        """登出：撤銷使用者所有 refresh token（實作）。"""
+        await self.injector("logout")
+        claims = jwt.decode(access_token, self.jwt_secret, ["HS256"], audience="authenticated")
+        email = claims["email"]
+        for token in [t for t, owner in self._refresh_tokens.items() if owner == email]:
+            del self._refresh_tokens[token]
+
+
+class FakeDatabaseRepository(AsyncDatabaseRepository):
+    """程序內的資料庫連線檢查。"""
+
+    def __init__(self, injector: FaultInjector | None = None):
+        """初始化 FakeDatabaseRepository.
+
+        Args:
+            injector: 延遲與錯誤注入（None 時不注入）
+        """
+        self.injector = injector or FaultInjector()
+
+    async def check_connection(self) -> str:
+        """檢查資料庫連線狀態（實作，注入的錯誤直接拋出）。"""
+        await self.injector("check_connection")
+        return "connected"
+
+
+class FakeProductRepository(ProductRepository):
+    """程序內的產品資料。"""
+
+    def __init__(self, injector: FaultInjector | None = None):
+        """初始化 FakeProductRepository.
+
+        Args:
+            injector: 延遲與錯誤注入（None 時不注入）
+        """
+        self.injector = injector or FaultInjector()
+        self._products: dict[str, Product] = {}
+
+    def add_product(self, product_id: str, user_id: str) -> Product:
+        """直接建立產品（準備資料用，不經過注入）。"""
+        now = datetime.now(UTC)
+        product = Product(
+            id=product_id,
+            asin="B000000001",
+            title=f"Product {product_id}",
+            category="Electronics",
+            user_id=user_id,
+            created_at=now,
+            updated_at=now,
+        )
+        self._products[product_id] = product
+        return product
+
+    async def find_by_id(self, product_id: str) -> Product | None:
+        """取得產品（實作）。"""
+        await self.injector("find_by_id")
+        return self._products.get(product_id)
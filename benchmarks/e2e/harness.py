@@ -0,0 +1,110 @@
+"""E2E harness - 以 fake 上游執行完整 app（lifespan、middleware、routers 與正式環境相同）。
+
+lifespan 於啟動時才匯入 Supabase adapter，harness 在啟動前以 fake 的 factory 取代 adapter
+類別，因此 metrics 計時、``CachedAuthRepository``、``HealthMonitor``、JWT 本機驗證與
+所有 middleware 都照常運作，只有最外層的網路呼叫換成程序內的 fake。產品歷史查詢的
+SnapshotRepository 與 ProductRepository 則以 dependency override 換成已放入資料的
+``SQLiteSnapshotRepository`` 與 ``FakeProductRepository``。
+"""
+
+import os
+from collections.abc import AsyncIterator
+from contextlib import ExitStack, asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import httpx
+
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import ProductSnapshot
+from benchmarks.common import asgi_client, configure_env
+from benchmarks.e2e.fakes import FakeAuthRepository, FakeDatabaseRepository, FakeProductRepository
+
+JWT_SECRET = "e2e-benchmark-jwt-secret-0123456789abcdef"
+HISTORY_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+# 所有請求來自同一個 client：關閉限流，只量測 app 本身
+BASE_ENV = {
+    "SUPABASE_JWT_SECRET": JWT_SECRET,
+    "RATE_LIMIT_AUTH_IP_PER_MINUTE": "0",
+    "RATE_LIMIT_API_IP_PER_MINUTE": "0",
+    "RATE_LIMIT_API_USER_PER_MINUTE": "0",
+    "RATE_LIMIT_BULK_SIGNUP_USER_PER_MINUTE": "0",
+}
+
+
+@dataclass
+class Upstreams:
+    """情境使用的 fake 上游。"""
+
+    auth: FakeAuthRepository
+    database: FakeDatabaseRepository
+    snapshots: SQLiteSnapshotRepository
+    products: FakeProductRepository
+
+
+async def seed_history(repo: SQLiteSnapshotRepository, product_id: str, points: int) -> None:
+    """放入 ``points`` 筆每小時一筆的快照。"""
+    await repo.save_many(
+        [
+            ProductSnapshot(
+                id=f"{product_id}-{i}",
+                product_id=product_id,
+                asin="B000000001",
+                price=Decimal("19.99") + i % 50,
+                currency="USD",
+                bsr_main=1000 + (i * 7919) % 5000,
+                bsr_sub=10 + i % 90,
+                rating=4.5,
+                review_count=i,
+                buybox_price=None,
+                scraped_at=HISTORY_START + timedelta(hours=i),
+                created_at=HISTORY_START,
+            )
+            for i in range(points)
+        ]
+    )
+
+
+@asynccontextmanager
+async def running_app(
+    upstreams: Upstreams, env: dict[str, str]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """以 fake 上游啟動 app 並回傳 ASGI client（結束時執行 lifespan shutdown、還原環境變數）.
+
+    Args:
+        upstreams: fake 上游
+        env: 額外的環境變數（覆蓋 ``BASE_ENV``）
+
+    Yields:
+        httpx.AsyncClient: 直接呼叫 app 的 client
+    """
+    from app.adapters.api.dependencies import get_product_repository, get_snapshot_repository
+    from app.infrastructure.config import get_settings
+    from app.main import app
+
+    configure_env()
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, {**BASE_ENV, **env}))
+        stack.enter_context(
+            patch(
+                "app.adapters.repositories.supabase_auth_repository.AsyncSupabaseAuthRepository",
+                lambda auth_client: upstreams.auth,
+            )
+        )
+        stack.enter_context(
+            patch(
+                "app.adapters.repositories.supabase_database_repository."
+                "AsyncSupabaseDatabaseRepository",
+                lambda supabase_client, **_: upstreams.database,
+            )
+        )
+        stack.callback(get_settings.cache_clear)
+        stack.callback(app.dependency_overrides.clear)
+        get_settings.cache_clear()
+        app.dependency_overrides[get_snapshot_repository] = lambda: upstreams.snapshots
+        app.dependency_overrides[get_product_repository] = lambda: upstreams.products
+        async with asgi_client(app) as client:
+            yield client
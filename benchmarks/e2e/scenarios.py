@@ -0,0 +1,188 @@
+"""E2E scenarios - 登入風暴、health probe flood 與混合讀取流量。
+
+每個情境建立自己的 fake 上游（固定亂數種子），以 closed-loop 的 ``concurrency`` 個 client
+送出請求，回傳 ``latency_summary`` 加上 ``error_rate``（非 2xx 比例）與各上游操作的實際呼叫數：
+
+- ``login_storm``: ``users`` 個帳號各登入 ``repeats`` 次；auth 上游 80-120ms、1% 錯誤，
+  session 快取與 coalescing 決定打到上游的次數
+- ``health_flood``: 持續打 ``/health`` 與 ``/livez``；資料庫上游 5ms、10% 錯誤，背景探測
+  每 50ms 一次，請求本身不等上游
+- ``mixed_reads``: 已登入使用者的讀取流量（``/api/v1/auth/me``、自己產品的歷史分頁、
+  ``/health``、``/openapi.json``，依權重抽樣）
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from benchmarks.common import latency_summary
+from benchmarks.e2e.fakes import (
+    FakeAuthRepository,
+    FakeDatabaseRepository,
+    FakeProductRepository,
+    FaultInjector,
+)
+from benchmarks.e2e.harness import JWT_SECRET, Upstreams, running_app, seed_history
+
+Request = tuple[str, str, dict]  # (method, path, httpx 參數)
+
+
+@dataclass(frozen=True)
+class ScenarioConfig:
+    """情境規模。"""
+
+    concurrency: int = 32
+    duration_seconds: float = 5.0
+    warmup_seconds: float = 1.0
+    users: int = 200
+    repeats: int = 5
+    seed: int = 0
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    next_request: Callable[[], Request | None],
+    concurrency: int,
+    deadline: float,
+) -> dict:
+    """以 ``concurrency`` 個 client 持續送出請求，直到 ``next_request`` 回傳 None 或時間到。"""
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline and (request := next_request()) is not None:
+            method, path, kwargs = request
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            if response.is_success:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    summary = latency_summary(latencies, time.perf_counter() - started)
+    total = len(latencies) + errors
+    return {**summary, "error_rate": round(errors / total, 4) if total else 0.0}
+
+
+async def _timed(
+    client: httpx.AsyncClient,
+    next_request: Callable[[], Request],
+    concurrency: int,
+    config: ScenarioConfig,
+) -> dict:
+    """暖機 ``warmup_seconds`` 後量測 ``duration_seconds``（暖機結果不計）。"""
+    await _drive(client, next_request, concurrency, time.perf_counter() + config.warmup_seconds)
+    deadline = time.perf_counter() + config.duration_seconds
+    return await _drive(client, next_request, concurrency, deadline)
+
+
+def _upstream_calls(*injectors: FaultInjector) -> dict[str, int]:
+    calls: dict[str, int] = {}
+    for injector in injectors:
+        calls.update(injector.calls)
+    return dict(sorted(calls.items()))
+
+
+def _upstreams(auth: FaultInjector, database: FaultInjector) -> Upstreams:
+    return Upstreams(
+        auth=FakeAuthRepository(JWT_SECRET, auth),
+        database=FakeDatabaseRepository(database),
+        snapshots=SQLiteSnapshotRepository(),
+        products=FakeProductRepository(),
+    )
+
+
+async def login_storm(config: ScenarioConfig) -> dict:
+    """登入風暴：同一批帳號在短時間內重複登入。"""
+    auth = FaultInjector(latency_ms=80, jitter_ms=40, error_rate=0.01, seed=config.seed)
+    upstreams = _upstreams(auth, FaultInjector())
+    emails = [f"user{i}@example.com" for i in range(config.users)]
+    for email in emails:
+        upstreams.auth.add_user(email, "correct-horse")
+    rng = random.Random(config.seed)
+    pending = [email for email in emails for _ in range(config.repeats)]
+    rng.shuffle(pending)
+
+    def next_request() -> Request | None:
+        if not pending:
+            return None
+        body = {"email": pending.pop(), "password": "correct-horse"}
+        return ("POST", "/api/v1/auth/login", {"json": body})
+
+    async with running_app(upstreams, {}) as client:
+        result = await _drive(client, next_request, config.concurrency, float("inf"))
+    return {**result, "upstream_calls": _upstream_calls(auth)}
+
+
+async def health_flood(config: ScenarioConfig) -> dict:
+    """Health probe flood：大量 health / liveness 請求，資料庫上游間歇失敗。"""
+    database = FaultInjector(latency_ms=5, error_rate=0.1, seed=config.seed)
+    upstreams = _upstreams(FaultInjector(), database)
+    rng = random.Random(config.seed)
+    env = {"HEALTH_PROBE_INTERVAL_SECONDS": "0.05"}
+
+    def next_request() -> Request:
+        return ("GET", rng.choice(("/health", "/livez")), {})
+
+    async with running_app(upstreams, env) as client:
+        result = await _timed(client, next_request, config.concurrency * 2, config)
+    return {**result, "upstream_calls": _upstream_calls(database)}
+
+
+async def mixed_reads(config: ScenarioConfig) -> dict:
+    """混合讀取：已登入使用者查詢自己的資料、產品歷史與文件。"""
+    auth = FaultInjector(latency_ms=80, jitter_ms=40, seed=config.seed)
+    database = FaultInjector(latency_ms=5, seed=config.seed)
+    upstreams = _upstreams(auth, database)
+    tokens = []
+    for i in range(config.users):
+        user = upstreams.auth.add_user(f"user{i}@example.com", "correct-horse")
+        tokens.append(upstreams.auth.issue_session(f"user{i}@example.com").access_token)
+        # 每個使用者擁有一個產品；產品歷史只能查詢自己的產品
+        upstreams.products.add_product(f"p{i}", user.id)
+    owners = min(10, config.users)  # 前 10 個使用者的產品有歷史資料
+    for i in range(owners):
+        await seed_history(upstreams.snapshots, f"p{i}", 2000)
+    rng = random.Random(config.seed)
+
+    def authorized() -> dict:
+        return {"headers": {"Authorization": f"Bearer {rng.choice(tokens)}"}}
+
+    def history() -> Request:
+        owner = rng.randrange(owners)
+        return (
+            "GET",
+            f"/api/v1/products/p{owner}/history",
+            {"params": {"limit": 100}, "headers": {"Authorization": f"Bearer {tokens[owner]}"}},
+        )
+
+    mix: list[tuple[int, Callable[[], Request]]] = [
+        (40, lambda: ("GET", "/api/v1/auth/me", authorized())),
+        (30, history),
+        (20, lambda: ("GET", "/health", {})),
+        (10, lambda: ("GET", "/openapi.json", {})),
+    ]
+    weights = [weight for weight, _ in mix]
+    builders = [builder for _, builder in mix]
+
+    def next_request() -> Request:
+        return rng.choices(builders, weights)[0]()
+
+    async with running_app(upstreams, {}) as client:
+        result = await _timed(client, next_request, config.concurrency, config)
+    return {**result, "upstream_calls": _upstream_calls(auth, database)}
+
+
+SCENARIOS: dict[str, Callable[[ScenarioConfig], Awaitable[dict]]] = {
+    "login_storm": login_storm,
+    "health_flood": health_flood,
+    "mixed_reads": mixed_reads,
+}
@@ -0,0 +1,134 @@
+"""Product history streaming - 10 萬點時序的峰值記憶體與 time-to-first-byte。
+
+SQLite stand-in（``SQLiteSnapshotRepository``，檔案資料庫）中放入單一產品的 ``--points`` 筆快照，
+比較產生回應 body 的方式（不經過 HTTP，只量 Repository 讀取 + 編碼）：
+
+- ``blob``: 一次讀出整個區間並編碼為單一 JSON（原本規劃的做法）
+- ``ndjson``: ``stream=true``，逐批讀取並以 NDJSON 串流
+- ``page``: 一頁 ``--limit`` 筆（游標分頁）
+- ``daily`` / ``lttb``: 降採樣後的單頁
+
+``peak_mib`` 為 tracemalloc 量到的 Python 配置峰值（不含 SQLite 本身的快取）；
+tracemalloc 會拖慢配置，時間欄位適合互相比較、不代表實際延遲。
+
+Usage::
+
+    python -m benchmarks.history_stream --points 100000 --limit 1000 --lttb-points 1000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+
+from app.adapters.api.responses import ndjson_stream
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import ProductSnapshot
+from app.use_cases.product.get_product_history_use_case import (
+    GetProductHistoryUseCase,
+    HistoryPoint,
+)
+from benchmarks.common import print_table
+
+_START = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+async def _seed(repo: SQLiteSnapshotRepository, points: int) -> datetime:
+    step = timedelta(hours=1)
+    for offset in range(0, points, 10_000):
+        await repo.save_many(
+            [
+                ProductSnapshot(
+                    id=f"s{i}",
+                    product_id="p1",
+                    asin="B000000001",
+                    price=Decimal("19.99") + i % 500,
+                    currency="USD",
+                    bsr_main=1000 + (i * 7919) % 5000,
+                    bsr_sub=10 + i % 90,
+                    rating=4.5,
+                    review_count=i,
+                    buybox_price=None,
+                    scraped_at=_START + step * i,
+                    created_at=_START,
+                )
+                for i in range(offset, min(points, offset + 10_000))
+            ]
+        )
+    return _START + step * points
+
+
+async def _blob(use_case: GetProductHistoryUseCase, end: datetime):
+    snapshots = await use_case.snapshot_repo.find_range("p1", _START, end)
+    body = orjson.dumps({"items": [HistoryPoint.from_snapshot(s) for s in snapshots]})
+    yield body
+
+
+async def _page(use_case: GetProductHistoryUseCase, end: datetime, **kwargs):
+    yield orjson.dumps(await use_case.execute("p1", end=end, **kwargs))
+
+
+async def _measure(mode: str, chunks) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    ttfb = None
+    size = 0
+    async for chunk in chunks:
+        if ttfb is None:
+            ttfb = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": mode,
+        "ttfb_ms": round((ttfb or 0.0) * 1000, 1),
+        "total_ms": round(total * 1000, 1),
+        "body_kib": round(size / 1024),
+        "peak_mib": round(peak / 2**20, 2),
+    }
+
+
+async def _run(args, database: str) -> list[dict]:
+    repo = SQLiteSnapshotRepository(database)
+    end = await _seed(repo, args.points)
+    use_case = GetProductHistoryUseCase(snapshot_repo=repo, batch_size=args.batch)
+    scenarios = {
+        "blob": lambda: _blob(use_case, end),
+        "ndjson": lambda: ndjson_stream(use_case.stream("p1", end=end)),
+        "page": lambda: _page(use_case, end, limit=args.limit),
+        "daily": lambda: _page(use_case, end, resolution="daily", limit=args.limit),
+        "lttb": lambda: _page(use_case, end, resolution="lttb", points=args.lttb_points),
+        "ndjson_lttb": lambda: ndjson_stream(
+            use_case.stream("p1", end=end, resolution="lttb", points=args.lttb_points)
+        ),
+    }
+    rows = []
+    for mode, factory in scenarios.items():
+        await _measure(mode, factory())  # 預熱 SQLite page cache
+        rows.append(await _measure(mode, factory()))
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=1000, help="分頁模式每頁筆數")
+    parser.add_argument("--lttb-points", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=1000, help="每次向 Repository 取出的筆數")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = str(Path(tmpdir) / "history.sqlite3")
+        print_table(asyncio.run(_run(args, database)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""HTTP response cache - 讀取端點在有 / 無回應快取與 ETag 時的每秒請求數。
+
+對完整 ASGI app（``app.main``，經過所有 middleware）依序發出 GET 請求：
+
+- ``off``: 停用快取（``app.state.http_cache = None``），每次都進入端點並重新序列化
+- ``cached``: 回應快取命中，直接送出已序列化的 body
+- ``304``: 帶 If-None-Match 的重新驗證，只回 headers
+
+ASGITransport 不經過網路，數字包含 httpx client 本身的成本，適合互相比較；
+304 省下的傳輸量在真實網路上的效益更大。
+
+Usage::
+
+    python -m benchmarks.http_cache --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import asgi_client, configure_env, print_table
+
+PATHS = ("/", "/openapi.json", "/docs", "/favicon.ico")
+
+
+async def _rps(client, path: str, requests: int, headers: dict | None = None) -> tuple[float, int]:
+    for _ in range(50):
+        await client.get(path, headers=headers)
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path, headers=headers)
+    elapsed = time.perf_counter() - start
+    return requests / elapsed, response.status_code
+
+
+async def _run(requests: int) -> list[dict]:
+    from app.main import app
+
+    rows = []
+    async with asgi_client(app) as client:
+        http_cache = app.state.http_cache
+        for path in PATHS:
+            app.state.http_cache = None
+            off, _ = await _rps(client, path, requests)
+            app.state.http_cache = http_cache
+            cached, _ = await _rps(client, path, requests)
+            etag = (await client.get(path)).headers["etag"]
+            not_modified, status = await _rps(client, path, requests, {"If-None-Match": etag})
+            assert status == 304
+            size = len((await client.get(path)).content)
+            rows.append(
+                {
+                    "path": path,
+                    "body_bytes": size,
+                    "off_rps": round(off),
+                    "cached_rps": round(cached),
+                    "304_rps": round(not_modified),
+                    "speedup": f"{cached / off:.1f}x",
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="每個路徑 / 模式的請求數")
+    args = parser.parse_args()
+
+    configure_env()
+    print_table(asyncio.run(_run(args.requests)))
+
+
+if __name__ == "__main__":
+    main()
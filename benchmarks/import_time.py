@@ -0,0 +1,114 @@
+"""Import-time budget check - 以 ``python -X importtime`` 量測 ``import app.main`` 成本。
+
+每次在全新子程序中匯入目標模組，依頂層套件彙總 self time，取多次執行的
+最小值（降低雜訊），並與 ``import_budget.json`` 比較：
+
+- ``total_ms``: 目標模組的 cumulative 匯入時間上限
+- ``packages_ms``: 各頂層套件 self time 加總的上限
+- ``forbidden``: import 階段不應載入的重量級 SDK（應延遲到 lifespan 啟動時）
+
+超出預算時以 exit code 1 結束，可直接放進 CI。
+
+Usage::
+
+    python -m benchmarks.import_time --runs 5
+    python -m benchmarks.import_time --budget benchmarks/import_budget.json --top 15
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.common import print_table
+
+DEFAULT_BUDGET = Path(__file__).with_name("import_budget.json")
+
+
+def measure_once(target: str) -> tuple[float, dict[str, float]]:
+    """在子程序中匯入目標模組一次.
+
+    Args:
+        target: 要匯入的模組
+
+    Returns:
+        tuple[float, dict[str, float]]: (cumulative 毫秒, 頂層套件 -> self 毫秒)
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    packages: dict[str, float] = defaultdict(float)
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        packages[module.split(".")[0]] += int(self_us) / 1000
+        if module == target:
+            total = int(cumulative_us) / 1000
+    return total, dict(packages)
+
+
+def main() -> None:
+    """量測匯入時間並與預算比較。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    args = parser.parse_args()
+
+    totals: list[float] = []
+    best: dict[str, float] = {}
+    for _ in range(args.runs):
+        total, packages = measure_once(args.target)
+        totals.append(total)
+        for package, ms in packages.items():
+            best[package] = min(ms, best.get(package, ms))
+
+    budget = json.loads(args.budget.read_text())
+    budget_packages: dict[str, float] = budget.get("packages_ms", {})
+    failures: list[str] = []
+
+    total_ms = min(totals)
+    if total_ms > budget["total_ms"]:
+        failures.append(f"{args.target}: {total_ms:.1f}ms > budget {budget['total_ms']}ms")
+    for package in budget.get("forbidden", []):
+        if package in best:
+            failures.append(f"{package}: imported at import time (forbidden)")
+    for package, limit in budget_packages.items():
+        if best.get(package, 0.0) > limit:
+            failures.append(f"{package}: {best[package]:.1f}ms > budget {limit}ms")
+
+    ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)[: args.top]
+    print(f"import {args.target}: {total_ms:.1f}ms (min of {args.runs} runs)")
+    print_table(
+        [
+            {
+                "package": package,
+                "self_ms": round(ms, 1),
+                "budget_ms": budget_packages.get(package, "-"),
+            }
+            for package, ms in ranked
+        ]
+    )
+
+    if failures:
+        print("\nimport-time budget exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nimport-time budget OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Job runner throughput - WorkerPool 以 N 個程序消化工作佇列的 jobs/s 與排隊延遲。
+
+每個 worker 數各跑兩個階段（handler 以 ``asyncio.sleep`` 模擬 I/O 為主的爬取）：
+
+- ``drain``: 預先加入 ``--jobs`` 個工作，量測全部完成的 jobs/s 與排隊延遲
+  （enqueue 到開始執行；預載時主要反映積壓）
+- ``trickle``: 以低於容量的速率逐一加入，量測空閒時的取件延遲（主要由 poll interval 決定）
+
+``products_1000_s`` 為以 drain 吞吐量處理 1000 個產品所需秒數（每日更新的容量估算）。
+
+Usage::
+
+    python -m benchmarks.job_throughput --jobs 2000 --workers 1 2 4 --concurrency 20 --job-ms 20
+    python -m benchmarks.job_throughput --backend redis --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import os
+import signal
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from app.infrastructure.job_queue import RedisJobQueue, SQLiteJobQueue
+from app.infrastructure.job_worker import JobRegistry, WorkerPool
+from app.use_cases.jobs.ports import Job
+from benchmarks.common import percentile, print_table
+
+
+def _registry(job_ms: float, results_dir: str) -> JobRegistry:
+    """建立 benchmark handler（於 worker 程序內呼叫，結果寫入各程序的檔案）。"""
+    registry = JobRegistry()
+    output = open(Path(results_dir) / f"{os.getpid()}.txt", "a", buffering=1)  # noqa: SIM115
+
+    @registry.handler("benchmark")
+    async def handle(job: Job) -> None:
+        started = time.time()
+        await asyncio.sleep(job_ms / 1000)
+        output.write(f"{job.payload['phase']} {started - job.enqueued_at:.6f} {time.time():.6f}\n")
+
+    return registry
+
+
+def _run_pool(pool: WorkerPool) -> None:
+    pool.run()
+
+
+def _queue_factory(args, name: str):
+    if args.backend == "redis":
+        return functools.partial(RedisJobQueue.from_url, args.redis_url, key_prefix=f"{name}:")
+    return functools.partial(SQLiteJobQueue, str(Path(args.tmpdir) / f"{name}.sqlite3"))
+
+
+def _read_results(results_dir: Path, phase: str) -> tuple[list[float], list[float]]:
+    latencies, finished = [], []
+    for path in results_dir.glob("*.txt"):
+        for line in path.read_text().splitlines():
+            line_phase, latency, finished_at = line.split()
+            if line_phase == phase:
+                latencies.append(float(latency))
+                finished.append(float(finished_at))
+    return latencies, finished
+
+
+async def _wait_for_results(results_dir: Path, phase: str, total: int) -> None:
+    while len(_read_results(results_dir, phase)[0]) < total:
+        await asyncio.sleep(0.05)
+
+
+async def _measure(args, workers: int) -> list[dict]:
+    name = f"bench-{uuid.uuid4().hex[:8]}"
+    results_dir = Path(args.tmpdir) / name
+    results_dir.mkdir()
+    queue_factory = _queue_factory(args, name)
+    queue = queue_factory()
+    pool = WorkerPool(
+        queue_factory,
+        functools.partial(_registry, args.job_ms, str(results_dir)),
+        processes=workers,
+        worker_options={
+            "concurrency": args.concurrency,
+            "prefetch": args.prefetch,
+            "poll_interval_seconds": args.poll_interval,
+        },
+    )
+    supervisor = multiprocessing.get_context("spawn").Process(target=_run_pool, args=(pool,))
+    supervisor.start()
+    rows = []
+    try:
+        # 預熱：等待所有 worker 程序啟動完成
+        await queue.enqueue("benchmark", {"phase": "warmup"})
+        await _wait_for_results(results_dir, "warmup", 1)
+        await asyncio.sleep(1.0)
+
+        start = time.time()
+        for _ in range(args.jobs):
+            await queue.enqueue("benchmark", {"phase": "drain"})
+        enqueued = time.time()
+        await _wait_for_results(results_dir, "drain", args.jobs)
+        latencies, finished = _read_results(results_dir, "drain")
+        elapsed = max(finished) - start
+        jobs_per_second = args.jobs / elapsed
+        rows.append(
+            {
+                "backend": args.backend,
+                "workers": workers,
+                "phase": "drain",
+                "jobs": args.jobs,
+                "enqueue_jobs_s": round(args.jobs / (enqueued - start)),
+                "jobs_s": round(jobs_per_second, 1),
+                "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+                "latency_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+                "products_1000_s": round(1000 / jobs_per_second, 1),
+            }
+        )
+
+        for _ in range(args.trickle):
+            await queue.enqueue("benchmark", {"phase": "trickle"})
+            await asyncio.sleep(args.trickle_interval)
+        await _wait_for_results(results_dir, "trickle", args.trickle)
+        latencies, _ = _read_results(results_dir, "trickle")
+        rows.append(
+            {
+                "backend": args.backend,
+                "workers": workers,
+                "phase": "trickle",
+                "jobs": args.trickle,
+                "enqueue_jobs_s": "",
+                "jobs_s": "",
+                "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+                "latency_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+                "products_1000_s": "",
+            }
+        )
+    finally:
+        # SIGTERM：supervisor 轉送給 worker，worker 歸還預取工作後結束
+        os.kill(supervisor.pid, signal.SIGTERM)
+        await asyncio.to_thread(supervisor.join, 60)
+        await queue.aclose()
+    return rows
+
+
+async def _run(args) -> list[dict]:
+    rows = []
+    for workers in args.workers:
+        rows.extend(await _measure(args, workers))
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=("sqlite", "redis"), default="sqlite")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=20, help="每個 worker 程序的並發數")
+    parser.add_argument("--prefetch", type=int, default=None, help="每個 worker 最多持有的工作數")
+    parser.add_argument("--job-ms", type=float, default=20.0, help="每個工作的模擬 I/O 時間")
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    parser.add_argument("--trickle", type=int, default=50, help="trickle 階段的工作數")
+    parser.add_argument("--trickle-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        args.tmpdir = tmpdir
+        print_table(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
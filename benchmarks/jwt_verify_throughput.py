@@ -0,0 +1,108 @@
+"""JWT verification throughput - 本機驗證每秒可處理的 token 數（冷/熱快取）。
+
+- ``cold``: 每個 token 只驗證一次（完整簽章驗證，金鑰已在快取中）
+- ``warm``: 同一批 token 重複驗證（命中已驗證 token 的 LRU 快取）
+- ``first-call``: 全新 verifier 的第一個請求（含向 stub 取得 JWKS 的網路往返）
+
+Usage::
+
+    python -m benchmarks.jwt_verify_throughput --tokens 2000 --rounds 10
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+
+import jwt
+
+from benchmarks.common import print_table
+from benchmarks.stub_auth_server import StubAuthServer
+
+
+def _hs256_tokens(secret: str, count: int) -> list[str]:
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "sub": f"user-{i}",
+                "email": f"user{i}@example.com",
+                "aud": "authenticated",
+                "iat": now,
+                "exp": now + 3600,
+            },
+            secret,
+            algorithm="HS256",
+        )
+        for i in range(count)
+    ]
+
+
+async def _measure(verifier, tokens: list[str], rounds: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for token in tokens:
+        await verifier.verify(token)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for token in tokens:
+            await verifier.verify(token)
+    warm = time.perf_counter() - start
+    return len(tokens) / cold, len(tokens) * rounds / warm
+
+
+async def _run(tokens_count: int, rounds: int) -> list[dict]:
+    from app.adapters.security.jwt_token_verifier import JwtTokenVerifier, SigningKeyCache
+
+    rows = []
+    with StubAuthServer(latency=0.02) as stub:
+        jwks_url = f"{stub.url}/auth/v1/.well-known/jwks.json"
+
+        verifier = JwtTokenVerifier(SigningKeyCache(jwks_url=jwks_url))
+        first_token = stub.issue_token("first@example.com")
+        start = time.perf_counter()
+        await verifier.verify(first_token)
+        first_call_us = (time.perf_counter() - start) * 1e6
+
+        es_tokens = [stub.issue_token(f"user{i}@example.com") for i in range(tokens_count)]
+        cold, warm = await _measure(verifier, es_tokens, rounds)
+        rows.append(
+            {
+                "alg": "ES256 (JWKS)",
+                "first_call_us": round(first_call_us),
+                "cold_per_s": round(cold),
+                "warm_per_s": round(warm),
+                "warm_us": round(1e6 / warm, 2),
+            }
+        )
+
+    secret = secrets.token_urlsafe(32)
+    verifier = JwtTokenVerifier(SigningKeyCache(shared_secret=secret))
+    cold, warm = await _measure(verifier, _hs256_tokens(secret, tokens_count), rounds)
+    rows.append(
+        {
+            "alg": "HS256 (secret)",
+            "first_call_us": "-",
+            "cold_per_s": round(cold),
+            "warm_per_s": round(warm),
+            "warm_us": round(1e6 / warm, 2),
+        }
+    )
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = asyncio.run(_run(args.tokens, args.rounds))
+    print(f"JWT verification: {args.tokens} distinct tokens, warm rounds={args.rounds}")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
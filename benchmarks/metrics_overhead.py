@@ -0,0 +1,133 @@
+"""Metrics overhead - 請求指標 middleware 與 Repository 計時 proxy 的額外成本。
+
+- ``asgi``: 直接呼叫 ASGI endpoint vs 經過 MetricsMiddleware（不含 HTTP client 與 FastAPI
+  本身的成本，只量 middleware），交錯執行多輪取每輪平均的最小值
+- ``port call``: 直接呼叫 vs 經過 ``Metrics.instrument`` proxy 呼叫 no-op async port
+- ``render``: /metrics 輸出（``--routes`` 個路由各有數個狀態碼）的時間
+
+Usage::
+
+    python -m benchmarks.metrics_overhead --requests 100000 --rounds 5 --calls 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.adapters.api.middleware.metrics import MetricsMiddleware
+from app.infrastructure.metrics import Metrics
+from app.use_cases.health.ports import AsyncDatabaseRepository
+from benchmarks.common import print_table
+
+
+class _NoopRepository(AsyncDatabaseRepository):
+    async def check_connection(self) -> str:
+        return "connected"
+
+
+class _Route:
+    path = "/api/items/{item_id}"
+
+
+class _State:
+    def __init__(self, metrics: Metrics | None):
+        self.metrics = metrics
+
+
+class _App:
+    def __init__(self, metrics: Metrics | None):
+        self.state = _State(metrics)
+
+
+async def _endpoint(scope, receive, send) -> None:
+    """最小的 ASGI endpoint：模擬 router 寫回 route 並送出回應。"""
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _asgi_rows(requests: int, rounds: int) -> list[dict]:
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message) -> None:
+        pass
+
+    middleware = MetricsMiddleware(_endpoint)
+    variants = {
+        "endpoint only": (_endpoint, _App(None)),
+        "with metrics": (middleware, _App(Metrics())),
+    }
+    best = dict.fromkeys(variants, float("inf"))
+    for _ in range(rounds):
+        for name, (asgi, app) in variants.items():
+            start = time.perf_counter()
+            for i in range(requests):
+                scope = {"type": "http", "method": "GET", "path": f"/api/items/{i}", "app": app}
+                await asgi(scope, receive, send)
+            best[name] = min(best[name], (time.perf_counter() - start) / requests)
+
+    rows = [{"asgi": name, "us_per_request": round(t * 1e6, 2)} for name, t in best.items()]
+    rows.append(
+        {
+            "asgi": "overhead",
+            "us_per_request": round((best["with metrics"] - best["endpoint only"]) * 1e6, 2),
+        }
+    )
+    return rows
+
+
+async def _port_rows(calls: int) -> list[dict]:
+    metrics = Metrics()
+    rows = []
+    for name, repo in (
+        ("direct", _NoopRepository()),
+        ("instrumented", metrics.instrument(_NoopRepository())),
+    ):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            await repo.check_connection()
+        rows.append(
+            {"port call": name, "ns_per_call": round((time.perf_counter_ns() - start) / calls)}
+        )
+    rows.append(
+        {"port call": "overhead", "ns_per_call": rows[1]["ns_per_call"] - rows[0]["ns_per_call"]}
+    )
+    return rows
+
+
+def _render_rows(routes: int) -> list[dict]:
+    metrics = Metrics()
+    for i in range(routes):
+        for status in ("200", "400", "401", "500"):
+            metrics.http_requests.labels("GET", f"/api/v1/route{i}", status).inc()
+        metrics.http_duration.labels("GET", f"/api/v1/route{i}").observe(0.01)
+    start = time.perf_counter()
+    content, _ = metrics.render()
+    return [
+        {
+            "render": f"{routes} routes",
+            "bytes": len(content),
+            "ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+    ]
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--routes", type=int, default=50)
+    args = parser.parse_args()
+
+    print_table(asyncio.run(_asgi_rows(args.requests, args.rounds)))
+    print()
+    print_table(asyncio.run(_port_rows(args.calls)))
+    print()
+    print_table(_render_rows(args.routes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Notification fan-out - 市場整體價格變動時的警報派送吞吐量與端到端延遲。
+
+``--users`` 個使用者各自追蹤 ``--products-per-user`` 個產品，一次送出 ``--alerts`` 筆警報
+（模擬整體市場價格變動），經過本機 stub SMTP 與 webhook 接收端（各自有延遲，webhook 可
+設定失敗率以觸發重試）：
+
+- ``per_alert``: 改版前規劃的做法，每筆警報依序呼叫各通道一次（只跑 ``--baseline-alerts`` 筆）
+- ``dispatcher``: ``NotificationDispatcher`` 緩衝、依使用者彙整摘要、各通道有界佇列並行送出
+
+``alerts_per_s`` 為送出的警報數 / 全部送達所需時間；延遲為警報進入到通道送出完成。
+
+Usage::
+
+    python -m benchmarks.notification_fanout --alerts 20000 --users 1000 --failure-rate 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.adapters.external.email_notifier import EmailNotifier
+from app.adapters.external.webhook_notifier import WebhookNotifier
+from app.adapters.repositories.file_dead_letter_store import FileDeadLetterStore
+from app.domain.entities.product import ChangeAlert
+from app.use_cases.notification.dispatcher import NotificationDispatcher
+from app.use_cases.notification.ports import Digest, Recipient, RecipientDirectory
+from benchmarks.common import percentile, print_table
+from benchmarks.stub_notification_servers import StubSmtpServer, StubWebhookServer
+
+
+class _Directory(RecipientDirectory):
+    def __init__(self, recipients: dict[str, list[Recipient]]):
+        self.recipients = recipients
+
+    async def find_recipients(self, product_ids):
+        return {pid: self.recipients[pid] for pid in product_ids if pid in self.recipients}
+
+
+def _alerts(count: int, product_ids: list[str]) -> list[ChangeAlert]:
+    rng = random.Random(1)
+    now = datetime.now(UTC)
+    return [
+        ChangeAlert(
+            id=f"alert-{i}",
+            product_id=rng.choice(product_ids),
+            alert_type="PRICE_CHANGE",
+            change_percentage=-12.5,
+            old_value=100.0,
+            new_value=87.5,
+            triggered_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+async def _per_alert(channels, directory: _Directory, alerts: list[ChangeAlert]) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for alert in alerts:
+        for recipient in directory.recipients[alert.product_id]:
+            digest = Digest(
+                id=alert.id, recipient=recipient, alerts=[alert], created_at=datetime.now(UTC)
+            )
+            for channel in channels:
+                if channel.accepts(recipient):
+                    await channel.send(digest)
+        latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": "per_alert",
+        "alerts": len(alerts),
+        "alerts_per_s": round(len(alerts) / elapsed),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "digests": len(alerts),
+        "retries": 0,
+        "dead": 0,
+    }
+
+
+async def _dispatcher(args, channels, directory: _Directory, alerts, dlq_path: Path) -> dict:
+    dispatcher = NotificationDispatcher(
+        directory,
+        channels,
+        FileDeadLetterStore(dlq_path),
+        digest_window_seconds=args.window,
+        queue_size=args.queue_size,
+        concurrency=args.concurrency,
+        retry_base_seconds=0.05,
+        clock=time.perf_counter,
+    )
+    dispatcher.start()
+    start = time.perf_counter()
+    # 以 1000 筆一批送入（模擬批次更新每個 chunk 產生的警報）
+    for offset in range(0, len(alerts), 1000):
+        await dispatcher.submit(alerts[offset : offset + 1000])
+    await dispatcher.stop()
+    elapsed = time.perf_counter() - start
+    latencies = list(dispatcher.stats.latencies)
+    return {
+        "mode": "dispatcher",
+        "alerts": len(alerts),
+        "alerts_per_s": round(len(alerts) / elapsed),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "digests": dispatcher.stats.digests,
+        "retries": dispatcher.stats.retries,
+        "dead": dispatcher.stats.dead_lettered,
+    }
+
+
+async def _run(args, smtp: StubSmtpServer, webhook: StubWebhookServer, tmpdir: Path) -> list:
+    recipients = {}
+    for user in range(args.users):
+        recipient = Recipient(
+            user_id=f"user-{user}", email=f"user-{user}@example.com", webhook_url=webhook.url
+        )
+        for product in range(args.products_per_user):
+            recipients[f"p-{user}-{product}"] = [recipient]
+    directory = _Directory(recipients)
+    alerts = _alerts(args.alerts, list(recipients))
+
+    host, port = smtp.address
+    rows = []
+    for mode in ("per_alert", "dispatcher"):
+        channels = [EmailNotifier(host, port), WebhookNotifier()]
+        if mode == "per_alert":
+            # 依序呼叫，失敗直接略過（改版前沒有重試）
+            webhook.failure_rate = 0.0
+            rows.append(await _per_alert(channels, directory, alerts[: args.baseline_alerts]))
+            webhook.failure_rate = args.failure_rate
+        else:
+            rows.append(await _dispatcher(args, channels, directory, alerts, tmpdir / "dlq.jsonl"))
+        for channel in channels:
+            await channel.aclose()
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--products-per-user", type=int, default=20)
+    parser.add_argument("--baseline-alerts", type=int, default=300, help="per_alert 模式的警報數")
+    parser.add_argument("--latency", type=float, default=0.005, help="收件端每則延遲（秒）")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="webhook 503 機率")
+    parser.add_argument("--window", type=float, default=0.2, help="彙整視窗秒數")
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16, help="每個通道的 worker 數")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    with (
+        StubSmtpServer(latency=args.latency) as smtp,
+        StubWebhookServer(latency=args.latency) as webhook,
+        tempfile.TemporaryDirectory() as tmpdir,
+    ):
+        print_table(asyncio.run(_run(args, smtp, webhook, Path(tmpdir))))
+        print(f"\nsmtp messages: {smtp.messages}, webhook delivered: {webhook.received}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Profiling overhead - 關閉、啟用但未選中、取樣中三種情況下每個請求的成本。
+
+端點模擬一般請求：一段 CPU 工作（約 ``--work-ms`` 毫秒）加上數次 await。
+
+- ``no middleware``: 對照組
+- ``off``: 加上 ProfilingMiddleware，但 ``app.state.profiler`` 為 None（預設部署）
+- ``armed``: 設定 admin token，請求沒有帶 header（只多 header 比對）
+- ``sampling (save)``: 每個請求都 profile 並存檔（sample rate = 1）
+- ``inline``: 管理者 header + inline，回傳 speedscope JSON
+- ``select()``: 未選中時 ``RequestProfiler.select`` 本身的成本
+
+Usage::
+
+    python -m benchmarks.profiling_overhead --requests 300 --rounds 5 --work-ms 2
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.adapters.api.middleware.profiling import ProfilingMiddleware
+from app.infrastructure.profiling import RequestProfiler
+from benchmarks.common import print_table
+
+
+def _app(work_ms: float, middleware: bool, profiler: RequestProfiler | None) -> FastAPI:
+    app = FastAPI()
+    loops = int(work_ms * 20_000)
+
+    @app.get("/api/work")
+    async def work():
+        total = 0
+        for _ in range(4):
+            total += sum(i * i for i in range(loops // 4))
+            await asyncio.sleep(0)
+        return {"total": total}
+
+    if middleware:
+        app.add_middleware(ProfilingMiddleware)
+        app.state.profiler = profiler
+    return app
+
+
+async def _round(app: FastAPI, requests: int, headers: dict | None) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get("/api/work", headers=headers)
+        elapsed = time.perf_counter() - start
+    assert response.status_code == 200
+    return elapsed / requests
+
+
+async def _run(args) -> list[dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [
+            ("no middleware", _app(args.work_ms, False, None), None),
+            ("off", _app(args.work_ms, True, None), None),
+            ("armed", _app(args.work_ms, True, RequestProfiler(admin_token="t")), None),
+            (
+                "sampling (save)",
+                _app(args.work_ms, True, RequestProfiler(output_dir=tmp, sample_rate=1.0)),
+                None,
+            ),
+            (
+                "inline",
+                _app(args.work_ms, True, RequestProfiler(admin_token="t")),
+                {"X-Profile": "t", "X-Profile-Output": "inline"},
+            ),
+        ]
+        for _, app, headers in variants:
+            await _round(app, 20, headers)
+        # 各模式輪流執行，取每個模式最快的一輪（降低 CPU 頻率 / GC 造成的順序偏差）
+        best = [float("inf")] * len(variants)
+        for _ in range(args.rounds):
+            for i, (_, app, headers) in enumerate(variants):
+                best[i] = min(best[i], await _round(app, args.requests, headers))
+        results = [(name, seconds) for (name, _, _), seconds in zip(variants, best, strict=True)]
+
+    baseline = results[0][1]
+    rows = [
+        {
+            "mode": name,
+            "ms_per_request": round(seconds * 1000, 3),
+            "overhead": f"{(seconds / baseline - 1) * 100:+.1f}%",
+        }
+        for name, seconds in results
+    ]
+
+    profiler = RequestProfiler(admin_token="t", sample_rate=0.001)
+    scope = {"path": "/api/work", "headers": [(b"host", b"bench"), (b"accept", b"*/*")]}
+    start = time.perf_counter_ns()
+    for _ in range(100_000):
+        profiler.select(scope)
+    rows.append(
+        {
+            "mode": "select() not selected",
+            "ms_per_request": round((time.perf_counter_ns() - start) / 100_000 / 1e6, 5),
+            "overhead": "-",
+        }
+    )
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--work-ms", type=float, default=2.0, help="每個請求的 CPU 工作（毫秒）")
+    args = parser.parse_args()
+
+    print_table(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Rate limit overhead - 限流檢查每個請求增加的時間（預算 50µs）。
+
+- ``check``: 直接呼叫 ``RateLimiter.check``（程序內 store，1 萬個不同 IP / 使用者）
+  - 未套用規則的路由、per-IP、per-IP + per-user（JWT 於本機驗證且已在快取中）
+- ``redis``: 同樣的 per-IP 檢查改用 Redis store（預設 fakeredis，可用 ``--redis-url``）
+- ``asgi``: 同一個 app 加上 / 不加 middleware 的每請求時間差
+
+程序內 store 的 check p99 超過 ``--budget-us`` 時 exit code 1（可放進 CI）。
+
+Usage::
+
+    python -m benchmarks.rate_limit_overhead --calls 200000
+"""
+
+import argparse
+import asyncio
+import random
+import secrets
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.adapters.api.middleware.rate_limit import RateLimiter, RateLimitMiddleware, RouteLimit
+from app.adapters.security.jwt_token_verifier import JwtTokenVerifier, SigningKeyCache
+from app.infrastructure.rate_limit import InMemoryRateLimitStore, RedisRateLimitStore, TokenBucket
+from benchmarks.common import percentile, print_table
+from benchmarks.jwt_verify_throughput import _hs256_tokens
+
+# 足夠大的 bucket，benchmark 期間不會被拒絕（量的是放行路徑）
+BUCKET = TokenBucket(rate=1e9, burst=1_000_000_000)
+
+
+def _scopes(count: int, path: str, tokens: list[str] | None) -> list[dict]:
+    rng = random.Random(1)
+    scopes = []
+    for i in range(count):
+        headers = [(b"host", b"bench"), (b"user-agent", b"bench")]
+        if tokens:
+            headers.append((b"authorization", f"Bearer {tokens[i % len(tokens)]}".encode()))
+        scopes.append(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": path,
+                "headers": headers,
+                "client": (f"10.{rng.randrange(256)}.{rng.randrange(256)}.{i % 256}", 5000),
+            }
+        )
+    return scopes
+
+
+async def _time_checks(name: str, limiter: RateLimiter, scopes: list[dict], calls: int) -> dict:
+    samples = []
+    for i in range(calls):
+        scope = scopes[i % len(scopes)]
+        start = time.perf_counter_ns()
+        await limiter.check(scope)
+        samples.append(time.perf_counter_ns() - start)
+    return {
+        "check": name,
+        "calls": calls,
+        "mean_us": round(sum(samples) / len(samples) / 1000, 2),
+        "p50_us": round(percentile(samples, 50) / 1000, 2),
+        "p99_us": round(percentile(samples, 99) / 1000, 2),
+    }
+
+
+async def _check_rows(args) -> list[dict]:
+    secret = secrets.token_hex(32)
+    verifier = JwtTokenVerifier(SigningKeyCache(shared_secret=secret))
+    tokens = _hs256_tokens(secret, args.users)
+    for token in tokens:
+        await verifier.verify(token)
+
+    rules = [
+        RouteLimit("/api/v1/auth/login", per_ip=BUCKET),
+        RouteLimit("/api/*", per_ip=BUCKET, per_user=BUCKET),
+    ]
+    limiter = RateLimiter(InMemoryRateLimitStore(), rules, token_verifier=verifier)
+    rows = [
+        await _time_checks(
+            "unmatched route", limiter, _scopes(args.keys, "/health", None), args.calls
+        ),
+        await _time_checks(
+            "per-IP", limiter, _scopes(args.keys, "/api/v1/auth/login", None), args.calls
+        ),
+        await _time_checks(
+            "per-IP + per-user",
+            limiter,
+            _scopes(args.keys, "/api/v1/products", tokens),
+            args.calls,
+        ),
+    ]
+
+    if args.redis_url:
+        from redis.asyncio import Redis
+
+        redis = Redis.from_url(args.redis_url)
+    else:
+        import fakeredis
+
+        redis = fakeredis.FakeAsyncRedis()
+    redis_limiter = RateLimiter(RedisRateLimitStore(redis), rules)
+    rows.append(
+        await _time_checks(
+            "per-IP (redis)" if args.redis_url else "per-IP (fakeredis)",
+            redis_limiter,
+            _scopes(args.keys, "/api/v1/auth/login", None),
+            min(args.calls, 5_000),
+        )
+    )
+    await redis.aclose()
+    return rows
+
+
+async def _asgi_rows(requests: int) -> list[dict]:
+    rows = []
+    for with_middleware in (False, True):
+        app = FastAPI()
+
+        @app.get("/api/ping")
+        async def ping():
+            return {"ok": True}
+
+        if with_middleware:
+            app.add_middleware(RateLimitMiddleware)
+            app.state.rate_limiter = RateLimiter(
+                InMemoryRateLimitStore(), [RouteLimit("/api/*", per_ip=BUCKET)]
+            )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(200):
+                await client.get("/api/ping")
+            start = time.perf_counter()
+            for _ in range(requests):
+                await client.get("/api/ping")
+            elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "asgi": "with middleware" if with_middleware else "without middleware",
+                "us_per_request": round(elapsed / requests * 1e6, 1),
+            }
+        )
+
+    # 驗證超過限制時回應 429 與 Retry-After
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware)
+    app.state.rate_limiter = RateLimiter(
+        InMemoryRateLimitStore(), [RouteLimit("/*", per_ip=TokenBucket.per_minute(1))]
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/")
+        response = await client.get("/")
+    assert response.status_code == 429 and response.headers["retry-after"] == "60"
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000, help="不同 IP 數")
+    parser.add_argument("--users", type=int, default=10_000, help="不同使用者（token）數")
+    parser.add_argument("--requests", type=int, default=3_000)
+    parser.add_argument("--redis-url", default=None, help="使用真實 Redis（預設 fakeredis）")
+    parser.add_argument("--budget-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    check_rows = asyncio.run(_check_rows(args))
+    print_table(check_rows)
+    print()
+    print_table(asyncio.run(_asgi_rows(args.requests)))
+
+    worst = max(row["p99_us"] for row in check_rows if "redis" not in row["check"])
+    if worst > args.budget_us:
+        print(f"\nrate-limit check over budget: p99 {worst}us > {args.budget_us}us")
+        sys.exit(1)
+    print(f"\nrate-limit check within budget: p99 {worst}us <= {args.budget_us}us")
+
+
+if __name__ == "__main__":
+    main()
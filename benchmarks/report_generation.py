@@ -0,0 +1,122 @@
+"""Report generation - LLM 報告的快取命中率、LLM 呼叫數與端到端延遲（本機 stub LLM server）。
+
+``--clients`` 個並發 client 共送出 ``--requests`` 個報告請求，輸入從 ``--unique`` 份商品資料中
+依 Zipf 分布挑選（少數熱門商品被重複請求）。比較：
+
+- ``direct``: 每個請求直接呼叫 LLM（無快取、無合併）
+- ``cache + dedupe``: 內容定址快取 + 相同輸入的進行中請求合併
+- ``cache + dedupe + batch``: 再加上短 prompt 合併為一次 LLM 呼叫
+- ``stream``: 快取 + 串流共用，``ttfb`` 為收到第一個片段的時間
+
+Usage::
+
+    python -m benchmarks.report_generation --requests 300 --unique 60 --clients 30
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.adapters.external.openai_llm import OpenAILLM
+from app.infrastructure.cache import TwoTierCache
+from app.use_cases.report.prompts import PROMPTS, canonical_json
+from app.use_cases.report.report_generator import ReportGenerator
+from benchmarks.common import percentile, print_table
+from benchmarks.stub_llm_server import StubLLMServer
+
+KIND = "listing-suggestions"
+
+
+def _workload(args) -> list[dict]:
+    rng = random.Random(0)
+    listings = [
+        {
+            "asin": f"B0BENCH{i:03d}",
+            "title": f"Wireless Earbuds model {i}",
+            "price": round(rng.uniform(10, 200), 2),
+            "rating": round(rng.uniform(3, 5), 1),
+            "review_count": rng.randint(0, 20_000),
+        }
+        for i in range(args.unique)
+    ]
+    weights = [1 / (i + 1) for i in range(args.unique)]
+    return rng.choices(listings, weights=weights, k=args.requests)
+
+
+async def _run_mode(mode: str, stub: StubLLMServer, args, workload: list[dict]) -> dict:
+    llm = OpenAILLM(api_key="benchmark", base_url=stub.url, max_connections=args.clients)
+    generator = ReportGenerator(
+        llm=llm, cache=TwoTierCache(), max_batch_size=8 if "batch" in mode else 1
+    )
+    calls_before = stub.calls["completions"] + stub.calls["streams"]
+    prompts_before = stub.calls["prompts"]
+    queue = list(reversed(workload))
+    latencies: list[float] = []
+    ttfbs: list[float] = []
+
+    async def one(data: dict) -> None:
+        start = time.perf_counter()
+        if mode == "direct":
+            await llm.complete(PROMPTS[KIND].build(canonical_json(data)))
+        elif mode == "stream":
+            async for _ in generator.stream(KIND, data):
+                if len(ttfbs) < len(latencies) + 1:
+                    ttfbs.append(time.perf_counter() - start)
+        else:
+            await generator.generate(KIND, data)
+        latencies.append(time.perf_counter() - start)
+
+    async def client() -> None:
+        while queue:
+            await one(queue.pop())
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    await llm.aclose()
+
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "llm_calls": stub.calls["completions"] + stub.calls["streams"] - calls_before,
+        "llm_prompts": stub.calls["prompts"] - prompts_before,
+        "hit_ratio": "-" if mode == "direct" else f"{generator.stats.hit_ratio:.0%}",
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "ttfb_p50_ms": round(percentile(ttfbs, 50) * 1000, 1) if ttfbs else "-",
+        "elapsed_s": round(elapsed, 2),
+    }
+
+
+async def _run(args) -> list[dict]:
+    workload = _workload(args)
+    with StubLLMServer(
+        first_token_latency=args.first_token_latency,
+        tokens_per_second=args.tokens_per_second,
+        output_tokens=args.output_tokens,
+        concurrency=args.llm_concurrency,
+    ) as stub:
+        return [
+            await _run_mode(mode, stub, args, workload)
+            for mode in ("direct", "cache + dedupe", "cache + dedupe + batch", "stream")
+        ]
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--unique", type=int, default=60, help="不同的商品資料數")
+    parser.add_argument("--clients", type=int, default=30)
+    parser.add_argument("--first-token-latency", type=float, default=0.1)
+    parser.add_argument("--tokens-per-second", type=float, default=2000.0)
+    parser.add_argument("--output-tokens", type=int, default=100)
+    parser.add_argument("--llm-concurrency", type=int, default=8, help="stub LLM 並發上限")
+    args = parser.parse_args()
+
+    print_table(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Response serialization - 重建 Pydantic model vs dataclass 直接以 orjson 編碼。
+
+- ``encode``: 每個回應的編碼時間與暫時配置的記憶體高峰（tracemalloc）
+  - ``pydantic rebuild``: 原本的做法，從 use case 結果逐欄建立 response model 再輸出 JSON
+  - ``dict + json``: /health 原本的做法，手動組 dict 再 ``json.dumps``
+  - ``orjson dataclass``: ``DataclassJSONResponse`` 的做法
+- ``entities``: 10 萬個 ProductSnapshot 的記憶體與建立時間（一般 dataclass / slots / slots + frozen）
+- ``asgi``: 同一個 FastAPI app 中兩種寫法的端點，經 ASGI 呼叫的每請求時間
+
+Usage::
+
+    python -m benchmarks.response_serialization --iterations 100000 --entities 100000
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import httpx
+import orjson
+from fastapi import FastAPI
+
+from app.adapters.api.responses import DataclassJSONResponse
+from app.adapters.api.schemas.auth import LoginResponse, UserResponse
+from app.domain.entities.product import ProductSnapshot
+from app.domain.entities.user import User
+from app.use_cases.auth.login_use_case import LoginResult
+from app.use_cases.health.health_check_use_case import HealthCheckResult
+from benchmarks.common import print_table
+
+LOGIN = LoginResult(
+    access_token="eyJhbGciOiJFUzI1NiJ9." + "x" * 600,
+    user=User(id="123e4567-e89b-12d3-a456-426614174000", email="user@example.com"),
+)
+HEALTH = HealthCheckResult(status="healthy", database="connected", timestamp=datetime.now(UTC))
+
+
+def _pydantic_login() -> bytes:
+    return (
+        LoginResponse(
+            access_token=LOGIN.access_token,
+            user=UserResponse(id=LOGIN.user.id, email=LOGIN.user.email),
+        )
+        .model_dump_json()
+        .encode()
+    )
+
+
+def _dict_health() -> bytes:
+    return json.dumps(
+        {
+            "status": HEALTH.status,
+            "database": HEALTH.database,
+            "timestamp": HEALTH.timestamp.isoformat(),
+        }
+    ).encode()
+
+
+def _measure(name: str, encode, iterations: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encode()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    encode()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return {
+        "encode": name,
+        "us_per_response": round(elapsed / iterations * 1e6, 3),
+        "peak_alloc_bytes": peak,
+    }
+
+
+def _encode_rows(iterations: int) -> list[dict]:
+    # 兩種做法輸出的 JSON 必須相同
+    assert orjson.loads(orjson.dumps(LOGIN)) == orjson.loads(_pydantic_login())
+    assert orjson.loads(orjson.dumps(HEALTH)) == orjson.loads(_dict_health())
+    return [
+        _measure("login: pydantic rebuild", _pydantic_login, iterations),
+        _measure("login: orjson dataclass", lambda: orjson.dumps(LOGIN), iterations),
+        _measure("health: dict + json", _dict_health, iterations),
+        _measure("health: orjson dataclass", lambda: orjson.dumps(HEALTH), iterations),
+    ]
+
+
+def _entity_rows(count: int) -> list[dict]:
+    fields = [(f.name, f.type) for f in dataclasses.fields(ProductSnapshot)]
+    variants = (
+        ("plain @dataclass", dataclasses.make_dataclass("PlainSnapshot", fields)),
+        ("slots", ProductSnapshot),
+        (
+            "slots + frozen",
+            dataclasses.make_dataclass("FrozenSnapshot", fields, slots=True, frozen=True),
+        ),
+    )
+    now = datetime.now(UTC)
+    price = Decimal("19.99")
+    args = ("id", "p", "B000000000", price, "USD", 1, 1, 4.5, 10, price, now, now)
+    rows = []
+    for name, cls in variants:
+        start = time.perf_counter()
+        items = [cls(*args) for _ in range(count)]
+        elapsed = time.perf_counter() - start
+        del items
+
+        # 欄位值共用同一組物件，量到的只有 entity 本身（含 __dict__）的大小
+        tracemalloc.start()
+        items = [cls(*args) for _ in range(count)]
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del items
+        rows.append(
+            {
+                "entities": name,
+                "count": count,
+                "bytes_per_entity": round(current / count),
+                "us_per_create": round(elapsed / count * 1e6, 3),
+            }
+        )
+    return rows
+
+
+async def _asgi_rows(requests: int) -> list[dict]:
+    app = FastAPI()
+
+    @app.get("/pydantic/login", response_model=LoginResponse)
+    async def pydantic_login() -> LoginResponse:
+        return LoginResponse(
+            access_token=LOGIN.access_token,
+            user=UserResponse(id=LOGIN.user.id, email=LOGIN.user.email),
+        )
+
+    @app.get("/dataclass/login", response_model=LoginResponse)
+    async def dataclass_login():
+        return DataclassJSONResponse(LOGIN)
+
+    rows = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ("/pydantic/login", "/dataclass/login"):
+            for _ in range(100):
+                await client.get(path)
+            start = time.perf_counter()
+            for _ in range(requests):
+                await client.get(path)
+            elapsed = time.perf_counter() - start
+            rows.append({"asgi": path, "us_per_request": round(elapsed / requests * 1e6, 1)})
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=3_000)
+    args = parser.parse_args()
+
+    print_table(_encode_rows(args.iterations))
+    print()
+    print_table(_entity_rows(args.entities))
+    print()
+    print_table(asyncio.run(_asgi_rows(args.requests)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Product rollups - 產品列表由快照即時計算 vs 讀取增量維護的彙總表。
+
+SQLite stand-in（檔案資料庫）中放入 ``--products`` 個產品 × ``--days`` 天的每日快照，
+每天一批寫入後以 ``UpdateRollupsUseCase`` 增量更新彙總，比較：
+
+- ``on_demand``: 列表請求時讀取每個產品最近 30 天快照、計算變化與統計後排序分頁
+- ``rollup``: ``RollupRepository.list_page`` 直接排序分頁
+- ``update``: 每批快照寫入後的增量更新成本（每批平均）
+- ``check``: 一致性檢查（由全部快照重建並比對）
+
+Usage::
+
+    python -m benchmarks.rollup_list --products 1000 --days 60 --repeat 20
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from app.adapters.repositories.sqlite_rollup_repository import SQLiteRollupRepository
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import ProductSnapshot
+from app.domain.services.rollup import WINDOW_DAYS, apply_snapshot
+from app.use_cases.product.check_rollups_use_case import CheckRollupsUseCase
+from app.use_cases.product.update_rollups_use_case import UpdateRollupsUseCase
+from benchmarks.common import print_table
+
+_START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+async def _seed(
+    snapshot_repo: SQLiteSnapshotRepository,
+    updater: UpdateRollupsUseCase,
+    product_ids: list[str],
+    days: int,
+) -> tuple[datetime, float]:
+    rng = random.Random(42)
+    update_seconds = 0.0
+    for day in range(days):
+        batch = [
+            ProductSnapshot(
+                id=f"{product_id}-{day}",
+                product_id=product_id,
+                asin="B000000001",
+                price=Decimal(rng.randint(1000, 3000)) / 100,
+                currency="USD",
+                bsr_main=rng.randint(1, 100_000),
+                bsr_sub=rng.randint(1, 5000),
+                rating=4.5,
+                review_count=day,
+                buybox_price=None,
+                scraped_at=_START + timedelta(days=day, minutes=rng.randint(0, 600)),
+                created_at=_START,
+            )
+            for product_id in product_ids
+        ]
+        await snapshot_repo.save_many(batch)
+        start = time.perf_counter()
+        await updater.execute(batch)
+        update_seconds += time.perf_counter() - start
+    return _START + timedelta(days=days), update_seconds / days
+
+
+async def _on_demand_page(
+    snapshot_repo: SQLiteSnapshotRepository, product_ids: list[str], end: datetime, limit: int
+):
+    rollups = []
+    for product_id in product_ids:
+        rollup = None
+        for snapshot in await snapshot_repo.find_range(
+            product_id, end - timedelta(days=WINDOW_DAYS + 1), end
+        ):
+            rollup = apply_snapshot(rollup, snapshot)
+        if rollup is not None:
+            rollups.append(rollup)
+    rollups.sort(key=lambda r: (r.price_change_7d is None, -(r.price_change_7d or 0.0)))
+    return rollups[:limit], len(rollups)
+
+
+async def _timed(repeat: int, factory) -> float:
+    await factory()  # 預熱 SQLite page cache
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await factory()
+    return (time.perf_counter() - start) / repeat
+
+
+async def _run(args, directory: Path) -> list[dict]:
+    snapshot_repo = SQLiteSnapshotRepository(str(directory / "snapshots.sqlite3"))
+    rollup_repo = SQLiteRollupRepository(str(directory / "rollups.sqlite3"))
+    product_ids = [f"p{i:05d}" for i in range(args.products)]
+    end, update_seconds = await _seed(
+        snapshot_repo, UpdateRollupsUseCase(rollup_repo), product_ids, args.days
+    )
+
+    on_demand = await _timed(
+        max(1, args.repeat // 10),
+        lambda: _on_demand_page(snapshot_repo, product_ids, end, args.limit),
+    )
+    rollup = await _timed(
+        args.repeat,
+        lambda: rollup_repo.list_page(sort_by="price_change_7d", limit=args.limit),
+    )
+    start = time.perf_counter()
+    check = await CheckRollupsUseCase(snapshot_repo, rollup_repo).execute(product_ids)
+    check_seconds = time.perf_counter() - start
+
+    return [
+        {"mode": "on_demand", "ms": round(on_demand * 1000, 2), "note": f"page of {args.limit}"},
+        {"mode": "rollup", "ms": round(rollup * 1000, 2), "note": f"page of {args.limit}"},
+        {"mode": "update", "ms": round(update_seconds * 1000, 2), "note": "per daily batch"},
+        {
+            "mode": "check",
+            "ms": round(check_seconds * 1000, 2),
+            "note": f"{check.checked} checked, {len(check.drifted)} drifted",
+        },
+    ]
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--limit", type=int, default=50, help="列表每頁筆數")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print_table(asyncio.run(_run(args, Path(tmpdir))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Scrape cache - 爬取結果快取對付費爬蟲呼叫次數與讀取延遲的影響（FakeScraper）。
+
+- ``stampede``: 同一個 ASIN 同時 50 個查詢，比較實際爬取次數
+- ``read workload``: 依 Zipf 分布的熱門度讀取產品，比較 no cache / local LRU /
+  two-tier（local LRU + Redis）的爬取次數、命中率與 p50/p99
+
+未指定 ``--redis-url`` 時以 fakeredis（程序內）代替 Redis，只量測快取邏輯本身的成本。
+
+Usage::
+
+    python -m benchmarks.scrape_cache --requests 20000 --products 2000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.adapters.external.cached_scraper import CachedScraper
+from app.adapters.external.fake_scraper import FakeScraper
+from app.infrastructure.cache import TwoTierCache
+from benchmarks.common import latency_summary, print_table
+
+
+def _zipf_asins(requests: int, products: int, skew: float, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    weights = [1 / (rank**skew) for rank in range(1, products + 1)]
+    ranks = rng.choices(range(products), weights=weights, k=requests)
+    return [f"B{rank:09d}" for rank in ranks]
+
+
+def _redis(url: str | None):
+    if url:
+        from redis.asyncio import Redis
+
+        return Redis.from_url(url)
+    import fakeredis
+
+    return fakeredis.FakeAsyncRedis()
+
+
+async def _stampede(args) -> list[dict]:
+    rows = []
+    for mode in ("no cache", "cached"):
+        inner = FakeScraper(latency_seconds=args.latency)
+        scraper = inner if mode == "no cache" else CachedScraper(inner, TwoTierCache())
+        start = time.perf_counter()
+        await asyncio.gather(*(scraper.scrape_product("B000000001") for _ in range(50)))
+        rows.append(
+            {
+                "scenario": f"stampede x50 ({mode})",
+                "scraper_calls": inner.calls,
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+        )
+    return rows
+
+
+async def _read_workload(args, mode: str, asins: list[str]) -> dict:
+    inner = FakeScraper(latency_seconds=args.latency)
+    cache = None
+    scraper = inner
+    if mode != "no cache":
+        remote = _redis(args.redis_url) if mode == "two-tier" else None
+        cache = TwoTierCache(remote=remote, local_max_entries=args.local_entries)
+        scraper = CachedScraper(inner, cache)
+
+    latencies: list[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for asin in asins:
+        queue.put_nowait(asin)
+
+    async def client() -> None:
+        while not queue.empty():
+            asin = queue.get_nowait()
+            start = time.perf_counter()
+            await scraper.scrape_product(asin)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    if cache is not None:
+        await cache.aclose()
+
+    summary = latency_summary(latencies, elapsed)
+    return {
+        "scenario": f"reads ({mode})",
+        "scraper_calls": inner.calls,
+        "hit_ratio": round(cache.stats.hit_ratio, 3) if cache else 0.0,
+        "evictions": cache.stats.evictions if cache else 0,
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "rps": summary["rps"],
+    }
+
+
+async def _run(args) -> tuple[list[dict], list[dict]]:
+    stampede = await _stampede(args)
+    asins = _zipf_asins(args.requests, args.products, args.skew)
+    reads = [
+        await _read_workload(args, mode, asins) for mode in ("no cache", "local LRU", "two-tier")
+    ]
+    return stampede, reads
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--products", type=int, default=2_000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf 分布參數")
+    parser.add_argument("--latency", type=float, default=0.05, help="每次爬取延遲（秒）")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--local-entries", type=int, default=500)
+    parser.add_argument("--redis-url", default=None, help="使用真實 Redis（預設 fakeredis）")
+    args = parser.parse_args()
+
+    stampede, reads = asyncio.run(_run(args))
+    print_table(stampede)
+    print()
+    print_table(reads)
+
+
+if __name__ == "__main__":
+    main()
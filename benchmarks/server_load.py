@@ -0,0 +1,165 @@
+"""Server load test - 以不同 worker 數與伺服器設定啟動 ``python -m app.server`` 並量測 RPS / p99。
+
+每個組合啟動一個真實的伺服器程序（經過 TCP），以 ``--connections`` 條 keep-alive
+連線 closed-loop 持續送出 ``GET --path`` ``--duration`` 秒，最後送 SIGTERM 並記錄
+平順關閉所需時間。伺服器設定組合：
+
+- ``default``: uvicorn 預設（asyncio loop、h11 parser、keep-alive 5 秒）
+- ``tuned``: ``python -m app.server`` 預設（uvloop、httptools、keep-alive 75 秒）
+
+負載產生器與伺服器在同一台機器上競爭 CPU；worker 數超過可用 CPU 數時不會再提升吞吐量。
+
+Usage::
+
+    python -m benchmarks.server_load --workers 1,2,4 --duration 10 --connections 64
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+from benchmarks.common import configure_env, latency_summary, print_table
+
+PROFILES = {
+    "default": {"SERVER_LOOP": "asyncio", "SERVER_HTTP": "h11", "SERVER_KEEPALIVE_SECONDS": "5"},
+    "tuned": {"SERVER_LOOP": "uvloop", "SERVER_HTTP": "httptools"},
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(port: int, workers: int, profile: dict, max_requests: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        **profile,
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_PORT": str(port),
+        "SERVER_WORKERS": str(workers),
+        "SERVER_MAX_REQUESTS": str(max_requests),
+        "SERVER_ACCESS_LOG": "false",
+        # 所有請求來自同一個 IP：關閉限流，只量測伺服器本身
+        "RATE_LIMIT_API_IP_PER_MINUTE": "0",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1) as sock:
+                sock.sendall(b"GET /livez HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n")
+                if sock.recv(16).startswith(b"HTTP/1.1 200"):
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not become ready")
+
+
+async def _connection(port: int, request: bytes, deadline: float, stats: dict) -> None:
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            started = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            headers = head.lower()
+            length = int(headers.split(b"content-length:", 1)[1].split(b"\r\n", 1)[0])
+            await reader.readexactly(length)
+            if head[9:12] == b"200":
+                stats["latencies"].append(time.perf_counter() - started)
+            else:
+                stats["errors"] += 1
+            if b"connection: close" in headers:
+                writer.close()
+                writer = None
+        except (OSError, asyncio.IncompleteReadError):
+            # 伺服器關閉 keep-alive 連線（例如 worker 回收）：重新連線
+            stats["reconnects"] += 1
+            if writer is not None:
+                writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def _run_load(port: int, path: str, connections: int, duration: float) -> dict:
+    request = f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode()
+    stats = {"latencies": [], "errors": 0, "reconnects": 0}
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_connection(port, request, deadline, stats) for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+    summary = latency_summary(stats["latencies"], elapsed)
+    return {**summary, "errors": stats["errors"], "reconnects": stats["reconnects"]}
+
+
+def _stop_server(server: subprocess.Popen) -> tuple[float, int]:
+    started = time.perf_counter()
+    server.send_signal(signal.SIGTERM)
+    exit_code = server.wait(timeout=60)
+    return time.perf_counter() - started, exit_code
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2", help="以逗號分隔的 worker 數")
+    parser.add_argument("--profiles", default="default,tuned", help="以逗號分隔的伺服器設定")
+    parser.add_argument("--path", default="/health", help="量測的 GET 路徑")
+    parser.add_argument("--connections", type=int, default=64, help="keep-alive 連線數")
+    parser.add_argument("--duration", type=float, default=10.0, help="每個組合的量測秒數")
+    parser.add_argument("--warmup", type=float, default=2.0, help="量測前的暖機秒數")
+    parser.add_argument(
+        "--max-requests", type=int, default=0, help="每個 worker 回收前的請求數（0 為不回收）"
+    )
+    args = parser.parse_args()
+    configure_env()
+
+    rows = []
+    for workers in (int(n) for n in args.workers.split(",")):
+        for name in args.profiles.split(","):
+            port = _free_port()
+            server = _start_server(port, workers, PROFILES[name], args.max_requests)
+            try:
+                _wait_ready(port)
+                asyncio.run(_run_load(port, args.path, args.connections, args.warmup))
+                summary = asyncio.run(_run_load(port, args.path, args.connections, args.duration))
+            finally:
+                stop_seconds, exit_code = _stop_server(server)
+            rows.append(
+                {
+                    "workers": workers,
+                    "profile": name,
+                    **summary,
+                    "stop_s": round(stop_seconds, 2),
+                    "exit": exit_code,
+                }
+            )
+
+    print(
+        f"GET {args.path}: {args.connections} keep-alive connections, "
+        f"{args.duration:.0f}s per run, {os.cpu_count()} CPUs"
+    )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
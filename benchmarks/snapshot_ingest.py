@@ -0,0 +1,134 @@
+"""Snapshot ingest throughput - 10 萬筆快照的批次 upsert 與查詢效能（SQLite stand-in）。
+
+- ``row-by-row``: 每筆快照各自呼叫一次 ``save_many``（各自一個 transaction）
+- ``bulk``: 每 ``--batch`` 筆呼叫一次 ``save_many``（單一 transaction + executemany）
+
+並量測「多產品最新快照」與「單一產品時間區間」兩種查詢。
+
+Usage::
+
+    python -m benchmarks.snapshot_ingest --products 1000 --days 100 --batch 5000
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import ProductSnapshot
+from benchmarks.common import print_table
+
+
+def generate_snapshots(products: int, days: int, seed: int = 42) -> list[ProductSnapshot]:
+    """產生 products x days 筆合成快照（每個產品每日一筆）.
+
+    Args:
+        products: 產品數
+        days: 天數
+        seed: 亂數種子
+
+    Returns:
+        list[ProductSnapshot]: 依日期、產品排序的快照
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, 2, 0, tzinfo=UTC)
+    product_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(products)]
+    snapshots = []
+    for day in range(days):
+        scraped_at = start + timedelta(days=day)
+        for i, product_id in enumerate(product_ids):
+            price = Decimal(rng.randint(500, 20000)) / 100
+            snapshots.append(
+                ProductSnapshot(
+                    id=str(uuid.UUID(int=rng.getrandbits(128))),
+                    product_id=product_id,
+                    asin=f"B{i:09d}",
+                    price=price,
+                    currency="USD",
+                    bsr_main=rng.randint(1, 500_000),
+                    bsr_sub=rng.randint(1, 5_000),
+                    rating=round(rng.uniform(1, 5), 1),
+                    review_count=rng.randint(0, 50_000),
+                    buybox_price=price,
+                    scraped_at=scraped_at,
+                    created_at=scraped_at,
+                )
+            )
+    return snapshots
+
+
+async def _run(products: int, days: int, batch: int, row_sample: int) -> list[dict]:
+    snapshots = generate_snapshots(products, days)
+    rows = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # row-by-row：只跑前 row_sample 筆，避免 benchmark 過久
+        repo = SQLiteSnapshotRepository(str(Path(tmp) / "row.db"))
+        sample = snapshots[:row_sample]
+        start = time.perf_counter()
+        for snapshot in sample:
+            await repo.save_many([snapshot])
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "mode": "row-by-row",
+                "rows": len(sample),
+                "seconds": round(elapsed, 2),
+                "rows_per_s": round(len(sample) / elapsed),
+            }
+        )
+
+        repo = SQLiteSnapshotRepository(str(Path(tmp) / "bulk.db"))
+        start = time.perf_counter()
+        for offset in range(0, len(snapshots), batch):
+            await repo.save_many(snapshots[offset : offset + batch])
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "mode": f"bulk (batch={batch})",
+                "rows": len(snapshots),
+                "seconds": round(elapsed, 2),
+                "rows_per_s": round(len(snapshots) / elapsed),
+            }
+        )
+
+        product_ids = list(dict.fromkeys(s.product_id for s in snapshots[:products]))
+        start = time.perf_counter()
+        latest = await repo.find_latest_by_products(product_ids)
+        latest_ms = (time.perf_counter() - start) * 1000
+        assert len(latest) == len(product_ids)
+
+        first = snapshots[0]
+        start = time.perf_counter()
+        history = await repo.find_range(
+            first.product_id, first.scraped_at, first.scraped_at + timedelta(days=30)
+        )
+        range_ms = (time.perf_counter() - start) * 1000
+        assert len(history) == min(30, days)
+
+    print(f"latest-per-product for {len(product_ids)} products: {latest_ms:.1f}ms")
+    print(f"30-day range for one product: {range_ms:.2f}ms")
+    return rows
+
+
+def main() -> None:
+    """執行 benchmark 並輸出結果表格。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--row-sample", type=int, default=5000)
+    args = parser.parse_args()
+
+    rows = asyncio.run(_run(args.products, args.days, args.batch, args.row_sample))
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Local stub Supabase Auth (GoTrue) server - 供 benchmark 使用的假上游服務。
+
+只實作 benchmark 需要的端點：
+
+- ``POST /auth/v1/token?grant_type=password``（登入）
+- ``POST /auth/v1/token?grant_type=refresh_token``（換發 token，refresh token 只能用一次）
+- ``POST /auth/v1/logout``（撤銷該使用者所有 refresh token）
+- ``POST /auth/v1/signup``（註冊）
+- ``GET /auth/v1/.well-known/jwks.json``（簽章公鑰）
+
+登入回傳的 access token 是以 stub 自己的 ES256 金鑰簽發的真實 JWT，
+可用 JWKS 端點在本機驗證。每個請求會先 sleep ``latency`` 秒模擬上游
+網路延遲，並記錄呼叫次數。
+"""
+
+import json
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec
+
+STUB_KEY_ID = "stub-es256"
+
+
+def _user_payload(email: str) -> dict:
+    return {
+        "id": str(uuid.uuid5(uuid.NAMESPACE_DNS, email)),
+        "aud": "authenticated",
+        "email": email,
+        "app_metadata": {},
+        "user_metadata": {},
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StubAuthServer:
+    """在背景 thread 執行的假 GoTrue 伺服器。"""
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        expires_in: int = 3600,
+    ):
+        """初始化 StubAuthServer.
+
+        Args:
+            latency: 每個請求的模擬延遲（秒）
+            host: 綁定位址
+            port: 綁定 port（0 表示自動選擇）
+            expires_in: 簽發的 access token 有效秒數
+        """
+        self.latency = latency
+        self.expires_in = expires_in
+        self.calls: dict[str, int] = {
+            "token": 0,
+            "refresh": 0,
+            "logout": 0,
+            "signup": 0,
+            "jwks": 0,
+        }
+        self._refresh_tokens: dict[str, str] = {}  # refresh token -> email
+        self.signing_key = ec.generate_private_key(ec.SECP256R1())
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Supabase project URL（不含 /auth/v1）。"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def jwks(self) -> dict:
+        """回傳 stub 簽章公鑰的 JWKS。"""
+        public_jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(self.signing_key.public_key()))
+        return {"keys": [{**public_jwk, "kid": STUB_KEY_ID, "alg": "ES256", "use": "sig"}]}
+
+    def issue_token(self, email: str, expires_in: int = 3600, role: str | None = None) -> str:
+        """簽發與 Supabase 格式相同的 access token.
+
+        Args:
+            email: 使用者 email
+            expires_in: 有效秒數
+            role: ``app_metadata.role``（None 時不帶角色）
+
+        Returns:
+            str: ES256 簽章的 JWT
+        """
+        user = _user_payload(email)
+        now = int(time.time())
+        claims = {
+            "sub": user["id"],
+            "email": email,
+            "aud": "authenticated",
+            "role": "authenticated",
+            "app_metadata": {"role": role} if role else {},
+            "iat": now,
+            "exp": now + expires_in,
+        }
+        return jwt.encode(claims, self.signing_key, algorithm="ES256", headers={"kid": STUB_KEY_ID})
+
+    def _record(self, endpoint: str) -> None:
+        with self._lock:
+            self.calls[endpoint] += 1
+
+    def _session(self, email: str) -> dict:
+        refresh_token = uuid.uuid4().hex
+        with self._lock:
+            self._refresh_tokens[refresh_token] = email
+        return {
+            "access_token": self.issue_token(email, self.expires_in),
+            "refresh_token": refresh_token,
+            "expires_in": self.expires_in,
+            "expires_at": int(time.time()) + self.expires_in,
+            "token_type": "bearer",
+            "user": _user_payload(email),
+        }
+
+    def _revoke(self, email: str) -> None:
+        with self._lock:
+            for token in [t for t, owner in self._refresh_tokens.items() if owner == email]:
+                del self._refresh_tokens[token]
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def _send_json(self, status: int, payload: dict) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                time.sleep(stub.latency)
+                if self.path.startswith("/auth/v1/token?grant_type=refresh_token"):
+                    stub._record("refresh")
+                    with stub._lock:
+                        email = stub._refresh_tokens.pop(body.get("refresh_token", ""), None)
+                    if email is None:
+                        self._send_json(400, {"msg": "Invalid Refresh Token"})
+                    else:
+                        self._send_json(200, stub._session(email))
+                elif self.path.startswith("/auth/v1/token"):
+                    stub._record("token")
+                    self._send_json(200, stub._session(body.get("email", "")))
+                elif self.path.startswith("/auth/v1/logout"):
+                    stub._record("logout")
+                    token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+                    try:
+                        claims = jwt.decode(
+                            token,
+                            stub.signing_key.public_key(),
+                            ["ES256"],
+                            audience="authenticated",
+                        )
+                    except jwt.PyJWTError:
+                        self._send_json(401, {"msg": "invalid JWT"})
+                    else:
+                        stub._revoke(claims["email"])
+                        self.send_response(204)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                elif self.path.startswith("/auth/v1/signup"):
+                    stub._record("signup")
+                    self._send_json(200, _user_payload(body.get("email", "")))
+                else:
+                    self._send_json(404, {"msg": "not found"})
+
+            def do_GET(self):  # noqa: N802
+                time.sleep(stub.latency)
+                if self.path.startswith("/auth/v1/.well-known/jwks.json"):
+                    stub._record("jwks")
+                    self._send_json(200, stub.jwks())
+                else:
+                    self._send_json(404, {"msg": "not found"})
+
+        return Handler
+
+    def start(self) -> "StubAuthServer":
+        """啟動背景伺服器。"""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止背景伺服器。"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubAuthServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,159 @@
+"""Local stub OpenAI Chat Completions server - 供 benchmark 使用的假 LLM 服務。
+
+只實作 ``POST /v1/chat/completions``（一般與 ``stream: true`` 的 server-sent events）。
+回應內容由 prompt 的 hash 決定（相同 prompt 相同回應）。延遲模型：
+
+- 首 token 延遲 ``first_token_latency`` 秒，之後每秒輸出 ``tokens_per_second`` 個 token
+- 同時處理的請求數上限 ``concurrency``（模擬上游的並發 / 速率限制，超過時排隊）
+
+system 為 ``BATCH_SYSTEM_PROMPT`` 的請求視為合併呼叫，依序回答 JSON 陣列中的每個任務。
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.adapters.external.openai_llm import BATCH_SYSTEM_PROMPT
+
+_WORDS = (
+    "price rating review rank listing competitor keyword title bullet image "
+    "position margin premium budget value bundle search conversion buyer brand"
+).split()
+
+
+def _answer(system: str, prompt: str, tokens: int) -> str:
+    seed = hashlib.sha256(f"{system}\n{prompt}".encode()).digest()
+    return " ".join(_WORDS[seed[i % len(seed)] % len(_WORDS)] for i in range(tokens))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StubLLMServer:
+    """在背景 thread 執行的假 LLM 伺服器。"""
+
+    def __init__(
+        self,
+        first_token_latency: float = 0.3,
+        tokens_per_second: float = 500.0,
+        output_tokens: int = 200,
+        concurrency: int = 8,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """初始化 StubLLMServer.
+
+        Args:
+            first_token_latency: 首 token 延遲（秒）
+            tokens_per_second: 輸出速度（token / 秒）
+            output_tokens: 每個回答的 token 數
+            concurrency: 同時處理的請求數上限
+            host: 綁定位址
+            port: 綁定 port（0 表示自動選擇）
+        """
+        self.first_token_latency = first_token_latency
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.calls: dict[str, int] = {"completions": 0, "streams": 0, "prompts": 0}
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """OpenAI 相容的 base URL（含 /v1）。"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _record(self, endpoint: str, prompts: int) -> None:
+        with self._lock:
+            self.calls[endpoint] += 1
+            self.calls["prompts"] += prompts
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def do_POST(self):  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.startswith("/v1/chat/completions"):
+                    self._send(404, b'{"error":"not found"}')
+                    return
+                messages = {m["role"]: m["content"] for m in body["messages"]}
+                system, prompt = messages.get("system", ""), messages.get("user", "")
+                if system == BATCH_SYSTEM_PROMPT:
+                    tasks = json.loads(prompt)
+                    content = json.dumps(
+                        [_answer(t["system"], t["prompt"], stub.output_tokens) for t in tasks]
+                    )
+                    prompts = len(tasks)
+                else:
+                    content, prompts = _answer(system, prompt, stub.output_tokens), 1
+
+                with stub._slots:
+                    time.sleep(stub.first_token_latency)
+                    if body.get("stream"):
+                        stub._record("streams", prompts)
+                        self._stream(content)
+                    else:
+                        stub._record("completions", prompts)
+                        time.sleep(stub.output_tokens * prompts / stub.tokens_per_second)
+                        payload = {"choices": [{"message": {"content": content}}]}
+                        self._send(200, json.dumps(payload).encode())
+
+            def _send(self, status: int, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _stream(self, content: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                words = content.split(" ")
+                # 每 10 個 token 送出一個 event
+                for start in range(0, len(words), 10):
+                    time.sleep(min(10, len(words) - start) / stub.tokens_per_second)
+                    piece = " ".join(words[start : start + 10])
+                    if start:
+                        piece = " " + piece
+                    delta = {"choices": [{"delta": {"content": piece}}]}
+                    self._chunk(f"data: {json.dumps(delta)}\n\n".encode())
+                self._chunk(b"data: [DONE]\n\n")
+                self._chunk(b"")
+
+            def _chunk(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+        return Handler
+
+    def start(self) -> "StubLLMServer":
+        """啟動背景伺服器。"""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止背景伺服器。"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,169 @@
+"""Local stub SMTP / webhook servers - 供通知 benchmark 使用的假收件端。
+
+- ``StubSmtpServer``: 只實作 smtplib 寄信需要的指令（EHLO / MAIL / RCPT / DATA / QUIT）
+- ``StubWebhookServer``: 接受任意 ``POST``，依 ``failure_rate`` 隨機回應 503
+
+每封信 / 每個請求會先 sleep ``latency`` 秒模擬收件端延遲，並記錄收到的數量。
+"""
+
+import random
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _SmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+
+class StubSmtpServer:
+    """在背景 thread 執行的假 SMTP 伺服器。"""
+
+    def __init__(self, latency: float = 0.01, host: str = "127.0.0.1", port: int = 0):
+        """初始化 StubSmtpServer.
+
+        Args:
+            latency: 每封信的模擬延遲（秒）
+            host: 綁定位址
+            port: 綁定 port（0 表示自動選擇）
+        """
+        self.latency = latency
+        self.messages = 0
+        self._lock = threading.Lock()
+        self._server = _SmtpServer((host, port), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """(host, port)。"""
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def _make_handler(self) -> type[socketserver.StreamRequestHandler]:
+        stub = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(f"{line}\r\n".encode())
+
+            def handle(self):
+                self.reply("220 stub-smtp ready")
+                while line := self.rfile.readline():
+                    command = line[:4].upper()
+                    if command in (b"EHLO", b"HELO"):
+                        self.reply("250 stub-smtp")
+                    elif command == b"DATA":
+                        self.reply("354 end data with <CR><LF>.<CR><LF>")
+                        while self.rfile.readline() not in (b".\r\n", b""):
+                            pass
+                        time.sleep(stub.latency)
+                        with stub._lock:
+                            stub.messages += 1
+                        self.reply("250 OK queued")
+                    elif command == b"QUIT":
+                        self.reply("221 bye")
+                        return
+                    else:
+                        self.reply("250 OK")
+
+        return Handler
+
+    def start(self) -> "StubSmtpServer":
+        """啟動背景伺服器。"""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止背景伺服器。"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubSmtpServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _HttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StubWebhookServer:
+    """在背景 thread 執行的假 webhook 接收端。"""
+
+    def __init__(
+        self,
+        latency: float = 0.01,
+        failure_rate: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ):
+        """初始化 StubWebhookServer.
+
+        Args:
+            latency: 每個請求的模擬延遲（秒）
+            failure_rate: 回應 503 的機率
+            host: 綁定位址
+            port: 綁定 port（0 表示自動選擇）
+            seed: 失敗亂數種子
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.received = 0
+        self.failed = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _HttpServer((host, port), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Webhook URL。"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/hooks"
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def do_POST(self):  # noqa: N802
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                time.sleep(stub.latency)
+                with stub._lock:
+                    fail = stub._random.random() < stub.failure_rate
+                    if fail:
+                        stub.failed += 1
+                    else:
+                        stub.received += 1
+                self.send_response(503 if fail else 204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        return Handler
+
+    def start(self) -> "StubWebhookServer":
+        """啟動背景伺服器。"""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止背景伺服器。"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubWebhookServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,129 @@
+-- Products 與 product_snapshots（時序資料，依 scraped_at 按月分區）
+
+CREATE TABLE IF NOT EXISTS products (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    asin VARCHAR(10) UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    category VARCHAR(255),
+    user_id UUID NOT NULL REFERENCES auth.users(id),
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_products_user_id ON products(user_id);
+CREATE INDEX IF NOT EXISTS idx_products_active ON products(id) WHERE is_active;
+
+-- 分區表的主鍵必須包含分區鍵；(product_id, scraped_at) 同時是批次 upsert 的衝突鍵
+CREATE TABLE IF NOT EXISTS product_snapshots (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    product_id UUID NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    asin VARCHAR(10) NOT NULL,
+
+    -- 追蹤項目
+    price DECIMAL(10, 2),
+    currency VARCHAR(3) DEFAULT 'USD',
+    bsr_main INTEGER,
+    bsr_sub INTEGER,
+    rating DECIMAL(2, 1),
+    review_count INTEGER,
+    buybox_price DECIMAL(10, 2),
+
+    -- 元資料
+    scraped_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (product_id, scraped_at)
+) PARTITION BY RANGE (scraped_at);
+
+-- 「最新一筆」與「單一產品時間區間」查詢直接使用主鍵索引 (product_id, scraped_at)：
+-- ORDER BY scraped_at DESC LIMIT 1 與下方 view 的 DISTINCT ON 都是反向掃描，不另建索引
+-- （同鍵的第二個索引只會增加每個分區的寫入成本）
+
+-- 跨產品的時間範圍掃描（例如每日批次、清理舊分區前的統計）：BRIN 體積極小
+CREATE INDEX IF NOT EXISTS idx_snapshots_scraped_at_brin
+    ON product_snapshots USING BRIN (scraped_at);
+
+-- 建立指定月份的分區（可重複呼叫）。default 分區已有該月份的資料時，CREATE ... PARTITION OF
+-- 會因 default 分區的資料違反新分區範圍而失敗：先卸下 default 分區、建立新分區並把該月份的
+-- 資料搬過去，再掛回 default 分區（整個函式在同一個交易內）
+CREATE OR REPLACE FUNCTION create_product_snapshots_partition(month_start DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    from_date DATE := date_trunc('month', month_start)::DATE;
+    to_date DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::DATE;
+    partition_name TEXT := format('product_snapshots_%s', to_char(from_date, 'YYYY_MM'));
+    has_default BOOLEAN := to_regclass('product_snapshots_default') IS NOT NULL;
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    IF has_default THEN
+        ALTER TABLE product_snapshots DETACH PARTITION product_snapshots_default;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF product_snapshots FOR VALUES FROM (%L) TO (%L)',
+        partition_name, from_date, to_date
+    );
+    -- 分區也可經由 PostgREST 直接存取：啟用 RLS 且不建 policy（只能經由父表套用 policy 讀取）
+    EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', partition_name);
+
+    IF has_default THEN
+        INSERT INTO product_snapshots
+        SELECT * FROM product_snapshots_default
+        WHERE scraped_at >= from_date AND scraped_at < to_date;
+        DELETE FROM product_snapshots_default
+        WHERE scraped_at >= from_date AND scraped_at < to_date;
+        ALTER TABLE product_snapshots ATTACH PARTITION product_snapshots_default DEFAULT;
+    END IF;
+END;
+$$;
+
+-- 預先建立本月起 N 個月的分區（建議由排程每月執行一次）
+CREATE OR REPLACE FUNCTION ensure_product_snapshots_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        PERFORM create_product_snapshots_partition(
+            (date_trunc('month', NOW()) + make_interval(months => i))::DATE
+        );
+    END LOOP;
+END;
+$$;
+
+SELECT ensure_product_snapshots_partitions(3);
+
+-- 超出預建範圍的資料落入 default 分區，避免寫入失敗；之後建立該月份的分區時資料會搬出
+CREATE TABLE IF NOT EXISTS product_snapshots_default
+    PARTITION OF product_snapshots DEFAULT;
+ALTER TABLE product_snapshots_default ENABLE ROW LEVEL SECURITY;
+
+-- Row Level Security：使用者只能存取自己的產品與其快照（service role 不受 RLS 限制，
+-- 供背景排程寫入）。auth.uid() 包在 SELECT 內，每個查詢只求值一次
+ALTER TABLE products ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS products_owner ON products;
+CREATE POLICY products_owner ON products
+    FOR ALL TO authenticated
+    USING (user_id = (SELECT auth.uid()))
+    WITH CHECK (user_id = (SELECT auth.uid()));
+
+ALTER TABLE product_snapshots ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS product_snapshots_owner ON product_snapshots;
+CREATE POLICY product_snapshots_owner ON product_snapshots
+    FOR ALL TO authenticated
+    USING (product_id IN (SELECT id FROM products WHERE user_id = (SELECT auth.uid())))
+    WITH CHECK (product_id IN (SELECT id FROM products WHERE user_id = (SELECT auth.uid())));
+
+-- 每個產品的最新快照。兩欄皆 DESC，與主鍵方向完全相反，DISTINCT ON 以主鍵索引反向掃描，
+-- 不需要額外排序（view 回傳整列，不是 index-only scan）。
+-- security_invoker：以查詢者身分讀取底層資料表，套用上面的 RLS policy（預設 view 以擁有者身分執行）
+CREATE OR REPLACE VIEW latest_product_snapshots WITH (security_invoker = true) AS
+SELECT DISTINCT ON (product_id) *
+FROM product_snapshots
+ORDER BY product_id DESC, scraped_at DESC;
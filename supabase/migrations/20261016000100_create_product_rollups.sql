@@ -0,0 +1,50 @@
+-- product_rollups：每個產品一筆的彙總（最新值、7 / 30 日變化、30 日統計、最後一次警報），
+-- 由每批快照寫入後增量更新，產品列表只讀這張表（見 app/domain/services/rollup.py）
+
+CREATE TABLE IF NOT EXISTS product_rollups (
+    product_id UUID PRIMARY KEY REFERENCES products(id) ON DELETE CASCADE,
+    asin VARCHAR(10) NOT NULL,
+    currency VARCHAR(3) NOT NULL DEFAULT 'USD',
+    latest_at TIMESTAMP WITH TIME ZONE NOT NULL,
+
+    -- 最新快照的值
+    price DOUBLE PRECISION,
+    buybox_price DOUBLE PRECISION,
+    bsr_main INTEGER,
+    bsr_sub INTEGER,
+    rating DOUBLE PRECISION,
+    review_count INTEGER,
+
+    -- 變化百分比與近 30 日統計
+    price_change_7d DOUBLE PRECISION,
+    price_change_30d DOUBLE PRECISION,
+    bsr_change_7d DOUBLE PRECISION,
+    bsr_change_30d DOUBLE PRECISION,
+    price_min_30d DOUBLE PRECISION,
+    price_max_30d DOUBLE PRECISION,
+    price_mean_30d DOUBLE PRECISION,
+    bsr_min_30d DOUBLE PRECISION,
+    bsr_max_30d DOUBLE PRECISION,
+    bsr_mean_30d DOUBLE PRECISION,
+
+    -- 最後一次警報
+    last_alert_type VARCHAR(50),
+    last_alert_at TIMESTAMP WITH TIME ZONE,
+    last_alert_change DOUBLE PRECISION,
+
+    -- 增量更新用的每日樣本 [[scraped_at Unix 秒, price, bsr_sub], ...]
+    "window" JSONB NOT NULL DEFAULT '[]'::JSONB
+);
+
+-- 產品列表的排序欄位（NULLS LAST + product_id 作為 tie-breaker，與查詢的 ORDER BY 一致）
+CREATE INDEX IF NOT EXISTS idx_rollups_latest_at ON product_rollups (latest_at DESC NULLS LAST, product_id);
+CREATE INDEX IF NOT EXISTS idx_rollups_price ON product_rollups (price DESC NULLS LAST, product_id);
+CREATE INDEX IF NOT EXISTS idx_rollups_bsr_sub ON product_rollups (bsr_sub DESC NULLS LAST, product_id);
+
+-- Row Level Security：只能存取自己產品的彙總（見 20261016000000 的 products policy）
+ALTER TABLE product_rollups ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS product_rollups_owner ON product_rollups;
+CREATE POLICY product_rollups_owner ON product_rollups
+    FOR ALL TO authenticated
+    USING (product_id IN (SELECT id FROM products WHERE user_id = (SELECT auth.uid())))
+    WITH CHECK (product_id IN (SELECT id FROM products WHERE user_id = (SELECT auth.uid())));
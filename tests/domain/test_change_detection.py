@@ -0,0 +1,123 @@
+"""Unit tests for vectorized change detection."""
+
+import random
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.domain.entities.product import ProductSnapshot
+from app.domain.services.change_detection import (
+    ALERT_BSR_CHANGE,
+    ALERT_PRICE_CHANGE,
+    ALERT_RATING_CHANGE,
+    ChangeDetector,
+    ChangeRule,
+    SnapshotBatch,
+    align_pairs,
+)
+
+NOW = datetime(2025, 10, 10, tzinfo=UTC)
+
+
+def make_snapshot(product_id: str, price=None, bsr_sub=None, rating=None) -> ProductSnapshot:
+    """建立測試用快照。"""
+    return ProductSnapshot(
+        id=f"snapshot-{product_id}",
+        product_id=product_id,
+        asin="B08N5WRWNW",
+        price=Decimal(price) if price is not None else None,
+        currency="USD",
+        bsr_main=None,
+        bsr_sub=bsr_sub,
+        rating=rating,
+        review_count=None,
+        buybox_price=None,
+        scraped_at=NOW,
+        created_at=NOW,
+    )
+
+
+def test_detect_matches_per_object_rules():
+    """測試向量化結果與逐筆 calculate_*_change_percentage 判斷一致。"""
+    # Arrange - 準備隨機前後快照（含缺值與 0）
+    rng = random.Random(7)
+
+    def random_price():
+        return rng.choice([None, "0", f"{rng.randint(100, 2000) / 100:.2f}"])
+
+    def random_bsr():
+        return rng.choice([None, 0, rng.randint(1, 1000)])
+
+    previous = [make_snapshot(f"p{i}", random_price(), random_bsr()) for i in range(2000)]
+    current = [make_snapshot(f"p{i}", random_price(), random_bsr()) for i in range(2000)]
+    expected = set()
+    for cur, prev in zip(current, previous, strict=True):
+        if abs(cur.calculate_price_change_percentage(prev)) > 10:
+            expected.add((cur.product_id, ALERT_PRICE_CHANGE))
+        if abs(cur.calculate_bsr_change_percentage(prev)) > 30:
+            expected.add((cur.product_id, ALERT_BSR_CHANGE))
+
+    # Act - 執行受測操作
+    alerts = ChangeDetector().detect(
+        SnapshotBatch.from_snapshots(current), SnapshotBatch.from_snapshots(previous), NOW
+    )
+
+    # Assert - 驗證結果
+    assert {(a.product_id, a.alert_type) for a in alerts} == expected
+
+
+def test_detect_threshold_boundary_and_alert_values():
+    """測試剛好等於門檻時不觸發、超過才觸發，並帶出新舊值與變化百分比。"""
+    # Arrange - 準備測試資料
+    previous = SnapshotBatch(["a", "b", "c"], {"price": np.array([100.0, 19.99, 100.0])})
+    current = SnapshotBatch(["a", "b", "c"], {"price": np.array([110.0, 21.989, 110.5])})
+
+    # Act - 執行受測操作
+    alerts = ChangeDetector().detect(current, previous, NOW)
+
+    # Assert - 驗證結果
+    assert [a.product_id for a in alerts] == ["c"]
+    assert (alerts[0].old_value, alerts[0].new_value) == (100.0, 110.5)
+    assert alerts[0].change_percentage == pytest.approx(10.5)
+    assert alerts[0].triggered_at == NOW
+
+
+def test_detect_custom_directional_rule():
+    """測試自訂規則（評分下降 > 5%）只在下降時觸發。"""
+    # Arrange - 準備測試資料
+    rule = ChangeRule(ALERT_RATING_CHANGE, "rating", 5.0, direction="decrease")
+    previous = SnapshotBatch(["a", "b"], {"rating": np.array([4.5, 4.0])})
+    current = SnapshotBatch(["a", "b"], {"rating": np.array([4.2, 4.5])})
+
+    # Act - 執行受測操作
+    alerts = ChangeDetector(rules=[rule]).detect(current, previous, NOW)
+
+    # Assert - 驗證結果
+    assert [(a.product_id, a.alert_type) for a in alerts] == [("a", ALERT_RATING_CHANGE)]
+
+
+def test_align_pairs_skips_products_without_previous():
+    """測試對齊前後快照時略過沒有前一筆的產品。"""
+    # Arrange - 準備測試資料
+    current = [make_snapshot("a", "10"), make_snapshot("b", "20")]
+    previous = {"b": make_snapshot("b", "15")}
+
+    # Act - 執行受測操作
+    cur, prev = align_pairs(current, previous)
+
+    # Assert - 驗證結果
+    assert list(cur.product_ids) == list(prev.product_ids) == ["b"]
+    assert prev.column("price").tolist() == [15.0]
+
+
+def test_detect_rejects_mismatched_batches():
+    """測試前後批次列數不同時拋出例外。"""
+    # Arrange - 準備測試資料
+    current = SnapshotBatch(["a", "b"], {"price": np.array([1.0, 2.0])})
+    previous = SnapshotBatch(["a"], {"price": np.array([1.0])})
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ValueError):
+        ChangeDetector().detect(current, previous, NOW)
@@ -0,0 +1,72 @@
+"""Unit tests for Product entities."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+
+def test_product_creation():
+    """測試建立 Product 實體。"""
+    from app.domain.entities.product import Product
+
+    now = datetime.now(UTC)
+    product = Product(
+        id="123e4567-e89b-12d3-a456-426614174000",
+        asin="B08N5WRWNW",
+        title="Echo Dot",
+        category="Electronics",
+        user_id="223e4567-e89b-12d3-a456-426614174000",
+        created_at=now,
+        updated_at=now,
+    )
+
+    assert product.asin == "B08N5WRWNW"
+
+
+def test_product_invalid_asin():
+    """測試 ASIN 長度不符時拋出例外。"""
+    from app.domain.entities.product import Product
+
+    now = datetime.now(UTC)
+    with pytest.raises(ValueError):
+        Product(
+            id="123e4567-e89b-12d3-a456-426614174000",
+            asin="B08N5",
+            title="Echo Dot",
+            category="Electronics",
+            user_id="223e4567-e89b-12d3-a456-426614174000",
+            created_at=now,
+            updated_at=now,
+        )
+
+
+def test_snapshot_change_percentage():
+    """測試快照價格與 BSR 變化百分比（缺值時為 0）。"""
+    from decimal import Decimal
+
+    from app.domain.entities.product import ProductSnapshot
+
+    now = datetime.now(UTC)
+
+    def snapshot(price, bsr_sub):
+        return ProductSnapshot(
+            id="s",
+            product_id="p",
+            asin="B08N5WRWNW",
+            price=price,
+            currency="USD",
+            bsr_main=None,
+            bsr_sub=bsr_sub,
+            rating=None,
+            review_count=None,
+            buybox_price=None,
+            scraped_at=now,
+            created_at=now,
+        )
+
+    previous = snapshot(Decimal("20.00"), 100)
+
+    assert snapshot(Decimal("22.00"), 130).calculate_price_change_percentage(previous) == 10.0
+    assert snapshot(Decimal("22.00"), 130).calculate_bsr_change_percentage(previous) == 30.0
+    assert snapshot(None, None).calculate_price_change_percentage(previous) == 0.0
+    assert snapshot(None, None).calculate_bsr_change_percentage(previous) == 0.0
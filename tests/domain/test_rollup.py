@@ -0,0 +1,114 @@
+"""Unit tests for product rollup maintenance."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.domain.entities.product import ChangeAlert, ProductSnapshot
+from app.domain.services.change_detection import ALERT_PRICE_CHANGE
+from app.domain.services.rollup import apply_snapshot, record_alert, rollup_drift
+
+START = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+def make_snapshot(day: float, price: str | None = "100", bsr_sub: int | None = 1000):
+    """建立第 day 天的測試用快照。"""
+    return ProductSnapshot(
+        id=f"snapshot-{day}",
+        product_id="product-1",
+        asin="B08N5WRWNW",
+        price=Decimal(price) if price is not None else None,
+        currency="USD",
+        bsr_main=None,
+        bsr_sub=bsr_sub,
+        rating=4.5,
+        review_count=10,
+        buybox_price=None,
+        scraped_at=START + timedelta(days=day),
+        created_at=START,
+    )
+
+
+def make_alert(day: float, change: float) -> ChangeAlert:
+    """建立第 day 天觸發的測試用警報。"""
+    return ChangeAlert(
+        id=f"alert-{day}-{change}",
+        product_id="product-1",
+        alert_type=ALERT_PRICE_CHANGE,
+        change_percentage=change,
+        old_value=100.0,
+        new_value=100.0 + change,
+        triggered_at=START + timedelta(days=day),
+    )
+
+
+def test_apply_snapshot_computes_deltas_and_window_stats():
+    """測試變化百分比以期間內最早的每日樣本為基準，統計值涵蓋最近 30 日。"""
+    # Arrange - 準備測試資料和依賴
+    prices = {0: "80", 20: "100", 25: "90", 40: "120"}
+
+    # Act - 執行受測操作
+    rollup = None
+    for day, price in prices.items():
+        rollup = apply_snapshot(rollup, make_snapshot(day, price=price))
+
+    # Assert - 驗證結果
+    assert rollup.latest_at == START + timedelta(days=40)
+    assert rollup.price == 120.0
+    assert rollup.price_change_7d is None
+    assert rollup.price_change_30d == pytest.approx(20.0)
+    assert (rollup.price_min_30d, rollup.price_max_30d) == (90.0, 120.0)
+    assert rollup.price_mean_30d == pytest.approx(310 / 3)
+    assert [s[1] for s in rollup.window] == [100.0, 90.0, 120.0]
+
+
+def test_apply_snapshot_keeps_latest_sample_per_day_and_ignores_older_latest():
+    """測試同日只保留最晚的樣本，較舊的快照不覆蓋最新值。"""
+    # Arrange - 準備測試資料和依賴
+    rollup = apply_snapshot(None, make_snapshot(10, price="100"))
+
+    # Act - 執行受測操作
+    rollup = apply_snapshot(rollup, make_snapshot(10.25, price="110"))
+    rollup = apply_snapshot(rollup, make_snapshot(10.1, price="105"))
+    rollup = apply_snapshot(rollup, make_snapshot(3, price="50"))
+
+    # Assert - 驗證結果
+    assert rollup.latest_at == START + timedelta(days=10.25)
+    assert rollup.price == 110.0
+    assert [s[1] for s in rollup.window] == [50.0, 110.0]
+    assert rollup.price_change_7d == pytest.approx(120.0)
+
+
+def test_record_alert_keeps_latest_then_largest_change():
+    """測試最後一次警報取時間最晚者，同時間取變化幅度最大者。"""
+    # Arrange - 準備測試資料和依賴
+    rollup = apply_snapshot(None, make_snapshot(5))
+
+    # Act - 執行受測操作
+    record_alert(rollup, make_alert(5, 12.0))
+    record_alert(rollup, make_alert(5, -40.0))
+    record_alert(rollup, make_alert(5, 20.0))
+    record_alert(rollup, make_alert(4, 90.0))
+
+    # Assert - 驗證結果
+    assert rollup.last_alert_at == START + timedelta(days=5)
+    assert rollup.last_alert_change == -40.0
+    assert rollup.has_recent_alert(START + timedelta(days=10))
+    assert not rollup.has_recent_alert(START + timedelta(days=13))
+
+
+def test_rollup_drift_reports_changed_fields():
+    """測試差異比對：容許 float 誤差，回報不一致欄位與缺漏。"""
+    # Arrange - 準備測試資料和依賴
+    expected = apply_snapshot(None, make_snapshot(1, price="100"))
+    actual = apply_snapshot(None, make_snapshot(1, price="100"))
+    actual.price_mean_30d = 100.0 + 1e-9
+
+    # Act & Assert - 執行並驗證結果
+    assert rollup_drift(expected, actual) == []
+    actual.price = 99.0
+    actual.bsr_sub = 999
+    assert rollup_drift(expected, actual) == ["price", "bsr_sub"]
+    assert rollup_drift(expected, None) == ["missing"]
+    assert rollup_drift(None, actual) == ["orphan"]
@@ -0,0 +1,40 @@
+"""Unit tests for Settings."""
+
+import pytest
+
+from app.infrastructure.config import ConfigError, Settings
+
+
+def test_settings_from_env_success():
+    """測試從環境變數建立設定（含選填項目轉型與預設值）。"""
+    # Arrange - 準備測試資料
+    environ = {
+        "SUPABASE_URL": "https://example.supabase.co",
+        "SUPABASE_ANON_KEY": "anon-key",
+        "HEALTH_PROBE_INTERVAL_SECONDS": "5",
+    }
+
+    # Act - 執行受測操作
+    settings = Settings.from_env(environ)
+
+    # Assert - 驗證結果
+    assert settings.supabase_url == "https://example.supabase.co"
+    assert settings.supabase_anon_key == "anon-key"
+    assert settings.health_probe_interval_seconds == 5.0
+    assert settings.supabase_jwt_secret is None
+    assert settings.supabase_http_max_connections == 100
+
+
+def test_settings_from_env_reports_all_errors():
+    """測試缺少必要環境變數與格式錯誤時一次回報所有問題。"""
+    # Arrange - 準備測試資料
+    environ = {"SUPABASE_HTTP_MAX_CONNECTIONS": "many"}
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ConfigError) as exc_info:
+        Settings.from_env(environ)
+
+    message = str(exc_info.value)
+    assert "SUPABASE_URL" in message
+    assert "SUPABASE_ANON_KEY" in message
+    assert "SUPABASE_HTTP_MAX_CONNECTIONS" in message
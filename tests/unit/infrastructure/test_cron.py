@@ -0,0 +1,87 @@
+"""Unit tests for cron scheduling."""
+
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.infrastructure.cron import CronSchedule, ScheduledJob, Scheduler
+from app.infrastructure.job_queue import SQLiteJobQueue
+
+TAIPEI = ZoneInfo("Asia/Taipei")
+
+
+def test_parse_supports_lists_ranges_and_steps():
+    """測試解析清單、範圍與間隔，星期 7 視為週日。"""
+    # Act - 執行受測操作
+    schedule = CronSchedule.parse("*/15 9-17/4 1,15 * 7")
+
+    # Assert - 驗證結果
+    assert schedule.minutes == {0, 15, 30, 45}
+    assert schedule.hours == {9, 13, 17}
+    assert schedule.days == {1, 15}
+    assert schedule.weekdays == {0}
+
+
+@pytest.mark.parametrize("expression", ["0 2 * *", "60 * * * *", "0 2 31-1 * *", "*/0 * * * *"])
+def test_parse_rejects_invalid_expressions(expression):
+    """測試欄位數錯誤或超出範圍時拋出 ValueError。"""
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ValueError):
+        CronSchedule.parse(expression)
+
+
+def test_next_after_daily_at_two_in_local_timezone():
+    """測試每日 02:00 以排程時區計算。"""
+    # Arrange - 準備測試資料和依賴
+    schedule = CronSchedule.parse("0 2 * * *")
+
+    # Act - 執行受測操作
+    before = schedule.next_after(datetime(2024, 3, 10, 1, 30, tzinfo=TAIPEI))
+    exactly = schedule.next_after(datetime(2024, 3, 10, 2, 0, tzinfo=TAIPEI))
+
+    # Assert - 驗證結果
+    assert before == datetime(2024, 3, 10, 2, 0, tzinfo=TAIPEI)
+    assert exactly == datetime(2024, 3, 11, 2, 0, tzinfo=TAIPEI)
+    assert before.astimezone(UTC).hour == 18
+
+
+def test_next_after_matches_day_or_weekday_when_both_restricted():
+    """測試日期與星期同時指定時任一符合即觸發。"""
+    # Arrange - 準備測試資料和依賴
+    schedule = CronSchedule.parse("0 0 15 * 1")  # 每月 15 日或每週一
+
+    # Act - 執行受測操作
+    moment = datetime(2024, 1, 10, 12, 0, tzinfo=UTC)  # 週三
+    first = schedule.next_after(moment)
+    second = schedule.next_after(first)
+
+    # Assert - 驗證結果
+    assert first == datetime(2024, 1, 15, 0, 0, tzinfo=UTC)  # 週一且為 15 日
+    assert second == datetime(2024, 1, 22, 0, 0, tzinfo=UTC)
+
+
+async def test_scheduler_enqueues_due_job_once_across_replicas():
+    """測試到期的排程工作只加入一次（多個排程器共用 idempotency key）。"""
+    # Arrange - 準備測試資料和依賴
+    now = [datetime(2024, 3, 10, 1, 59, tzinfo=TAIPEI).timestamp()]
+    queue = SQLiteJobQueue(clock=lambda: now[0])
+    entries = [ScheduledJob("update_products", "0 2 * * *", {"scope": "all"}, "Asia/Taipei")]
+    first = Scheduler(queue, entries, clock=lambda: now[0])
+    second = Scheduler(queue, entries, clock=lambda: now[0])
+
+    # Act - 執行受測操作
+    early = await first.tick()
+    now[0] += 90
+    fired = await first.tick() + await second.tick()
+    again = await first.tick()
+    jobs = await queue.reserve(10, visibility_timeout=30)
+
+    # Assert - 驗證結果
+    assert early == []
+    assert len(fired) == 2
+    assert fired[0] == fired[1]
+    assert again == []
+    assert len(jobs) == 1
+    assert jobs[0].payload == {"scope": "all", "scheduled_for": "2024-03-10T02:00:00+08:00"}
+    assert first.seconds_until_next() == pytest.approx(24 * 3600 - 30)
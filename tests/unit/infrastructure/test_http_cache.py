@@ -0,0 +1,137 @@
+"""Unit tests for HTTP response caching."""
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.adapters.api.middleware.http_cache import CacheRule, HttpCache, HttpCacheMiddleware
+from app.adapters.api.middleware.metrics import MetricsMiddleware
+from app.infrastructure.http_cache import ResponseCache, etag_matches, strong_etag
+from app.infrastructure.metrics import Metrics
+
+
+def make_app(cache: HttpCache) -> tuple[FastAPI, list[str]]:
+    """建立掛上 HttpCacheMiddleware 的 app，並記錄實際進入端點的請求。"""
+    app = FastAPI()
+    calls: list[str] = []
+
+    @app.get("/info")
+    async def info(lang: str = "en"):
+        calls.append("info")
+        return {"lang": lang}
+
+    @app.get("/stream")
+    async def stream():
+        calls.append("stream")
+        return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+    @app.get("/missing")
+    async def missing():
+        calls.append("missing")
+        return StreamingResponse(iter([b"gone"]), status_code=404)
+
+    app.add_middleware(HttpCacheMiddleware)
+    app.state.http_cache = cache
+    return app, calls
+
+
+def test_etag_matches_uses_weak_comparison_and_lists():
+    """測試 If-None-Match 支援多個 ETag、W/ 前綴與 *。"""
+    # Arrange - 準備測試資料和依賴
+    etag = strong_etag(b"body")
+
+    # Act & Assert - 執行並驗證結果
+    assert etag == strong_etag(b"body") != strong_etag(b"other")
+    assert etag_matches(f'"x", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"x"', etag)
+
+
+def test_response_cache_lru_evicts_and_skips_large_bodies():
+    """測試超過筆數時淘汰最久未使用者，過大的 body 不保存。"""
+    # Arrange - 準備測試資料和依賴
+    store = ResponseCache(max_entries=2, max_body_bytes=8)
+    for path in ("/a", "/b", "/c"):
+        store.put(path, b"", [], b"body", '"e"')
+
+    # Act - 執行受測操作
+    evicted = store.get("/a", b"")
+    store.put("/big", b"", [], b"x" * 9, '"e"')
+
+    # Assert - 驗證結果
+    assert evicted is None
+    assert store.get("/b", b"").body == b"body"
+    assert store.get("/big", b"") is None
+    assert store.stats.evictions == 1
+
+
+async def test_middleware_serves_cached_body_and_304():
+    """測試第一次請求後由快取回應，If-None-Match 符合時回 304，query 不同則分開快取。"""
+    # Arrange - 準備測試資料和依賴
+    app, calls = make_app(HttpCache([CacheRule("/info", "public, max-age=60", store_body=True)]))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Act - 執行受測操作
+        first = await client.get("/info")
+        second = await client.get("/info")
+        revalidated = await client.get("/info", headers={"If-None-Match": first.headers["etag"]})
+        other = await client.get("/info", params={"lang": "zh"})
+        private = await client.get("/info", headers={"Authorization": "Bearer t"})
+
+    # Assert - 驗證結果
+    assert first.json() == second.json() == {"lang": "en"}
+    assert first.headers["cache-control"] == "public, max-age=60"
+    assert first.headers["etag"] == second.headers["etag"] == strong_etag(first.content)
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert other.json() == {"lang": "zh"}
+    assert private.status_code == 200
+    assert calls == ["info", "info", "info"]
+
+
+async def test_middleware_passes_streams_and_errors_through():
+    """測試串流回應不加 ETag 只加 Cache-Control，非 200 回應不修改。"""
+    # Arrange - 準備測試資料和依賴
+    app, calls = make_app(HttpCache([CacheRule("/*", "no-cache", store_body=True)]))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Act - 執行受測操作
+        streams = [await client.get("/stream") for _ in range(2)]
+        missing = await client.get("/missing")
+
+    # Assert - 驗證結果
+    assert [r.content for r in streams] == [b"a\nb\n", b"a\nb\n"]
+    assert "etag" not in streams[0].headers
+    assert streams[0].headers["cache-control"] == "no-cache"
+    assert missing.status_code == 404
+    assert "cache-control" not in missing.headers
+    assert calls == ["stream", "stream", "missing"]
+
+
+async def test_cache_hits_are_counted_under_the_route():
+    """測試快取命中與 304 不經過 router，指標仍記在該路由（不是 unmatched）。"""
+    # Arrange - 準備測試資料和依賴
+    app, calls = make_app(HttpCache([CacheRule("/info", "public, max-age=60", store_body=True)]))
+    app.add_middleware(MetricsMiddleware)
+    app.state.metrics = metrics = Metrics()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Act - 執行受測操作
+        first = await client.get("/info")
+        await client.get("/info")
+        await client.get("/info", headers={"If-None-Match": first.headers["etag"]})
+
+    # Assert - 驗證結果
+    def requests(route: str, status: str) -> float | None:
+        return metrics.registry.get_sample_value(
+            "http_requests_total", {"method": "GET", "route": route, "status": status}
+        )
+
+    assert calls == ["info"]
+    assert requests("/info", "200") == 2
+    assert requests("/info", "304") == 1
+    assert requests("unmatched", "304") is None
@@ -0,0 +1,166 @@
+"""Unit tests for job queues."""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from app.infrastructure.job_queue import RedisJobQueue, SQLiteJobQueue
+from app.use_cases.jobs.ports import QueueStats
+
+
+class FakeClock:
+    """可手動前進的時鐘。"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+async def queue(request):
+    """兩種實作共用相同語意的測試。"""
+    if request.param == "sqlite":
+        queue = SQLiteJobQueue()
+    else:
+        queue = RedisJobQueue(fakeredis.FakeAsyncRedis())
+    yield queue
+    await queue.aclose()
+
+
+async def test_enqueue_with_idempotency_key_returns_existing_job(queue):
+    """測試相同 idempotency key 只加入一次。"""
+    # Arrange - 準備測試資料和依賴
+    first = await queue.enqueue("update_products", {"batch": 1}, idempotency_key="daily:1")
+
+    # Act - 執行受測操作
+    second = await queue.enqueue("update_products", {"batch": 1}, idempotency_key="daily:1")
+    jobs = await queue.reserve(10, visibility_timeout=30)
+
+    # Assert - 驗證結果
+    assert second == first
+    assert [job.id for job in jobs] == [first]
+    assert jobs[0].payload == {"batch": 1}
+    assert jobs[0].attempts == 1
+
+
+async def test_reserve_respects_limit_and_hides_reserved_jobs(queue):
+    """測試 reserve 最多取出 max_jobs 筆，已取出的工作不會重複交付。"""
+    # Arrange - 準備測試資料和依賴
+    for index in range(5):
+        await queue.enqueue("scrape", {"index": index})
+
+    # Act - 執行受測操作
+    first = await queue.reserve(3, visibility_timeout=30)
+    second = await queue.reserve(3, visibility_timeout=30)
+    third = await queue.reserve(3, visibility_timeout=30)
+    stats = await queue.stats()
+
+    # Assert - 驗證結果
+    assert len(first) == 3
+    assert len(second) == 2
+    assert third == []
+    assert {job.id for job in first}.isdisjoint(job.id for job in second)
+    assert stats.in_flight == 5
+    assert stats.ready == 0
+
+
+async def test_nack_retries_until_max_attempts_then_dead(queue):
+    """測試失敗的工作重試，超過 max_attempts 後移入 dead。"""
+    # Arrange - 準備測試資料和依賴
+    await queue.enqueue("scrape", max_attempts=2)
+
+    # Act - 執行受測操作
+    [first] = await queue.reserve(1, visibility_timeout=30)
+    await queue.nack(first, "boom")
+    [second] = await queue.reserve(1, visibility_timeout=30)
+    await queue.nack(second, "boom again")
+    remaining = await queue.reserve(1, visibility_timeout=30)
+    stats = await queue.stats()
+
+    # Assert - 驗證結果
+    assert second.attempts == 2
+    assert remaining == []
+    assert stats.dead == 1
+
+
+async def test_release_returns_job_without_counting_attempt(queue):
+    """測試歸還的工作可再次取出，且不計入執行次數。"""
+    # Arrange - 準備測試資料和依賴
+    await queue.enqueue("scrape")
+    [job] = await queue.reserve(1, visibility_timeout=30)
+
+    # Act - 執行受測操作
+    released = await queue.release(job)
+    [again] = await queue.reserve(1, visibility_timeout=30)
+
+    # Assert - 驗證結果
+    assert released is True
+    assert again.id == job.id
+    assert again.attempts == 1
+
+
+async def test_sqlite_expired_lease_is_redelivered_and_stale_ack_rejected():
+    """測試租約逾時的工作重新交付，原 worker 的 ack 失效。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    queue = SQLiteJobQueue(clock=clock)
+    await queue.enqueue("scrape")
+    [stale] = await queue.reserve(1, visibility_timeout=30)
+
+    # Act - 執行受測操作
+    clock.now += 10
+    extended = await queue.extend(stale, visibility_timeout=30)
+    clock.now += 25
+    before_expiry = await queue.reserve(1, visibility_timeout=30)
+    clock.now += 10
+    [redelivered] = await queue.reserve(1, visibility_timeout=30)
+    stale_ack = await queue.ack(stale)
+    fresh_ack = await queue.ack(redelivered)
+
+    # Assert - 驗證結果
+    assert extended is True
+    assert before_expiry == []
+    assert redelivered.id == stale.id
+    assert redelivered.attempts == 2
+    assert stale_ack is False
+    assert fresh_ack is True
+    assert await queue.stats() == QueueStats(ready=0, delayed=0, in_flight=0, dead=0)
+
+
+async def test_sqlite_expired_lease_on_last_attempt_moves_to_dead():
+    """測試最後一次執行的租約逾時時移入 dead，不再交付。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    queue = SQLiteJobQueue(clock=clock)
+    await queue.enqueue("scrape", max_attempts=1)
+    await queue.reserve(1, visibility_timeout=30)
+
+    # Act - 執行受測操作
+    clock.now += 31
+    jobs = await queue.reserve(1, visibility_timeout=30)
+    stats = await queue.stats()
+
+    # Assert - 驗證結果
+    assert jobs == []
+    assert stats.dead == 1
+
+
+async def test_redis_expired_lease_is_redelivered():
+    """測試 Redis 佇列以伺服器時間判斷租約逾時。"""
+    # Arrange - 準備測試資料和依賴
+    queue = RedisJobQueue(fakeredis.FakeAsyncRedis())
+    await queue.enqueue("scrape")
+    [stale] = await queue.reserve(1, visibility_timeout=0.05)
+
+    # Act - 執行受測操作
+    await asyncio.sleep(0.1)
+    [redelivered] = await queue.reserve(1, visibility_timeout=30)
+    stale_nack = await queue.nack(stale, "late failure")
+
+    # Assert - 驗證結果
+    assert redelivered.id == stale.id
+    assert redelivered.attempts == 2
+    assert stale_nack is False
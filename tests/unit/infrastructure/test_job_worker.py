@@ -0,0 +1,114 @@
+"""Unit tests for the job worker."""
+
+import asyncio
+
+from app.infrastructure.job_queue import SQLiteJobQueue
+from app.infrastructure.job_worker import JobRegistry, Worker
+
+
+async def _run_until(worker: Worker, condition, timeout: float = 2.0) -> None:
+    """執行 worker 直到 condition 成立後停止。"""
+    stop = asyncio.Event()
+    task = asyncio.create_task(worker.run(stop))
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+    stop.set()
+    await task
+
+
+async def test_worker_processes_jobs_and_retries_failures():
+    """測試 worker 執行工作，失敗的工作以 backoff 重試後成功。"""
+    # Arrange - 準備測試資料和依賴
+    queue = SQLiteJobQueue()
+    registry = JobRegistry()
+    seen: list[tuple[int, int]] = []
+
+    @registry.handler("scrape")
+    async def scrape(job):
+        seen.append((job.payload["index"], job.attempts))
+        if job.payload["index"] == 0 and job.attempts == 1:
+            raise RuntimeError("temporary failure")
+
+    for index in range(5):
+        await queue.enqueue("scrape", {"index": index})
+    worker = Worker(
+        queue, registry, concurrency=2, poll_interval_seconds=0.01, retry_base_seconds=0
+    )
+
+    # Act - 執行受測操作
+    await _run_until(worker, lambda: worker.stats.succeeded == 5)
+    stats = await queue.stats()
+
+    # Assert - 驗證結果
+    assert worker.stats.failed == 1
+    assert (0, 2) in seen
+    assert stats.ready == stats.in_flight == stats.dead == 0
+
+
+async def test_worker_holds_at_most_prefetch_jobs():
+    """測試 worker 同時持有的工作不超過 prefetch。"""
+    # Arrange - 準備測試資料和依賴
+    queue = SQLiteJobQueue()
+    registry = JobRegistry()
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    @registry.handler("slow")
+    async def slow(job):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    for _ in range(10):
+        await queue.enqueue("slow")
+    worker = Worker(queue, registry, concurrency=2, prefetch=3, poll_interval_seconds=0.01)
+
+    # Act - 執行受測操作
+    stop = asyncio.Event()
+    task = asyncio.create_task(worker.run(stop))
+    await asyncio.sleep(0.1)
+    in_flight = (await queue.stats()).in_flight
+    release.set()
+    await asyncio.sleep(0.05)
+    stop.set()
+    await task
+
+    # Assert - 驗證結果
+    assert peak == 2
+    assert in_flight == 3
+
+
+async def test_worker_releases_prefetched_jobs_on_stop():
+    """測試停止時歸還尚未開始的預取工作，並等待執行中的工作完成。"""
+    # Arrange - 準備測試資料和依賴
+    queue = SQLiteJobQueue()
+    registry = JobRegistry()
+    started = asyncio.Event()
+    finished: list[str] = []
+
+    @registry.handler("slow")
+    async def slow(job):
+        started.set()
+        await asyncio.sleep(0.1)
+        finished.append(job.id)
+
+    for _ in range(4):
+        await queue.enqueue("slow")
+    worker = Worker(queue, registry, concurrency=1, prefetch=4, poll_interval_seconds=0.01)
+
+    # Act - 執行受測操作
+    stop = asyncio.Event()
+    task = asyncio.create_task(worker.run(stop))
+    await started.wait()
+    stop.set()
+    await task
+    stats = await queue.stats()
+
+    # Assert - 驗證結果
+    assert len(finished) == 1
+    assert stats.ready == 3
+    assert stats.in_flight == 0
@@ -0,0 +1,85 @@
+"""Unit tests for repository instrumentation."""
+
+import pytest
+
+from app.infrastructure.metrics import Metrics
+from app.use_cases.health.ports import AsyncDatabaseRepository, DatabaseRepository
+
+
+class StubAsyncDatabaseRepository(AsyncDatabaseRepository):
+    """回傳固定結果或拋出例外的 Repository。"""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    async def check_connection(self) -> str:
+        if self.error:
+            raise self.error
+        return "connected"
+
+
+class StubDatabaseRepository(DatabaseRepository):
+    """同步版本的 Repository。"""
+
+    def check_connection(self) -> str:
+        return "connected"
+
+
+def sample(metrics: Metrics, name: str, **labels) -> float | None:
+    """讀取指標數值。"""
+    return metrics.registry.get_sample_value(name, labels)
+
+
+async def test_instrument_times_async_port_calls():
+    """測試 async port 呼叫被計時，port 名稱取自實作的 ABC。"""
+    # Arrange - 準備測試資料和依賴
+    metrics = Metrics()
+    repo = metrics.instrument(StubAsyncDatabaseRepository())
+
+    # Act - 執行受測操作
+    results = [await repo.check_connection() for _ in range(3)]
+
+    # Assert - 驗證結果
+    assert results == ["connected"] * 3
+    labels = {"port": "AsyncDatabaseRepository", "method": "check_connection"}
+    assert sample(metrics, "repository_call_duration_seconds_count", **labels) == 3
+
+
+async def test_instrument_counts_errors_and_reraises():
+    """測試 port 呼叫拋出例外時記錄錯誤並原樣拋出。"""
+    # Arrange - 準備測試資料和依賴
+    metrics = Metrics()
+    repo = metrics.instrument(StubAsyncDatabaseRepository(error=TimeoutError("slow")))
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(TimeoutError):
+        await repo.check_connection()
+
+    labels = {"port": "AsyncDatabaseRepository", "method": "check_connection"}
+    assert sample(metrics, "repository_call_errors_total", error="TimeoutError", **labels) == 1
+    assert sample(metrics, "repository_call_duration_seconds_count", **labels) == 1
+
+
+def test_instrument_times_sync_port_calls_and_passes_attributes():
+    """測試同步 port 呼叫被計時，非方法屬性直接轉送。"""
+    # Arrange - 準備測試資料和依賴
+    metrics = Metrics()
+    target = StubDatabaseRepository()
+    target.name = "primary"
+    repo = metrics.instrument(target, port="Primary")
+
+    # Act - 執行受測操作
+    result = repo.check_connection()
+
+    # Assert - 驗證結果
+    assert result == "connected"
+    assert repo.name == "primary"
+    assert (
+        sample(
+            metrics,
+            "repository_call_duration_seconds_count",
+            port="Primary",
+            method="check_connection",
+        )
+        == 1
+    )
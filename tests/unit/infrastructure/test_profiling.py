@@ -0,0 +1,71 @@
+"""Unit tests for RequestProfiler."""
+
+import json
+
+from app.infrastructure.profiling import RequestProfiler
+
+
+def make_scope(*headers: tuple[bytes, bytes], path: str = "/api/v1/auth/me") -> dict:
+    """建立 ASGI HTTP scope。"""
+    return {"type": "http", "method": "GET", "path": path, "headers": list(headers)}
+
+
+def test_select_requires_matching_admin_token():
+    """測試只有 admin token 正確時才 profile。"""
+    # Arrange - 準備測試資料和依賴
+    profiler = RequestProfiler(admin_token="secret")
+
+    # Act - 執行受測操作
+    missing = profiler.select(make_scope())
+    wrong = profiler.select(make_scope((b"x-profile", b"guess")))
+    selected = profiler.select(
+        make_scope(
+            (b"x-profile", b"secret"),
+            (b"x-profile-output", b"inline"),
+            (b"x-profile-format", b"html"),
+        )
+    )
+
+    # Assert - 驗證結果
+    assert missing is None
+    assert wrong is None
+    assert selected.inline is True
+    assert selected.format == "html"
+    assert "-api_v1_auth_me-" in selected.filename
+
+
+def test_select_sampled_requests_are_saved_not_inline():
+    """測試隨機取樣的請求一律存檔，inline header 無效。"""
+    # Arrange - 準備測試資料和依賴
+    profiler = RequestProfiler(sample_rate=1.0)
+
+    # Act - 執行受測操作
+    selected = profiler.select(make_scope((b"x-profile-output", b"inline")))
+
+    # Assert - 驗證結果
+    assert selected.inline is False
+    assert selected.filename.endswith(".speedscope.json")
+
+
+def test_disabled_profiler_selects_nothing():
+    """測試未設定 token 與 sample rate 時停用。"""
+    profiler = RequestProfiler()
+
+    assert profiler.enabled is False
+    assert profiler.select(make_scope((b"x-profile", b""))) is None
+
+
+async def test_start_render_and_save_speedscope(tmp_path):
+    """測試 profile 一段程式並輸出 speedscope JSON 檔案。"""
+    # Arrange - 準備測試資料和依賴
+    profiler = RequestProfiler(output_dir=str(tmp_path), interval_seconds=0.0001)
+
+    # Act - 執行受測操作
+    session = profiler.start()
+    sum(i * i for i in range(200_000))
+    content, content_type = profiler.render(session, "speedscope")
+    path = profiler.save(content, "profile.speedscope.json")
+
+    # Assert - 驗證結果
+    assert content_type == "application/json"
+    assert "speedscope" in json.loads(path.read_bytes())["$schema"]
@@ -0,0 +1,114 @@
+"""Unit tests for rate limit stores."""
+
+from unittest.mock import AsyncMock, Mock
+
+import fakeredis
+import pytest
+
+from app.infrastructure.rate_limit import (
+    InMemoryRateLimitStore,
+    RedisRateLimitStore,
+    TokenBucket,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    """可手動前進的時鐘。"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_in_memory_allows_burst_then_limits():
+    """測試 burst 用完後拒絕，並回傳下一個 token 的等待秒數。"""
+    # Arrange - 準備測試資料和依賴
+    store = InMemoryRateLimitStore(clock=FakeClock())
+    bucket = TokenBucket(rate=0.5, burst=3)
+
+    # Act - 執行受測操作
+    results = [await store.acquire("ip:1", bucket) for _ in range(4)]
+
+    # Assert - 驗證結果
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert results[3] == pytest.approx(2.0)
+
+
+async def test_in_memory_refills_over_time_and_keys_are_independent():
+    """測試 token 依 rate 補充，且不同 key 互不影響。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    store = InMemoryRateLimitStore(clock=clock)
+    bucket = TokenBucket.per_minute(60, burst=1)
+    await store.acquire("ip:1", bucket)
+
+    # Act - 執行受測操作
+    denied = await store.acquire("ip:1", bucket)
+    other = await store.acquire("ip:2", bucket)
+    clock.now += 1.0
+    refilled = await store.acquire("ip:1", bucket)
+
+    # Assert - 驗證結果
+    assert denied > 0
+    assert other == 0.0
+    assert refilled == 0.0
+
+
+async def test_in_memory_sweeps_idle_buckets():
+    """測試超過 max_keys 時清除已補滿的 bucket。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    store = InMemoryRateLimitStore(max_keys=2, clock=clock)
+    bucket = TokenBucket(rate=1.0, burst=1)
+    await store.acquire("a", bucket)
+    await store.acquire("b", bucket)
+    clock.now += 5
+
+    # Act - 執行受測操作
+    await store.acquire("c", bucket)
+
+    # Assert - 驗證結果
+    assert set(store._buckets) == {"c"}
+
+
+async def test_redis_store_shares_bucket_between_instances():
+    """測試兩個副本透過 Redis 共用同一個 bucket。"""
+    # Arrange - 準備測試資料和依賴
+    redis = fakeredis.FakeAsyncRedis()
+    first = RedisRateLimitStore(redis)
+    second = RedisRateLimitStore(redis)
+    bucket = TokenBucket(rate=1 / 60, burst=2)
+
+    # Act - 執行受測操作
+    results = [
+        await first.acquire("ip:1", bucket),
+        await second.acquire("ip:1", bucket),
+        await first.acquire("ip:1", bucket),
+    ]
+
+    # Assert - 驗證結果
+    assert results[:2] == [0.0, 0.0]
+    assert 59 < results[2] <= 60
+
+
+async def test_redis_store_fails_open():
+    """測試 Redis 無法連線時放行請求。"""
+    # Arrange - 準備測試資料和依賴
+    redis = Mock()
+    redis.register_script.return_value = AsyncMock(side_effect=ConnectionError("down"))
+    store = RedisRateLimitStore(redis)
+
+    # Act - 執行受測操作
+    wait = await store.acquire("ip:1", TokenBucket(rate=1.0, burst=1))
+
+    # Assert - 驗證結果
+    assert wait == 0.0
+
+
+def test_retry_after_rounds_up():
+    """測試 Retry-After 無條件進位且至少 1 秒。"""
+    assert retry_after_seconds(0.01) == 1
+    assert retry_after_seconds(2.2) == 3
@@ -0,0 +1,201 @@
+"""Unit tests for upstream resilience (deadline, circuit breaker, hedged reads)."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.metrics import Metrics
+from app.infrastructure.resilience import CircuitState, Resilience
+from app.use_cases.exceptions import UpstreamUnavailableError
+from app.use_cases.health.ports import AsyncDatabaseRepository
+
+PORT = "AsyncDatabaseRepository"
+
+
+class UpstreamError(Exception):
+    """模擬的上游錯誤（status 為 HTTP 狀態碼）。"""
+
+    def __init__(self, status: int = 503):
+        super().__init__(f"upstream returned {status}")
+        self.status = status
+
+
+class FaultyDatabaseRepository(AsyncDatabaseRepository):
+    """依序套用注入的錯誤與延遲的 Repository（用完後正常回應）。"""
+
+    def __init__(self, errors: list[Exception] | None = None, delays: list[float] | None = None):
+        self.errors = list(errors or [])
+        self.delays = list(delays or [])
+        self.calls = 0
+
+    async def check_connection(self) -> str:
+        self.calls += 1
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        if self.errors:
+            raise self.errors.pop(0)
+        return "connected"
+
+
+class FakeClock:
+    """手動推進的時間來源。"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def sample(metrics: Metrics, name: str, **labels) -> float | None:
+    """讀取指標數值。"""
+    return metrics.registry.get_sample_value(name, labels)
+
+
+async def test_breaker_opens_after_consecutive_failures_and_fails_fast():
+    """測試連續失敗達門檻後斷路器開啟，之後的呼叫不送到上游並附 retry_after。"""
+    # Arrange - 準備測試資料和依賴
+    metrics = Metrics()
+    clock = FakeClock()
+    resilience = Resilience(failure_threshold=3, recovery_seconds=30, metrics=metrics, clock=clock)
+    upstream = FaultyDatabaseRepository(errors=[UpstreamError()] * 3)
+    repo = resilience.wrap(upstream, port=PORT)
+    for _ in range(3):
+        with pytest.raises(UpstreamError):
+            await repo.check_connection()
+    clock.now = 10.0
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(UpstreamUnavailableError) as exc_info:
+        await repo.check_connection()
+
+    assert exc_info.value.retry_after == 20.0
+    assert upstream.calls == 3
+    assert resilience.breaker(PORT).state is CircuitState.OPEN
+    assert sample(metrics, "upstream_circuit_state", port=PORT) == CircuitState.OPEN
+    assert sample(metrics, "upstream_circuit_trips_total", port=PORT) == 1
+    assert sample(metrics, "upstream_circuit_rejections_total", port=PORT) == 1
+
+
+async def test_breaker_half_open_probe_closes_or_reopens():
+    """測試開啟超過 recovery 秒數後放行一個試探呼叫：失敗再次開啟、成功則關閉。"""
+    # Arrange - 準備測試資料和依賴
+    metrics = Metrics()
+    clock = FakeClock()
+    resilience = Resilience(failure_threshold=1, recovery_seconds=5, metrics=metrics, clock=clock)
+    upstream = FaultyDatabaseRepository(errors=[UpstreamError(), UpstreamError()])
+    repo = resilience.wrap(upstream, port=PORT)
+    breaker = resilience.breaker(PORT)
+    with pytest.raises(UpstreamError):
+        await repo.check_connection()
+
+    # Act - 執行受測操作
+    clock.now = 5.0
+    with pytest.raises(UpstreamError):
+        await repo.check_connection()  # 試探失敗
+    state_after_failed_probe = breaker.state
+    clock.now = 10.0
+    result = await repo.check_connection()  # 試探成功
+
+    # Assert - 驗證結果
+    assert state_after_failed_probe is CircuitState.OPEN
+    assert result == "connected"
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.trips == 2
+    assert sample(metrics, "upstream_circuit_trips_total", port=PORT) == 2
+    assert sample(metrics, "upstream_circuit_state", port=PORT) == CircuitState.CLOSED
+
+
+async def test_breaker_allows_single_probe_while_half_open():
+    """測試 half-open 時只放行一個試探呼叫，其餘呼叫快速失敗。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    resilience = Resilience(failure_threshold=1, recovery_seconds=5, clock=clock)
+    upstream = FaultyDatabaseRepository(errors=[UpstreamError()], delays=[0.0, 0.05])
+    repo = resilience.wrap(upstream, port=PORT)
+    with pytest.raises(UpstreamError):
+        await repo.check_connection()
+    clock.now = 5.0
+
+    # Act - 執行受測操作
+    results = await asyncio.gather(
+        *(repo.check_connection() for _ in range(3)), return_exceptions=True
+    )
+
+    # Assert - 驗證結果
+    assert results[0] == "connected"
+    assert all(isinstance(r, UpstreamUnavailableError) for r in results[1:])
+    assert upstream.calls == 2
+
+
+async def test_client_errors_do_not_trip_breaker():
+    """測試上游回應 4xx（例如密碼錯誤）不計為失敗，429 則計為失敗。"""
+    # Arrange - 準備測試資料和依賴
+    resilience = Resilience(failure_threshold=2)
+    upstream = FaultyDatabaseRepository(
+        errors=[UpstreamError(400), UpstreamError(400), UpstreamError(429), UpstreamError(429)]
+    )
+    repo = resilience.wrap(upstream, port=PORT)
+
+    # Act - 執行受測操作
+    states = []
+    for _ in range(4):
+        with pytest.raises(UpstreamError):
+            await repo.check_connection()
+        states.append(resilience.breaker(PORT).state)
+
+    # Assert - 驗證結果
+    assert states == [CircuitState.CLOSED] * 3 + [CircuitState.OPEN]
+
+
+async def test_deadline_cancels_slow_call_and_counts_as_failure():
+    """測試超過 deadline 的呼叫被取消並拋出 UpstreamUnavailableError，計入斷路器失敗。"""
+    # Arrange - 準備測試資料和依賴
+    resilience = Resilience(deadline_seconds=0.02, failure_threshold=1)
+    upstream = FaultyDatabaseRepository(delays=[1.0])
+    repo = resilience.wrap(upstream, port=PORT)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(UpstreamUnavailableError, match="deadline"):
+        await repo.check_connection()
+
+    assert loop.time() - started < 0.5
+    assert resilience.breaker(PORT).state is CircuitState.OPEN
+
+
+async def test_hedged_read_returns_faster_attempt():
+    """測試冪等讀取超過 hedge 延遲時送出第二次呼叫，回傳先完成的結果。"""
+    # Arrange - 準備測試資料和依賴
+    metrics = Metrics()
+    resilience = Resilience(hedge_delay_seconds=0.02, metrics=metrics)
+    upstream = FaultyDatabaseRepository(delays=[1.0, 0.0])
+    repo = resilience.wrap(upstream, port=PORT, hedged_methods=("check_connection",))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    # Act - 執行受測操作
+    result = await repo.check_connection()
+
+    # Assert - 驗證結果
+    assert result == "connected"
+    assert loop.time() - started < 0.5
+    assert upstream.calls == 2
+    labels = {"port": PORT, "method": "check_connection"}
+    assert sample(metrics, "upstream_hedged_calls_total", **labels) == 1
+
+
+async def test_methods_not_listed_are_not_hedged():
+    """測試未列為冪等讀取的方法不會 hedge。"""
+    # Arrange - 準備測試資料和依賴
+    resilience = Resilience(hedge_delay_seconds=0.01)
+    upstream = FaultyDatabaseRepository(delays=[0.05])
+    repo = resilience.wrap(upstream, port=PORT)
+
+    # Act - 執行受測操作
+    result = await repo.check_connection()
+
+    # Assert - 驗證結果
+    assert result == "connected"
+    assert upstream.calls == 1
@@ -0,0 +1,108 @@
+"""Unit tests for production server options."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.config import ConfigError, Settings
+from app.infrastructure.server import ServerOptions, available_cpus, logger
+
+BASE_ENV = {"SUPABASE_URL": "https://example.supabase.co", "SUPABASE_ANON_KEY": "anon-key"}
+
+
+def test_server_options_from_settings_defaults_to_available_cpus():
+    """測試未設定 worker 數時依可用 CPU 數，並套用正式環境預設值。"""
+    # Arrange - 準備測試資料
+    settings = Settings.from_env(BASE_ENV)
+
+    # Act - 執行受測操作
+    options = ServerOptions.from_settings(settings)
+
+    # Assert - 驗證結果
+    assert options.workers == available_cpus() >= 1
+    assert options.keepalive_seconds == 75
+    assert options.graceful_timeout_seconds == 30
+    assert options.max_requests == 10_000
+
+
+def test_uvicorn_kwargs_adds_jitter_to_max_requests():
+    """測試每個 worker 的 max requests 加上 jitter，且在範圍內。"""
+    # Arrange - 準備測試資料
+    options = ServerOptions(max_requests=1000, max_requests_jitter=100)
+    rng = random.Random(0)
+
+    # Act - 執行受測操作
+    limits = {options.uvicorn_kwargs(rng)["limit_max_requests"] for _ in range(50)}
+
+    # Assert - 驗證結果
+    assert len(limits) > 1
+    assert all(1000 <= limit <= 1100 for limit in limits)
+
+
+def test_uvicorn_kwargs_disables_unset_limits():
+    """測試 max requests 與並行上限為 0 時不傳給 uvicorn。"""
+    # Arrange - 準備測試資料
+    options = ServerOptions(max_requests=0, limit_concurrency=0, keepalive_seconds=65)
+
+    # Act - 執行受測操作
+    kwargs = options.uvicorn_kwargs()
+
+    # Assert - 驗證結果
+    assert kwargs["limit_max_requests"] is None
+    assert kwargs["limit_concurrency"] is None
+    assert kwargs["timeout_keep_alive"] == 65
+
+
+def test_settings_server_options_from_env():
+    """測試伺服器設定從環境變數讀取。"""
+    # Arrange - 準備測試資料
+    environ = {
+        **BASE_ENV,
+        "SERVER_WORKERS": "3",
+        "SERVER_LOOP": "asyncio",
+        "SERVER_HTTP": "h11",
+        "SERVER_ACCESS_LOG": "false",
+    }
+
+    # Act - 執行受測操作
+    options = ServerOptions.from_settings(Settings.from_env(environ))
+
+    # Assert - 驗證結果
+    assert (options.workers, options.loop, options.http) == (3, "asyncio", "h11")
+    assert options.access_log is False
+
+
+@pytest.mark.parametrize(
+    ("extra_env", "warned"),
+    [
+        ({"SERVER_WORKERS": "4"}, True),
+        ({"SERVER_WORKERS": "4", "REDIS_URL": "redis://localhost:6379/0"}, False),
+        ({"SERVER_WORKERS": "1"}, False),
+    ],
+)
+def test_server_options_warn_when_workers_do_not_share_state(extra_env, warned):
+    """測試多 worker 且未設定 Redis 時警告限流與快取不跨 worker 共用。"""
+    # Arrange - 準備測試資料
+    settings = Settings.from_env({**BASE_ENV, **extra_env})
+
+    # Act - 執行受測操作
+    with patch.object(logger, "warning") as warning:
+        ServerOptions.from_settings(settings)
+
+    # Assert - 驗證結果
+    assert any("REDIS_URL" in call.args[0] for call in warning.call_args_list) is warned
+
+
+def test_settings_rejects_unknown_server_loop():
+    """測試不支援的 event loop / HTTP parser 設定於啟動時回報。"""
+    # Arrange - 準備測試資料
+    environ = {**BASE_ENV, "SERVER_LOOP": "trio", "SERVER_ACCESS_LOG": "yes"}
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ConfigError) as exc_info:
+        Settings.from_env(environ)
+
+    message = str(exc_info.value)
+    assert "SERVER_LOOP" in message
+    assert "SERVER_ACCESS_LOG" in message
@@ -0,0 +1,153 @@
+"""Unit tests for TwoTierCache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import fakeredis
+import pytest
+
+from app.infrastructure.cache import TwoTierCache
+
+
+class FakeClock:
+    """可手動前進的時鐘。"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_loader(value: bytes = b"data", delay: float = 0.0) -> AsyncMock:
+    """建立會等待 delay 秒後回傳 value 的 loader。"""
+
+    async def load():
+        await asyncio.sleep(delay)
+        return value
+
+    return AsyncMock(side_effect=load)
+
+
+async def test_concurrent_misses_trigger_single_load():
+    """測試同一個 key 50 個並發查詢只呼叫一次 loader。"""
+    # Arrange - 準備測試資料和依賴
+    cache = TwoTierCache(remote=fakeredis.FakeAsyncRedis())
+    loader = make_loader(delay=0.01)
+
+    # Act - 執行受測操作
+    results = await asyncio.gather(
+        *(cache.get_or_load("B000000001", loader, ttl_seconds=60) for _ in range(50))
+    )
+
+    # Assert - 驗證結果
+    assert results == [b"data"] * 50
+    assert loader.await_count == 1
+    assert cache.stats.misses == 50
+    assert cache.stats.coalesced == 49
+
+
+async def test_remote_hit_shared_across_instances():
+    """測試另一個程序（另一個 local LRU）可從 Redis 取得已載入的值。"""
+    # Arrange - 準備測試資料和依賴
+    redis = fakeredis.FakeAsyncRedis()
+    writer = TwoTierCache(remote=redis)
+    reader = TwoTierCache(remote=redis)
+    await writer.get_or_load("key", make_loader(), ttl_seconds=60)
+    loader = make_loader(b"other")
+
+    # Act - 執行受測操作
+    value = await reader.get_or_load("key", loader, ttl_seconds=60)
+    again = await reader.get("key")
+
+    # Assert - 驗證結果
+    assert value == again == b"data"
+    loader.assert_not_awaited()
+    assert (reader.stats.remote_hits, reader.stats.local_hits) == (1, 1)
+
+
+async def test_stale_value_returned_while_revalidating():
+    """測試過期但在 stale 區間內的值先回傳，並於背景重新載入。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    cache = TwoTierCache(clock=clock)
+    await cache.get_or_load("key", make_loader(b"old"), ttl_seconds=10, stale_seconds=60)
+    clock.now += 30
+    loader = make_loader(b"new")
+
+    # Act - 執行受測操作
+    stale = await cache.get_or_load("key", loader, ttl_seconds=10, stale_seconds=60)
+    await asyncio.sleep(0.01)  # 等待背景更新完成
+    fresh = await cache.get_or_load("key", loader, ttl_seconds=10, stale_seconds=60)
+
+    # Assert - 驗證結果
+    assert (stale, fresh) == (b"old", b"new")
+    assert loader.await_count == 1
+    assert cache.stats.stale_hits == 1
+
+
+async def test_expired_beyond_stale_window_is_miss():
+    """測試超過 stale 區間的值視為未命中並同步重新載入。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    cache = TwoTierCache(clock=clock)
+    await cache.set("key", b"old", ttl_seconds=10)
+    clock.now += 11
+
+    # Act - 執行受測操作
+    cached = await cache.get("key")
+    value = await cache.get_or_load("key", make_loader(b"new"), ttl_seconds=10)
+
+    # Assert - 驗證結果
+    assert cached is None
+    assert value == b"new"
+
+
+async def test_lru_evicts_least_recently_used():
+    """測試 local LRU 超過上限時淘汰最久未使用的 key。"""
+    # Arrange - 準備測試資料和依賴
+    cache = TwoTierCache(local_max_entries=2)
+    await cache.set("a", b"1", ttl_seconds=60)
+    await cache.set("b", b"2", ttl_seconds=60)
+    await cache.get("a")
+
+    # Act - 執行受測操作
+    await cache.set("c", b"3", ttl_seconds=60)
+
+    # Assert - 驗證結果
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1"
+    assert cache.stats.evictions == 1
+
+
+async def test_loader_error_propagates_and_is_not_cached():
+    """測試 loader 失敗時所有等待者收到例外，且不寫入快取。"""
+    # Arrange - 準備測試資料和依賴
+    cache = TwoTierCache()
+    loader = AsyncMock(side_effect=RuntimeError("scraper down"))
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("key", loader, ttl_seconds=60)
+
+    assert await cache.get("key") is None
+    assert cache.stats.load_errors == 1
+
+
+async def test_remote_failure_degrades_to_local():
+    """測試 Redis 故障時仍可使用 local LRU。"""
+    # Arrange - 準備測試資料和依賴
+    redis = AsyncMock()
+    redis.get.side_effect = ConnectionError("redis down")
+    redis.set.side_effect = ConnectionError("redis down")
+    cache = TwoTierCache(remote=redis)
+    loader = make_loader()
+
+    # Act - 執行受測操作
+    first = await cache.get_or_load("key", loader, ttl_seconds=60)
+    second = await cache.get_or_load("key", loader, ttl_seconds=60)
+
+    # Assert - 驗證結果
+    assert first == second == b"data"
+    assert loader.await_count == 1
+    assert cache.stats.remote_errors == 2
@@ -0,0 +1,213 @@
+"""Unit tests for the authentication router."""
+
+import json
+
+import httpx
+from fastapi import FastAPI
+
+from app.adapters.api.middleware.rate_limit import RateLimiter, RateLimitMiddleware, RouteLimit
+from app.adapters.api.routers import auth
+from app.domain.entities.user import User
+from app.infrastructure.cache import TwoTierCache
+from app.infrastructure.config import Settings
+from app.infrastructure.rate_limit import InMemoryRateLimitStore, TokenBucket
+from app.main import upstream_unavailable
+from app.use_cases.auth.ports import AsyncAuthRepository, TokenVerifier
+from app.use_cases.exceptions import InvalidTokenError, UpstreamUnavailableError
+
+SIGNUP_LIMIT = TokenBucket(rate=0.001, burst=3)
+BULK_SIGNUP_LIMIT = TokenBucket(rate=0.001, burst=8)
+
+
+class FakeTokenVerifier(TokenVerifier):
+    """以固定對照表驗證 token。"""
+
+    def __init__(self, payloads: dict[str, dict]):
+        self.payloads = payloads
+
+    async def verify(self, token):
+        if token not in self.payloads:
+            raise InvalidTokenError("Invalid token")
+        return self.payloads[token]
+
+
+class RejectedError(Exception):
+    """上游以 4xx 拒絕請求（例如帳密錯誤）。"""
+
+    status = 400
+
+
+class FakeAuthRepository(AsyncAuthRepository):
+    """記錄註冊呼叫的上游（login_error 不為 None 時登入拋出該例外）。"""
+
+    def __init__(self, login_error: Exception | None = None):
+        self.signups: list[str] = []
+        self.login_error = login_error
+
+    async def signup(self, email, password):
+        self.signups.append(email)
+        return User(id=f"id-{len(self.signups)}", email=email)
+
+    async def login(self, email, password):
+        raise self.login_error
+
+    async def login_session(self, email, password):
+        raise NotImplementedError
+
+    async def refresh_session(self, refresh_token):
+        raise NotImplementedError
+
+    async def logout(self, access_token):
+        raise NotImplementedError
+
+
+def make_app(auth_repository: AsyncAuthRepository) -> FastAPI:
+    """建立掛上 auth router 與限流（匿名註冊 per-IP、批次註冊 per-user）的 app。"""
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_exception_handler(UpstreamUnavailableError, upstream_unavailable)
+    token_verifier = FakeTokenVerifier(
+        {
+            "agency-token": {
+                "sub": "agency",
+                "email": "agency@example.com",
+                "app_metadata": {"role": "agency"},
+            },
+            "admin-token": {
+                "sub": "admin",
+                "email": "admin@example.com",
+                "app_metadata": {"role": "admin"},
+            },
+            "user-token": {"sub": "user", "email": "user@example.com", "app_metadata": {}},
+        }
+    )
+    app.state.settings = Settings(
+        supabase_url="http://supabase.test",
+        supabase_anon_key="anon",
+        upstream_circuit_recovery_seconds=30.0,
+    )
+    app.state.token_verifier = token_verifier
+    app.state.auth_repository = auth_repository
+    app.state.cache = TwoTierCache()
+    app.state.rate_limiter = RateLimiter(
+        store=InMemoryRateLimitStore(),
+        rules=[
+            RouteLimit("/api/v1/auth/signup", per_ip=SIGNUP_LIMIT),
+            RouteLimit("/api/v1/auth/signup/bulk", per_user=BULK_SIGNUP_LIMIT),
+        ],
+        token_verifier=token_verifier,
+    )
+    return app
+
+
+def bulk_body(count: int) -> dict:
+    return {"users": [{"email": f"u{i}@example.com", "password": "pw"} for i in range(count)]}
+
+
+async def test_bulk_signup_requires_admin_or_agency_role():
+    """測試沒有 admin / agency 角色的使用者無法批次註冊。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository()
+    transport = httpx.ASGITransport(app=make_app(repo))
+
+    # Act - 執行受測操作
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/auth/signup/bulk",
+            json=bulk_body(1),
+            headers={"Authorization": "Bearer user-token"},
+        )
+
+    # Assert - 驗證結果
+    assert response.status_code == 403
+    assert repo.signups == []
+
+
+async def test_bulk_signup_uses_caller_budget_not_anonymous_signup_limit():
+    """測試批次註冊不受匿名註冊 per-IP 額度限制，且不消耗該額度。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository()
+    transport = httpx.ASGITransport(app=make_app(repo))
+
+    # Act - 執行受測操作
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        bulk = await client.post(
+            "/api/v1/auth/signup/bulk",
+            json=bulk_body(SIGNUP_LIMIT.burst + 3),
+            headers={"Authorization": "Bearer admin-token"},
+        )
+        single = await client.post(
+            "/api/v1/auth/signup", json={"email": "late@example.com", "password": "pw"}
+        )
+
+    # Assert - 驗證結果
+    results = [json.loads(line) for line in bulk.text.splitlines()]
+    assert [r["status"] for r in results] == ["created"] * (SIGNUP_LIMIT.burst + 3)
+    assert single.status_code == 201
+
+
+async def test_bulk_signup_stops_when_caller_budget_is_spent():
+    """測試批次註冊逐筆計入呼叫者額度，用完後停止處理；其他呼叫者的額度不受影響。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository()
+    transport = httpx.ASGITransport(app=make_app(repo))
+    count = BULK_SIGNUP_LIMIT.burst + 2
+
+    # Act - 執行受測操作
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        spent = await client.post(
+            "/api/v1/auth/signup/bulk",
+            json=bulk_body(count),
+            headers={"Authorization": "Bearer admin-token"},
+        )
+        other = await client.post(
+            "/api/v1/auth/signup/bulk",
+            json={"users": [{"email": "x@example.com", "password": "pw"}]},
+            headers={"Authorization": "Bearer agency-token"},
+        )
+
+    # Assert - 驗證結果
+    results = sorted(
+        (json.loads(line) for line in spent.text.splitlines()), key=lambda r: r["index"]
+    )
+    burst = BULK_SIGNUP_LIMIT.burst
+    assert [r["status"] for r in results] == ["created"] * burst + ["failed"]
+    assert results[burst]["error"].startswith("Too Many Requests")
+    assert [json.loads(line)["status"] for line in other.text.splitlines()] == ["created"]
+    assert len(repo.signups) == burst + 1
+
+
+async def test_login_upstream_failure_returns_503_with_retry_after():
+    """測試上游連線失敗時回應 503 與 Retry-After，而非當成帳密錯誤回應 401。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(login_error=ConnectionError("connect to 10.0.0.5 failed"))
+    transport = httpx.ASGITransport(app=make_app(repo))
+
+    # Act - 執行受測操作
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": "a@example.com", "password": "pw"}
+        )
+
+    # Assert - 驗證結果
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
+    assert "10.0.0.5" not in response.text
+
+
+async def test_login_rejected_by_upstream_returns_401():
+    """測試上游以 4xx 拒絕（帳密錯誤）時仍回應 401。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(login_error=RejectedError("Invalid login credentials"))
+    transport = httpx.ASGITransport(app=make_app(repo))
+
+    # Act - 執行受測操作
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": "a@example.com", "password": "pw"}
+        )
+
+    # Assert - 驗證結果
+    assert response.status_code == 401
+    assert "Retry-After" not in response.headers
@@ -0,0 +1,200 @@
+"""Unit tests for AsyncBulkSignupUseCase."""
+
+import asyncio
+
+import fakeredis
+
+from app.domain.entities.user import User
+from app.infrastructure.cache import TwoTierCache
+from app.use_cases.auth.bulk_signup_use_case import (
+    AsyncBulkSignupUseCase,
+    InvalidSignupItem,
+    SignupItem,
+)
+from app.use_cases.auth.ports import AsyncAuthRepository
+
+
+class FakeAuthRepository(AsyncAuthRepository):
+    """記錄註冊與最大並行數的上游（email 已存在時失敗）。"""
+
+    def __init__(self, delay: float = 0.0, fail_emails=()):
+        self.delay = delay
+        self.fail_emails = set(fail_emails)
+        self.users: dict[str, User] = {}
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def signup(self, email, password):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if email in self.fail_emails or email in self.users:
+                raise Exception("User already registered")
+            user = self.users[email] = User(id=f"id-{len(self.users)}", email=email)
+            return user
+        finally:
+            self.active -= 1
+
+    async def login(self, email, password):
+        raise NotImplementedError
+
+    async def login_session(self, email, password):
+        raise NotImplementedError
+
+    async def refresh_session(self, refresh_token):
+        raise NotImplementedError
+
+    async def logout(self, access_token):
+        raise NotImplementedError
+
+
+async def items_of(*items):
+    """將項目包成 async iterator。"""
+    for item in items:
+        yield item
+
+
+async def collect(use_case, items, scope="agency"):
+    """收集所有結果並依輸入順序排序。"""
+    results = [result async for result in use_case.stream(items, scope=scope)]
+    return sorted(results, key=lambda result: result.index)
+
+
+async def test_bulk_signup_runs_with_bounded_concurrency():
+    """測試批次註冊並行但不超過上限，並回傳每筆結果。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(delay=0.01)
+    target = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache(), concurrency=4)
+    items = [SignupItem(email=f"user{i}@example.com", password="pw") for i in range(20)]
+
+    # Act - 執行受測操作
+    results = await collect(target, items_of(*items))
+
+    # Assert - 驗證結果
+    assert [result.index for result in results] == list(range(20))
+    assert all(result.status == "created" for result in results)
+    assert [result.user.email for result in results] == [item.email for item in items]
+    assert repo.max_active == 4
+    assert target.stats.created == 20
+
+
+async def test_bulk_signup_streams_results_before_batch_completes():
+    """測試先完成的項目先回傳，不等待整批完成。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(delay=0.01)
+    target = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache(), concurrency=2)
+    items = [SignupItem(email=f"user{i}@example.com", password="pw") for i in range(10)]
+
+    # Act - 執行受測操作
+    stream = target.stream(items_of(*items))
+    first = await anext(stream)
+    calls_at_first = repo.calls
+    await stream.aclose()
+
+    # Assert - 驗證結果
+    assert first.status == "created"
+    assert calls_at_first < len(items)
+
+
+async def test_failed_and_invalid_items_do_not_stop_batch():
+    """測試單筆失敗或格式錯誤時其他項目照常註冊。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(fail_emails={"taken@example.com"})
+    target = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache())
+
+    # Act - 執行受測操作
+    results = await collect(
+        target,
+        items_of(
+            SignupItem(email="taken@example.com", password="pw"),
+            InvalidSignupItem(error="Invalid item: value is not a valid email address"),
+            SignupItem(email="new@example.com", password="pw"),
+        ),
+    )
+
+    # Assert - 驗證結果
+    assert [result.status for result in results] == ["failed", "failed", "created"]
+    assert results[0].error == "User already registered"
+    assert results[1].email is None
+    assert repo.calls == 2
+    assert (target.stats.created, target.stats.failed) == (1, 2)
+
+
+async def test_retry_with_idempotency_key_replays_result():
+    """測試以相同 idempotency key 重試時回傳原結果，不重複建立使用者。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository()
+    cache = TwoTierCache(remote=fakeredis.FakeAsyncRedis())
+    item = SignupItem(email="seller@example.com", password="pw", idempotency_key="seller-1")
+    first_run = AsyncBulkSignupUseCase(auth_repo=repo, cache=cache)
+    [created] = await collect(first_run, items_of(item))
+
+    # Act - 執行受測操作（另一個程序重試，只共用 Redis）
+    retry = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache(remote=cache.remote))
+    [replayed] = await collect(retry, items_of(item))
+
+    # Assert - 驗證結果
+    assert replayed.status == "created"
+    assert replayed.replayed is True
+    assert replayed.user == created.user
+    assert repo.calls == 1
+    assert retry.stats.replayed == 1
+
+
+async def test_concurrent_items_with_same_key_sign_up_once():
+    """測試同一個 key 同時出現時只註冊一次。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(delay=0.01)
+    target = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache())
+    item = SignupItem(email="seller@example.com", password="pw", idempotency_key="seller-1")
+
+    # Act - 執行受測操作
+    results = await collect(target, items_of(item, item, item))
+
+    # Assert - 驗證結果
+    assert [result.status for result in results] == ["created"] * 3
+    assert repo.calls == 1
+
+
+async def test_failed_item_is_not_recorded_for_idempotency():
+    """測試失敗的項目不保存冪等紀錄，重試時重新註冊。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository(fail_emails={"seller@example.com"})
+    target = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache())
+    item = SignupItem(email="seller@example.com", password="pw", idempotency_key="seller-1")
+    await collect(target, items_of(item))
+    repo.fail_emails.clear()
+
+    # Act - 執行受測操作
+    [result] = await collect(target, items_of(item))
+
+    # Assert - 驗證結果
+    assert result.status == "created"
+    assert result.replayed is False
+    assert repo.calls == 2
+
+
+async def test_idempotency_keys_are_scoped_per_caller():
+    """測試不同呼叫者的相同 key 互不影響，且 key 不可用於不同 email。"""
+    # Arrange - 準備測試資料和依賴
+    repo = FakeAuthRepository()
+    target = AsyncBulkSignupUseCase(auth_repo=repo, cache=TwoTierCache())
+    await collect(target, items_of(SignupItem("a@example.com", "pw", "key-1")), scope="agency-a")
+
+    # Act - 執行受測操作
+    [other_caller] = await collect(
+        target, items_of(SignupItem("b@example.com", "pw", "key-1")), scope="agency-b"
+    )
+    [reused_key] = await collect(
+        target, items_of(SignupItem("c@example.com", "pw", "key-1")), scope="agency-a"
+    )
+
+    # Assert - 驗證結果
+    assert other_caller.status == "created"
+    assert other_caller.user.email == "b@example.com"
+    assert reused_key.status == "failed"
+    assert "different email" in reused_key.error
+    assert repo.calls == 2
@@ -0,0 +1,295 @@
+"""Unit tests for CachedAuthRepository."""
+
+import asyncio
+import base64
+import json
+
+import pytest
+
+from app.adapters.repositories.cached_auth_repository import CachedAuthRepository
+from app.domain.entities.user import User
+from app.use_cases.auth.ports import AsyncAuthRepository, AuthSession
+
+EMAIL = "alice@example.com"
+PASSWORD = "password123"
+
+
+def make_token(user_id: str, serial: int) -> str:
+    """建立未簽章、只含 sub 的測試用 JWT。"""
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": user_id, "n": serial}).encode())
+    return f"header.{payload.decode().rstrip('=')}.signature"
+
+
+class FakeClock:
+    """可手動推進的時鐘。"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeAuthRepository(AsyncAuthRepository):
+    """記錄呼叫次數的上游，簽發 ``expires_in`` 秒後到期的 session。"""
+
+    def __init__(self, clock: FakeClock, expires_in: float = 3600.0, delay: float = 0.0):
+        self.clock = clock
+        self.expires_in = expires_in
+        self.delay = delay
+        self.logins = 0
+        self.refreshes = 0
+        self.logouts: list[str] = []
+        self.fail_refresh = False
+        self.password = PASSWORD
+        self._serial = 0
+
+    def _session(self, email: str) -> AuthSession:
+        self._serial += 1
+        user_id = f"id-{email}"
+        return AuthSession(
+            access_token=make_token(user_id, self._serial),
+            refresh_token=f"refresh-{self._serial}",
+            expires_at=self.clock() + self.expires_in,
+            user=User(id=user_id, email=email),
+        )
+
+    async def signup(self, email, password):
+        return User(id=f"id-{email}", email=email)
+
+    async def login(self, email, password):
+        session = await self.login_session(email, password)
+        return (session.access_token, session.user)
+
+    async def login_session(self, email, password):
+        self.logins += 1
+        await asyncio.sleep(self.delay)
+        if password != self.password:
+            raise Exception("Invalid login credentials")
+        return self._session(email)
+
+    async def refresh_session(self, refresh_token):
+        self.refreshes += 1
+        if self.fail_refresh:
+            raise Exception("Invalid Refresh Token")
+        return self._session(EMAIL)
+
+    async def logout(self, access_token):
+        self.logouts.append(access_token)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def upstream(clock):
+    return FakeAuthRepository(clock)
+
+
+async def test_repeated_login_reuses_cached_session(clock, upstream):
+    """測試重複登入重用 session，不再呼叫上游。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock)
+
+    # Act - 執行受測操作
+    first = await target.login(EMAIL, PASSWORD)
+    second = await target.login(EMAIL.upper(), PASSWORD)
+
+    # Assert - 驗證結果
+    assert first == second
+    assert upstream.logins == 1
+    assert (target.stats.misses, target.stats.hits) == (1, 1)
+
+
+async def test_different_password_is_not_served_from_cache(clock, upstream):
+    """測試密碼不同時不使用快取，且登入失敗不快取。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock)
+    await target.login(EMAIL, PASSWORD)
+
+    # Act & Assert - 執行並驗證拋出例外
+    for _ in range(2):
+        with pytest.raises(Exception, match="Invalid login credentials"):
+            await target.login(EMAIL, "wrong-password")
+
+    # Assert - 驗證結果
+    assert upstream.logins == 3
+
+
+async def test_cache_keys_do_not_contain_credentials(clock, upstream):
+    """測試快取 key 為 salted hash，不含明文憑證，且不同 salt 產生不同 key。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock)
+    other = CachedAuthRepository(upstream, clock=clock)
+
+    # Act - 執行受測操作
+    await target.login(EMAIL, PASSWORD)
+    await other.login(EMAIL, PASSWORD)
+
+    # Assert - 驗證結果
+    [key] = target._entries
+    assert PASSWORD.encode() not in key
+    assert EMAIL.encode() not in key
+    assert key not in other._entries
+
+
+async def test_concurrent_logins_share_one_upstream_call(clock):
+    """測試同一組憑證同時登入只有一個上游請求。"""
+    # Arrange - 準備測試資料和依賴
+    upstream = FakeAuthRepository(clock, delay=0.01)
+    target = CachedAuthRepository(upstream, clock=clock)
+
+    # Act - 執行受測操作
+    results = await asyncio.gather(*(target.login(EMAIL, PASSWORD) for _ in range(10)))
+
+    # Assert - 驗證結果
+    assert len(set(results)) == 1
+    assert upstream.logins == 1
+    assert target.stats.coalesced == 9
+
+
+async def test_session_near_expiry_is_refreshed_in_background(clock, upstream):
+    """測試 token 接近到期時以 refresh token 於背景換發。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, refresh_margin_seconds=60, clock=clock)
+    first_token, _ = await target.login(EMAIL, PASSWORD)
+    clock.now += 3600 - 30
+
+    # Act - 執行受測操作
+    served_token, _ = await target.login(EMAIL, PASSWORD)
+    await asyncio.sleep(0)
+    refreshed_token, _ = await target.login(EMAIL, PASSWORD)
+
+    # Assert - 驗證結果
+    assert served_token == first_token  # 換發期間仍回傳目前的 token
+    assert refreshed_token != first_token
+    assert upstream.logins == 1
+    assert upstream.refreshes == 1
+    assert target.stats.refreshes == 1
+
+
+async def test_failed_refresh_drops_cached_session(clock, upstream):
+    """測試換發失敗（例如已在其他地方登出）時移除快取。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, refresh_margin_seconds=60, clock=clock)
+    await target.login(EMAIL, PASSWORD)
+    upstream.fail_refresh = True
+    clock.now += 3600 - 30
+
+    # Act - 執行受測操作
+    await target.login(EMAIL, PASSWORD)
+    await asyncio.sleep(0)
+    await target.login(EMAIL, PASSWORD)
+
+    # Assert - 驗證結果
+    assert target.stats.refresh_errors == 1
+    assert upstream.logins == 2
+
+
+async def test_expired_verification_requires_upstream_login(clock, upstream):
+    """測試超過 max_age 後重新向上游驗證密碼（即使 token 仍有效）。"""
+    # Arrange - 準備測試資料和依賴
+    upstream.expires_in = 10 * 3600
+    target = CachedAuthRepository(upstream, max_age_seconds=600, clock=clock)
+    await target.login(EMAIL, PASSWORD)
+    clock.now += 601
+
+    # Act - 執行受測操作
+    await target.login(EMAIL, PASSWORD)
+
+    # Assert - 驗證結果
+    assert upstream.logins == 2
+    assert upstream.refreshes == 0
+
+
+async def test_least_recently_used_session_is_evicted(clock, upstream):
+    """測試超過上限時淘汰最久未使用的 session。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, max_entries=2, clock=clock)
+    await target.login("a@example.com", PASSWORD)
+    await target.login("b@example.com", PASSWORD)
+    await target.login("a@example.com", PASSWORD)
+
+    # Act - 執行受測操作
+    await target.login("c@example.com", PASSWORD)
+    await target.login("a@example.com", PASSWORD)
+    await target.login("b@example.com", PASSWORD)
+
+    # Assert - 驗證結果
+    assert target.stats.evictions == 2
+    assert upstream.logins == 4  # a, b, c 各一次，b 被淘汰後再一次
+    assert len(target._entries) == 2
+
+
+async def test_logout_invalidates_all_sessions_of_user(clock, upstream):
+    """測試登出時移除該使用者以任何 token 快取的 session。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock)
+    await target.login(EMAIL, PASSWORD)
+    await target.login("bob@example.com", PASSWORD)
+    # 以非快取的 token 登出（例如另一台裝置取得的 token）
+    token = make_token(f"id-{EMAIL}", 999)
+
+    # Act - 執行受測操作
+    await target.logout(token)
+    await target.login(EMAIL, PASSWORD)
+    await target.login("bob@example.com", PASSWORD)
+
+    # Assert - 驗證結果
+    assert upstream.logouts == [token]
+    assert upstream.logins == 3
+    assert target.stats.invalidations == 1
+
+
+async def test_invalidate_user_after_password_change(clock, upstream):
+    """測試 invalidate_user 移除使用者的所有快取 session。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock)
+    await target.login(EMAIL, PASSWORD)
+
+    # Act - 執行受測操作
+    removed = target.invalidate_user(f"id-{EMAIL}")
+    await target.login(EMAIL, PASSWORD)
+
+    # Assert - 驗證結果
+    assert removed == 1
+    assert upstream.logins == 2
+
+
+async def test_login_with_new_password_evicts_sessions_for_old_password(clock, upstream):
+    """測試以新密碼登入成功後，舊密碼不再由快取放行。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock)
+    await target.login(EMAIL, PASSWORD)
+    upstream.password = "new-password"
+
+    # Act - 執行受測操作
+    await target.login(EMAIL, "new-password")
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(Exception, match="Invalid login credentials"):
+        await target.login(EMAIL, PASSWORD)
+
+    # Assert - 驗證結果
+    assert upstream.logins == 3
+    assert len(target._entries) == 1
+
+
+async def test_shared_session_does_not_expose_refresh_token(clock, upstream):
+    """測試回傳的 session 不含 refresh token，背景換發仍以快取保存的 token 進行。"""
+    # Arrange - 準備測試資料和依賴
+    target = CachedAuthRepository(upstream, clock=clock, refresh_margin_seconds=60.0)
+    first = await target.login_session(EMAIL, PASSWORD)
+    clock.now += 3600.0 - 30.0
+
+    # Act - 執行受測操作
+    second = await target.login_session(EMAIL, PASSWORD)
+    await asyncio.sleep(0)
+
+    # Assert - 驗證結果
+    assert first.refresh_token == second.refresh_token == ""
+    assert upstream.refreshes == 1
+    [entry] = target._entries.values()
+    assert entry.session.refresh_token == "refresh-2"
@@ -0,0 +1,175 @@
+"""Unit tests for JwtTokenVerifier and SigningKeyCache."""
+
+import json
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.algorithms import ECAlgorithm
+
+from app.adapters.security.jwt_token_verifier import JwtTokenVerifier, SigningKeyCache
+from app.use_cases.exceptions import InvalidTokenError
+
+SECRET = "test-jwt-secret-0123456789abcdef0123"
+JWKS_URL = "https://example.supabase.co/auth/v1/.well-known/jwks.json"
+
+
+def make_claims(**overrides) -> dict:
+    """建立有效的 access token claims。"""
+    claims = {
+        "sub": "123e4567-e89b-12d3-a456-426614174000",
+        "email": "test@example.com",
+        "aud": "authenticated",
+        "exp": int(time.time()) + 3600,
+    }
+    claims.update(overrides)
+    return claims
+
+
+class CountingKeyCache(SigningKeyCache):
+    """記錄 get_key 呼叫次數的金鑰快取。"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lookups = 0
+
+    async def get_key(self, kid, alg):
+        self.lookups += 1
+        return await super().get_key(kid, alg)
+
+
+class JwksServer:
+    """以 httpx.MockTransport 提供 JWKS 的本機 stub（記錄請求次數）。"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.requests = 0
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return httpx.Response(200, content=self.body)
+
+
+@pytest.fixture
+def es256_key():
+    """ES256 私鑰與對應的 JWKS body（kid 為 key-1）。"""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    jwk = ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": "key-1", "alg": "ES256", "use": "sig"})
+    return private_key, json.dumps({"keys": [jwk]}).encode()
+
+
+async def test_verify_hs256_token_with_shared_secret():
+    """測試以共用密鑰驗證 HS256 token 並回傳 payload。"""
+    # Arrange - 準備測試資料和依賴
+    claims = make_claims()
+    token = jwt.encode(claims, SECRET, algorithm="HS256")
+    target = JwtTokenVerifier(SigningKeyCache(shared_secret=SECRET))
+
+    # Act - 執行受測操作
+    payload = await target.verify(token)
+
+    # Assert - 驗證結果
+    assert payload["sub"] == claims["sub"]
+    assert payload["email"] == claims["email"]
+
+
+async def test_verify_rejects_expired_token():
+    """測試過期的 token 被拒絕。"""
+    # Arrange - 準備測試資料和依賴
+    token = jwt.encode(make_claims(exp=int(time.time()) - 10), SECRET, algorithm="HS256")
+    target = JwtTokenVerifier(SigningKeyCache(shared_secret=SECRET))
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(InvalidTokenError, match="expired"):
+        await target.verify(token)
+
+
+async def test_verify_rejects_token_without_email_claim():
+    """測試缺少 email claim 的 token 被拒絕（而不是之後建立 User 時失敗）。"""
+    # Arrange - 準備測試資料和依賴
+    claims = make_claims()
+    del claims["email"]
+    token = jwt.encode(claims, SECRET, algorithm="HS256")
+    target = JwtTokenVerifier(SigningKeyCache(shared_secret=SECRET))
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(InvalidTokenError, match="email"):
+        await target.verify(token)
+
+
+async def test_verify_es256_token_with_jwks(es256_key):
+    """測試以 JWKS 公鑰驗證 ES256 token，金鑰只取得一次。"""
+    # Arrange - 準備測試資料和依賴
+    private_key, jwks_body = es256_key
+    server = JwksServer(jwks_body)
+    target = JwtTokenVerifier(SigningKeyCache(jwks_url=JWKS_URL, transport=server.transport))
+    tokens = [
+        jwt.encode(make_claims(sub=f"user-{i}"), private_key, "ES256", headers={"kid": "key-1"})
+        for i in range(3)
+    ]
+
+    # Act - 執行受測操作
+    payloads = [await target.verify(token) for token in tokens]
+
+    # Assert - 驗證結果
+    assert [p["sub"] for p in payloads] == ["user-0", "user-1", "user-2"]
+    assert server.requests == 1
+
+
+async def test_unknown_kid_forces_rate_limited_refetch(es256_key):
+    """測試未知 kid 時強制重新取得 JWKS 一次，短時間內不再重複取得。"""
+    # Arrange - 準備測試資料和依賴
+    private_key, jwks_body = es256_key
+    server = JwksServer(jwks_body)
+    target = JwtTokenVerifier(SigningKeyCache(jwks_url=JWKS_URL, transport=server.transport))
+    forged = [
+        jwt.encode(make_claims(), private_key, "ES256", headers={"kid": f"forged-{i}"})
+        for i in range(3)
+    ]
+
+    # Act & Assert - 執行並驗證拋出例外
+    for token in forged:
+        with pytest.raises(InvalidTokenError, match="Unknown signing key"):
+            await target.verify(token)
+
+    assert server.requests == 2  # 第一次載入 + 一次強制更新
+
+
+async def test_malformed_jwks_maps_to_invalid_token(es256_key):
+    """測試 JWKS 回應不是 JSON 時回報 InvalidTokenError（不是 500）。"""
+    # Arrange - 準備測試資料和依賴
+    private_key, _ = es256_key
+    server = JwksServer(b"<html>maintenance</html>")
+    target = JwtTokenVerifier(SigningKeyCache(jwks_url=JWKS_URL, transport=server.transport))
+    token = jwt.encode(make_claims(), private_key, "ES256", headers={"kid": "key-1"})
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(InvalidTokenError, match="malformed JWKS"):
+        await target.verify(token)
+
+
+async def test_verified_tokens_are_cached_in_bounded_lru():
+    """測試已驗證的 token 重複驗證時不再查金鑰，超過上限時淘汰最久未使用的。"""
+    # Arrange - 準備測試資料和依賴
+    keys = CountingKeyCache(shared_secret=SECRET)
+    target = JwtTokenVerifier(keys, cache_size=2)
+    first, second, third = (
+        jwt.encode(make_claims(sub=f"user-{i}"), SECRET, algorithm="HS256") for i in range(3)
+    )
+
+    # Act - 執行受測操作
+    await target.verify(first)
+    await target.verify(first)
+    await target.verify(second)
+    await target.verify(third)  # 淘汰 first
+    lookups_before = keys.lookups
+    await target.verify(third)
+    await target.verify(first)
+
+    # Assert - 驗證結果
+    assert lookups_before == 3
+    assert keys.lookups == 4
@@ -1,11 +1,11 @@
 """Unit tests for LoginUseCase."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from app.domain.entities.user import User
-from app.use_cases.auth.login_use_case import LoginUseCase
+from app.use_cases.auth.login_use_case import AsyncLoginUseCase, LoginUseCase
 
 
 def test_login_use_case_success():
@@ -46,3 +46,38 @@ def test_login_use_case_invalid_credentials():
     # Assert - 驗證例外訊息
     assert error_message in str(exc_info.value)
     mock_auth_repo.login.assert_called_once_with(email, password)
+
+
+async def test_async_login_use_case_success():
+    """測試非同步登入成功。"""
+    # Arrange - 準備測試資料和依賴
+    email = "test@example.com"
+    password = "password123"
+    expected_access_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
+    expected_user = User(id="123e4567-e89b-12d3-a456-426614174000", email=email)
+    mock_auth_repo = Mock()
+    mock_auth_repo.login = AsyncMock(return_value=(expected_access_token, expected_user))
+    target = AsyncLoginUseCase(auth_repo=mock_auth_repo)
+
+    # Act - 執行受測操作
+    result = await target.execute(email=email, password=password)
+
+    # Assert - 驗證結果
+    assert result.access_token == expected_access_token
+    assert result.user == expected_user
+    mock_auth_repo.login.assert_awaited_once_with(email, password)
+
+
+async def test_async_login_use_case_invalid_credentials():
+    """測試非同步登入失敗 - 無效憑證。"""
+    # Arrange - 準備測試資料和依賴
+    error_message = "Invalid login credentials"
+    mock_auth_repo = Mock()
+    mock_auth_repo.login = AsyncMock(side_effect=Exception(error_message))
+    target = AsyncLoginUseCase(auth_repo=mock_auth_repo)
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(Exception) as exc_info:
+        await target.execute(email="test@example.com", password="wrongpassword")
+
+    assert error_message in str(exc_info.value)
@@ -1,11 +1,11 @@
 """Unit tests for SignupUseCase."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from app.domain.entities.user import User
-from app.use_cases.auth.signup_use_case import SignupUseCase
+from app.use_cases.auth.signup_use_case import AsyncSignupUseCase, SignupUseCase
 
 
 def test_signup_use_case_success():
@@ -45,3 +45,22 @@ def test_signup_use_case_email_already_exists():
     # Assert - 驗證例外訊息
     assert error_message in str(exc_info.value)
     mock_auth_repo.signup.assert_called_once_with(email, password)
+
+
+async def test_async_signup_use_case_success():
+    """測試非同步註冊成功。"""
+    # Arrange - 準備測試資料和依賴
+    email = "test@example.com"
+    password = "password123"
+    expected_user = User(id="123e4567-e89b-12d3-a456-426614174000", email=email)
+    mock_auth_repo = Mock()
+    mock_auth_repo.signup = AsyncMock(return_value=expected_user)
+    target = AsyncSignupUseCase(auth_repo=mock_auth_repo)
+
+    # Act - 執行受測操作
+    result = await target.execute(email=email, password=password)
+
+    # Assert - 驗證結果
+    assert result.user == expected_user
+    assert result.message == "User created successfully"
+    mock_auth_repo.signup.assert_awaited_once_with(email, password)
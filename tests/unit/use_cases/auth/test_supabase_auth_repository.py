@@ -0,0 +1,66 @@
+"""Unit tests for the Supabase auth repository and its isolation from data queries."""
+
+import time
+
+import httpx
+
+from app.adapters.repositories.supabase_auth_repository import AsyncSupabaseAuthRepository
+from app.infrastructure.supabase_client import SupabaseClientProvider
+
+ANON_KEY = "anon-key"
+USER_TOKEN = "user-access-token"
+
+
+class SupabaseServer:
+    """以 httpx.MockTransport 模擬 GoTrue 與 PostgREST（記錄請求）。"""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/auth/v1/token":
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": USER_TOKEN,
+                    "refresh_token": "refresh-token",
+                    "token_type": "bearer",
+                    "expires_in": 3600,
+                    "expires_at": int(time.time()) + 3600,
+                    "user": {
+                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "email": "test@example.com",
+                        "aud": "authenticated",
+                        "app_metadata": {},
+                        "user_metadata": {},
+                        "created_at": "2026-01-01T00:00:00Z",
+                    },
+                },
+            )
+        return httpx.Response(200, json=[])
+
+
+async def test_login_does_not_change_data_client_identity():
+    """測試登入後資料查詢仍使用 anon key，而不是剛登入使用者的 token。"""
+    # Arrange - 準備測試資料和依賴
+    server = SupabaseServer()
+    provider = SupabaseClientProvider(
+        "https://example.supabase.co", ANON_KEY, transport=server.transport
+    )
+    data_client = provider.get_async_client()
+    target = AsyncSupabaseAuthRepository(auth_client=provider.get_auth_client())
+
+    # Act - 執行受測操作
+    access_token, user = await target.login("test@example.com", "password")
+    await data_client.table("products").select("*").execute()
+    await provider.aclose()
+
+    # Assert - 驗證結果
+    assert access_token == USER_TOKEN
+    assert user.email == "test@example.com"
+    assert data_client.options.headers["Authorization"] == f"Bearer {ANON_KEY}"
+    query = server.requests[-1]
+    assert query.url.path == "/rest/v1/products"
+    assert query.headers["Authorization"] == f"Bearer {ANON_KEY}"
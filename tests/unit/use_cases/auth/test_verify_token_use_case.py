@@ -0,0 +1,42 @@
+"""Unit tests for VerifyTokenUseCase."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.use_cases.auth.verify_token_use_case import VerifyTokenUseCase
+from app.use_cases.exceptions import InvalidTokenError
+
+
+async def test_verify_token_use_case_success():
+    """測試驗證 token 成功並取得使用者。"""
+    # Arrange - 準備測試資料和依賴
+    token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
+    payload = {
+        "sub": "123e4567-e89b-12d3-a456-426614174000",
+        "email": "test@example.com",
+        "aud": "authenticated",
+    }
+    mock_verifier = Mock()
+    mock_verifier.verify = AsyncMock(return_value=payload)
+    target = VerifyTokenUseCase(token_verifier=mock_verifier)
+
+    # Act - 執行受測操作
+    user = await target.execute(token)
+
+    # Assert - 驗證結果
+    assert user.id == payload["sub"]
+    assert user.email == payload["email"]
+    mock_verifier.verify.assert_awaited_once_with(token)
+
+
+async def test_verify_token_use_case_invalid_token():
+    """測試驗證 token 失敗 - 無效 token。"""
+    # Arrange - 準備測試資料和依賴
+    mock_verifier = Mock()
+    mock_verifier.verify = AsyncMock(side_effect=InvalidTokenError("Signature has expired"))
+    target = VerifyTokenUseCase(token_verifier=mock_verifier)
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(InvalidTokenError):
+        await target.execute("expired-token")
@@ -0,0 +1,93 @@
+"""Unit tests for CompareCompetitorsUseCase."""
+
+import time
+from decimal import Decimal
+
+import pytest
+
+from app.adapters.external.fake_listing_scraper import FakeListingScraper
+from app.use_cases.competitor.compare_competitors_use_case import CompareCompetitorsUseCase
+from app.use_cases.competitor.normalization import ListingNormalizer
+from app.use_cases.exceptions import ProductFetchError
+
+MAIN_URL = "https://www.amazon.com/dp/B000000000"
+COMPETITOR_URLS = [f"https://www.amazon.com/dp/B00000000{i}" for i in range(1, 6)]
+
+
+async def test_compare_fetches_concurrently():
+    """測試所有產品同時爬取，總耗時接近最慢的單次爬取而不是總和。"""
+    # Arrange - 準備測試資料和依賴
+    scraper = FakeListingScraper(latencies={"B000000003": 0.2}, latency_seconds=0.05)
+    target = CompareCompetitorsUseCase(scraper=scraper)
+
+    # Act - 執行受測操作
+    start = time.perf_counter()
+    result = await target.execute(MAIN_URL, COMPETITOR_URLS)
+    elapsed = time.perf_counter() - start
+
+    # Assert - 驗證結果
+    assert scraper.calls == 6
+    assert scraper.max_in_flight == 6
+    assert elapsed < 0.2 + 0.1  # 循序執行需要 0.45 秒
+    assert result.main.asin == "B000000000"
+    assert [c.asin for c in result.competitors] == [f"B00000000{i}" for i in range(1, 6)]
+    assert all(len(row) == 6 for row in result.values.values())
+    assert all(len(row) == 5 for row in result.vs_main.values())
+
+
+async def test_compare_builds_matrix_across_marketplaces():
+    """測試不同站點的競品換算為同一幣別，並計算相對主產品的差異百分比。"""
+    # Arrange - 準備測試資料和依賴
+    scraper = FakeListingScraper(latency_seconds=0)
+    normalizer = ListingNormalizer(currency="USD", exchange_rates={"EUR": Decimal("1.10")})
+    target = CompareCompetitorsUseCase(scraper=scraper, normalizer=normalizer)
+
+    # Act - 執行受測操作
+    result = await target.execute(MAIN_URL, ["https://www.amazon.de/dp/B000000001"])
+
+    # Assert - 驗證結果
+    competitor = result.competitors[0]
+    assert competitor.original_currency == "EUR"
+    assert competitor.price == (competitor.original_price * Decimal("1.10")).quantize(
+        Decimal("0.01")
+    )
+    main_price, competitor_price = result.values["price"]
+    assert result.vs_main["price"] == [round((competitor_price - main_price) / main_price * 100, 2)]
+    assert result.values["bsr_main"] == [result.main.bsr_main, competitor.bsr_main]
+
+
+async def test_compare_records_failed_competitors():
+    """測試競品爬取失敗或逾時時記錄於 errors，其餘結果照常回傳；重複的競品只爬一次。"""
+    # Arrange - 準備測試資料和依賴
+    scraper = FakeListingScraper(
+        latency_seconds=0,
+        latencies={"B000000002": 1.0},
+        failing_asins=frozenset({"B000000001"}),
+    )
+    target = CompareCompetitorsUseCase(scraper=scraper, fetch_timeout_seconds=0.05)
+    urls = [COMPETITOR_URLS[0], COMPETITOR_URLS[1], COMPETITOR_URLS[2], "B000000003"]
+
+    # Act - 執行受測操作
+    result = await target.execute(MAIN_URL, urls)
+
+    # Assert - 驗證結果
+    assert scraper.calls == 4
+    assert [c.asin for c in result.competitors] == ["B000000003"]
+    assert [(e["asin"], e["error"]) for e in result.errors] == [
+        ("B000000001", "Fake fetch failed for B000000001"),
+        ("B000000002", "Timed out after 0.05s"),
+    ]
+
+
+async def test_compare_main_product_failure():
+    """測試主產品爬取失敗時拋出 ProductFetchError 並取消其餘爬取。"""
+    # Arrange - 準備測試資料和依賴
+    scraper = FakeListingScraper(latency_seconds=1.0, failing_asins=frozenset({"B000000000"}))
+    scraper.latencies["B000000000"] = 0
+    target = CompareCompetitorsUseCase(scraper=scraper)
+
+    # Act & Assert - 執行並驗證拋出例外
+    start = time.perf_counter()
+    with pytest.raises(ProductFetchError):
+        await target.execute(MAIN_URL, COMPETITOR_URLS)
+    assert time.perf_counter() - start < 0.5
@@ -0,0 +1,112 @@
+"""Unit tests for listing normalization."""
+
+from decimal import Decimal
+
+import pytest
+
+from app.use_cases.competitor.normalization import ListingNormalizer, parse_product_url
+from app.use_cases.competitor.ports import ProductRef, RawListing
+from app.use_cases.exceptions import InvalidProductUrlError
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.amazon.com/dp/B0ABCDEFGH", ProductRef("B0ABCDEFGH", "amazon.com")),
+        (
+            "https://www.amazon.de/Sony-WH-1000XM5/dp/b0abcdefgh/ref=sr_1_1?th=1",
+            ProductRef("B0ABCDEFGH", "amazon.de"),
+        ),
+        ("amazon.co.jp/gp/product/B012345678", ProductRef("B012345678", "amazon.co.jp")),
+        ("https://smile.amazon.com/gp/aw/d/B012345678", ProductRef("B012345678", "amazon.com")),
+        ("B012345678", ProductRef("B012345678", "amazon.com")),
+    ],
+)
+def test_parse_product_url(url, expected):
+    """測試各種 Amazon 產品 URL 與直接輸入的 ASIN 都能解析。"""
+    # Act & Assert - 執行並驗證結果
+    assert parse_product_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url", ["https://example.com/dp/B0ABCDEFGH", "https://amzn.to/3abcdef", "amazon.com/s?k=x"]
+)
+def test_parse_product_url_rejects_invalid(url):
+    """測試非 Amazon 網域、短網址或沒有 ASIN 的 URL 會被拒絕。"""
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(InvalidProductUrlError):
+        parse_product_url(url)
+
+
+def test_normalize_localized_listings():
+    """測試德國站與美國站的價格、評分、評論數、BSR 統一為相同格式。"""
+    # Arrange - 準備測試資料和依賴
+    normalizer = ListingNormalizer(currency="USD", exchange_rates={"EUR": Decimal("1.10")})
+    german = RawListing(
+        asin="B0ABCDEFGH",
+        marketplace="amazon.de",
+        title=" Kopfhörer ",
+        price="1.299,99 €",
+        currency=None,
+        rating="4,5 von 5 Sternen",
+        review_count="1.234 Sternebewertungen",
+        bsr=(
+            "Nr. 5 in Elektronik & Foto (Siehe Top 100 in Elektronik & Foto)",
+            "Nr. 12 in Kopfhörer",
+        ),
+    )
+    american = RawListing(
+        asin="B012345678",
+        marketplace="amazon.com",
+        title="Headphones",
+        price="$1,299.99",
+        currency="$",
+        rating="4.5 out of 5 stars",
+        review_count="1,234 ratings",
+        bsr=("#1,234 in Electronics (See Top 100 in Electronics)",),
+        breadcrumbs="Electronics › Headphones › Earbud Headphones",
+    )
+
+    # Act - 執行受測操作
+    de = normalizer.normalize(german)
+    us = normalizer.normalize(american)
+
+    # Assert - 驗證結果
+    assert (de.original_price, de.original_currency) == (Decimal("1299.99"), "EUR")
+    assert de.price == Decimal("1429.99")
+    assert (de.rating, de.review_count) == (4.5, 1234)
+    assert (de.bsr_main, de.bsr_sub) == (5, 12)
+    assert de.category_path == ("Elektronik & Foto", "Kopfhörer")
+    assert de.title == "Kopfhörer"
+
+    assert (us.price, us.currency, us.rating, us.review_count) == (
+        Decimal("1299.99"),
+        "USD",
+        4.5,
+        1234,
+    )
+    assert (us.bsr_main, us.bsr_sub) == (1234, None)
+    assert us.category_path == ("Electronics", "Headphones", "Earbud Headphones")
+
+
+def test_normalize_without_exchange_rate():
+    """測試缺少匯率時換算後價格為 None，但保留原始價格與評分換算（日本站格式）。"""
+    # Arrange - 準備測試資料和依賴
+    normalizer = ListingNormalizer(currency="USD")
+    raw = RawListing(
+        asin="B0ABCDEFGH",
+        marketplace="amazon.co.jp",
+        title="ヘッドホン",
+        price="￥12,800",
+        currency=None,
+        rating="5つ星のうち4.2",
+        review_count="2,345個の評価",
+    )
+
+    # Act - 執行受測操作
+    result = normalizer.normalize(raw)
+
+    # Assert - 驗證結果
+    assert result.price is None
+    assert (result.original_price, result.original_currency) == (Decimal("12800"), "JPY")
+    assert (result.rating, result.review_count) == (4.2, 2345)
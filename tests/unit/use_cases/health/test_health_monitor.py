@@ -0,0 +1,128 @@
+"""Unit tests for HealthMonitor."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from app.use_cases.exceptions import UpstreamUnavailableError
+from app.use_cases.health.health_monitor import HealthMonitor
+
+
+async def test_health_monitor_latest_probes_once():
+    """測試尚未探測時會探測一次，之後重複讀取快取結果。"""
+    # Arrange - 準備測試資料和依賴
+    mock_db_repo = Mock()
+    mock_db_repo.check_connection = AsyncMock(return_value="connected")
+    target = HealthMonitor(db_repo=mock_db_repo)
+
+    # Act - 執行受測操作
+    results = await asyncio.gather(*(target.latest() for _ in range(5)))
+
+    # Assert - 驗證結果
+    assert all(result.database == "connected" for result in results)
+    assert results[0].status == "healthy"
+    mock_db_repo.check_connection.assert_awaited_once()
+
+
+async def test_health_monitor_probe_timeout():
+    """測試探測逾時時回報錯誤且不是 ready。"""
+
+    # Arrange - 準備測試資料和依賴
+    async def slow_check():
+        await asyncio.sleep(1)
+        return "connected"
+
+    mock_db_repo = Mock()
+    mock_db_repo.check_connection = slow_check
+    target = HealthMonitor(db_repo=mock_db_repo, timeout_seconds=0.01)
+
+    # Act - 執行受測操作
+    result = await target.probe()
+    readiness = target.readiness()
+
+    # Assert - 驗證結果
+    assert result.database.startswith("error: timeout")
+    assert readiness.ready is False
+    assert readiness.stale is False
+
+
+async def test_health_monitor_readiness_before_first_probe():
+    """測試尚未探測前 readiness 為未就緒且過期。"""
+    # Arrange - 準備測試資料和依賴
+    target = HealthMonitor(db_repo=Mock())
+
+    # Act - 執行受測操作
+    readiness = target.readiness()
+
+    # Assert - 驗證結果
+    assert readiness.ready is False
+    assert readiness.stale is True
+    assert readiness.checked_at is None
+
+
+async def test_health_monitor_readiness_stale():
+    """測試探測結果超過 stale_after_seconds 時視為未就緒。"""
+    # Arrange - 準備測試資料和依賴
+    mock_db_repo = Mock()
+    mock_db_repo.check_connection = AsyncMock(return_value="connected")
+    target = HealthMonitor(db_repo=mock_db_repo, stale_after_seconds=0.0)
+    await target.probe()
+
+    # Act - 執行受測操作
+    readiness = target.readiness()
+
+    # Assert - 驗證結果
+    assert readiness.database == "connected"
+    assert readiness.stale is True
+    assert readiness.ready is False
+
+
+async def test_health_monitor_background_refresh():
+    """測試背景 task 依間隔持續探測，停止後不再探測。"""
+    # Arrange - 準備測試資料和依賴
+    mock_db_repo = Mock()
+    mock_db_repo.check_connection = AsyncMock(return_value="connected")
+    target = HealthMonitor(db_repo=mock_db_repo, interval_seconds=0.01)
+
+    # Act - 執行受測操作
+    target.start()
+    await asyncio.sleep(0.05)
+    await target.stop()
+    calls = mock_db_repo.check_connection.await_count
+    await asyncio.sleep(0.03)
+
+    # Assert - 驗證結果
+    assert calls >= 2
+    assert mock_db_repo.check_connection.await_count == calls
+    assert target.readiness().ready is True
+
+
+async def test_health_monitor_reports_open_circuit_as_error():
+    """測試上游斷路器開啟時探測回報錯誤，不拋出例外。"""
+    # Arrange - 準備測試資料和依賴
+    mock_db_repo = Mock()
+    mock_db_repo.check_connection = AsyncMock(
+        side_effect=UpstreamUnavailableError("AsyncDatabaseRepository is unavailable")
+    )
+    target = HealthMonitor(db_repo=mock_db_repo)
+
+    # Act - 執行受測操作
+    result = await target.probe()
+
+    # Assert - 驗證結果
+    assert result.database == "error: AsyncDatabaseRepository is unavailable"
+    assert target.readiness().ready is False
+
+
+async def test_health_monitor_reports_upstream_failure_as_error():
+    """測試連線檢查拋出例外時探測回報錯誤狀態，不拋出例外。"""
+    # Arrange - 準備測試資料和依賴
+    mock_db_repo = Mock()
+    mock_db_repo.check_connection = AsyncMock(side_effect=ConnectionError("connection refused"))
+    target = HealthMonitor(db_repo=mock_db_repo)
+
+    # Act - 執行受測操作
+    result = await target.probe()
+
+    # Assert - 驗證結果
+    assert result.database == "error: connection refused"
+    assert target.readiness().ready is False
@@ -0,0 +1,57 @@
+"""Unit tests for the Supabase database connection check."""
+
+import httpx
+import pytest
+from supabase import AsyncClient, AsyncClientOptions
+
+from app.adapters.repositories.supabase_database_repository import (
+    AsyncSupabaseDatabaseRepository,
+)
+
+
+def make_client(handler) -> AsyncClient:
+    """建立以 MockTransport 回應的 Supabase async client。"""
+    options = AsyncClientOptions(
+        auto_refresh_token=False,
+        persist_session=False,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return AsyncClient("https://example.supabase.co", "anon-key", options)
+
+
+async def test_check_connection_round_trips_to_auth_health():
+    """測試連線檢查實際送出請求到 /auth/v1/health（附 apikey）。"""
+    # Arrange - 準備測試資料和依賴
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"name": "GoTrue"})
+
+    target = AsyncSupabaseDatabaseRepository(make_client(handler))
+
+    # Act - 執行受測操作
+    result = await target.check_connection()
+
+    # Assert - 驗證結果
+    assert result == "connected"
+    assert len(requests) == 1
+    assert requests[0].url.path == "/auth/v1/health"
+    assert requests[0].headers["apikey"] == "anon-key"
+
+
+async def test_check_connection_raises_for_unreachable_upstream():
+    """測試 Supabase 無法連線或回應 5xx 時拋出例外（斷路器才看得到失敗）。"""
+
+    # Arrange - 準備測試資料和依賴
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("All connection attempts failed")
+
+    unreachable = AsyncSupabaseDatabaseRepository(make_client(refuse))
+    failing = AsyncSupabaseDatabaseRepository(make_client(lambda request: httpx.Response(503)))
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(httpx.ConnectError):
+        await unreachable.check_connection()
+    with pytest.raises(httpx.HTTPStatusError, match="503"):
+        await failing.check_connection()
@@ -0,0 +1,210 @@
+"""Unit tests for NotificationDispatcher."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from app.adapters.repositories.file_dead_letter_store import FileDeadLetterStore
+from app.domain.entities.product import ChangeAlert
+from app.use_cases.exceptions import NotificationDeliveryError
+from app.use_cases.notification.dispatcher import NotificationDispatcher
+from app.use_cases.notification.ports import (
+    Digest,
+    NotificationChannel,
+    Recipient,
+    RecipientDirectory,
+)
+
+ALICE = Recipient(user_id="alice", email="alice@example.com", webhook_url="http://hooks/a")
+BOB = Recipient(user_id="bob")
+
+
+class FakeDirectory(RecipientDirectory):
+    """以 dict 設定的收件者查詢。"""
+
+    def __init__(self, recipients: dict[str, list[Recipient]]):
+        self.recipients = recipients
+
+    async def find_recipients(self, product_ids):
+        return {pid: self.recipients[pid] for pid in product_ids if pid in self.recipients}
+
+
+class FlakyDirectory(FakeDirectory):
+    """前 failures 次查詢失敗的收件者查詢。"""
+
+    def __init__(self, recipients: dict[str, list[Recipient]], failures: int):
+        super().__init__(recipients)
+        self.failures = failures
+
+    async def find_recipients(self, product_ids):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("directory unavailable")
+        return await super().find_recipients(product_ids)
+
+
+class FakeChannel(NotificationChannel):
+    """記錄送出的摘要，並依序拋出預先設定的錯誤。"""
+
+    def __init__(self, name: str, errors=(), requires_email: bool = False, delay: float = 0.0):
+        self.name = name
+        self.errors = list(errors)
+        self.requires_email = requires_email
+        self.delay = delay
+        self.sent: list[Digest] = []
+        self.attempts = 0
+
+    def accepts(self, recipient: Recipient) -> bool:
+        return recipient.email is not None or not self.requires_email
+
+    async def send(self, digest: Digest) -> None:
+        self.attempts += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append(digest)
+
+
+def make_alert(product_id: str, index: int = 0) -> ChangeAlert:
+    """建立測試用警報。"""
+    return ChangeAlert(
+        id=f"alert-{product_id}-{index}",
+        product_id=product_id,
+        alert_type="PRICE_CHANGE",
+        change_percentage=15.0,
+        old_value=100.0,
+        new_value=115.0,
+        triggered_at=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+
+async def test_alerts_are_coalesced_per_user_and_fanned_out(tmp_path):
+    """測試同一使用者的警報合併為一則摘要，依通道條件送出，沒有收件者的警報只計數。"""
+    # Arrange - 準備測試資料和依賴
+    directory = FakeDirectory({"p1": [ALICE], "p2": [ALICE, BOB], "p3": [BOB]})
+    log, email = FakeChannel("log"), FakeChannel("email", requires_email=True)
+    target = NotificationDispatcher(
+        directory, [log, email], FileDeadLetterStore(tmp_path / "dlq.jsonl"), concurrency=2
+    )
+    target.start()
+
+    # Act - 執行受測操作
+    await target.submit([make_alert(pid, i) for i in range(3) for pid in ("p1", "p2", "p3", "p9")])
+    await target.stop()
+
+    # Assert - 驗證結果
+    by_user = {d.recipient.user_id: len(d.alerts) for d in log.sent}
+    assert by_user == {"alice": 6, "bob": 6}
+    assert [d.recipient.user_id for d in email.sent] == ["alice"]
+    assert target.stats.unrouted == 3
+    assert target.stats.delivered == {"log": 2, "email": 1}
+    assert len(target.stats.latencies) == 3
+
+
+async def test_failed_recipient_lookup_keeps_alerts_for_next_flush(tmp_path):
+    """測試收件者查詢失敗時警報放回緩衝，下一次彙整照常送出（不遺失）。"""
+    # Arrange - 準備測試資料和依賴
+    directory = FlakyDirectory({"p1": [ALICE]}, failures=1)
+    log = FakeChannel("log")
+    target = NotificationDispatcher(directory, [log], FileDeadLetterStore(tmp_path / "dlq.jsonl"))
+    target.start()
+    await target.submit([make_alert("p1", i) for i in range(2)])
+
+    # Act - 執行受測操作
+    with pytest.raises(ConnectionError):
+        await target.flush()
+    await target.submit([make_alert("p1", 2)])
+    await target.stop()
+
+    # Assert - 驗證結果
+    assert [[a.id for a in d.alerts] for d in log.sent] == [
+        ["alert-p1-0", "alert-p1-1", "alert-p1-2"]
+    ]
+
+
+async def test_directory_outage_caps_buffer_and_stop_still_cancels_tasks(tmp_path):
+    """測試收件者查詢持續失敗時 submit 不拋出、緩衝丟棄最舊警報，stop 仍停止所有 task。"""
+    # Arrange - 準備測試資料和依賴
+    directory = FlakyDirectory({"p1": [ALICE]}, failures=10**6)
+    target = NotificationDispatcher(
+        directory,
+        [FakeChannel("log")],
+        FileDeadLetterStore(tmp_path / "dlq.jsonl"),
+        digest_window_seconds=60.0,
+        max_buffer=3,
+        concurrency=2,
+    )
+    target.start()
+    tasks = list(target._tasks)
+
+    # Act - 執行受測操作
+    for i in range(5):
+        await target.submit([make_alert("p1", i)])
+    await target.stop()
+
+    # Assert - 驗證結果
+    assert [alert.id for alert, _ in target._buffer] == ["alert-p1-2", "alert-p1-3", "alert-p1-4"]
+    assert target.stats.dropped == 2
+    assert all(task.done() for task in tasks)
+
+
+async def test_retries_then_dead_letters_and_redrives(tmp_path):
+    """測試可重試的失敗會重試，不可重試或用盡次數時移入 DLQ，redrive 後送達。"""
+    # Arrange - 準備測試資料和依賴
+    dead_letters = FileDeadLetterStore(tmp_path / "dlq.jsonl")
+    flaky = FakeChannel("webhook", errors=[NotificationDeliveryError("503")])
+    broken = FakeChannel("email", errors=[NotificationDeliveryError("bad", retryable=False)])
+    down = FakeChannel("sms", errors=[OSError("down")] * 3)
+    target = NotificationDispatcher(
+        FakeDirectory({"p1": [ALICE]}),
+        [flaky, broken, down],
+        dead_letters,
+        max_attempts=3,
+        retry_base_seconds=0.001,
+    )
+    target.start()
+
+    # Act - 執行受測操作
+    await target.submit([make_alert("p1")])
+    await target.stop()
+    stored = await dead_letters.count()
+    target.start()
+    redriven = await target.redrive()
+    await target.stop()
+
+    # Assert - 驗證結果
+    assert len(flaky.sent) == 1 and flaky.attempts == 2
+    # 不可重試：只嘗試一次；可重試：用盡 3 次；redrive 各再送一次
+    assert broken.attempts == 1 + 1
+    assert down.attempts == 3 + 1
+    assert (stored, redriven) == (2, 2)
+    assert [d.alerts[0].id for d in broken.sent + down.sent] == ["alert-p1-0"] * 2
+    assert target.stats.retries == 3
+    assert target.stats.dead_lettered == 2
+    assert await dead_letters.count() == 0
+
+
+async def test_full_queues_apply_backpressure_to_submit(tmp_path):
+    """測試通道佇列滿時 submit 會等待，並在 drain 後全部送達。"""
+    # Arrange - 準備測試資料和依賴
+    slow = FakeChannel("log", delay=0.01)
+    target = NotificationDispatcher(
+        FakeDirectory({f"p{i}": [Recipient(user_id=f"u{i}")] for i in range(20)}),
+        [slow],
+        FileDeadLetterStore(tmp_path / "dlq.jsonl"),
+        max_buffer=1,
+        queue_size=2,
+        concurrency=1,
+    )
+    target.start()
+
+    # Act - 執行受測操作
+    for i in range(20):
+        await target.submit([make_alert(f"p{i}")])
+    in_flight_after_submit = 20 - len(slow.sent)
+    await target.stop()
+
+    # Assert - 驗證結果
+    assert in_flight_after_submit <= 2 + 1
+    assert len(slow.sent) == 20
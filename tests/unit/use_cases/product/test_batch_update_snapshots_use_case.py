@@ -0,0 +1,140 @@
+"""Unit tests for BatchUpdateSnapshotsUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.adapters.external.fake_scraper import FakeScraper
+from app.adapters.repositories.file_checkpoint_store import FileCheckpointStore
+from app.domain.entities.product import Product
+from app.use_cases.product.batch_update_snapshots_use_case import BatchUpdateSnapshotsUseCase
+
+
+def make_products(count: int) -> list[Product]:
+    """建立測試用產品。"""
+    now = datetime.now(UTC)
+    return [
+        Product(
+            id=f"product-{i}",
+            asin=f"B{i:09d}",
+            title=f"Product {i}",
+            category="Electronics",
+            user_id="user-1",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_snapshot_repo() -> Mock:
+    """建立記錄寫入內容的 Snapshot Repository mock。"""
+    repo = Mock()
+    repo.saved = []
+
+    async def save_many(snapshots):
+        repo.saved.extend(snapshots)
+        return len(snapshots)
+
+    repo.save_many = AsyncMock(side_effect=save_many)
+    return repo
+
+
+async def test_batch_update_success_in_chunks(tmp_path):
+    """測試所有產品並發更新成功，並依 chunk_size 分批寫入。"""
+    # Arrange - 準備測試資料和依賴
+    products = make_products(25)
+    scraper = FakeScraper(latency_seconds=0.001)
+    snapshot_repo = make_snapshot_repo()
+    checkpoint_store = FileCheckpointStore(tmp_path)
+    target = BatchUpdateSnapshotsUseCase(
+        scraper=scraper,
+        snapshot_repo=snapshot_repo,
+        checkpoint_store=checkpoint_store,
+        concurrency=5,
+        chunk_size=10,
+    )
+
+    # Act - 執行受測操作
+    result = await target.execute(products, run_id="daily")
+
+    # Assert - 驗證結果
+    assert (result.total, result.success, result.failed) == (25, 25, 0)
+    assert {s.product_id for s in snapshot_repo.saved} == {p.id for p in products}
+    assert len({s.scraped_at for s in snapshot_repo.saved}) == 1
+    assert [len(c.args[0]) for c in snapshot_repo.save_many.call_args_list] == [10, 10, 5]
+    assert 1 < scraper.max_in_flight <= 5
+    assert await checkpoint_store.load("daily") is None
+
+
+async def test_batch_update_retries_then_records_failure(tmp_path):
+    """測試爬取失敗會重試，超過重試次數後記錄失敗並保留 checkpoint。"""
+    # Arrange - 準備測試資料和依賴
+    products = make_products(3)
+    scraper = Mock()
+    scraper.host_for.return_value = "default"
+    scraper.scrape_product = AsyncMock(side_effect=RuntimeError("blocked"))
+    checkpoint_store = FileCheckpointStore(tmp_path)
+    target = BatchUpdateSnapshotsUseCase(
+        scraper=scraper,
+        snapshot_repo=make_snapshot_repo(),
+        checkpoint_store=checkpoint_store,
+        max_retries=2,
+        backoff_base_seconds=0,
+    )
+
+    # Act - 執行受測操作
+    result = await target.execute(products, run_id="daily")
+
+    # Assert - 驗證結果
+    assert (result.success, result.failed, result.retries) == (0, 3, 6)
+    assert scraper.scrape_product.await_count == 9
+    assert result.errors[0]["error"] == "blocked"
+    assert await checkpoint_store.load("daily") is not None
+
+
+async def test_batch_update_resumes_from_checkpoint(tmp_path):
+    """測試以相同 run_id 續跑時略過已完成產品並沿用 scraped_at。"""
+    # Arrange - 準備測試資料和依賴
+    products = make_products(10)
+    scraped_at = datetime(2025, 10, 10, 2, 0, tzinfo=UTC)
+    checkpoint_store = FileCheckpointStore(tmp_path)
+    await checkpoint_store.start("daily", scraped_at)
+    await checkpoint_store.mark_done("daily", [p.id for p in products[:6]])
+    scraper = FakeScraper(latency_seconds=0)
+    snapshot_repo = make_snapshot_repo()
+    target = BatchUpdateSnapshotsUseCase(
+        scraper=scraper, snapshot_repo=snapshot_repo, checkpoint_store=checkpoint_store
+    )
+
+    # Act - 執行受測操作
+    result = await target.execute(products, run_id="daily")
+
+    # Assert - 驗證結果
+    assert (result.total, result.skipped, result.success) == (10, 6, 4)
+    assert scraper.calls == 4
+    assert {s.scraped_at for s in snapshot_repo.saved} == {scraped_at}
+
+
+async def test_batch_update_repository_error_keeps_checkpoint(tmp_path):
+    """測試寫入 Repository 失敗時中止批次，已寫入的 chunk 仍在 checkpoint 中。"""
+    # Arrange - 準備測試資料和依賴
+    products = make_products(20)
+    snapshot_repo = Mock()
+    snapshot_repo.save_many = AsyncMock(side_effect=[10, ConnectionError("db down")])
+    checkpoint_store = FileCheckpointStore(tmp_path)
+    target = BatchUpdateSnapshotsUseCase(
+        scraper=FakeScraper(latency_seconds=0),
+        snapshot_repo=snapshot_repo,
+        checkpoint_store=checkpoint_store,
+        concurrency=1,
+        chunk_size=10,
+    )
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ConnectionError):
+        await target.execute(products, run_id="daily")
+
+    checkpoint = await checkpoint_store.load("daily")
+    assert checkpoint.done == {p.id for p in products[:10]}
@@ -0,0 +1,71 @@
+"""Unit tests for CachedScraper."""
+
+import asyncio
+from decimal import Decimal
+
+from app.adapters.external.cached_scraper import CachedScraper
+from app.adapters.external.fake_scraper import FakeScraper
+from app.infrastructure.cache import TwoTierCache
+
+
+class FakeClock:
+    """手動推進的時間來源。"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_cached_result_round_trips_decimal_prices():
+    """測試快取命中時回傳相同資料，金額仍為 Decimal 且不失精度，只爬取一次。"""
+    # Arrange - 準備測試資料和依賴
+    inner = FakeScraper(latency_seconds=0)
+    target = CachedScraper(inner, TwoTierCache())
+
+    # Act - 執行受測操作
+    first = await target.scrape_product("B000000001")
+    second = await target.scrape_product("B000000001")
+
+    # Assert - 驗證結果
+    assert second == first
+    assert isinstance(second.price, Decimal)
+    assert second.price == first.price == second.buybox_price
+    assert inner.calls == 1
+
+
+async def test_concurrent_requests_for_same_asin_scrape_once():
+    """測試同一 ASIN 的並發請求只觸發一次爬取，不同 ASIN 各自爬取。"""
+    # Arrange - 準備測試資料和依賴
+    inner = FakeScraper(latency_seconds=0.01)
+    target = CachedScraper(inner, TwoTierCache())
+
+    # Act - 執行受測操作
+    results = await asyncio.gather(
+        *(target.scrape_product("B000000001") for _ in range(5)),
+        target.scrape_product("B000000002"),
+    )
+
+    # Assert - 驗證結果
+    assert len({r.asin for r in results}) == 2
+    assert inner.calls == 2
+
+
+async def test_stale_result_is_served_while_refreshing():
+    """測試超過 ttl 但仍在 stale 區間內時先回傳舊值，並於背景重新爬取。"""
+    # Arrange - 準備測試資料和依賴
+    clock = FakeClock()
+    inner = FakeScraper(latency_seconds=0)
+    target = CachedScraper(inner, TwoTierCache(clock=clock), ttl_seconds=60, stale_seconds=60)
+    await target.scrape_product("B000000001")
+    clock.now += 90
+
+    # Act - 執行受測操作
+    stale = await target.scrape_product("B000000001")
+    await asyncio.sleep(0.01)  # 等待背景更新完成
+    fresh = await target.scrape_product("B000000001")
+
+    # Assert - 驗證結果
+    assert stale == fresh
+    assert inner.calls == 2  # 背景更新一次，之後的請求命中新值
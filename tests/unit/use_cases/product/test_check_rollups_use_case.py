@@ -0,0 +1,81 @@
+"""Unit tests for CheckRollupsUseCase."""
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from app.adapters.repositories.sqlite_rollup_repository import SQLiteRollupRepository
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import ProductSnapshot
+from app.use_cases.product.check_rollups_use_case import CheckRollupsUseCase
+from app.use_cases.product.update_rollups_use_case import UpdateRollupsUseCase
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+PRODUCT_IDS = [f"product-{i}" for i in range(5)]
+
+
+async def ingest(days: int) -> tuple[SQLiteSnapshotRepository, SQLiteRollupRepository]:
+    """模擬每 12 小時一批的快照寫入，並逐批增量更新彙總。"""
+    rng = random.Random(7)
+    snapshot_repo = SQLiteSnapshotRepository()
+    rollup_repo = SQLiteRollupRepository()
+    updater = UpdateRollupsUseCase(rollup_repo=rollup_repo)
+    for step in range(days * 2):
+        batch = [
+            ProductSnapshot(
+                id=f"snapshot-{product_id}-{step}",
+                product_id=product_id,
+                asin="B08N5WRWNW",
+                price=Decimal(rng.randint(80, 130)) if rng.random() > 0.1 else None,
+                currency="USD",
+                bsr_main=rng.randint(1, 10000),
+                bsr_sub=rng.randint(500, 2000),
+                rating=4.0,
+                review_count=step,
+                buybox_price=None,
+                scraped_at=START + timedelta(hours=12 * step, minutes=rng.randint(0, 59)),
+                created_at=START,
+            )
+            for product_id in PRODUCT_IDS
+        ]
+        await snapshot_repo.save_many(batch)
+        await updater.execute(batch)
+    return snapshot_repo, rollup_repo
+
+
+async def test_incremental_rollups_match_rebuild():
+    """測試依序增量更新的彙總與由快照重建的結果一致（跨多個批次讀取）。"""
+    # Arrange - 準備測試資料和依賴
+    snapshot_repo, rollup_repo = await ingest(days=45)
+    target = CheckRollupsUseCase(snapshot_repo, rollup_repo, batch_size=16)
+
+    # Act - 執行受測操作
+    result = await target.execute(PRODUCT_IDS)
+
+    # Assert - 驗證結果
+    assert result.checked == 5
+    assert result.drifted == []
+    rollups = await rollup_repo.get_many(PRODUCT_IDS)
+    assert all(r.last_alert_at is not None for r in rollups.values())
+
+
+async def test_check_reports_and_repairs_drift():
+    """測試被竄改或缺漏的彙總被回報，repair 時以重建結果覆蓋。"""
+    # Arrange - 準備測試資料和依賴
+    snapshot_repo, rollup_repo = await ingest(days=10)
+    rollups = await rollup_repo.get_many(["product-0", "product-1"])
+    rollups["product-0"].price_max_30d = 999.0
+    await rollup_repo.save_many([rollups["product-0"]])
+    rollup_repo.connection.execute("DELETE FROM product_rollups WHERE product_id = 'product-1'")
+    target = CheckRollupsUseCase(snapshot_repo, rollup_repo)
+
+    # Act - 執行受測操作
+    result = await target.execute(PRODUCT_IDS, repair=True)
+
+    # Assert - 驗證結果
+    assert {(d.product_id, tuple(d.fields)) for d in result.drifted} == {
+        ("product-0", ("price_max_30d",)),
+        ("product-1", ("missing",)),
+    }
+    assert result.repaired == 2
+    assert (await target.execute(PRODUCT_IDS)).drifted == []
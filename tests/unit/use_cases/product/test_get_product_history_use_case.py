@@ -0,0 +1,185 @@
+"""Unit tests for GetProductHistoryUseCase."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.adapters.repositories.sqlite_snapshot_repository import SQLiteSnapshotRepository
+from app.domain.entities.product import Product, ProductSnapshot
+from app.use_cases.exceptions import InvalidCursorError, ProductNotFoundError
+from app.use_cases.product.get_product_history_use_case import GetProductHistoryUseCase
+from app.use_cases.product.ports import ProductRepository
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class InMemoryProductRepository(ProductRepository):
+    """以記憶體保存產品的 Repository。"""
+
+    def __init__(self, *products: Product):
+        self.products = {p.id: p for p in products}
+
+    async def find_by_id(self, product_id: str) -> Product | None:
+        return self.products.get(product_id)
+
+
+def make_product(product_id: str = "product-1", user_id: str = "user-1") -> Product:
+    """建立屬於 user_id 的產品。"""
+    return Product(
+        id=product_id,
+        asin="B000000001",
+        title="Wireless Earbuds",
+        category="Electronics",
+        user_id=user_id,
+        created_at=START,
+        updated_at=START,
+    )
+
+
+async def make_repo(
+    count: int, step: timedelta, bsr=lambda i: 1000 + i
+) -> SQLiteSnapshotRepository:
+    """建立含 count 筆快照（每 step 一筆）的 Repository。"""
+    repo = SQLiteSnapshotRepository()
+    await repo.save_many(
+        [
+            ProductSnapshot(
+                id=f"snapshot-{i}",
+                product_id="product-1",
+                asin="B000000001",
+                price=Decimal("19.99"),
+                currency="USD",
+                bsr_main=bsr(i),
+                bsr_sub=None,
+                rating=4.5,
+                review_count=i,
+                buybox_price=None,
+                scraped_at=START + step * i,
+                created_at=START,
+            )
+            for i in range(count)
+        ]
+    )
+    return repo
+
+
+async def test_raw_pages_follow_cursor_without_gaps():
+    """測試以 next_cursor 逐頁取回所有快照，不重複也不遺漏。"""
+    # Arrange - 準備測試資料和依賴
+    repo = await make_repo(25, timedelta(hours=1))
+    target = GetProductHistoryUseCase(snapshot_repo=repo)
+
+    # Act - 執行受測操作
+    pages = [await target.execute("product-1", limit=10)]
+    while pages[-1].next_cursor:
+        pages.append(await target.execute("product-1", cursor=pages[-1].next_cursor, limit=10))
+
+    # Assert - 驗證結果
+    assert [len(page.items) for page in pages] == [10, 10, 5]
+    assert [p.review_count for page in pages for p in page.items] == list(range(25))
+    assert pages[0].items[0].price == 19.99
+
+
+async def test_daily_keeps_last_point_per_day_and_pages_by_day():
+    """測試 daily 每日保留最後一筆，下一頁從隔日開始。"""
+    # Arrange - 準備測試資料和依賴
+    repo = await make_repo(24 * 5, timedelta(hours=1))
+    target = GetProductHistoryUseCase(snapshot_repo=repo, batch_size=7)
+
+    # Act - 執行受測操作
+    first = await target.execute("product-1", resolution="daily", limit=3)
+    second = await target.execute(
+        "product-1", resolution="daily", cursor=first.next_cursor, limit=3
+    )
+
+    # Assert - 驗證結果
+    assert [p.review_count for p in first.items] == [23, 47, 71]
+    assert [p.review_count for p in second.items] == [95, 119]
+    assert second.next_cursor is None
+
+
+async def test_stream_reads_in_bounded_batches():
+    """測試串流逐批向 Repository 取資料，每批不超過 batch_size。"""
+    # Arrange - 準備測試資料和依賴
+    repo = await make_repo(100, timedelta(minutes=10))
+    limits = []
+    find_range = repo.find_range
+
+    async def recording_find_range(*args, **kwargs):
+        limits.append(kwargs["limit"])
+        return await find_range(*args, **kwargs)
+
+    repo.find_range = recording_find_range
+    target = GetProductHistoryUseCase(snapshot_repo=repo, batch_size=30)
+
+    # Act - 執行受測操作
+    points = [p async for p in target.stream("product-1", resolution="weekly")]
+
+    # Assert - 驗證結果
+    assert len(points) == 1
+    assert points[0].review_count == 99
+    assert limits == [30, 30, 30, 30]
+
+
+async def test_lttb_keeps_endpoints_and_spikes_within_point_budget():
+    """測試 LTTB 回傳不超過 points 筆，保留首尾與尖峰。"""
+    # Arrange - 準備測試資料和依賴
+    spikes = {1234: 50_000, 3210: 10}
+    repo = await make_repo(5000, timedelta(minutes=5), bsr=lambda i: spikes.get(i, 1000))
+    target = GetProductHistoryUseCase(snapshot_repo=repo)
+    end = START + timedelta(minutes=5) * 5000
+
+    # Act - 執行受測操作
+    page = await target.execute("product-1", end=end, resolution="lttb", points=100)
+
+    # Assert - 驗證結果
+    counts = [p.review_count for p in page.items]
+    assert len(page.items) <= 100
+    assert counts[0] == 0
+    assert counts[-1] == 4999
+    assert 1234 in counts
+    assert 3210 in counts
+    assert counts == sorted(counts)
+    assert page.next_cursor is None
+
+
+async def test_invalid_cursor_raises():
+    """測試游標格式錯誤時拋出 InvalidCursorError。"""
+    # Arrange - 準備測試資料和依賴
+    target = GetProductHistoryUseCase(snapshot_repo=SQLiteSnapshotRepository())
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(InvalidCursorError):
+        await target.execute("product-1", cursor="not-a-cursor")
+
+
+async def test_ensure_owner_accepts_owner():
+    """測試產品擁有者通過檢查。"""
+    # Arrange - 準備測試資料和依賴
+    target = GetProductHistoryUseCase(
+        snapshot_repo=SQLiteSnapshotRepository(),
+        product_repo=InMemoryProductRepository(make_product(user_id="user-1")),
+    )
+
+    # Act - 執行受測操作
+    result = await target.ensure_owner("product-1", "user-1")
+
+    # Assert - 驗證結果
+    assert result is None
+
+
+@pytest.mark.parametrize(
+    ("product_id", "user_id"), [("product-1", "user-2"), ("missing-product", "user-1")]
+)
+async def test_ensure_owner_rejects_other_users_and_missing_products(product_id, user_id):
+    """測試其他使用者的產品與不存在的產品一律視為找不到（不洩漏產品是否存在）。"""
+    # Arrange - 準備測試資料和依賴
+    target = GetProductHistoryUseCase(
+        snapshot_repo=SQLiteSnapshotRepository(),
+        product_repo=InMemoryProductRepository(make_product(user_id="user-1")),
+    )
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ProductNotFoundError):
+        await target.ensure_owner(product_id, user_id)
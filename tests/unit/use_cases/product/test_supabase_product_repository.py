@@ -0,0 +1,76 @@
+"""Unit tests for SupabaseProductRepository."""
+
+import httpx
+
+from app.adapters.repositories.supabase_product_repository import SupabaseProductRepository
+from app.infrastructure.supabase_client import SupabaseClientProvider
+
+PRODUCT_ID = "6f1c3b1e-2d7a-4e0b-9c61-0f5a1d2b3c4d"
+USER_TOKEN = "user-access-token"
+
+
+class PostgrestServer:
+    """以 httpx.MockTransport 模擬 PostgREST（記錄請求，回傳預設的 rows）。"""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.requests: list[httpx.Request] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=self.rows)
+
+
+def make_repo(server: PostgrestServer) -> SupabaseProductRepository:
+    """建立以使用者身分查詢的 Repository。"""
+    provider = SupabaseClientProvider(
+        "https://example.supabase.co", "anon-key", transport=server.transport
+    )
+    return SupabaseProductRepository(supabase_client=provider.get_user_data_client(USER_TOKEN))
+
+
+async def test_find_by_id_queries_as_user_and_maps_row():
+    """測試以使用者 token 查詢產品並轉換為 Entity（category 缺值時為空字串）。"""
+    # Arrange - 準備測試資料和依賴
+    server = PostgrestServer(
+        [
+            {
+                "id": PRODUCT_ID,
+                "asin": "B000000001",
+                "title": "Wireless Earbuds",
+                "category": None,
+                "user_id": "user-1",
+                "is_active": True,
+                "created_at": "2026-10-01T00:00:00+00:00",
+                "updated_at": "2026-10-02T00:00:00+00:00",
+            }
+        ]
+    )
+    target = make_repo(server)
+
+    # Act - 執行受測操作
+    product = await target.find_by_id(PRODUCT_ID)
+
+    # Assert - 驗證結果
+    assert product is not None
+    assert (product.user_id, product.category) == ("user-1", "")
+    request = server.requests[0]
+    assert request.url.path == "/rest/v1/products"
+    assert request.url.params["id"] == f"eq.{PRODUCT_ID}"
+    assert request.headers["Authorization"] == f"Bearer {USER_TOKEN}"
+
+
+async def test_find_by_id_returns_none_without_query_for_non_uuid():
+    """測試不是 UUID 的 ID 直接回傳 None，不送出查詢；查無資料時也回傳 None。"""
+    # Arrange - 準備測試資料和依賴
+    server = PostgrestServer([])
+    target = make_repo(server)
+
+    # Act - 執行受測操作
+    invalid = await target.find_by_id("not-a-uuid")
+    missing = await target.find_by_id(PRODUCT_ID)
+
+    # Assert - 驗證結果
+    assert (invalid, missing) == (None, None)
+    assert len(server.requests) == 1
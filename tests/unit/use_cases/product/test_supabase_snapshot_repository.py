@@ -0,0 +1,142 @@
+"""Unit tests for SupabaseSnapshotRepository (PostgREST requests and row mapping)."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import httpx
+
+from app.adapters.repositories.supabase_snapshot_repository import SupabaseSnapshotRepository
+from app.domain.entities.product import ProductSnapshot
+from app.infrastructure.supabase_client import SupabaseClientProvider
+
+START = datetime(2026, 10, 1, tzinfo=UTC)
+USER_TOKEN = "user-access-token"
+
+
+def make_snapshot(i: int, product_id: str = "product-1") -> ProductSnapshot:
+    """建立第 i 小時的快照。"""
+    return ProductSnapshot(
+        id=f"snapshot-{i}",
+        product_id=product_id,
+        asin="B000000001",
+        price=Decimal("19.99") + i,
+        currency="USD",
+        bsr_main=1000 + i,
+        bsr_sub=None,
+        rating=4.5,
+        review_count=i,
+        buybox_price=Decimal("0.10"),
+        scraped_at=START + timedelta(hours=i),
+        created_at=START,
+    )
+
+
+def to_postgrest_row(snapshot: ProductSnapshot) -> dict:
+    """PostgREST 回傳的 row（numeric 以 JSON number 回傳）。"""
+    return {
+        "id": snapshot.id,
+        "product_id": snapshot.product_id,
+        "asin": snapshot.asin,
+        "price": float(snapshot.price),
+        "currency": snapshot.currency,
+        "bsr_main": snapshot.bsr_main,
+        "bsr_sub": snapshot.bsr_sub,
+        "rating": snapshot.rating,
+        "review_count": snapshot.review_count,
+        "buybox_price": float(snapshot.buybox_price),
+        "scraped_at": snapshot.scraped_at.isoformat(),
+        "created_at": snapshot.created_at.isoformat(),
+    }
+
+
+class PostgrestServer:
+    """以 httpx.MockTransport 模擬 PostgREST（記錄請求，SELECT 回傳預設的 rows）。"""
+
+    def __init__(self, rows: list[dict] | None = None):
+        self.rows = rows or []
+        self.requests: list[httpx.Request] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json=self.rows)
+        return httpx.Response(201)
+
+
+def make_repo(server: PostgrestServer, chunk_size: int = 1000) -> SupabaseSnapshotRepository:
+    """建立以使用者身分查詢的 Repository。"""
+    provider = SupabaseClientProvider(
+        "https://example.supabase.co", "anon-key", transport=server.transport
+    )
+    return SupabaseSnapshotRepository(
+        supabase_client=provider.get_user_data_client(USER_TOKEN), chunk_size=chunk_size
+    )
+
+
+async def test_save_many_upserts_in_chunks_as_calling_user():
+    """測試批次寫入依 chunk_size 分成多個 upsert 請求，以使用者 token 送出，金額以字串傳遞。"""
+    # Arrange - 準備測試資料和依賴
+    server = PostgrestServer()
+    target = make_repo(server, chunk_size=2)
+
+    # Act - 執行受測操作
+    written = await target.save_many([make_snapshot(i) for i in range(3)])
+
+    # Assert - 驗證結果
+    assert written == 3
+    assert len(server.requests) == 2
+    first = server.requests[0]
+    assert first.method == "POST"
+    assert first.url.path == "/rest/v1/product_snapshots"
+    assert first.url.params["on_conflict"] == "product_id,scraped_at"
+    assert "resolution=merge-duplicates" in first.headers["Prefer"]
+    assert "return=minimal" in first.headers["Prefer"]
+    assert first.headers["Authorization"] == f"Bearer {USER_TOKEN}"
+    rows = json.loads(first.content)
+    assert [row["price"] for row in rows] == ["19.99", "20.99"]
+    assert len(json.loads(server.requests[1].content)) == 1
+
+
+async def test_find_range_filters_orders_and_maps_rows():
+    """測試區間查詢的 PostgREST 條件，以及 row 轉換回 Entity（金額為 Decimal）。"""
+    # Arrange - 準備測試資料和依賴
+    snapshots = [make_snapshot(i) for i in range(2)]
+    server = PostgrestServer([to_postgrest_row(s) for s in snapshots])
+    target = make_repo(server)
+    after = START - timedelta(hours=1)
+
+    # Act - 執行受測操作
+    result = await target.find_range(
+        "product-1", START, START + timedelta(days=1), limit=10, after=after
+    )
+
+    # Assert - 驗證結果
+    assert result == snapshots
+    assert result[0].price == Decimal("19.99")
+    params = server.requests[0].url.params
+    assert params["product_id"] == "eq.product-1"
+    assert params.get_list("scraped_at") == [
+        f"gte.{START.isoformat()}",
+        f"lt.{(START + timedelta(days=1)).isoformat()}",
+        f"gt.{after.isoformat()}",
+    ]
+    assert params["order"] == "scraped_at.asc"
+    assert params["limit"] == "10"
+
+
+async def test_find_latest_by_products_reads_view_per_chunk():
+    """測試多產品最新快照經由 DISTINCT ON view 查詢，並依 chunk_size 分批。"""
+    # Arrange - 準備測試資料和依賴
+    server = PostgrestServer([to_postgrest_row(make_snapshot(0, "product-1"))])
+    target = make_repo(server, chunk_size=2)
+
+    # Act - 執行受測操作
+    latest = await target.find_latest_by_products(["product-1", "product-2", "product-3"])
+
+    # Assert - 驗證結果
+    assert list(latest) == ["product-1"]
+    assert [r.url.path for r in server.requests] == ["/rest/v1/latest_product_snapshots"] * 2
+    assert server.requests[0].url.params["product_id"] == "in.(product-1,product-2)"
+    assert server.requests[1].url.params["product_id"] == "in.(product-3)"
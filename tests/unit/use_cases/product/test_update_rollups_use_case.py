@@ -0,0 +1,101 @@
+"""Unit tests for UpdateRollupsUseCase."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.adapters.repositories.sqlite_rollup_repository import SQLiteRollupRepository
+from app.domain.entities.product import ProductSnapshot
+from app.domain.services.change_detection import ALERT_BSR_CHANGE, ALERT_PRICE_CHANGE
+from app.use_cases.product.update_rollups_use_case import UpdateRollupsUseCase
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_snapshot(product_id: str, day: float, price: str | None, bsr_sub: int | None = 1000):
+    """建立第 day 天的測試用快照。"""
+    return ProductSnapshot(
+        id=f"snapshot-{product_id}-{day}",
+        product_id=product_id,
+        asin="B08N5WRWNW",
+        price=Decimal(price) if price is not None else None,
+        currency="USD",
+        bsr_main=None,
+        bsr_sub=bsr_sub,
+        rating=None,
+        review_count=None,
+        buybox_price=None,
+        scraped_at=START + timedelta(days=day),
+        created_at=START,
+    )
+
+
+async def test_update_rollups_detects_alerts_against_latest_value():
+    """測試每批更新彙總，警報以彙總中的最新值比對（含同批同產品的多筆快照）。"""
+    # Arrange - 準備測試資料和依賴
+    repo = SQLiteRollupRepository()
+    target = UpdateRollupsUseCase(rollup_repo=repo)
+    await target.execute(
+        [make_snapshot("product-1", 0, "100"), make_snapshot("product-2", 0, "50")]
+    )
+
+    # Act - 執行受測操作
+    alerts = await target.execute(
+        [
+            make_snapshot("product-1", 2, "130"),
+            make_snapshot("product-1", 1, "105"),
+            make_snapshot("product-2", 1, "51", bsr_sub=2000),
+        ]
+    )
+
+    # Assert - 驗證結果
+    assert sorted((a.product_id, a.alert_type, a.old_value, a.new_value) for a in alerts) == [
+        ("product-1", ALERT_PRICE_CHANGE, 105.0, 130.0),
+        ("product-2", ALERT_BSR_CHANGE, 1000.0, 2000.0),
+    ]
+    rollups = await repo.get_many(["product-1", "product-2"])
+    assert rollups["product-1"].price == 130.0
+    assert rollups["product-1"].price_change_7d == pytest.approx(30.0)
+    assert rollups["product-1"].last_alert_at == START + timedelta(days=2)
+    assert rollups["product-2"].last_alert_type == ALERT_BSR_CHANGE
+
+
+async def test_list_page_sorts_with_nulls_last_and_paginates():
+    """測試彙總列表依欄位排序（缺值排最後）並分頁，回傳總筆數。"""
+    # Arrange - 準備測試資料和依賴
+    repo = SQLiteRollupRepository()
+    prices = ["30", None, "10", "20", None, "40"]
+    await UpdateRollupsUseCase(rollup_repo=repo).execute(
+        [make_snapshot(f"product-{i}", 0, price) for i, price in enumerate(prices)]
+    )
+
+    # Act - 執行受測操作
+    first, total = await repo.list_page(sort_by="price", descending=False, limit=4)
+    second, _ = await repo.list_page(sort_by="price", descending=False, limit=4, offset=4)
+    filtered, filtered_total = await repo.list_page(
+        product_ids=["product-0", "product-1", "product-5"], sort_by="price", limit=2
+    )
+
+    # Assert - 驗證結果
+    assert total == 6
+    assert [r.product_id for r in first + second] == [
+        "product-2",
+        "product-3",
+        "product-0",
+        "product-5",
+        "product-1",
+        "product-4",
+    ]
+    assert filtered_total == 3
+    assert [r.product_id for r in filtered] == ["product-5", "product-0"]
+
+
+async def test_list_page_rejects_unknown_sort_column():
+    """測試不支援的排序欄位拋出 ValueError。"""
+    # Arrange - 準備測試資料和依賴
+    repo = SQLiteRollupRepository()
+
+    # Act & Assert - 執行並驗證拋出例外
+    with pytest.raises(ValueError):
+        await repo.list_page(sort_by="price; DROP TABLE product_rollups")
@@ -0,0 +1,49 @@
+"""Unit tests for OpenAILLM batch completion."""
+
+import json
+
+import httpx
+
+from app.adapters.external.openai_llm import BATCH_SYSTEM_PROMPT, OpenAILLM
+from app.use_cases.report.ports import LLMRequest
+
+
+class ChatServer:
+    """以 httpx.MockTransport 模擬 Chat Completions（批次呼叫回傳每個任務的 prompt）。"""
+
+    def __init__(self):
+        self.payloads: list[dict] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        system, user = (m["content"] for m in payload["messages"])
+        if system == BATCH_SYSTEM_PROMPT:
+            content = json.dumps([f"answer:{task['prompt']}" for task in json.loads(user)])
+        else:
+            content = f"answer:{user}"
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+async def test_complete_batch_merges_only_same_tenant_prompts():
+    """測試批次呼叫只合併同一 tenant 的 prompt，結果順序與輸入相同。"""
+    # Arrange - 準備測試資料和依賴
+    server = ChatServer()
+    target = OpenAILLM("test-key", transport=server.transport)
+    requests = [
+        LLMRequest("system", "a-1", tenant="tenant-a"),
+        LLMRequest("system", "b-1", tenant="tenant-b"),
+        LLMRequest("system", "a-2", tenant="tenant-a"),
+    ]
+
+    # Act - 執行受測操作
+    results = await target.complete_batch(requests)
+    await target.aclose()
+
+    # Assert - 驗證結果
+    assert results == ["answer:a-1", "answer:b-1", "answer:a-2"]
+    prompts = sorted(p["messages"][1]["content"] for p in server.payloads)
+    assert len(server.payloads) == 2
+    assert "a-1" in prompts[0] and "a-2" in prompts[0] and "b-1" not in prompts[0]
+    assert prompts[1] == "b-1"  # 只有一個 prompt 的 tenant 直接呼叫，不包裝成批次
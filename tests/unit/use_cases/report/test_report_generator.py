@@ -0,0 +1,177 @@
+"""Unit tests for ReportGenerator."""
+
+import asyncio
+from dataclasses import replace
+from decimal import Decimal
+
+from app.infrastructure.cache import TwoTierCache
+from app.use_cases.report.ports import LLMPort, LLMRequest
+from app.use_cases.report.prompts import PROMPTS
+from app.use_cases.report.report_generator import ReportGenerator
+
+
+class FakeLLM(LLMPort):
+    """記錄呼叫內容、延遲固定的假 LLM。"""
+
+    def __init__(self, latency_seconds: float = 0.01):
+        self.latency_seconds = latency_seconds
+        self.completions: list[LLMRequest] = []
+        self.batches: list[list[LLMRequest]] = []
+        self.streams: list[LLMRequest] = []
+
+    async def complete(self, request: LLMRequest) -> str:
+        self.completions.append(request)
+        await asyncio.sleep(self.latency_seconds)
+        return f"answer:{request.prompt[-20:]}"
+
+    async def complete_batch(self, requests):
+        self.batches.append(list(requests))
+        await asyncio.sleep(self.latency_seconds)
+        return [f"answer:{r.prompt[-20:]}" for r in requests]
+
+    async def stream(self, request: LLMRequest):
+        self.streams.append(request)
+        for word in ("Price ", "is ", "competitive."):
+            await asyncio.sleep(self.latency_seconds)
+            yield word
+
+
+def make_listing(asin: str = "B0ABCDEFGH") -> dict:
+    """建立測試用商品資料。"""
+    return {"asin": asin, "title": "Wireless Earbuds", "price": Decimal("29.90"), "rating": 4.5}
+
+
+async def test_generate_caches_by_normalized_content():
+    """測試內容相同（key 順序、數字型別、空白不同）的輸入命中同一筆快取。"""
+    # Arrange - 準備測試資料和依賴
+    llm = FakeLLM()
+    target = ReportGenerator(llm=llm, cache=TwoTierCache(), max_batch_size=1)
+    same_content = {
+        "rating": 4.5,
+        "price": 29.9,
+        "title": " Wireless Earbuds ",
+        "asin": "B0ABCDEFGH",
+    }
+
+    # Act - 執行受測操作
+    first = await target.generate("listing-suggestions", make_listing())
+    second = await target.generate("listing-suggestions", same_content)
+
+    # Assert - 驗證結果
+    assert (first.cached, second.cached) == (False, True)
+    assert first.key == second.key
+    assert first.key.startswith("report:listing-suggestions-v1:")
+    assert second.content == first.content
+    assert len(llm.completions) == 1
+    assert target.stats.hit_ratio == 0.5
+
+
+async def test_prompt_version_changes_cache_key():
+    """測試 prompt 版本改變時快取 key 不同，重新呼叫 LLM。"""
+    # Arrange - 準備測試資料和依賴
+    llm = FakeLLM()
+    cache = TwoTierCache()
+    prompts_v2 = {
+        **PROMPTS,
+        "listing-suggestions": replace(
+            PROMPTS["listing-suggestions"], version="listing-suggestions-v2"
+        ),
+    }
+    v1 = ReportGenerator(llm=llm, cache=cache, max_batch_size=1)
+    v2 = ReportGenerator(llm=llm, cache=cache, max_batch_size=1, prompts=prompts_v2)
+
+    # Act - 執行受測操作
+    old = await v1.generate("listing-suggestions", make_listing())
+    new = await v2.generate("listing-suggestions", make_listing())
+
+    # Assert - 驗證結果
+    assert old.key != new.key
+    assert new.cached is False
+    assert len(llm.completions) == 2
+
+
+async def test_generate_deduplicates_concurrent_requests():
+    """測試相同輸入同時請求時只呼叫 LLM 一次。"""
+    # Arrange - 準備測試資料和依賴
+    llm = FakeLLM(latency_seconds=0.05)
+    target = ReportGenerator(llm=llm, cache=TwoTierCache(), max_batch_size=1)
+
+    # Act - 執行受測操作
+    reports = await asyncio.gather(
+        *(target.generate("listing-suggestions", make_listing()) for _ in range(10))
+    )
+
+    # Assert - 驗證結果
+    assert len(llm.completions) == 1
+    assert len({r.content for r in reports}) == 1
+    assert target.stats.llm_prompts == 1
+
+
+async def test_generate_batches_small_prompts():
+    """測試批次視窗內的不同短 prompt 合併為一次 LLM 呼叫，結果對應各自的輸入。"""
+    # Arrange - 準備測試資料和依賴
+    llm = FakeLLM()
+    target = ReportGenerator(
+        llm=llm, cache=TwoTierCache(), batch_window_seconds=0.01, max_batch_size=8
+    )
+    listings = [make_listing(f"B0ABCDEF{i:02d}") for i in range(5)]
+
+    # Act - 執行受測操作
+    reports = await asyncio.gather(
+        *(target.generate("listing-suggestions", listing) for listing in listings)
+    )
+
+    # Assert - 驗證結果
+    assert len(llm.batches) == 1
+    assert len(llm.batches[0]) == 5
+    assert llm.completions == []
+    for report, listing in zip(reports, listings, strict=True):
+        _, request = target.prepare("listing-suggestions", listing)
+        assert report.content == f"answer:{request.prompt[-20:]}"
+    assert (target.stats.llm_calls, target.stats.llm_prompts) == (1, 5)
+
+
+async def test_generate_batches_only_within_same_tenant():
+    """測試不同使用者的短 prompt 不合併到同一次 LLM 呼叫。"""
+    # Arrange - 準備測試資料和依賴
+    llm = FakeLLM()
+    target = ReportGenerator(
+        llm=llm, cache=TwoTierCache(), batch_window_seconds=0.01, max_batch_size=8
+    )
+    requests = [(f"user-{i % 2}", make_listing(f"B0ABCDEF{i:02d}")) for i in range(5)]
+
+    # Act - 執行受測操作
+    await asyncio.gather(
+        *(target.generate("listing-suggestions", listing, tenant) for tenant, listing in requests)
+    )
+
+    # Assert - 驗證結果
+    batches = sorted(llm.batches, key=len)
+    assert [len(batch) for batch in batches] == [2, 3]
+    assert [{r.tenant for r in batch} for batch in batches] == [{"user-1"}, {"user-0"}]
+    assert (target.stats.llm_calls, target.stats.llm_prompts) == (2, 5)
+
+
+async def test_stream_shares_in_flight_output_and_caches():
+    """測試同時串流相同報告時共用一次 LLM 串流，完成後寫入快取。"""
+    # Arrange - 準備測試資料和依賴
+    llm = FakeLLM()
+    target = ReportGenerator(llm=llm, cache=TwoTierCache())
+
+    async def collect() -> list[str]:
+        return [chunk async for chunk in target.stream("listing-suggestions", make_listing())]
+
+    # Act - 執行受測操作
+    first = asyncio.create_task(collect())
+    await asyncio.sleep(0.015)  # 第二個訂閱者於第一個片段產生後才加入
+    second = await collect()
+    chunks = await first
+    cached = await target.generate("listing-suggestions", make_listing())
+
+    # Assert - 驗證結果
+    assert chunks == ["Price ", "is ", "competitive."]
+    assert second == chunks
+    assert len(llm.streams) == 1
+    assert target.stats.coalesced == 1
+    assert cached.cached is True
+    assert cached.content == "Price is competitive."